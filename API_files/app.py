@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import TYPE_CHECKING
 
 from anyio import move_on_after
 from fastapi import FastAPI
@@ -18,6 +21,9 @@ from .middleware.content_type import ContentTypeJSONMiddleware
 from .middleware.request_id import RequestIDMiddleware
 from .settings import Settings
 
+if TYPE_CHECKING:
+    from core_router.health_monitor import HealthMonitor
+
 # Define locally to avoid linter/editor issues with starlette.types.ASGIApp
 ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
 
@@ -99,6 +105,56 @@ def _configure_cors(fastapi_app: FastAPI, settings: Settings) -> None:
     )
 
 
+def _start_health_monitor(settings: Settings) -> HealthMonitor:
+    """
+    Attach a health monitor to the router the API routes use, run one probe
+    round so health is fresh before serving, and start it. Blocking: building
+    the router and probing do network I/O.
+    """
+    from core_router.health_monitor import HealthMonitorPolicy
+
+    from .services.router_client import get_router
+
+    monitor = get_router().health_monitor(
+        HealthMonitorPolicy(
+            interval_seconds=max(1, settings.health_check_interval_seconds),
+            timeout_seconds=max(1, settings.health_check_timeout_seconds),
+        )
+    )
+    monitor.run_once()
+    monitor.start()
+    return monitor
+
+
+def _make_lifespan(
+    settings: Settings,
+) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
+    """
+    Build the app lifespan: start the health monitor of the API's
+    ServiceRouter on startup (unless disabled in settings) and stop it on
+    shutdown.
+    """
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        monitor = None
+        if settings.health_monitor_enabled:
+            try:
+                # Off the event loop: router creation and the first probes block
+                monitor = await asyncio.to_thread(_start_health_monitor, settings)
+                log.info("Started service health monitor")
+            except Exception:  # pragma: no cover
+                log.exception("Failed to start service health monitor")
+                monitor = None
+        try:
+            yield
+        finally:
+            if monitor is not None:
+                await asyncio.to_thread(monitor.stop, settings.health_check_timeout_seconds)
+
+    return lifespan
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application with:
@@ -107,6 +163,7 @@ def create_app() -> FastAPI:
     - Structured logging and request/response logging
     - Unified error handlers
     - Conditional OpenAPI/docs exposure in dev
+    - Background service health monitor for the app lifespan
     """
     settings = Settings()  # reads env with DINOAIR_ prefix
 
@@ -126,6 +183,7 @@ def create_app() -> FastAPI:
         docs_url=docs_url,
         redoc_url=redoc_url,
         default_response_class=ORJSONResponse,
+        lifespan=_make_lifespan(settings),
     )
 
     # Register exception handlers (canonical ErrorResponse responses)
@@ -1,86 +1,265 @@
 """
-Enhanced FastAPI middleware for Datadog metrics collection.
-Integrates with the DinoAir API to collect custom business and performance metrics.
+Pure-ASGI metrics middleware for the DinoAir API (Datadog via utils.metrics).
+
+Per HTTP request it measures, by hooking `send`:
+- time to first byte (until http.response.start is sent) and total duration
+- response status and body bytes (summed over http.response.body messages)
+
+Requests are labelled by method and the matched route template (e.g.
+"/notes/{note_id}"), never the raw path: unmatched paths share one label and
+at most `max_routes` templates are tracked before further ones fold into
+"other". Samples are aggregated in process (counts, byte totals, log-linear
+latency histograms), so a request only updates in-memory state. A background
+task started with the app lifespan (or by the first request when the server
+runs without one) sends them to utils.metrics every `flush_interval_seconds`,
+and what is left is sent at lifespan shutdown.
+
+Latencies are sent as timings, one packet per non-empty histogram bucket at
+the bucket's value with sample rate 1/count, so Datadog computes percentiles
+across all processes without a packet per request.
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
 import time
-from typing import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Message, Receive, Scope, Send
 
-from utils.metrics import get_metrics_client, track_api_request, track_security_event
+from core_router.histogram import LogLinearHistogram
+from utils.metrics import DinoAirMetrics, get_metrics_client, track_security_event
 
+# Local alias to avoid linter/editor false positives on starlette.types.ASGIApp
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect API metrics for Datadog."""
+log = logging.getLogger("api.middleware.metrics")
 
-    def __init__(self, app):
-        super().__init__(app)
-        self.metrics = get_metrics_client()
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+UNMATCHED_ROUTE = "unmatched"
+OVERFLOW_ROUTE = "other"
+# Statuses from here up also count as api.errors
+ERROR_STATUS = 400
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and collect metrics."""
-        start_time = time.time()
+# Business counters derived from route templates at flush time
+ROUTE_COUNTERS = {
+    "/health": "health_checks.total",
+    "/translate": "translation.requests.total",
+    "/docs": "documentation.views",
+}
 
-        # Extract request information
-        method = request.method
-        path = request.url.path
 
-        # Track the incoming request
-        self.metrics.increment("api.requests.total", tags=[f"method:{method}", f"endpoint:{path}"])
+@dataclass
+class _Series:
+    """Aggregated samples for one (method, route, status) label set."""
 
-        try:
-            # Process the request
-            response = await call_next(request)
-
-            # Calculate response time
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Track the completed request with all details
-            track_api_request(
-                endpoint=path,
-                method=method,
-                status_code=response.status_code,
-                duration_ms=duration_ms,
-            )
+    count: int = 0
+    response_bytes: int = 0
+    duration: LogLinearHistogram = field(default_factory=LogLinearHistogram)
+    ttfb: LogLinearHistogram = field(default_factory=LogLinearHistogram)
 
-            # Track specific metrics based on endpoint
-            if path.startswith("/health"):
-                self.metrics.increment("health_checks.total")
-            elif path.startswith("/translate"):
-                self.metrics.increment("translation.requests.total")
-            elif path.startswith("/docs"):
-                self.metrics.increment("documentation.views")
 
-            # Track response size if available
-            if hasattr(response, "headers") and "content-length" in response.headers:
-                size = int(response.headers["content-length"])
-                self.metrics.histogram("api.response.size", size, tags=[f"endpoint:{path}"])
+class MetricsMiddleware:
+    """ASGI middleware collecting bounded-cardinality API metrics for Datadog."""
 
-            return response
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        flush_interval_seconds: float = 10.0,
+        max_routes: int = 200,
+        metrics: DinoAirMetrics | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.app = app
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_routes = max(1, max_routes)
+        self._metrics = metrics
+        self._clock = clock
+        self._routes: set[str] = set()
+        self._series: dict[tuple[str, str, int], _Series] = {}
+        # (method, route, error type) -> count of unhandled exceptions
+        self._exceptions: dict[tuple[str, str, str], int] = {}
+        self._flush_task: asyncio.Task[None] | None = None
 
-        except Exception as e:
-            # Track errors
-            duration_ms = (time.time() - start_time) * 1000
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope.get("type") == "lifespan":
+            return await self.app(scope, receive, self._lifespan_send(send))
+        if scope.get("type") != "http":
+            return await self.app(scope, receive, send)
 
-            self.metrics.increment(
-                "api.errors.total",
-                tags=[f"method:{method}", f"endpoint:{path}", f"error_type:{type(e).__name__}"],
-            )
+        self._ensure_flusher()
+        started = self._clock()
+        state: dict[str, Any] = {"status": None, "ttfb": None, "bytes": 0}
+
+        async def send_wrapper(message: Message) -> None:
+            kind = message.get("type")
+            if kind == "http.response.start":
+                state["status"] = int(message.get("status", 0))
+                state["ttfb"] = self._clock() - started
+            elif kind == "http.response.body":
+                state["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            self._record_exception(scope, exc)
+            if state["status"] is None:
+                state["status"] = 500
+            raise
+        finally:
+            self._record(scope, state, self._clock() - started)
+
+    # -------------------------
+    # Aggregation
+    # -------------------------
+
+    def _route_label(self, scope: Scope) -> str:
+        route = scope.get("route")
+        template = getattr(route, "path_format", None) or getattr(route, "path", None)
+        if not isinstance(template, str) or not template:
+            return UNMATCHED_ROUTE
+        if template not in self._routes:
+            if len(self._routes) >= self.max_routes:
+                return OVERFLOW_ROUTE
+            self._routes.add(template)
+        return template
+
+    @staticmethod
+    def _method_label(scope: Scope) -> str:
+        method = str(scope.get("method", "")).upper()
+        return method if method in KNOWN_METHODS else "OTHER"
 
-            # Track security events for certain error types
-            if isinstance(e, (PermissionError, ValueError)):
+    def _record(self, scope: Scope, state: dict[str, Any], duration_s: float) -> None:
+        key = (self._method_label(scope), self._route_label(scope), state["status"] or 500)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        series.count += 1
+        series.response_bytes += state["bytes"]
+        series.duration.record(duration_s * 1000)
+        if state["ttfb"] is not None:
+            series.ttfb.record(state["ttfb"] * 1000)
+
+    def _record_exception(self, scope: Scope, exc: Exception) -> None:
+        method, route = self._method_label(scope), self._route_label(scope)
+        key = (method, route, type(exc).__name__)
+        self._exceptions[key] = self._exceptions.get(key, 0) + 1
+        # Security-relevant failures are rare; report them as they happen
+        if isinstance(exc, PermissionError | ValueError):
+            try:
                 track_security_event(
                     event_type="api_error",
                     severity="medium",
-                    details={"endpoint": path, "error": str(e)},
+                    details={"endpoint": route, "error": type(exc).__name__},
+                    metrics=self._metrics,
                 )
+            except Exception:  # pragma: no cover - metrics must never break requests
+                log.debug("security event not sent", exc_info=True)
+
+    # -------------------------
+    # Flushing
+    # -------------------------
+
+    def flush(self) -> None:
+        """Send and reset the aggregated metrics. Never raises."""
+        self._emit_safely(*self._take())
+
+    async def _flush_loop(self) -> None:
+        """Flush every flush_interval_seconds; sending runs in a worker thread."""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            # Swap the aggregates on the event loop, where requests record into them
+            series, exceptions = self._take()
+            if series or exceptions:
+                await asyncio.to_thread(self._emit_safely, series, exceptions)
+
+    def _ensure_flusher(self) -> None:
+        """Start the flush task on the running event loop unless it runs there already."""
+        loop = asyncio.get_running_loop()
+        task = self._flush_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._flush_task = loop.create_task(self._flush_loop())
+
+    async def _stop_flusher(self) -> None:
+        task, self._flush_task = self._flush_task, None
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def _take(
+        self,
+    ) -> tuple[dict[tuple[str, str, int], _Series], dict[tuple[str, str, str], int]]:
+        series, self._series = self._series, {}
+        exceptions, self._exceptions = self._exceptions, {}
+        return series, exceptions
 
-            self.metrics.timing(
-                "api.request_duration",
-                duration_ms,
-                tags=[f"method:{method}", f"endpoint:{path}", "status:error"],
+    def _emit_safely(
+        self,
+        series: dict[tuple[str, str, int], _Series],
+        exceptions: dict[tuple[str, str, str], int],
+    ) -> None:
+        if not series and not exceptions:
+            return
+        try:
+            self._emit(series, exceptions)
+        except Exception:
+            log.warning("Failed to flush API metrics", exc_info=True)
+
+    def _emit(
+        self,
+        series: dict[tuple[str, str, int], _Series],
+        exceptions: dict[tuple[str, str, str], int],
+    ) -> None:
+        metrics = self._metrics or get_metrics_client()
+        business: dict[str, int] = {}
+        for (method, route, status), agg in series.items():
+            tags = [f"method:{method}", f"endpoint:{route}", f"status_code:{status}"]
+            metrics.increment("api.requests", agg.count, tags=tags)
+            if status >= ERROR_STATUS:
+                metrics.increment("api.errors", agg.count, tags=tags)
+            metrics.increment("api.response.bytes", agg.response_bytes, tags=tags)
+            self._emit_latency(metrics, "api.request_duration", agg.duration, tags)
+            self._emit_latency(metrics, "api.ttfb", agg.ttfb, tags)
+            for prefix, counter in ROUTE_COUNTERS.items():
+                if route.startswith(prefix):
+                    business[counter] = business.get(counter, 0) + agg.count
+        for counter, count in business.items():
+            metrics.increment(counter, count)
+        for (method, route, error_type), count in exceptions.items():
+            metrics.increment(
+                "api.errors.total",
+                count,
+                tags=[f"method:{method}", f"endpoint:{route}", f"error_type:{error_type}"],
             )
 
-            raise
+    @staticmethod
+    def _emit_latency(
+        metrics: DinoAirMetrics, name: str, hist: LogLinearHistogram, tags: list[str]
+    ) -> None:
+        # Per-process quantile gauges cannot be combined across processes; one
+        # timing per bucket, weighted by its count through the statsd sample
+        # rate, is aggregated by the agent like any other statsd histogram
+        for value, count in hist.buckets():
+            metrics.timing(name, value, tags=tags, count=count)
+
+    def _lifespan_send(self, send: Send) -> Send:
+        """Start the flush task at startup; stop it and flush what is left at shutdown."""
+
+        async def lifespan_send(message: Message) -> None:
+            kind = message.get("type")
+            if kind == "lifespan.startup.complete":
+                self._ensure_flusher()
+            elif kind == "lifespan.shutdown.complete":
+                await self._stop_flusher()
+                self.flush()
+            await send(message)
+
+        return lifespan_send
@@ -29,7 +29,14 @@ class ExecuteRequest(BaseModel):
     payload: dict[str, Any] = Field(default_factory=dict)
 
 
-PolicyLiteral = Literal["first_healthy", "round_robin", "lowest_latency"]
+PolicyLiteral = Literal[
+    "first_healthy",
+    "round_robin",
+    "weighted_round_robin",
+    "lowest_latency",
+    "p2c",
+    "least_outstanding",
+]
 
 
 class ExecuteByRequest(BaseModel):
@@ -71,7 +78,7 @@ async def router_execute(req: ExecuteRequest) -> Any:
 async def router_execute_by(req: ExecuteByRequest) -> Any:
     """
     POST /router/executeBy
-    Body: { tag: str, policy?: 'first_healthy'|'round_robin'|'lowest_latency', payload: dict }
+    Body: { tag: str, policy?: PolicyLiteral value, payload: dict }
     Calls core router.execute_by(...) and returns the result (JSON-serializable).
     """
     r = router_client.get_router()
@@ -100,3 +107,14 @@ async def router_metrics() -> dict[str, Any]:
     """
     _ = router_client.get_router()  # ensure initialization
     return core_metrics.snapshot()
+
+
+@router.get("/router/metrics/latency", tags=["router"])
+async def router_latency(service: str | None = None, buckets: bool = False) -> dict[str, Any]:
+    """
+    GET /router/metrics/latency?service=&buckets=
+    Latency histogram summaries (p50..p999) per service for the 1m, 5m and 15m
+    windows and the process lifetime; buckets=true adds mergeable bucket counts.
+    """
+    _ = router_client.get_router()  # ensure initialization
+    return core_metrics.histogram_snapshot(service, include_buckets=buckets)
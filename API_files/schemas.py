@@ -5,10 +5,12 @@ from enum import Enum
 from typing import Any, cast
 
 from pydantic import BaseModel, Field, field_validator
+from typing_extensions import TypeAliasType
 
 # Type definitions for better type safety (aligned with core_router and routing schemas)
 JSONPrimitive = str | int | float | bool | None
-JSONValue = JSONPrimitive | dict[str, "JSONValue"] | list["JSONValue"]
+# Named recursive alias: pydantic recurses forever on an implicit one
+JSONValue = TypeAliasType("JSONValue", "JSONPrimitive | dict[str, JSONValue] | list[JSONValue]")
 
 # Shared validation messages
 QUERY_EMPTY_ERROR = "query must not be empty"
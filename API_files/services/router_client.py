@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import threading
 from collections.abc import Mapping, Sequence
 from contextlib import suppress
 from typing import Any, cast
@@ -11,7 +12,8 @@ from core_router.router import ServiceRouter
 
 from ..settings import Settings, get_lmstudio_env
 
-_router_singleton: ServiceRouter | None = None
+# Process-wide router, set lazily by get_router() or by set_router()
+_router_singleton: dict[str, ServiceRouter | None] = {"router": None}
 
 
 def _get_adapter_value(svc: object) -> str | None:
@@ -107,38 +109,53 @@ def _apply_lmstudio_env_overrides(services: Sequence[Any]) -> list[Any]:
     return out
 
 
-_router_singleton = None
-
-
-@lru_cache(maxsize=1)
-    def get_router() -> ServiceRouter:
-        """
-        Return a process-wide ServiceRouter singleton initialized
-        from a services file. This keeps the API layer decoupled
-        from specific adapters.
-
-        The default file is 'config/services.lmstudio.yaml'.
-        It can be overridden later via the DINO_SERVICES_FILE
-        environment variable in a follow-up PR.
-        """
-        # Resolve services file path with layered precedence:
-        # 1) Env override DINO_SERVICES_FILE
-        # 2) Settings().services_config_path (DINOAIR_SERVICES_FILE)
-        # 3) Default "config/services.lmstudio.yaml"
-        env_file = os.getenv("DINO_SERVICES_FILE")
-        if env_file and str(env_file).strip():
-            services_file = env_file
-        else:
-            try:
-                settings = Settings()
-                settings_file = getattr(settings, "services_config_path", None)
-            except Exception:
-                settings_file = None
-            services_file = settings_file or "config/services.lmstudio.yaml"
-
-        services = load_services_from_file(services_file)
-        services = _apply_lmstudio_env_overrides(services)
-        registry = ServiceRegistry()
-        for s in services:
-            registry.register(s)
-        return ServiceRouter(registry)
+_router_singleton_lock = threading.Lock()
+
+
+def get_router() -> ServiceRouter:
+    """
+    Return a process-wide ServiceRouter singleton initialized
+    from a services file. This keeps the API layer decoupled
+    from specific adapters.
+
+    The default file is 'config/services.lmstudio.yaml'.
+    It can be overridden later via the DINO_SERVICES_FILE
+    environment variable in a follow-up PR.
+    """
+    router = _router_singleton["router"]
+    if router is None:
+        with _router_singleton_lock:
+            router = _router_singleton["router"]
+            if router is None:
+                router = _router_singleton["router"] = _create_router()
+    return router
+
+
+def set_router(router: ServiceRouter | None) -> None:
+    """Set or reset the process-wide ServiceRouter singleton (allow None for tests)."""
+    with _router_singleton_lock:
+        _router_singleton["router"] = router
+
+
+def _create_router() -> ServiceRouter:
+    # Resolve services file path with layered precedence:
+    # 1) Env override DINO_SERVICES_FILE
+    # 2) Settings().services_config_path (DINOAIR_SERVICES_FILE)
+    # 3) Default "config/services.lmstudio.yaml"
+    env_file = os.getenv("DINO_SERVICES_FILE")
+    if env_file and str(env_file).strip():
+        services_file = env_file
+    else:
+        try:
+            settings = Settings()
+            settings_file = getattr(settings, "services_config_path", None)
+        except Exception:
+            settings_file = None
+        services_file = settings_file or "config/services.lmstudio.yaml"
+
+    services = load_services_from_file(services_file)
+    services = _apply_lmstudio_env_overrides(services)
+    registry = ServiceRegistry()
+    for s in services:
+        registry.register(s)
+    return ServiceRouter(registry)
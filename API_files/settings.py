@@ -138,6 +138,9 @@ class Settings:
         - DINOAIR_MAX_REQUEST_BODY_BYTES: int bytes
             (default: 10_485_760 = 10 MiB)
         - DINOAIR_EXPOSE_OPENAPI_IN_DEV: bool (default: true)
+        - DINOAIR_HEALTH_MONITOR_ENABLED: bool (default: true)
+        - DINOAIR_HEALTH_CHECK_INTERVAL_SECONDS: int seconds (default: 10)
+        - DINOAIR_HEALTH_CHECK_TIMEOUT_SECONDS: int seconds (default: 2)
     """
 
     def __init__(self) -> None:
@@ -214,6 +217,17 @@ class Settings:
             _get_env("DINOAIR_RAG_WATCHDOG_MAX_WORKERS"), 2
         )
 
+        # Background service health checks (core_router.health_monitor)
+        self.health_monitor_enabled: bool = _parse_bool(
+            _get_env("DINOAIR_HEALTH_MONITOR_ENABLED"), True
+        )
+        self.health_check_interval_seconds: int = _parse_int(
+            _get_env("DINOAIR_HEALTH_CHECK_INTERVAL_SECONDS"), 10
+        )
+        self.health_check_timeout_seconds: int = _parse_int(
+            _get_env("DINOAIR_HEALTH_CHECK_TIMEOUT_SECONDS"), 2
+        )
+
         # Optional override for services config path (used by ServiceRouter)
         # Env var: DINOAIR_SERVICES_FILE
         self.services_config_path: str | None = _get_env("DINOAIR_SERVICES_FILE") or None
@@ -8,8 +8,16 @@ This top-level package exposes minimal, lightweight conveniences.
 from __future__ import annotations
 
 from .adapters import ServiceAdapter, make_adapter
-from .errors import AdapterError, NoHealthyService, ServiceNotFound, ValidationError
+from .circuit import CircuitPolicy, CircuitState
+from .errors import (
+    AdapterError,
+    CircuitOpenError,
+    NoHealthyService,
+    ServiceNotFound,
+    ValidationError,
+)
 from .health import HealthState
+from .hedging import HedgePolicy
 from .metrics import record_error, record_success
 from .metrics import snapshot as metrics_snapshot
 from .router import ServiceRouter, create_router, get_router, set_router
@@ -21,8 +29,14 @@ __all__ = [
     "NoHealthyService",
     "ValidationError",
     "AdapterError",
+    "CircuitOpenError",
     # health
     "HealthState",
+    # circuit breaker
+    "CircuitPolicy",
+    "CircuitState",
+    # hedging
+    "HedgePolicy",
     # metrics
     "record_success",
     "record_error",
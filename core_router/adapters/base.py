@@ -3,15 +3,22 @@ Adapter protocol and utilities for core_router.
 
 Adapters encapsulate transport/execution details for services.
 They must be synchronous and SHOULD NOT mutate the provided payload.
+
+Lifecycle:
+- ServiceRouter keeps one adapter per service and reuses it across calls.
+- Adapters MAY define open() and close(); the router calls open() before first
+  use and close() when the service is re-registered, unregistered or the router
+  is closed. Use them for pooled transports and other per-adapter resources.
 """
 
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import Any, Protocol, runtime_checkable
 
 from ..errors import AdapterError
 
-__all__ = ["ServiceAdapter", "ensure_protocol"]
+__all__ = ["ServiceAdapter", "close_adapter", "ensure_protocol", "open_adapter"]
 
 
 @runtime_checkable
@@ -39,6 +46,21 @@ class ServiceAdapter(Protocol):
         ...
 
 
+def open_adapter(adapter: Any) -> None:
+    """Call the adapter's optional open() hook."""
+    hook = getattr(adapter, "open", None)
+    if callable(hook):
+        hook()
+
+
+def close_adapter(adapter: Any) -> None:
+    """Call the adapter's optional close() hook. Never raises."""
+    hook = getattr(adapter, "close", None)
+    if callable(hook):
+        with suppress(Exception):
+            hook()
+
+
 def ensure_protocol(obj: Any) -> None:
     """
     Ensure the given object satisfies the ServiceAdapter protocol at runtime.
@@ -11,7 +11,8 @@ Configuration resolution (first match wins):
 - Safe defaults: base_url=http://127.0.0.1:1234, timeout=15s
 
 HTTP client:
-- httpx.Client with connect/read/write timeouts
+- httpx.Client with connect/read/write timeouts; open() keeps one pooled client
+  (keep-alive connections) until close(), otherwise each request uses its own
 - Bounded retries (default 3) on network errors and 5xx (except 501)
 - Exponential backoff with jitter between attempts
 - Authorization header added when API key provided via env or adapter_config.headers
@@ -122,6 +123,19 @@ class LMStudioAdapter(ServiceAdapter):
         self._backoff_base: float = 0.25  # seconds
         self._backoff_cap: float = 2.0
 
+        self._client: httpx.Client | None = None
+
+    def open(self) -> None:
+        """Create the pooled HTTP client reused by invoke() until close()."""
+        if self._client is None:
+            self._client = httpx.Client(timeout=self._timeout)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if open."""
+        client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
     def ping(self) -> bool:
         """
         Lightweight liveness probe of base_url with ~1s timeout.
@@ -289,8 +303,11 @@ class LMStudioAdapter(ServiceAdapter):
         Raises:
             AdapterError: On non-retryable errors
         """
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.post(url, json=body, headers=headers)
+        if self._client is not None:
+            resp = self._client.post(url, json=body, headers=headers)
+        else:
+            with httpx.Client(timeout=self._timeout) as client:
+                resp = client.post(url, json=body, headers=headers)
 
         if 200 <= resp.status_code < 300:
             return self._parse_successful_response(resp)
@@ -7,8 +7,10 @@ Configuration (adapter_config):
 }
 
 Behavior:
+- The function is resolved once at construction; if that fails (e.g. the module
+  is not importable yet) resolution is retried on the next ping()/invoke().
 - ping() returns True if import/callable checks succeed; else False.
-- invoke(...) imports and calls the function with a copy of payload.
+- invoke(...) calls the function with a copy of payload.
   Any failure is wrapped as AdapterError(adapter="local_python", reason="...").
 
 Compatibility:
@@ -20,6 +22,7 @@ Compatibility:
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
+from contextlib import suppress
 from importlib import import_module
 from typing import Any
 
@@ -91,6 +94,15 @@ class LocalPythonAdapter(ServiceAdapter):
                 adapter="local_python",
                 reason="adapter_config['function_path'] must be non-empty",
             )
+        self._func: Callable[[dict[str, Any]], object] | None = None
+        with suppress(Exception):
+            self._func = _resolve_function(self._path)
+
+    def _function(self) -> Callable[[dict[str, Any]], object]:
+        """Return the resolved function, resolving it now if construction could not."""
+        if self._func is None:
+            self._func = _resolve_function(self._path)
+        return self._func
 
     def ping(self) -> bool:
         """
@@ -98,7 +110,7 @@ class LocalPythonAdapter(ServiceAdapter):
         Returns False on failure.
         """
         try:
-            _resolve_function(self._path)
+            self._function()
             return True
         except Exception:
             return False
@@ -113,7 +125,7 @@ class LocalPythonAdapter(ServiceAdapter):
         """
         _, payload = _extract_invoke_args(a, b)
         try:
-            func = _resolve_function(self._path)
+            func = self._function()
             return func(dict(payload))
         except AdapterError:
             raise
@@ -0,0 +1,161 @@
+"""
+Live load tracking and load-aware selection for ServiceRouter.
+
+LoadTracker keeps, per service, an exponentially weighted moving average of
+request latency and the number of requests in flight, both updated by
+ServiceRouter.execute. Selection helpers use them together with the static
+ServiceDescriptor.weight:
+
+- power_of_two_choices: sample two candidates (weighted), keep the one with
+  the lower cost ewma_ms * (in_flight + 1) / weight
+- least_outstanding: fewest in-flight requests per unit of weight
+- SmoothWeightedRoundRobin: nginx-style interleaved weighted rotation
+
+Services without latency samples cost 0 so new replicas receive traffic.
+"""
+
+from __future__ import annotations
+
+import random
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .registry import ServiceDescriptor
+
+__all__ = [
+    "LoadTracker",
+    "SmoothWeightedRoundRobin",
+    "least_outstanding",
+    "power_of_two_choices",
+]
+
+EWMA_ALPHA = 0.3
+
+
+def _weight(desc: ServiceDescriptor) -> float:
+    w = getattr(desc, "weight", 1.0)
+    return float(w) if isinstance(w, int | float) and w > 0 else 1.0
+
+
+class LoadTracker:
+    """Thread-safe per-service EWMA latency and in-flight counters."""
+
+    def __init__(self, alpha: float = EWMA_ALPHA) -> None:
+        self._alpha = alpha
+        self._lock = Lock()
+        self._ewma_ms: dict[str, float] = {}
+        self._in_flight: dict[str, int] = {}
+
+    def begin(self, service_name: str) -> None:
+        with self._lock:
+            self._in_flight[service_name] = self._in_flight.get(service_name, 0) + 1
+
+    def end(self, service_name: str, duration_ms: float | None, ok: bool = True) -> None:
+        """
+        Finish a request. duration_ms=None leaves the latency average unchanged;
+        a failed call can only raise it, so fast errors do not attract traffic.
+        """
+        with self._lock:
+            self._in_flight[service_name] = max(0, self._in_flight.get(service_name, 0) - 1)
+            if duration_ms is None:
+                return
+            prev = self._ewma_ms.get(service_name)
+            sample = max(0.0, float(duration_ms))
+            if not ok and prev is not None:
+                sample = max(sample, prev)
+            self._ewma_ms[service_name] = (
+                sample if prev is None else prev + self._alpha * (sample - prev)
+            )
+
+    def forget(self, service_name: str) -> None:
+        """Drop the latency average of a removed service (in-flight calls still finish)."""
+        with self._lock:
+            self._ewma_ms.pop(service_name, None)
+            if not self._in_flight.get(service_name):
+                self._in_flight.pop(service_name, None)
+
+    def cost(self, desc: ServiceDescriptor) -> float:
+        """Expected wait on a replica: ewma * (in_flight + 1) / weight."""
+        with self._lock:
+            ewma = self._ewma_ms.get(desc.name, 0.0)
+            in_flight = self._in_flight.get(desc.name, 0)
+        return ewma * (in_flight + 1) / _weight(desc)
+
+    def outstanding(self, desc: ServiceDescriptor) -> tuple[float, float, str]:
+        """Sort key for least_outstanding: in-flight per weight, then EWMA, then name."""
+        with self._lock:
+            ewma = self._ewma_ms.get(desc.name, 0.0)
+            in_flight = self._in_flight.get(desc.name, 0)
+        return (in_flight / _weight(desc), ewma, desc.name)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        with self._lock:
+            names = set(self._ewma_ms) | set(self._in_flight)
+            return {
+                name: {
+                    "ewma_ms": self._ewma_ms.get(name),
+                    "in_flight": self._in_flight.get(name, 0),
+                }
+                for name in sorted(names)
+            }
+
+
+def power_of_two_choices(
+    candidates: Sequence[ServiceDescriptor],
+    tracker: LoadTracker,
+    rng: random.Random | None = None,
+) -> ServiceDescriptor:
+    """Pick two distinct candidates by weight and return the cheaper one."""
+    if len(candidates) == 1:
+        return candidates[0]
+    rng = rng or random  # type: ignore[assignment]
+    weights = [_weight(d) for d in candidates]
+    first = rng.choices(range(len(candidates)), weights=weights)[0]
+    weights[first] = 0.0
+    second = rng.choices(range(len(candidates)), weights=weights)[0]
+    a, b = candidates[first], candidates[second]
+    return a if (tracker.cost(a), a.name) <= (tracker.cost(b), b.name) else b
+
+
+def least_outstanding(
+    candidates: Sequence[ServiceDescriptor], tracker: LoadTracker
+) -> ServiceDescriptor:
+    """Return the candidate with the fewest in-flight requests per unit of weight."""
+    return min(candidates, key=tracker.outstanding)
+
+
+class SmoothWeightedRoundRobin:
+    """
+    Smooth weighted round-robin per tag: weights 5:1:1 yield a a b a c a a
+    rather than bursts. State is reset for a tag when its candidate set changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._current: dict[str, dict[str, float]] = {}
+
+    def select(self, tag: str, candidates: Sequence[ServiceDescriptor]) -> ServiceDescriptor:
+        with self._lock:
+            current = self._current.get(tag)
+            names = {d.name for d in candidates}
+            if current is None or set(current) != names:
+                current = dict.fromkeys(names, 0.0)
+                self._current[tag] = current
+            total = 0.0
+            best: ServiceDescriptor | None = None
+            for desc in candidates:
+                w = _weight(desc)
+                current[desc.name] += w
+                total += w
+                if best is None or current[desc.name] > current[best.name]:
+                    best = desc
+            assert best is not None  # candidates is non-empty
+            current[best.name] -= total
+            return best
+
+    def reset(self) -> None:
+        with self._lock:
+            self._current.clear()
@@ -0,0 +1,195 @@
+"""
+Per-service circuit breaker for core_router.
+
+States:
+- CLOSED: calls flow; each backend outcome re-evaluates the failure data
+  recorded in core_router.metrics (consecutive errors, rolling error rate).
+- OPEN: calls are rejected until open_seconds have elapsed.
+- HALF_OPEN: probe calls are let through, at most max_probes at a time and no
+  more often than probe_interval_seconds; a successful probe closes the
+  circuit, a failed one re-opens it.
+
+The clock is injectable (monotonic seconds) so transitions can be driven
+deterministically in tests.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+__all__ = ["CircuitBreaker", "CircuitPolicy", "CircuitState"]
+
+
+class CircuitState(str, Enum):
+    """Discrete circuit breaker states."""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+@dataclass(frozen=True)
+class CircuitPolicy:
+    """Thresholds and timings shared by a router's circuit breakers."""
+
+    # Trip after this many consecutive errors
+    failure_threshold: int = 5
+    # ...or when the rolling error rate reaches this, once min_calls outcomes
+    # have been seen since the circuit last closed
+    error_rate_threshold: float = 0.5
+    min_calls: int = 20
+    # How long an open circuit rejects calls before probing
+    open_seconds: float = 30.0
+    # Half-open probe rate limit
+    probe_interval_seconds: float = 5.0
+    max_probes: int = 1
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a single service."""
+
+    def __init__(
+        self,
+        name: str,
+        policy: CircuitPolicy,
+        clock: Callable[[], float],
+    ) -> None:
+        self.name = name
+        self.policy = policy
+        self._clock = clock
+        self._lock = Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at: float | None = None
+        self._last_probe_at: float | None = None
+        self._probes_in_flight = 0
+        self._calls_since_close = 0
+        self._trips = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an OPEN circuit past open_seconds reports HALF_OPEN."""
+        with self._lock:
+            self._advance(self._clock())
+            return self._state
+
+    def is_available(self) -> bool:
+        """True if a call would currently be admitted (no side effects)."""
+        with self._lock:
+            now = self._clock()
+            self._advance(now)
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                return False
+            return self._probe_slot_free(now)
+
+    def allow_request(self) -> bool:
+        """Admit a call, taking a probe slot when half-open."""
+        with self._lock:
+            now = self._clock()
+            self._advance(now)
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN or not self._probe_slot_free(now):
+                return False
+            self._probes_in_flight += 1
+            self._last_probe_at = now
+            return True
+
+    def record(self, ok: bool | None, stats: Mapping[str, Any] | None = None) -> CircuitState:
+        """
+        Record the outcome of an admitted call and return the resulting state.
+
+        ok=None releases a half-open probe slot without a transition (the call
+        ended before reaching the backend, e.g. input validation).
+        stats: metrics.failure_stats() for the service, consulted on failures.
+        Outcomes arriving while the circuit is OPEN (calls admitted before it
+        tripped) are ignored, so they neither extend open_seconds nor count
+        as another trip.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._state == CircuitState.OPEN:
+                return self._state
+            probing = self._state == CircuitState.HALF_OPEN
+            if probing:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+            if ok is None:
+                return self._state
+            if probing:
+                if ok:
+                    self._close()
+                else:
+                    self._open(now)
+                return self._state
+
+            self._calls_since_close += 1
+            if not ok and self._should_trip(stats or {}):
+                self._open(now)
+            return self._state
+
+    def snapshot(self) -> dict[str, Any]:
+        """State and counters for metrics output."""
+        with self._lock:
+            now = self._clock()
+            self._advance(now)
+            retry_in = None
+            if self._state == CircuitState.OPEN and self._opened_at is not None:
+                retry_in = round(max(0.0, self._opened_at + self.policy.open_seconds - now), 3)
+            return {
+                "state": self._state.value,
+                "trips": self._trips,
+                "retry_in_s": retry_in,
+                "probes_in_flight": self._probes_in_flight,
+            }
+
+    # -------------------------
+    # Internals (callers hold self._lock)
+    # -------------------------
+
+    def _advance(self, now: float) -> None:
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and now - self._opened_at >= self.policy.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._last_probe_at = None
+            self._probes_in_flight = 0
+
+    def _probe_slot_free(self, now: float) -> bool:
+        if self._probes_in_flight >= max(1, self.policy.max_probes):
+            return False
+        return (
+            self._last_probe_at is None
+            or now - self._last_probe_at >= self.policy.probe_interval_seconds
+        )
+
+    def _should_trip(self, stats: Mapping[str, Any]) -> bool:
+        consecutive = int(stats.get("consecutive_errors") or 0)
+        if consecutive >= self.policy.failure_threshold:
+            return True
+        error_rate = float(stats.get("error_rate") or 0.0)
+        return (
+            self._calls_since_close >= self.policy.min_calls
+            and error_rate >= self.policy.error_rate_threshold
+        )
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._probes_in_flight = 0
+        self._trips += 1
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._opened_at = None
+        self._last_probe_at = None
+        self._calls_since_close = 0
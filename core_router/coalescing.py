@@ -0,0 +1,130 @@
+"""
+Request coalescing and result caching for ServiceRouter.execute.
+
+Both are opt-in per service through the descriptor:
+
+- coalesce=True: concurrent execute() calls with the same service and
+  validated payload share one backend call (single flight); followers wait
+  for the leader and receive a copy of its result or its exception.
+- cache_ttl_seconds=N (for idempotent services): successful results are
+  kept for N seconds and served without a backend call. Implies coalescing.
+
+Requests are keyed by request_key(): the service name plus a SHA-256 digest
+of the payload serialized as canonical JSON (sorted keys, compact separators).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+__all__ = ["ResultCache", "SingleFlight", "request_key"]
+
+RequestKey = tuple[str, str]
+
+
+def request_key(service_name: str, payload: Mapping[str, Any]) -> RequestKey:
+    """(service name, digest of the canonical JSON payload)."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return (service_name, hashlib.sha256(encoded.encode("utf-8")).hexdigest())
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: object = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share it."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[RequestKey, _Call] = {}
+
+    def do(self, key: RequestKey, fn: Callable[[], object]) -> tuple[object, bool]:
+        """
+        Return (result, shared). shared is False for the caller that ran fn and
+        True for callers that waited on it; the leader's exception is re-raised
+        in every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class ResultCache:
+    """Thread-safe LRU of results with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self._lock = Lock()
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[RequestKey, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: RequestKey, default: object = None) -> object:
+        """The cached value, or default when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: RequestKey, value: object, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, service_name: str | None = None) -> None:
+        """Drop every entry, or only those of one service."""
+        with self._lock:
+            if service_name is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == service_name]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -96,6 +96,9 @@ def _copy_known_fields(raw: Mapping[str, Any]) -> dict[str, Any]:
         "output_schema",
         "rate_limits",
         "deps",
+        "weight",
+        "coalesce",
+        "cache_ttl_seconds",
         "health",
         "metadata",
     )
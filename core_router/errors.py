@@ -22,6 +22,10 @@ class NoHealthyService(Exception):
     """Raised when no healthy service is available for a given tag/policy."""
 
 
+class CircuitOpenError(NoHealthyService):
+    """Raised when a service's circuit breaker rejects a call."""
+
+
 class ValidationError(Exception):
     """
     Raised when input or output data fails schema validation.
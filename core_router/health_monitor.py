@@ -0,0 +1,261 @@
+"""
+Background active health checking for core_router.
+
+HealthMonitor pings every registered service's adapter in parallel, off the
+request path, on a jittered interval:
+
+- each probe runs in a worker pool with a per-probe timeout; a probe that
+  does not answer in time counts as DOWN (and the service is not probed again
+  until the stuck ping returns)
+- probe latency feeds an EWMA that is published as health['latency_ms']
+- state changes need hysteresis: `fall` consecutive worse observations
+  before HEALTHY -> DEGRADED -> DOWN, `rise` consecutive better ones before
+  moving back up. The first observation of a service is applied directly.
+
+Results go to ServiceRegistry.update_health, so execute_by policies select on
+fresh data. Probing is injectable (probe callable, rng) and run_once()
+performs one synchronous round, so the monitor can be driven with fake
+adapters in tests.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .errors import ServiceNotFound
+from .health import HealthState
+from .health_utils import ping_with_timing
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .health_utils import SupportsPing
+    from .registry import ServiceDescriptor, ServiceRegistry
+
+__all__ = ["HealthMonitor", "HealthMonitorPolicy"]
+
+# Lower is better; used to tell upgrades from downgrades
+_RANK = {HealthState.HEALTHY: 0, HealthState.DEGRADED: 1, HealthState.DOWN: 2}
+
+
+@dataclass(frozen=True)
+class HealthMonitorPolicy:
+    """Probe schedule, timeouts and hysteresis for HealthMonitor."""
+
+    interval_seconds: float = 10.0
+    # Each round waits interval * uniform(1 - jitter, 1 + jitter)
+    jitter_ratio: float = 0.2
+    timeout_seconds: float = 2.0
+    # Probe latency smoothing
+    ewma_alpha: float = 0.3
+    # A HEALTHY probe is treated as DEGRADED while the EWMA exceeds this
+    degraded_latency_ms: float | None = None
+    # Consecutive observations needed to move up (rise) or down (fall)
+    rise: int = 2
+    fall: int = 2
+    max_workers: int = 8
+
+
+class _ProbeState:
+    __slots__ = ("state", "candidate", "streak", "ewma_ms")
+
+    def __init__(self) -> None:
+        self.state: HealthState | None = None
+        self.candidate: HealthState | None = None
+        self.streak = 0
+        self.ewma_ms: float | None = None
+
+
+class HealthMonitor:
+    """Background thread keeping ServiceRegistry health fresh."""
+
+    def __init__(
+        self,
+        registry: ServiceRegistry,
+        probe: Callable[[ServiceDescriptor], SupportsPing],
+        policy: HealthMonitorPolicy | None = None,
+        *,
+        logger: logging.Logger | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Args:
+            registry: Registry whose services are probed and updated.
+            probe: Returns the adapter to ping for a descriptor (e.g. the
+                router's cached adapter).
+            policy: Schedule and thresholds; defaults to HealthMonitorPolicy().
+            logger: Defaults to 'core_router.health_monitor'.
+            rng: Source of interval jitter.
+        """
+        self._registry = registry
+        self._probe = probe
+        self.policy = policy or HealthMonitorPolicy()
+        self._logger = logger or logging.getLogger("core_router.health_monitor")
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._states: dict[str, _ProbeState] = {}
+        self._in_flight: dict[str, Future[tuple[str, int]]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+
+    def start(self) -> None:
+        """Start the background thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="core_router-health-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the thread and release the probe pool; stuck probes are abandoned."""
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+            pool, self._pool = self._pool, None
+        if thread is not None:
+            thread.join(timeout)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def running(self) -> bool:
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def next_delay(self) -> float:
+        """Seconds until the next round: the interval with jitter applied."""
+        jitter = max(0.0, min(1.0, self.policy.jitter_ratio))
+        return self.policy.interval_seconds * self._rng.uniform(1.0 - jitter, 1.0 + jitter)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.next_delay()):
+            try:
+                self.run_once()
+            except Exception:
+                self._logger.exception("health monitor round failed")
+
+    # -------------------------
+    # Probing
+    # -------------------------
+
+    def run_once(self) -> dict[str, dict[str, Any]]:
+        """
+        Probe every registered service once, in parallel, and publish the
+        results. Returns the health dict written per service.
+        """
+        services = self._registry.list()
+        pool = self._executor()
+        started = time.monotonic()
+        submitted: dict[str, Future[tuple[str, int]]] = {}
+        with self._lock:
+            for desc in services:
+                previous = self._in_flight.get(desc.name)
+                if previous is not None and not previous.done():
+                    continue  # still stuck in an earlier round
+                future = pool.submit(self._ping, desc)
+                self._in_flight[desc.name] = future
+                submitted[desc.name] = future
+
+        wait(submitted.values(), timeout=self.policy.timeout_seconds)
+
+        results: dict[str, dict[str, Any]] = {}
+        for desc in services:
+            future = submitted.get(desc.name)
+            if future is not None and future.done():
+                observed, probe_ms = future.result()
+                error = None if observed == HealthState.HEALTHY.value else "probe failed"
+            else:
+                observed = HealthState.DOWN.value
+                probe_ms = int(round((time.monotonic() - started) * 1000))
+                error = f"probe timed out after {self.policy.timeout_seconds:g}s"
+            info = self._observe(desc.name, HealthState(observed), probe_ms, error)
+            with suppress(ServiceNotFound):
+                self._registry.update_health(desc.name, info)
+                results[desc.name] = info
+        self._forget_missing({d.name for d in services})
+        return results
+
+    def _ping(self, desc: ServiceDescriptor) -> tuple[str, int]:
+        try:
+            adapter = self._probe(desc)
+        except Exception:
+            return (HealthState.DOWN.value, 0)
+        return ping_with_timing(adapter)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=max(1, self.policy.max_workers),
+                    thread_name_prefix="core_router-health-probe",
+                )
+            return self._pool
+
+    def _observe(
+        self, name: str, observed: HealthState, probe_ms: int, error: str | None
+    ) -> dict[str, Any]:
+        """Fold one probe into the EWMA and the hysteresis state; return the health dict."""
+        policy = self.policy
+        with self._lock:
+            st = self._states.setdefault(name, _ProbeState())
+            if st.ewma_ms is None:
+                st.ewma_ms = float(probe_ms)
+            else:
+                st.ewma_ms += policy.ewma_alpha * (probe_ms - st.ewma_ms)
+
+            if (
+                observed == HealthState.HEALTHY
+                and policy.degraded_latency_ms is not None
+                and st.ewma_ms > policy.degraded_latency_ms
+            ):
+                observed = HealthState.DEGRADED
+                error = f"probe latency {st.ewma_ms:.0f} ms over {policy.degraded_latency_ms:g} ms"
+
+            previous = st.state
+            if st.state is None or observed == st.state:
+                st.state = observed
+                st.candidate, st.streak = None, 0
+            else:
+                if observed == st.candidate:
+                    st.streak += 1
+                else:
+                    st.candidate, st.streak = observed, 1
+                needed = policy.fall if _RANK[observed] > _RANK[st.state] else policy.rise
+                if st.streak >= max(1, needed):
+                    st.state = observed
+                    st.candidate, st.streak = None, 0
+
+            info: dict[str, Any] = {
+                "state": st.state.value,
+                "latency_ms": round(st.ewma_ms, 3),
+                "probe_ms": probe_ms,
+                "checked_at": time.time(),
+            }
+            if error is not None and observed != HealthState.HEALTHY:
+                info["error"] = error
+            current = st.state
+
+        if previous is not None and previous != current:
+            self._logger.info("health %s: %s -> %s", name, previous.value, current.value)
+        return info
+
+    def _forget_missing(self, names: set[str]) -> None:
+        with self._lock:
+            for name in set(self._states) - names:
+                self._states.pop(name, None)
+                self._in_flight.pop(name, None)
@@ -0,0 +1,56 @@
+"""
+Hedged request policy for ServiceRouter.execute_by.
+
+A hedged call sends the request to the first selected replica and, if no
+result has arrived after a delay (by default that replica's p95 latency from
+core_router.metrics), sends a duplicate to the next candidate; the first
+success wins. A token budget caps the hedge rate: every hedged call earns
+budget_ratio tokens (up to budget_burst) and every duplicate spends one, so
+hedges stay around budget_ratio of calls even when a backend slows down.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+
+__all__ = ["HedgeBudget", "HedgePolicy"]
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Opt-in hedging settings for execute_by."""
+
+    # Fixed hedge delay; None uses the primary's p95 latency from metrics
+    delay_ms: float | None = None
+    # Delay used when the primary has no latency samples yet
+    fallback_delay_ms: float = 50.0
+    min_delay_ms: float = 1.0
+    # Duplicates per call beyond the primary request
+    max_hedges: int = 1
+    # Hedge rate cap (tokens earned per call, and the most that can be saved up)
+    budget_ratio: float = 0.1
+    budget_burst: float = 5.0
+
+
+class HedgeBudget:
+    """Thread-safe token budget limiting how often calls are hedged."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._tokens: float | None = None
+
+    def deposit(self, policy: HedgePolicy) -> None:
+        """Credit one hedged call's worth of tokens."""
+        with self._lock:
+            # Start full so the first slow calls can be hedged
+            tokens = policy.budget_burst if self._tokens is None else self._tokens
+            self._tokens = min(policy.budget_burst, tokens + policy.budget_ratio)
+
+    def try_spend(self) -> bool:
+        """Take one token for a duplicate request; False when the budget is spent."""
+        with self._lock:
+            if self._tokens is None or self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
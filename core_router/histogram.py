@@ -0,0 +1,170 @@
+"""
+Log-linear latency histograms for core_router.metrics.
+
+LogLinearHistogram buckets values (milliseconds) on a microsecond grid: values
+below 32 us get one bucket each, and every power-of-two range above that is
+split into 32 equal sub-buckets. A bucket is therefore at most 1/32 of its
+lower bound wide (quantiles are within ~3% of the true value) and state is
+bounded by the value range, not the number of samples. Histograms with the
+same layout merge by adding counts.
+
+WindowedHistogram rotates a ring of per-slot histograms so recent views
+(1 m, 5 m, 15 m) can be merged on demand, next to a lifetime histogram.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ["QUANTILES", "WINDOWS", "LogLinearHistogram", "WindowedHistogram"]
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Quantiles reported by summary(): output key -> quantile
+QUANTILES = {"p50_ms": 0.50, "p95_ms": 0.95, "p99_ms": 0.99, "p999_ms": 0.999}
+
+# Rolling views: name -> seconds
+WINDOWS = {"1m": 60, "5m": 300, "15m": 900}
+SLOT_SECONDS = 15
+
+
+def _bucket_index(value_ms: float) -> int:
+    us = int(value_ms * 1000) if value_ms > 0 else 0
+    if us < SUB_BUCKETS:
+        return us
+    shift = us.bit_length() - 1 - SUB_BUCKET_BITS
+    return SUB_BUCKETS * (shift + 1) + (us >> shift) - SUB_BUCKETS
+
+
+def _bucket_bounds_us(index: int) -> tuple[int, int]:
+    """Inclusive [low, high] microsecond range of a bucket."""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    low = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return low, low + (1 << shift) - 1
+
+
+class LogLinearHistogram:
+    """Mergeable fixed-layout histogram of millisecond values (not thread-safe)."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value_ms: float) -> None:
+        value_ms = max(0.0, float(value_ms))
+        index = _bucket_index(value_ms)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    def merge(self, other: LogLinearHistogram) -> None:
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantiles(self, qs: list[float]) -> list[float | None]:
+        """Values at the given quantiles (0..1), in one pass over the buckets."""
+        if not self.count:
+            return [None] * len(qs)
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        ranks = [self._rank(qs[i]) for i in order]
+        out: list[float | None] = [None] * len(qs)
+        seen = 0
+        pos = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen < ranks[pos]:
+                continue
+            while pos < len(order) and seen >= ranks[pos]:
+                out[order[pos]] = self._bucket_value(index)
+                pos += 1
+            if pos == len(order):
+                break
+        return out
+
+    def buckets(self) -> Iterator[tuple[float, int]]:
+        """(value_ms, count) per non-empty bucket in ascending order."""
+        for index in sorted(self.counts):
+            yield self._bucket_value(index), self.counts[index]
+
+    def _bucket_value(self, index: int) -> float:
+        """Bucket midpoint, clamped to the observed range."""
+        low, high = _bucket_bounds_us(index)
+        return min(self.max, max(self.min, (low + high) / 2000.0))
+
+    def quantile(self, q: float) -> float | None:
+        return self.quantiles([q])[0]
+
+    def _rank(self, q: float) -> int:
+        """1-based nearest rank of quantile q."""
+        return max(1, min(self.count, math.ceil(q * self.count)))
+
+    def summary(self, include_buckets: bool = False) -> dict[str, Any]:
+        """count, min/max/avg and the QUANTILES keys; optional [[upper_ms, count]] buckets."""
+        values = self.quantiles(list(QUANTILES.values()))
+        out: dict[str, Any] = {
+            "count": self.count,
+            "min_ms": self.min if self.count else None,
+            "max_ms": self.max if self.count else None,
+            "avg_ms": self.total / self.count if self.count else None,
+        }
+        out.update(zip(QUANTILES, values, strict=True))
+        if include_buckets:
+            out["buckets"] = [
+                [(_bucket_bounds_us(index)[1] + 1) / 1000.0, self.counts[index]]
+                for index in sorted(self.counts)
+            ]
+        return out
+
+
+class WindowedHistogram:
+    """
+    Lifetime histogram plus a ring of SLOT_SECONDS slots covering the longest
+    window. A view over N seconds merges the current slot and the N /
+    SLOT_SECONDS slots before it, so it spans N to N + SLOT_SECONDS seconds.
+    """
+
+    __slots__ = ("lifetime", "_slots", "_slot_ids")
+
+    def __init__(self) -> None:
+        size = max(WINDOWS.values()) // SLOT_SECONDS + 1
+        self.lifetime = LogLinearHistogram()
+        self._slots: list[LogLinearHistogram | None] = [None] * size
+        self._slot_ids: list[int] = [-1] * size
+
+    def record(self, value_ms: float, now: float) -> None:
+        self.lifetime.record(value_ms)
+        slot_id = int(now // SLOT_SECONDS)
+        pos = slot_id % len(self._slots)
+        slot = self._slots[pos]
+        if slot is None or self._slot_ids[pos] != slot_id:
+            slot = LogLinearHistogram()
+            self._slots[pos] = slot
+            self._slot_ids[pos] = slot_id
+        slot.record(value_ms)
+
+    def window(self, seconds: float, now: float) -> LogLinearHistogram:
+        current = int(now // SLOT_SECONDS)
+        oldest = current - int(seconds // SLOT_SECONDS)
+        merged = LogLinearHistogram()
+        for slot, slot_id in zip(self._slots, self._slot_ids, strict=True):
+            if slot is not None and oldest <= slot_id <= current:
+                merged.merge(slot)
+        return merged
@@ -5,6 +5,15 @@ Public API (backwards compatible):
 - record_success(service_name: str, duration_ms: int) -> None
 - record_error(name: str, ms: int|None, msg: str|None) -> None
 - snapshot() -> dict
+- failure_stats(name: str) -> dict (consecutive errors, rolling error rate)
+- latency_percentile(name: str, pct: float) -> float | None
+- record_circuit_state(name: str, state: str) -> None
+- record_coalesced(name: str) / record_cache_hit(name: str) -> None
+- histogram_snapshot(name: str | None = None, include_buckets: bool = False) -> dict
+
+Latencies go into log-linear histograms (core_router.histogram): one for the
+process lifetime plus rotating 1 m / 5 m / 15 m windows, so tail percentiles
+stay accurate for long-running processes at a fixed cost per service.
 
 Snapshot shape (new structure):
 {
@@ -12,16 +21,37 @@ Snapshot shape (new structure):
     service_name: {
       "calls": int,
       "errors": int,
-      "avg_ms": float,
+      "avg_ms": float,         # avg and percentiles over the process lifetime
       "p50_ms": float,
       "p95_ms": float,
-      "last_ms": int | None
+      "p99_ms": float,
+      "p999_ms": float,
+      "last_ms": int | None,
+      "consecutive_errors": int,
+      "error_rate": float,     # over the last `window` outcomes
+      "rejected": int,         # ValidationErrors (bad input, rate limit); not errors
+      "coalesced": int,        # calls that shared another call's backend result
+      "cache_hits": int,       # calls served from the result cache
+      "circuit": str           # only once a router reported a circuit state
     },
     ...
   },
   "totals": {"calls": int, "errors": int}
 }
 
+histogram_snapshot() shape:
+{
+  "services": {
+    service_name: {
+      "1m" | "5m" | "15m" | "all": {
+        "count": int, "min_ms", "max_ms", "avg_ms", "p50_ms", "p95_ms",
+        "p99_ms", "p999_ms": float | None,
+        "buckets": [[upper_ms, count], ...]   # only with include_buckets=True
+      }
+    }
+  }
+}
+
 Compatibility:
 For callers expecting a flat mapping of service to stats with
 keys "ok", "error", and "latency_ms_avg", snapshot() also includes
@@ -42,12 +72,24 @@ import time
 from collections import deque
 from copy import deepcopy
 from threading import Lock
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
+
+from .histogram import QUANTILES, WINDOWS, WindowedHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 __all__ = [
     "record_success",
     "record_error",
+    "record_rejection",
     "snapshot",
+    "failure_stats",
+    "latency_percentile",
+    "record_circuit_state",
+    "record_coalesced",
+    "record_cache_hit",
+    "histogram_snapshot",
     "minimal_snapshot",
     "increment_request",
     "increment_adapter",
@@ -57,44 +99,56 @@ __all__ = [
 class _ServiceStats:
     """Rolling metrics for a single service."""
 
-    __slots__ = ("calls", "errors", "durations", "last_ms")
+    __slots__ = (
+        "calls",
+        "errors",
+        "latency",
+        "last_ms",
+        "consecutive_errors",
+        "outcomes",
+        "rejected",
+        "circuit",
+        "coalesced",
+        "cache_hits",
+    )
 
     def __init__(self, window: int = 256) -> None:
         self.calls: int = 0
         self.errors: int = 0
-        self.durations: deque[int] = deque(maxlen=max(1, window))
+        self.latency = WindowedHistogram()
         self.last_ms: int | None = None
-
-    def add_success(self, ms: int) -> None:
+        self.consecutive_errors: int = 0
+        # True for success, False for error; basis of the rolling error rate
+        self.outcomes: deque[bool] = deque(maxlen=max(1, window))
+        # Calls refused before reaching the backend; kept out of the failure
+        # stats circuit breakers read
+        self.rejected: int = 0
+        self.circuit: str | None = None
+        self.coalesced: int = 0
+        self.cache_hits: int = 0
+
+    def add_success(self, ms: int, now: float) -> None:
         ms = max(ms, 0)
         self.calls += 1
         self.last_ms = int(ms)
-        self.durations.append(int(ms))
+        self.latency.record(ms, now)
+        self.consecutive_errors = 0
+        self.outcomes.append(True)
 
     def add_error(self) -> None:
         self.errors += 1
+        self.consecutive_errors += 1
+        self.outcomes.append(False)
 
-    def calc_stats(
-        self,
-    ) -> tuple[float | None, float | None, float | None]:
-        """Return (avg_ms, p50_ms, p95_ms) over the rolling window."""
-        if not self.durations:
-            return (None, None, None)
-        data: list[int] = sorted(self.durations)
-        n = len(data)
-        avg = float(sum(data)) / float(n)
-
-        # Percentile by nearest-rank within [0..n-1]
-        def _pct(rank: float) -> float:
-            idx = int(round(rank * (n - 1)))
-            idx = max(idx, 0)
-            if idx >= n:
-                idx = n - 1
-            return float(data[idx])
-
-        p50 = _pct(0.50)
-        p95 = _pct(0.95)
-        return (avg, p50, p95)
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def calc_stats(self) -> dict[str, float | None]:
+        """Return avg_ms and the QUANTILES keys over the process lifetime."""
+        summary = self.latency.lifetime.summary()
+        return {key: summary[key] for key in ("avg_ms", *QUANTILES)}
 
 
 # Process-level timers and request counters
@@ -129,9 +183,11 @@ def increment_adapter(name: str, success: bool) -> None:
 class _Metrics:
     """Thread-safe in-memory metrics store."""
 
-    def __init__(self, window: int = 256) -> None:
+    def __init__(self, window: int = 256, clock: Callable[[], float] = time.monotonic) -> None:
         self._lock = Lock()
+        # Outcome window for error rates; latency windows are time-based
         self._window = max(1, window)
+        self._clock = clock
         self._services: dict[str, _ServiceStats] = {}
         self._total_calls: int = 0
         self._total_errors: int = 0
@@ -142,7 +198,7 @@ class _Metrics:
             if stats is None:
                 stats = _ServiceStats(window=self._window)
                 self._services[service_name] = stats
-            stats.add_success(duration_ms)
+            stats.add_success(duration_ms, self._clock())
             self._total_calls += 1
 
     def record_error(
@@ -161,6 +217,70 @@ class _Metrics:
             self._total_errors += 1
             # We intentionally do not record error durations in the window.
 
+    def record_rejection(self, service_name: str) -> None:
+        with self._lock:
+            self._stats_for(service_name).rejected += 1
+
+    def failure_stats(self, service_name: str) -> dict[str, Any]:
+        with self._lock:
+            stats = self._services.get(service_name)
+            if stats is None:
+                return {"consecutive_errors": 0, "error_rate": 0.0, "window_calls": 0}
+            return {
+                "consecutive_errors": stats.consecutive_errors,
+                "error_rate": stats.error_rate(),
+                "window_calls": len(stats.outcomes),
+            }
+
+    def latency_percentile(self, service_name: str, pct: float) -> float | None:
+        with self._lock:
+            stats = self._services.get(service_name)
+            if stats is None:
+                return None
+            recent = stats.latency.window(WINDOWS["1m"], self._clock())
+            if recent.count:
+                return recent.quantile(pct)
+            return stats.latency.lifetime.quantile(pct)
+
+    def histogram_snapshot(
+        self, service_name: str | None = None, include_buckets: bool = False
+    ) -> dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            names = [service_name] if service_name is not None else list(self._services)
+            services: dict[str, dict[str, Any]] = {}
+            for name in names:
+                stats = self._services.get(name)
+                if stats is None:
+                    continue
+                views = {
+                    label: stats.latency.window(seconds, now).summary(include_buckets)
+                    for label, seconds in WINDOWS.items()
+                }
+                views["all"] = stats.latency.lifetime.summary(include_buckets)
+                services[name] = views
+            return {"services": services}
+
+    def record_circuit_state(self, service_name: str, state: str) -> None:
+        with self._lock:
+            self._stats_for(service_name).circuit = state
+
+    def record_coalesced(self, service_name: str) -> None:
+        with self._lock:
+            self._stats_for(service_name).coalesced += 1
+
+    def record_cache_hit(self, service_name: str) -> None:
+        with self._lock:
+            self._stats_for(service_name).cache_hits += 1
+
+    def _stats_for(self, service_name: str) -> _ServiceStats:
+        """Stats for a service, created on first use (caller holds self._lock)."""
+        stats = self._services.get(service_name)
+        if stats is None:
+            stats = _ServiceStats(window=self._window)
+            self._services[service_name] = stats
+        return stats
+
     def snapshot(self) -> dict[str, Any]:
         with self._lock:
             # Build new-structure snapshot
@@ -168,16 +288,22 @@ class _Metrics:
             flat_compat: dict[str, dict[str, Any]] = {}
 
             for name, stats in self._services.items():
-                avg, p50, p95 = stats.calc_stats()
+                latency = stats.calc_stats()
+                avg = latency["avg_ms"]
                 last_value: int | None = int(stats.last_ms) if stats.last_ms is not None else None
                 services_block[name] = {
                     "calls": int(stats.calls),
                     "errors": int(stats.errors),
-                    "avg_ms": float(avg) if avg is not None else 0.0,
-                    "p50_ms": float(p50) if p50 is not None else 0.0,
-                    "p95_ms": float(p95) if p95 is not None else 0.0,
+                    **{key: float(value or 0.0) for key, value in latency.items()},
                     "last_ms": last_value,
+                    "consecutive_errors": int(stats.consecutive_errors),
+                    "error_rate": round(stats.error_rate(), 4),
+                    "rejected": int(stats.rejected),
+                    "coalesced": int(stats.coalesced),
+                    "cache_hits": int(stats.cache_hits),
                 }
+                if stats.circuit is not None:
+                    services_block[name]["circuit"] = stats.circuit
                 # Compatibility fields expected by existing tests:
                 flat_compat[name] = {
                     "ok": int(stats.calls),
@@ -223,6 +349,56 @@ def record_error(
     _STORE.record_error(service_name, duration_ms, msg)
 
 
+def record_rejection(service_name: str) -> None:
+    """
+    Count a call refused with a ValidationError (invalid input or output,
+    rate limit). Unlike record_error it leaves consecutive_errors and the
+    error rate alone, so client-side rejections never trip a circuit.
+    """
+    _STORE.record_rejection(service_name)
+
+
+def failure_stats(service_name: str) -> dict[str, Any]:
+    """
+    Return failure data for a service:
+    {"consecutive_errors": int, "error_rate": float, "window_calls": int}
+    """
+    return _STORE.failure_stats(service_name)
+
+
+def latency_percentile(service_name: str, pct: float) -> float | None:
+    """
+    Latency percentile (pct in 0..1) of successful calls over the last minute,
+    else over the process lifetime; None without samples.
+    """
+    return _STORE.latency_percentile(service_name, pct)
+
+
+def record_circuit_state(service_name: str, state: str) -> None:
+    """Record a service's circuit breaker state for snapshot() output."""
+    _STORE.record_circuit_state(service_name, state)
+
+
+def record_coalesced(service_name: str) -> None:
+    """Count a call that shared an identical in-flight call's result."""
+    _STORE.record_coalesced(service_name)
+
+
+def record_cache_hit(service_name: str) -> None:
+    """Count a call served from the router's result cache."""
+    _STORE.record_cache_hit(service_name)
+
+
+def histogram_snapshot(
+    service_name: str | None = None, include_buckets: bool = False
+) -> dict[str, Any]:
+    """
+    Latency summaries per service for the 1m, 5m and 15m windows and the
+    process lifetime ("all"); include_buckets adds mergeable bucket counts.
+    """
+    return _STORE.histogram_snapshot(service_name, include_buckets)
+
+
 def snapshot() -> dict[str, Any]:
     """
     Return a detailed snapshot of metrics including both the structured layout
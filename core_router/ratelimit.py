@@ -0,0 +1,143 @@
+"""
+Per-service token bucket rate limiting for ServiceRouter.
+
+Each service with a rate limit gets one TokenBucket holding O(1) state (token
+count and last refill time) behind its own lock, so services never contend
+with each other. Tokens refill continuously at rate_per_s up to burst.
+
+Configuration lives in ServiceDescriptor.rate_limits:
+
+    {"rpm": 300}                                  # 5/s, burst 300 (one minute)
+    {"qps": 5, "burst": 10}                       # 5/s, burst 10
+    {"rpm": 600, "burst": 20, "max_wait_ms": 250} # wait up to 250 ms for a token
+
+Without max_wait_ms an empty bucket rejects immediately. With it, a caller
+reserves the next token (the count may go negative) and sleeps until that
+token would have been refilled, provided the wait fits the deadline; waiting
+callers are therefore served in arrival order.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["RateLimit", "TokenBucket", "parse_rate_limit"]
+
+_RPM_KEYS = ("rpm", "per_minute", "perMinute", "per-minute")
+_QPS_KEYS = ("qps", "per_second", "perSecond", "per-second")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Resolved limit for one service."""
+
+    rate_per_s: float
+    burst: float
+    # 0 rejects at once when no token is available
+    max_wait_s: float = 0.0
+
+    def describe(self) -> str:
+        return f"{self.rate_per_s * 60:g} rpm, burst {self.burst:g}"
+
+
+def _positive(value: Any) -> float | None:
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    return f if f > 0 and math.isfinite(f) else None
+
+
+def parse_rate_limit(config: Any, rpm: float | None = None) -> RateLimit | None:
+    """
+    Build a RateLimit from a rate_limits mapping; None when no rate is set.
+
+    rpm: a per-minute rate resolved elsewhere (e.g. rate_limit_per_minute);
+    it takes precedence over the rates in config. The default burst is one
+    window's worth of calls (a minute for rpm, a second for qps), which keeps
+    the old sliding-window allowance.
+    """
+    cfg = cast("Mapping[str, Any]", config) if isinstance(config, Mapping) else {}
+    window_s = 60.0
+    per_window = _positive(rpm)
+    if per_window is None:
+        per_window = next((v for k in _RPM_KEYS if (v := _positive(cfg.get(k)))), None)
+    if per_window is None:
+        window_s = 1.0
+        per_window = next((v for k in _QPS_KEYS if (v := _positive(cfg.get(k)))), None)
+    if per_window is None:
+        return None
+
+    burst = _positive(cfg.get("burst")) or per_window
+    max_wait_ms = _positive(cfg.get("max_wait_ms")) or 0.0
+    return RateLimit(
+        rate_per_s=per_window / window_s,
+        burst=max(1.0, burst),
+        max_wait_s=max_wait_ms / 1000.0,
+    )
+
+
+class TokenBucket:
+    """Thread-safe token bucket; starts full."""
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.limit = limit
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = Lock()
+        self._tokens = limit.burst
+        self._updated = clock()
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available now."""
+        return self.reserve(0.0) == 0.0
+
+    def acquire(self) -> bool:
+        """
+        Take a token, sleeping up to the limit's max_wait_s for one to refill.
+        False when none can be had within the deadline.
+        """
+        wait = self.reserve(self.limit.max_wait_s)
+        if wait is None:
+            return False
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def reserve(self, max_wait_s: float) -> float | None:
+        """
+        Claim the next token and return how long to wait before using it
+        (0.0 when one is available now), or None without claiming anything
+        when the wait would exceed max_wait_s.
+        """
+        with self._lock:
+            now = self._clock()
+            rate = self.limit.rate_per_s
+            tokens = min(self.limit.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            wait = 0.0 if tokens >= 1.0 else (1.0 - tokens) / rate
+            if wait > max_wait_s:
+                self._tokens = tokens
+                return None
+            self._tokens = tokens - 1.0
+            return wait
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while waiters hold reservations)."""
+        with self._lock:
+            elapsed = self._clock() - self._updated
+            return min(self.limit.burst, self._tokens + elapsed * self.limit.rate_per_s)
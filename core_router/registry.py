@@ -8,7 +8,7 @@ Provides:
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from threading import Lock
 from typing import TYPE_CHECKING, Any
@@ -18,10 +18,14 @@ from pydantic.config import ConfigDict
 
 from .errors import ServiceNotFound
 from .health import HealthState
+from .schemas import invalidate_validators
 
 if TYPE_CHECKING:
     import builtins
 
+# Called with (event, service name, descriptor or None); events: "register", "unregister"
+RegistryListener = Callable[[str, str, "ServiceDescriptor | None"], None]
+
 
 class ServiceDescriptor(BaseModel):
     """Pydantic model for a service's static config and runtime hints."""
@@ -39,9 +43,15 @@ class ServiceDescriptor(BaseModel):
     adapter_config: dict[str, Any] = Field(default_factory=dict)
 
     # Optional operational knobs and metadata
-    # e.g. {"qps": 5} or {"rpm": 300}
+    # e.g. {"qps": 5} or {"rpm": 300, "burst": 20, "max_wait_ms": 100}; see core_router.ratelimit
     rate_limits: dict[str, Any] | None = None
     deps: list[str] | None = None
+    # share one backend call among identical concurrent execute() calls
+    coalesce: bool = False
+    # idempotent services: cache successful results this long (implies coalesce)
+    cache_ttl_seconds: float | None = Field(default=None, gt=0)
+    # relative share of traffic for weighted policies (p2c, least_outstanding, weighted_round_robin)
+    weight: float = Field(default=1.0, gt=0)
     # health snapshot: {"state": "...", "latency_ms": number}
     health: dict[str, Any] | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
@@ -56,11 +66,33 @@ class ServiceRegistry:
 
     - Services are keyed by unique 'name'.
     - Registering an existing name overwrites the previous descriptor.
+    - Listeners are notified after register/unregister (outside the lock).
     """
 
     def __init__(self) -> None:
         self._lock: Lock = Lock()
         self._services: dict[str, ServiceDescriptor] = {}
+        self._listeners: builtins.list[RegistryListener] = []
+
+    # -------------------------
+    # Listeners
+    # -------------------------
+    def subscribe(self, listener: RegistryListener) -> None:
+        """Notify listener(event, name, desc) after every register/unregister."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: RegistryListener) -> None:
+        """Stop notifying a listener added with subscribe()."""
+        with self._lock, suppress(ValueError):
+            self._listeners.remove(listener)
+
+    def _notify(self, event: str, name: str, desc: ServiceDescriptor | None) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            with suppress(Exception):
+                listener(event, name, desc)
 
     # -------------------------
     # CRUD / Lookup
@@ -74,12 +106,18 @@ class ServiceRegistry:
         sd = desc if isinstance(desc, ServiceDescriptor) else ServiceDescriptor(**dict(desc))
         with self._lock:
             self._services[sd.name] = sd
-            return sd
+        invalidate_validators(sd.name)
+        self._notify("register", sd.name, sd)
+        return sd
 
     def unregister(self, name: str) -> bool:
         """Remove a service by name. True if removed, else False."""
         with self._lock:
-            return self._services.pop(name, None) is not None
+            removed = self._services.pop(name, None) is not None
+        invalidate_validators(name)
+        if removed:
+            self._notify("unregister", name, None)
+        return removed
 
     def get_by_name(self, name: str) -> ServiceDescriptor:
         """
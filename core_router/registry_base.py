@@ -5,6 +5,6 @@ This module provides imports from registry.py for backward compatibility.
 """
 
 # Import the classes from the actual registry module
-from .registry import ServiceDescriptor, ServiceRegistry
+from .registry import ServiceDescriptor, ServiceRegistry, auto_register_from_config_and_env
 
-__all__ = ["ServiceDescriptor", "ServiceRegistry"]
+__all__ = ["ServiceDescriptor", "ServiceRegistry", "auto_register_from_config_and_env"]
@@ -3,26 +3,43 @@ Service router for DinoAir core_router.
 
 Synchronous router that:
 - validates input/output via schemas
-- enforces per-service rate limits (per-minute, sliding window)
+- enforces per-service rate limits (token bucket with burst, optional wait)
 - selects services by tag using policies
-- records metrics and updates health
+- records metrics and updates health (left to the HealthMonitor while one runs)
 - emits JSON-ish logs
+- reuses one adapter per service (keyed by an adapter config fingerprint)
+- trips a per-service circuit breaker on repeated backend failures
+- optionally hedges and retries execute_by across replicas sharing a tag
+- balances execute_by on live load (EWMA latency, in-flight requests, weights)
+- optionally coalesces identical concurrent calls and caches idempotent results
 """
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import logging
 import threading
 import time
-from collections import deque
-from collections.abc import Callable, Mapping, Sequence
-from contextlib import suppress
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, contextmanager, suppress
 from typing import Any, NoReturn, cast
 
 from .adapters import make_adapter
-from .adapters.base import ServiceAdapter
+from .adapters.base import ServiceAdapter, close_adapter, open_adapter
+from .balancing import (
+    LoadTracker,
+    SmoothWeightedRoundRobin,
+    least_outstanding,
+    power_of_two_choices,
+)
+from .circuit import CircuitBreaker, CircuitPolicy, CircuitState
+from .coalescing import RequestKey, ResultCache, SingleFlight, request_key
 from .errors import (
+    AdapterError,
+    CircuitOpenError,
     NoHealthyService,
     ServiceNotFound,
     ValidationError,
@@ -31,18 +48,57 @@ from .errors import (
 
 # Import HealthState for runtime use
 from .health import HealthState
-from .metrics import record_error, record_success
+from .health_monitor import HealthMonitor, HealthMonitorPolicy
+from .hedging import HedgeBudget, HedgePolicy
+from .metrics import (
+    failure_stats,
+    latency_percentile,
+    record_cache_hit,
+    record_circuit_state,
+    record_coalesced,
+    record_error,
+    record_rejection,
+    record_success,
+)
+from .ratelimit import RateLimit, TokenBucket, parse_rate_limit
 from .registry_base import ServiceDescriptor, ServiceRegistry
 from .schemas import validate_input, validate_output
 
 # Type alias for adapter factory to keep signatures short
 AdapterFactory = Callable[[ServiceDescriptor], ServiceAdapter]
 
+# Failures after which execute_by moves on to the next replica
+RETRYABLE_ERRORS = (AdapterError, CircuitOpenError)
+
+# execute_by policy names (aliases map onto the canonical name)
+POLICY_ALIASES = {
+    "first_healthy": "first_healthy",
+    "round_robin": "round_robin",
+    "weighted_round_robin": "weighted_round_robin",
+    "lowest_latency": "lowest_latency",
+    "p2c": "p2c",
+    "power_of_two": "p2c",
+    "least_outstanding": "least_outstanding",
+}
+
 
 def _typed_make_adapter(kind: str, cfg: dict[str, Any]) -> ServiceAdapter:
     return make_adapter(kind, cfg)
 
 
+class _LeasedProbe:
+    """Pingable handle for HealthMonitor that leases the cached adapter per ping."""
+
+    __slots__ = ("_lease",)
+
+    def __init__(self, lease: Callable[[], AbstractContextManager[ServiceAdapter]]) -> None:
+        self._lease = lease
+
+    def ping(self) -> bool:
+        with self._lease() as adapter:
+            return adapter.ping()
+
+
 # Module-level router singleton helpers
 _router_singleton: ServiceRouter | None = None
 _router_singleton_lock = threading.Lock()
@@ -121,9 +177,19 @@ class ServiceRouter:
     Service Router.
 
     - Keep synchronous; thread-safe internal state via a single lock.
-    - Per-service sliding-window rate limit (per-minute).
-    - Policies: first_healthy, round_robin, lowest_latency.
+    - Per-service token bucket rate limit (rpm/qps, burst, optional max_wait_ms),
+      each bucket behind its own lock.
+    - Policies: first_healthy, round_robin, weighted_round_robin, lowest_latency,
+      p2c, least_outstanding.
     - JSON-ish logs with keys: service, event, duration_ms, ok.
+    - Adapters are built once per service and config fingerprint, opened before
+      first use and closed on re-register, unregister and close().
+    - Per-service circuit breakers: backend failures are evaluated against the
+      metrics failure data; open circuits reject execute() and are skipped by
+      execute_by() until their rate-limited half-open probes succeed.
+    - Opt-in per service: identical concurrent execute() calls share one
+      backend call (desc.coalesce) and idempotent results are cached for
+      desc.cache_ttl_seconds (see core_router.coalescing).
     """
 
     def __init__(
@@ -132,6 +198,9 @@ class ServiceRouter:
         adapter_factory: AdapterFactory | None = None,
         *,
         logger: logging.Logger | None = None,
+        circuit_policy: CircuitPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
     ) -> None:
         """Initialize the router.
 
@@ -141,6 +210,11 @@ class ServiceRouter:
                 a ServiceDescriptor. When provided, it is used instead of the
                 default adapters.make_adapter.
             logger: Optional logger; defaults to 'core_router.router'.
+            circuit_policy: Circuit breaker thresholds; defaults to CircuitPolicy().
+            clock: Monotonic clock (seconds) for circuit breaker, rate limit and
+                result cache timing.
+            sleep: Blocks for the given seconds while a rate-limited call waits
+                for a token; pass a fake together with a fake clock.
         """
         self._registry: ServiceRegistry = registry
         self._adapter_factory = adapter_factory
@@ -149,11 +223,63 @@ class ServiceRouter:
         # Thread-safety for limiter state and RR pointers
         self._lock = threading.Lock()
 
-        # Rate limit windows: service -> deque[timestamps (monotonic)]
-        self._rate_windows: dict[str, deque[float]] = {}
+        # Rate limit buckets: service -> bucket (created on first limited call)
+        self._buckets_lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
 
         # Round-robin pointers: tag -> next index
         self._rr_pointers: dict[str, int] = {}
+        self._swrr = SmoothWeightedRoundRobin()
+
+        # Live load (EWMA latency, in-flight) for p2c / least_outstanding
+        self._load = LoadTracker()
+
+        # Name-sorted candidates per tag, rebuilt after registry changes
+        self._tag_cache: dict[str, list[ServiceDescriptor]] = {}
+        self._tag_cache_generation = 0
+
+        # Circuit breakers: service -> breaker (created on first execute)
+        self._circuit_policy = circuit_policy or CircuitPolicy()
+        self._clock = clock
+        self._sleep = sleep
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+        # Coalescing: in-flight calls and cached results by request key
+        self._single_flight = SingleFlight()
+        self._result_cache = ResultCache(clock=clock)
+
+        # Hedged execute_by: worker pool (created on first use) and rate budget
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        self._hedge_budget = HedgeBudget()
+
+        # Background prober built by health_monitor(); owns health while running
+        self._monitor: HealthMonitor | None = None
+
+        # Adapter cache: service -> (config fingerprint, opened adapter). Calls lease
+        # the adapter they use; one replaced or evicted while leased is kept open
+        # until its last lease is released.
+        self._adapters_lock = threading.Lock()
+        self._adapters: dict[str, tuple[str, ServiceAdapter]] = {}
+        # id(adapter) -> in-flight calls, and retired adapters awaiting their last release
+        self._adapter_leases: dict[int, int] = {}
+        self._retired_adapters: dict[int, ServiceAdapter] = {}
+        self._registry.subscribe(self._on_registry_change)
+
+    def close(self) -> None:
+        """Stop the health monitor, close cached adapters and stop following the registry."""
+        self._registry.unsubscribe(self._on_registry_change)
+        if self._monitor is not None:
+            self._monitor.stop()
+        with self._lock:
+            pool, self._hedge_pool = self._hedge_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        with self._adapters_lock:
+            cached = [adapter for _, adapter in self._adapters.values()]
+            self._adapters.clear()
+            idle = [adapter for adapter in cached if self._retire_locked(adapter)]
+        for adapter in idle:
+            close_adapter(adapter)
 
     # -------------------------
     # Public API
@@ -167,36 +293,57 @@ class ServiceRouter:
         Steps:
           a) Lookup descriptor.
           b) Resolve adapter kind; else raise ValidationError.
-          c) Enforce per-minute sliding-window rate limit if configured.
+          c) Take a rate limit token if configured (waiting up to max_wait_ms).
           d) Validate input.
           e) make_adapter(kind, config) and invoke.
           f) Validate output, update health, record metrics, log, return.
+        Services opting into coalescing/caching share (or skip) steps b-f for
+        identical payloads; callers get copies of the shared result.
         """
         # (using module-level HealthState import)
 
         started = time.monotonic()
         desc = self._lookup_desc_or_log_raise(started, service_name, "execute")
+        if (key := self._coalesce_key(desc, payload)) is not None:
+            return self._execute_coalesced(started, desc, payload, key)
+        return self._execute_desc(started, desc, payload)
+
+    def _execute_desc(
+        self, started: float, desc: ServiceDescriptor, payload: Mapping[str, Any]
+    ) -> object:
+        """execute() for a looked-up descriptor, without coalescing."""
+        if not self._breaker_for(desc.name).allow_request():
+            exc = CircuitOpenError(f"circuit open for service '{desc.name}'")
+            self._extracted_from_check_health_19(started, desc.name, "execute", exc)
+        self._load.begin(desc.name)
+        load_ms: float | None = None
+        load_ok = True
         try:
             kind = self._resolve_kind_or_raise(desc)
 
-            if (rpm := self._resolve_rpm(desc)) is not None and rpm > 0:
-                self._enforce_rate_limit(desc.name, rpm)
+            if (limit := self._resolve_rate_limit(desc)) is not None:
+                self._enforce_rate_limit(desc.name, limit)
 
             in_payload = validate_input(desc, dict(payload))
-            adapter = self._adapter_for(desc, kind)
-
-            result = adapter.invoke(desc, in_payload)
+            with self._leased_adapter(desc, kind) as adapter:
+                invoked = time.monotonic()
+                load_ok = False
+                result = adapter.invoke(desc, in_payload)
+                load_ok = True
+                load_ms = (time.monotonic() - invoked) * 1000
             validated = validate_output(desc, result)
 
             duration_ms = int(round((time.monotonic() - started) * 1000))
 
-            self._registry.update_health(
-                desc.name,
-                HealthState.HEALTHY,
-                latency_ms=duration_ms,
-            )
+            if not self._monitor_owns_health():
+                self._registry.update_health(
+                    desc.name,
+                    HealthState.HEALTHY,
+                    latency_ms=duration_ms,
+                )
 
             record_success(desc.name, duration_ms)
+            self._record_circuit(desc.name, True)
 
             self._log_event(
                 service=desc.name,
@@ -207,11 +354,60 @@ class ServiceRouter:
             return validated
         except ValidationError as exc:
             duration_ms = int(round((time.monotonic() - started) * 1000))
-            record_error(desc.name, duration_ms, str(exc))
-            # No health change for validation errors
+            # Counted apart from errors: no health, circuit or failure-stat change
+            record_rejection(desc.name)
+            self._record_circuit(desc.name, None)
+            self._log_event(
+                service=desc.name,
+                event="rejected",
+                duration_ms=duration_ms,
+                ok=False,
+                error=str(exc),
+            )
             return None
         except Exception as exc:
+            if not load_ok:
+                load_ms = (time.monotonic() - invoked) * 1000
             self._extracted_from_execute_77(started, desc, exc)
+        finally:
+            self._load.end(desc.name, load_ms, ok=load_ok)
+
+    @staticmethod
+    def _coalesce_key(desc: ServiceDescriptor, payload: Mapping[str, Any]) -> RequestKey | None:
+        """Request key for services opting into coalescing or caching, else None."""
+        if not (desc.coalesce or desc.cache_ttl_seconds):
+            return None
+        try:
+            validated = validate_input(desc, dict(payload))
+        except ValidationError:
+            return None  # the regular path reports it
+        return request_key(desc.name, validated)
+
+    def _execute_coalesced(
+        self,
+        started: float,
+        desc: ServiceDescriptor,
+        payload: Mapping[str, Any],
+        key: RequestKey,
+    ) -> object:
+        """Serve from the result cache, join an identical in-flight call, or lead one."""
+        ttl = desc.cache_ttl_seconds
+        if ttl and (cached := self._result_cache.get(key)) is not None:
+            record_cache_hit(desc.name)
+            self._log_event(service=desc.name, event="cache_hit", duration_ms=0, ok=True)
+            return copy.deepcopy(cached)
+
+        result, shared = self._single_flight.do(
+            key, lambda: self._execute_desc(started, desc, payload)
+        )
+        if shared:
+            record_coalesced(desc.name)
+            duration_ms = int(round((time.monotonic() - started) * 1000))
+            self._log_event(service=desc.name, event="coalesced", duration_ms=duration_ms, ok=True)
+            return copy.deepcopy(result)
+        if ttl and result is not None:
+            self._result_cache.set(key, copy.deepcopy(result), ttl)
+        return result
 
     def _extracted_from_execute_77(
         self,
@@ -221,7 +417,13 @@ class ServiceRouter:
     ) -> NoReturn:
         result = int(round((time.monotonic() - started) * 1000))
         record_error(desc.name, result, str(exc))
-        self._registry.update_health(desc.name, HealthState.DOWN, latency_ms=result, error=str(exc))
+        # The breaker decides when a failing service leaves rotation
+        if self._record_circuit(desc.name, False) == CircuitState.OPEN:
+            state = HealthState.DOWN
+        else:
+            state = self._get_health_state(desc) or HealthState.HEALTHY
+        if not self._monitor_owns_health():
+            self._registry.update_health(desc.name, state, latency_ms=result, error=str(exc))
         self._log_event(
             service=desc.name,
             event="execute",
@@ -231,6 +433,31 @@ class ServiceRouter:
         )
         raise exc
 
+    def health_monitor(self, policy: HealthMonitorPolicy | None = None) -> HealthMonitor:
+        """
+        Build a HealthMonitor that probes this router's registry through its
+        cached adapters (call start()/stop() on it).
+
+        While it runs, execute() leaves desc.health to the monitor so single
+        calls do not bypass its EWMA and hysteresis; failing backends are
+        taken out of rotation by the circuit breakers instead.
+        """
+        monitor = HealthMonitor(
+            self._registry,
+            self._probe_adapter,
+            policy,
+            logger=self._logger.getChild("health"),
+        )
+        self._monitor = monitor
+        return monitor
+
+    def _monitor_owns_health(self) -> bool:
+        return self._monitor is not None and self._monitor.running
+
+    def _probe_adapter(self, desc: ServiceDescriptor) -> _LeasedProbe:
+        kind = self._resolve_kind_or_raise(desc)
+        return _LeasedProbe(lambda: self._leased_adapter(desc, kind))
+
     # TODO: Rename method 'check_health' to 'ping_service_health' and update all references in codebase (e.g., calls in execute and monitoring logic).
     def check_health(self, service_name: str) -> dict[str, Any]:
         """
@@ -244,9 +471,8 @@ class ServiceRouter:
         desc = self._lookup_desc_or_log_raise(started, service_name, "check_health")
         kind = self._resolve_kind_or_raise(desc)
 
-        adapter = self._adapter_for(desc, kind)
-
-        state_str, adapter_ms = ping_with_timing(adapter)
+        with self._leased_adapter(desc, kind) as adapter:
+            state_str, adapter_ms = ping_with_timing(adapter)
 
         # Convert string state to HealthState enum for registry update
         state = HealthState(state_str)
@@ -289,6 +515,9 @@ class ServiceRouter:
         tag: str,
         payload: Mapping[str, Any],
         policy: str = "first_healthy",
+        *,
+        hedge: HedgePolicy | None = None,
+        retries: int = 0,
     ) -> object:
         """
         Execute a service selected by tag and policy.
@@ -296,27 +525,45 @@ class ServiceRouter:
         Policies:
           - "first_healthy": first by name-sorted order.
           - "round_robin": cycle across healthy services per tag.
+          - "weighted_round_robin": smooth weighted rotation by descriptor weight.
           - "lowest_latency": smallest health['latency_ms']; tie-break by name.
+          - "p2c" (alias "power_of_two"): of two weighted random picks, the one
+            with the lower EWMA latency x (in-flight + 1) / weight.
+          - "least_outstanding": fewest in-flight requests per unit of weight.
+          Unknown policies fall back to "first_healthy".
+        Options (opt-in; the other healthy services are the fallback replicas):
+          - hedge: after the policy's delay, also send the request to the next
+            replica and return the first success (see core_router.hedging).
+          - retries: on AdapterError/CircuitOpenError, try up to this many
+            further replicas.
         Raises:
           - ServiceNotFound if no services are registered for the tag.
           - NoHealthyService if none of the candidates are healthy.
+          - The last replica's error when every attempt failed.
         """
-        if not (candidates := self._registry.get_by_tag(tag)):
+        if not (candidates := self._candidates_for_tag(tag)):
             raise ServiceNotFound(f"No services registered for tag '{tag}'")
 
-        if not (healthy := [d for d in candidates if self._is_healthy(d)]):
+        if not (healthy := [d for d in candidates if self._is_selectable(d)]):
             raise NoHealthyService(
                 f"No healthy service available for tag '{tag}' with policy '{policy}'"
             )
 
-        p = (policy or "first_healthy").strip().lower()
+        p = POLICY_ALIASES.get((policy or "").strip().lower(), "first_healthy")
 
-        if p == "first_healthy" or p not in ["round_robin", "lowest_latency"]:
-            chosen = sorted(healthy, key=lambda d: d.name)[0]
-        elif p == "round_robin":
+        # Candidates are name-sorted, so healthy is too
+        if p == "round_robin":
             chosen = self._select_round_robin(tag, healthy)
-        else:
+        elif p == "weighted_round_robin":
+            chosen = self._swrr.select(tag, healthy)
+        elif p == "lowest_latency":
             chosen = self._select_lowest_latency(healthy)
+        elif p == "p2c":
+            chosen = power_of_two_choices(healthy, self._load)
+        elif p == "least_outstanding":
+            chosen = least_outstanding(healthy, self._load)
+        else:
+            chosen = healthy[0]
         self._log_event(
             service=chosen.name,
             event="route_select",
@@ -326,7 +573,147 @@ class ServiceRouter:
             policy=p,
         )
 
-        return self.execute(chosen.name, payload)
+        if hedge is None and retries <= 0:
+            return self.execute(chosen.name, payload)
+
+        order = [chosen, *(d for d in self._fallback_order(healthy, p) if d.name != chosen.name)]
+        if hedge is not None and len(order) > 1:
+            return self._execute_hedged(order, payload, hedge, max(0, retries))
+        return self._execute_with_retries(order, payload, max(0, retries))
+
+    # -------------------------
+    # Hedging / retries
+    # -------------------------
+
+    def _fallback_order(
+        self, healthy: Sequence[ServiceDescriptor], policy: str
+    ) -> list[ServiceDescriptor]:
+        """
+        Replica order after the chosen one: by health latency for lowest_latency,
+        by live load for p2c/least_outstanding, else by name.
+        """
+        if policy == "lowest_latency":
+            return sorted(healthy, key=self._latency_key)
+        if policy in {"p2c", "least_outstanding"}:
+            return sorted(healthy, key=lambda d: (self._load.cost(d), d.name))
+        return list(healthy)
+
+    def _execute_with_retries(
+        self, order: Sequence[ServiceDescriptor], payload: Mapping[str, Any], retries: int
+    ) -> object:
+        """Run on each replica in turn until one does not fail with a retryable error."""
+        attempts = list(order[: retries + 1])
+        for index, desc in enumerate(attempts):
+            try:
+                return self.execute(desc.name, payload)
+            except RETRYABLE_ERRORS as exc:
+                if index == len(attempts) - 1:
+                    raise
+                self._log_event(
+                    service=desc.name,
+                    event="retry_next",
+                    duration_ms=0,
+                    ok=False,
+                    error=str(exc),
+                )
+        raise NoHealthyService("no replica available")  # pragma: no cover - attempts non-empty
+
+    def _hedge_delay_s(self, service_name: str, hedge: HedgePolicy) -> float:
+        delay_ms = hedge.delay_ms
+        if delay_ms is None:
+            delay_ms = latency_percentile(service_name, 0.95)
+        if delay_ms is None:
+            delay_ms = hedge.fallback_delay_ms
+        return max(hedge.min_delay_ms, float(delay_ms)) / 1000.0
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(thread_name_prefix="core_router-hedge")
+            return self._hedge_pool
+
+    def _execute_hedged(
+        self,
+        order: Sequence[ServiceDescriptor],
+        payload: Mapping[str, Any],
+        hedge: HedgePolicy,
+        retries: int,
+    ) -> object:
+        """
+        Race the primary against delayed duplicates on the next replicas.
+
+        The first successful result is returned and queued losers are cancelled;
+        a loser already running cannot be interrupted, so it finishes in the
+        background and only its metrics/health outcome is kept. A replica failing
+        with a retryable error is replaced by the next one while retries remain;
+        with none left, the hedge is sent at once instead of after the delay.
+        """
+        pool = self._hedge_executor()
+        self._hedge_budget.deposit(hedge)
+        delay_s = self._hedge_delay_s(order[0].name, hedge)
+
+        remaining = list(order[1:])
+        pending: dict[Future[object], ServiceDescriptor] = {
+            pool.submit(self.execute, order[0].name, payload): order[0]
+        }
+        hedges = 0
+        retries_left = retries
+        last_exc: BaseException | None = None
+
+        def send_hedge() -> bool:
+            nonlocal hedges
+            if not self._hedge_budget.try_spend():
+                hedges = hedge.max_hedges  # budget spent: wait for what is in flight
+                return False
+            hedges += 1
+            desc = remaining.pop(0)
+            self._log_event(service=desc.name, event="hedge", duration_ms=0, ok=True)
+            pending[pool.submit(self.execute, desc.name, payload)] = desc
+            return True
+
+        while pending:
+            can_hedge = hedges < hedge.max_hedges and bool(remaining)
+            done, _ = wait(
+                pending, timeout=delay_s if can_hedge else None, return_when=FIRST_COMPLETED
+            )
+
+            if not done:
+                # Hedge delay elapsed with no result
+                send_hedge()
+                continue
+
+            for future in done:
+                desc = pending.pop(future)
+                try:
+                    result = future.result()
+                except RETRYABLE_ERRORS as exc:
+                    last_exc = exc
+                    if retries_left > 0 and remaining:
+                        retries_left -= 1
+                        nxt = remaining.pop(0)
+                        self._log_event(
+                            service=desc.name,
+                            event="retry_next",
+                            duration_ms=0,
+                            ok=False,
+                            error=str(exc),
+                        )
+                        pending[pool.submit(self.execute, nxt.name, payload)] = nxt
+                    elif hedges < hedge.max_hedges and remaining:
+                        # Failed before the hedge went out: send it now
+                        send_hedge()
+                    continue
+                except Exception as exc:
+                    last_exc = exc
+                    continue
+
+                for loser in pending:
+                    loser.cancel()
+                return result
+
+        if last_exc is not None:
+            raise last_exc
+        raise NoHealthyService("no replica available")  # pragma: no cover
 
     # -------------------------
     # Internals
@@ -368,15 +755,135 @@ class ServiceRouter:
             raise ValidationError(f"missing adapter kind for service '{desc.name}'")
         return kind
 
-    def _adapter_for(self, desc: ServiceDescriptor, kind: str) -> ServiceAdapter:
+    @staticmethod
+    def _adapter_fingerprint(desc: ServiceDescriptor, kind: str) -> str:
+        """Digest of what an adapter is built from; health and metadata are excluded."""
+        encoded = json.dumps(
+            {"kind": kind, "config": desc.adapter_config}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _adapter_for(
+        self, desc: ServiceDescriptor, kind: str, *, lease: bool = False
+    ) -> ServiceAdapter:
         """
-        Return an adapter instance for the given descriptor and kind using either the
-        injected factory or default.
+        Return the cached adapter for the descriptor, building (via the injected
+        factory or the default) and opening one when none matches its config.
+        With lease=True the caller holds a lease and must _release_adapter() it.
         """
-        factory: AdapterFactory = self._adapter_factory or (
-            lambda _d: _typed_make_adapter(kind, desc.adapter_config)
-        )
-        return factory(desc)
+        fingerprint = self._adapter_fingerprint(desc, kind)
+        stale: ServiceAdapter | None = None
+        with self._adapters_lock:
+            cached = self._adapters.get(desc.name)
+            if cached is not None and cached[0] == fingerprint:
+                adapter = cached[1]
+            else:
+                factory: AdapterFactory = self._adapter_factory or (
+                    lambda _d: _typed_make_adapter(kind, desc.adapter_config)
+                )
+                adapter = factory(desc)
+                open_adapter(adapter)
+                self._adapters[desc.name] = (fingerprint, adapter)
+                if cached is not None and cached[1] is not adapter:
+                    stale = self._retire_locked(cached[1])
+            if lease:
+                key = id(adapter)
+                self._adapter_leases[key] = self._adapter_leases.get(key, 0) + 1
+        if stale is not None:
+            close_adapter(stale)
+        return adapter
+
+    @contextmanager
+    def _leased_adapter(self, desc: ServiceDescriptor, kind: str) -> Iterator[ServiceAdapter]:
+        """The cached adapter, kept open until the block exits even if replaced meanwhile."""
+        adapter = self._adapter_for(desc, kind, lease=True)
+        try:
+            yield adapter
+        finally:
+            self._release_adapter(adapter)
+
+    def _release_adapter(self, adapter: ServiceAdapter) -> None:
+        """Drop one lease; close the adapter if it was retired and this was the last."""
+        key = id(adapter)
+        with self._adapters_lock:
+            remaining = self._adapter_leases.pop(key) - 1
+            if remaining:
+                self._adapter_leases[key] = remaining
+                return
+            retired = self._retired_adapters.pop(key, None)
+        if retired is not None:
+            close_adapter(retired)
+
+    def _retire_locked(self, adapter: ServiceAdapter) -> ServiceAdapter | None:
+        """
+        Take an adapter out of service (caller holds _adapters_lock). Returns it when
+        it can be closed now; a leased one is closed by its last _release_adapter().
+        """
+        if self._adapter_leases.get(id(adapter)):
+            self._retired_adapters[id(adapter)] = adapter
+            return None
+        return adapter
+
+    def _evict_adapter(self, service_name: str) -> None:
+        """Drop the cached adapter of a service, closing it once no call is using it."""
+        with self._adapters_lock:
+            cached = self._adapters.pop(service_name, None)
+            idle = self._retire_locked(cached[1]) if cached is not None else None
+        if idle is not None:
+            close_adapter(idle)
+
+    def _candidates_for_tag(self, tag: str) -> list[ServiceDescriptor]:
+        """
+        Name-sorted descriptors for a tag, cached until the registry changes.
+        Health updates mutate the cached descriptors in place, so they stay current.
+        """
+        key = (tag or "").lower()
+        with self._lock:
+            cached = self._tag_cache.get(key)
+            generation = self._tag_cache_generation
+        if cached is not None:
+            return cached
+        candidates = sorted(self._registry.get_by_tag(tag), key=lambda d: d.name)
+        with self._lock:
+            # Skip the store if the registry changed while this list was built
+            if generation == self._tag_cache_generation:
+                self._tag_cache[key] = candidates
+        return candidates
+
+    def load_snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        """Live EWMA latency (ms) and in-flight count per service."""
+        return self._load.snapshot()
+
+    def _on_registry_change(
+        self, event: str, service_name: str, desc: ServiceDescriptor | None
+    ) -> None:
+        """
+        Registry listener: drop per-tag candidate lists and cached results,
+        replace adapters on register and release them on unregister.
+        """
+        with self._lock:
+            self._tag_cache.clear()
+            self._tag_cache_generation += 1
+        self._result_cache.invalidate(service_name)
+        self._evict_adapter(service_name)
+        if event != "register" or desc is None:
+            self._load.forget(service_name)
+            with self._buckets_lock:
+                self._buckets.pop(service_name, None)
+            return
+        # Warm the new adapter so the first request does not pay for construction
+        kind = self._resolve_adapter_kind(desc)
+        if kind:
+            try:
+                self._adapter_for(desc, kind)
+            except Exception as exc:
+                self._log_event(
+                    service=service_name,
+                    event="adapter_open",
+                    duration_ms=0,
+                    ok=False,
+                    error=str(exc),
+                )
 
     @staticmethod
     def _get_health_state(desc: ServiceDescriptor) -> HealthState | None:
@@ -430,20 +937,64 @@ class ServiceRouter:
         except Exception:
             return None
 
-    def _enforce_rate_limit(self, service_name: str, rpm: int) -> None:
-        """Sliding-window limiter over the last 60 seconds."""
-        now = time.monotonic()
+    def _resolve_rate_limit(self, desc: ServiceDescriptor) -> RateLimit | None:
+        """Rate, burst and max wait from desc.rate_limits (rpm as resolved above)."""
+        return parse_rate_limit(getattr(desc, "rate_limits", None), rpm=self._resolve_rpm(desc))
+
+    def _enforce_rate_limit(self, service_name: str, limit: RateLimit) -> None:
+        """Take a token from the service's bucket or raise ValidationError."""
+        bucket = self._buckets.get(service_name)
+        if bucket is None or bucket.limit != limit:
+            with self._buckets_lock:
+                bucket = self._buckets.get(service_name)
+                # A changed limit starts a fresh bucket
+                if bucket is None or bucket.limit != limit:
+                    bucket = TokenBucket(limit, clock=self._clock, sleep=self._sleep)
+                    self._buckets[service_name] = bucket
+        if not bucket.acquire():
+            raise ValidationError(f"rate limit exceeded: {limit.describe()}")
+
+    def circuit_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Circuit breaker state per service that has been executed."""
         with self._lock:
-            dq: deque[float] = self._rate_windows.setdefault(service_name, deque())
-
-            cutoff = now - 60.0
-            while dq and dq[0] <= cutoff:
-                dq.popleft()
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in breakers.items()}
 
-            if len(dq) >= rpm:
-                raise ValidationError(f"rate limit exceeded: {rpm} rpm")
+    def _breaker_for(self, service_name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(service_name)
+            if breaker is None:
+                breaker = CircuitBreaker(service_name, self._circuit_policy, self._clock)
+                self._breakers[service_name] = breaker
+                record_circuit_state(service_name, CircuitState.CLOSED.value)
+            return breaker
+
+    def _record_circuit(self, service_name: str, ok: bool | None) -> CircuitState:
+        """Feed a call outcome to the service's breaker; publish and log transitions."""
+        breaker = self._breaker_for(service_name)
+        before = breaker.state
+        stats = failure_stats(service_name) if ok is False else None
+        after = breaker.record(ok, stats)
+        if after != before:
+            record_circuit_state(service_name, after.value)
+            self._log_event(
+                service=service_name,
+                event=f"circuit_{after.value.lower()}",
+                duration_ms=0,
+                ok=after == CircuitState.CLOSED,
+            )
+        return after
 
-            dq.append(now)
+    def _is_selectable(self, desc: ServiceDescriptor) -> bool:
+        """
+        Selection filter for execute_by: open circuits are skipped, circuits
+        ready for a half-open probe are eligible, closed ones follow health.
+        """
+        with self._lock:
+            breaker = self._breakers.get(desc.name)
+        if breaker is None or breaker.state == CircuitState.CLOSED:
+            return self._is_healthy(desc)
+        return breaker.is_available()
 
     @staticmethod
     def _is_healthy(desc: ServiceDescriptor) -> bool:
@@ -460,14 +1011,13 @@ class ServiceRouter:
         tag: str,
         healthy: Sequence[ServiceDescriptor],
     ) -> ServiceDescriptor:
-        """Round-robin among healthy services, deterministic by name."""
-        sorted_healthy = sorted(healthy, key=lambda d: d.name)
+        """Round-robin among healthy services (name-sorted by the caller)."""
         with self._lock:
             idx = self._rr_pointers.get(tag, 0)
-            if idx >= len(sorted_healthy) or idx < 0:
+            if idx >= len(healthy) or idx < 0:
                 idx = 0
-            choice = sorted_healthy[idx]
-            self._rr_pointers[tag] = (idx + 1) % len(sorted_healthy)
+            choice = healthy[idx]
+            self._rr_pointers[tag] = (idx + 1) % len(healthy)
             return choice
 
     @staticmethod
@@ -478,18 +1028,19 @@ class ServiceRouter:
         Choose the healthy service with the smallest health['latency_ms'].
         Tie-breaker: name.
         """
+        return min(healthy, key=ServiceRouter._latency_key)
 
-        def _lat(d: ServiceDescriptor) -> float:
-            h = getattr(d, "health", None)
-            if isinstance(h, dict):
-                md = cast("dict[str, Any]", h)
-                with suppress(Exception):
-                    v = float(md.get("latency_ms"))  # type: ignore[arg-type]
-                    if v >= 0:
-                        return v
-            return float("inf")
-
-        return sorted(healthy, key=lambda d: (_lat(d), d.name))[0]
+    @staticmethod
+    def _latency_key(d: ServiceDescriptor) -> tuple[float, str]:
+        """Sort key: health['latency_ms'] (unknown last), then name."""
+        h = getattr(d, "health", None)
+        if isinstance(h, dict):
+            md = cast("dict[str, Any]", h)
+            with suppress(Exception):
+                v = float(md.get("latency_ms"))  # type: ignore[arg-type]
+                if v >= 0:
+                    return (v, d.name)
+        return (float("inf"), d.name)
 
     def _log_event(
         self,
@@ -8,15 +8,21 @@ Scope:
   - required: presence enforcement
   - arrays: items.type mapped when present; default Any
 - Additional properties allowed; side-effect free.
+- Models are compiled once per (service, direction, schema hash) and cached;
+  ServiceRegistry.register/unregister invalidate a service's entries.
 
 Exports:
 - validate_input(desc, payload)
 - validate_output(desc, payload)
+- invalidate_validators(name=None)
 """
 
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import json
+import threading
 from collections.abc import Mapping
 from typing import TYPE_CHECKING, Union, cast
 
@@ -43,7 +49,11 @@ PropertyDefinition = dict[str, JSONValue]
 FieldDefinition = tuple[object, object]  # More flexible to handle Union types
 DescriptorType = Union["ServiceDescriptor", Mapping[str, JSONValue], object]
 
-__all__ = ["validate_input", "validate_output"]
+__all__ = ["invalidate_validators", "validate_input", "validate_output"]
+
+# Compiled models: (service name, "input"|"output") -> (schema hash, model)
+_MODEL_CACHE: dict[tuple[str, str], tuple[str, type[BaseModel]]] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
 
 
 class _DynamicBaseModel(BaseModel):
@@ -235,6 +245,45 @@ def _build_model_from_schema(
     )
 
 
+def _schema_hash(schema: Mapping[str, JSONValue]) -> str:
+    """Stable digest of a schema; key order does not matter."""
+    encoded = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _compiled_model(
+    name: str,
+    direction: str,
+    schema: Mapping[str, JSONValue],
+) -> type[BaseModel]:
+    """
+    Return the cached model for a service's input or output schema, building it
+    on first use or when the schema has changed since it was compiled.
+    """
+    digest = _schema_hash(schema)
+    key = (name, direction)
+    with _MODEL_CACHE_LOCK:
+        entry = _MODEL_CACHE.get(key)
+    if entry is not None and entry[0] == digest:
+        return entry[1]
+
+    model_name = f"{name.replace(' ', '_').replace('-', '_')}_{direction.capitalize()}"
+    model_class = _build_model_from_schema(schema, model_name)
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE[key] = (digest, model_class)
+    return model_class
+
+
+def invalidate_validators(name: str | None = None) -> None:
+    """Drop compiled models for one service, or for every service when name is None."""
+    with _MODEL_CACHE_LOCK:
+        if name is None:
+            _MODEL_CACHE.clear()
+            return
+        for direction in ("input", "output"):
+            _MODEL_CACHE.pop((name, direction), None)
+
+
 def validate_input(
     desc: DescriptorType,
     payload: Mapping[str, JSONValue],
@@ -250,9 +299,8 @@ def validate_input(
         return dict(payload)
 
     name = _to_service_name(desc)
-    model_name = f"{name.replace(' ', '_').replace('-', '_')}_Input"
     try:
-        model_class = _build_model_from_schema(schema, model_name)
+        model_class = _compiled_model(name, "input", schema)
         inst = model_class.model_validate(dict(payload))
         return inst.model_dump(by_alias=False, exclude_none=True)
     except PydanticValidationError as e:
@@ -283,7 +331,6 @@ def validate_output(
         return payload
 
     name = _to_service_name(desc)
-    model_name = f"{name.replace(' ', '_').replace('-', '_')}_Output"
 
     # Best-effort normalization for non-dict payloads
     candidate: dict[str, JSONValue] | object
@@ -300,7 +347,7 @@ def validate_output(
         candidate = payload
 
     try:
-        model_class = _build_model_from_schema(schema, model_name)
+        model_class = _compiled_model(name, "output", schema)
         inst = model_class.model_validate(candidate)
         return inst.model_dump(by_alias=False, exclude_none=True)
     except PydanticValidationError as e:
@@ -6,15 +6,20 @@ Manages all calendar event database operations with resilient handling.
 
 from __future__ import annotations
 
+import calendar
 import json
+import re
 import sqlite3
 import uuid
 from datetime import date, datetime, time, timedelta
-from typing import Any, Protocol, cast
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from models.calendar_event import CalendarEvent
 from utils.logger import Logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class _AppointmentsConnectionProvider(Protocol):
     """Protocol for objects providing appointments DB connections."""
@@ -49,6 +54,112 @@ _UPDATE_FIELD_SET_CLAUSES: dict[str, str] = {
 }
 
 
+# One pass over calendar_events (served by idx_events_stats); each row holds the
+# status, event type, event count, upcoming-week count and reminder count
+_EVENT_STATS_SQL = """
+    SELECT status, event_type, COUNT(*),
+           SUM(CASE WHEN status = 'scheduled'
+                     AND event_date >= date('now')
+                     AND event_date <= date('now', '+7 days') THEN 1 ELSE 0 END),
+           SUM(CASE WHEN reminder_minutes_before IS NOT NULL THEN 1 ELSE 0 END)
+    FROM calendar_events
+    GROUP BY status, event_type
+"""
+
+# Counter rows use '' for NULL so (status, event_type) can be a primary key
+_EVENT_COUNTERS_SQL = """
+    SELECT NULLIF(status, ''), NULLIF(event_type, ''), event_count, 0, reminder_count
+    FROM event_stat_counters
+    WHERE event_count > 0
+"""
+
+# "Upcoming" depends on today's date, so it stays a query (idx_events_status_date range)
+_UPCOMING_WEEK_SQL = """
+    SELECT COUNT(*) FROM calendar_events
+    WHERE status = 'scheduled'
+    AND event_date >= date('now')
+    AND event_date <= date('now', '+7 days')
+"""
+
+# Optional O(1) statistics: per (status, event_type) counters kept current by triggers
+_EVENT_COUNTER_DDL: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS event_stat_counters (
+        status TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        event_count INTEGER NOT NULL DEFAULT 0,
+        reminder_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (status, event_type)
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_counters_ai AFTER INSERT ON calendar_events BEGIN
+        INSERT INTO event_stat_counters (status, event_type, event_count, reminder_count)
+        VALUES (COALESCE(new.status, ''), COALESCE(new.event_type, ''), 1,
+                new.reminder_minutes_before IS NOT NULL)
+        ON CONFLICT(status, event_type) DO UPDATE SET
+            event_count = event_count + 1,
+            reminder_count = reminder_count + excluded.reminder_count;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_counters_ad AFTER DELETE ON calendar_events BEGIN
+        UPDATE event_stat_counters SET
+            event_count = event_count - 1,
+            reminder_count = reminder_count - (old.reminder_minutes_before IS NOT NULL)
+        WHERE status = COALESCE(old.status, '') AND event_type = COALESCE(old.event_type, '');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_counters_au
+    AFTER UPDATE OF status, event_type, reminder_minutes_before ON calendar_events BEGIN
+        UPDATE event_stat_counters SET
+            event_count = event_count - 1,
+            reminder_count = reminder_count - (old.reminder_minutes_before IS NOT NULL)
+        WHERE status = COALESCE(old.status, '') AND event_type = COALESCE(old.event_type, '');
+        INSERT INTO event_stat_counters (status, event_type, event_count, reminder_count)
+        VALUES (COALESCE(new.status, ''), COALESCE(new.event_type, ''), 1,
+                new.reminder_minutes_before IS NOT NULL)
+        ON CONFLICT(status, event_type) DO UPDATE SET
+            event_count = event_count + 1,
+            reminder_count = reminder_count + excluded.reminder_count;
+    END
+    """,
+)
+
+_EVENT_COUNTER_TRIGGERS: tuple[str, ...] = (
+    "event_counters_ai",
+    "event_counters_ad",
+    "event_counters_au",
+)
+
+
+# Reminder columns joined with the event fields shown when a reminder fires
+_REMINDER_SELECT = """
+    SELECT r.*, e.title, e.description, e.event_date,
+           e.start_time, e.location
+    FROM event_reminders r
+    JOIN calendar_events e ON r.event_id = e.id
+"""
+
+# Keep IN (...) lists well below SQLite's host parameter limit
+_ID_BATCH_SIZE = 500
+
+# Upper bound of end_ts - start_ts (all-day and overnight events end within a day),
+# which turns the overlap predicate into a bounded scan of idx_events_range
+MAX_EVENT_SPAN_SECONDS = 86399
+
+EVENT_RANGE_SQL = """
+    SELECT * FROM calendar_events
+    WHERE start_ts BETWEEN ? AND ? AND end_ts >= ?
+    ORDER BY start_ts
+"""
+
+EVENT_FTS_TABLE = "calendar_events_fts"
+SEARCH_RESULT_LIMIT = 100
+_FTS_TERM_RE = re.compile(r"\w+")
+
+
 class AppointmentsDatabase:
     """Manages appointments/calendar events database operations"""
 
@@ -56,6 +167,25 @@ class AppointmentsDatabase:
         """Initialize with database manager reference"""
         self.db_manager = db_manager
         self.logger = Logger()
+        self._event_listeners: list[Callable[[str], None]] = []
+        self._fts_available: bool | None = None
+
+    def add_event_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback run with the event id after an event is created,
+        updated or deleted (e.g. ReminderScheduler re-syncing its queue)"""
+        self._event_listeners.append(listener)
+
+    def remove_event_listener(self, listener: Callable[[str], None]) -> None:
+        """Unregister a callback added with add_event_listener"""
+        if listener in self._event_listeners:
+            self._event_listeners.remove(listener)
+
+    def _notify_event_changed(self, event_id: str) -> None:
+        for listener in list(self._event_listeners):
+            try:
+                listener(event_id)
+            except Exception as e:
+                self.logger.error(f"Event listener failed for {event_id}: {str(e)}")
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection"""
@@ -164,7 +294,8 @@ class AppointmentsDatabase:
                 conn.commit()
 
                 self.logger.info(f"Created calendar event: {event.id}")
-                return {"success": True, "id": event.id}
+            self._notify_event_changed(event.id)
+            return {"success": True, "id": event.id}
 
         except Exception as e:
             self.logger.error(f"Failed to create event: {str(e)}")
@@ -204,7 +335,8 @@ class AppointmentsDatabase:
 
                 conn.commit()
 
-                return True
+            self._notify_event_changed(event_id)
+            return True
 
         except Exception as e:
             self.logger.error(f"Failed to update event: {str(e)}")
@@ -240,7 +372,10 @@ class AppointmentsDatabase:
                 conn.commit()
 
                 rows_deleted = cursor.rowcount or 0
-                return rows_deleted > 0
+
+            if rows_deleted > 0:
+                self._notify_event_changed(event_id)
+            return rows_deleted > 0
 
         except Exception as e:
             self.logger.error(f"Failed to delete event: {str(e)}")
@@ -270,18 +405,20 @@ class AppointmentsDatabase:
             return None
 
     def get_events_for_date_range(self, start_date: date, end_date: date) -> list[CalendarEvent]:
-        """Get all events within a date range"""
+        """Get all events overlapping a date range (inclusive)
+
+        Events are matched on their start_ts/end_ts bounds, so an overnight event
+        from the day before the range is included.
+        """
+        range_start = calendar.timegm(start_date.timetuple())
+        range_end = calendar.timegm(end_date.timetuple()) + MAX_EVENT_SPAN_SECONDS
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
-                    """
-                    SELECT * FROM calendar_events
-                    WHERE event_date >= ? AND event_date <= ?
-                    ORDER BY event_date, start_time
-                """,
-                    (start_date.isoformat(), end_date.isoformat()),
+                    EVENT_RANGE_SQL,
+                    (range_start - MAX_EVENT_SPAN_SECONDS, range_end, range_start),
                 )
 
                 events = []
@@ -300,7 +437,38 @@ class AppointmentsDatabase:
         return self.get_events_for_date_range(target_date, target_date)
 
     def search_events(self, query: str) -> list[CalendarEvent]:
-        """Search events by title, description, location, or notes"""
+        """Search events by title, description, location, or notes
+
+        Uses the calendar_events_fts index when available, matching every word
+        of the query as a prefix; otherwise falls back to a LIKE scan.
+        """
+        fts_query = self._build_fts_query(query)
+        if fts_query is None or not self._has_fts_index():
+            return self._search_events_like(query)
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    f"""
+                    SELECT e.* FROM {EVENT_FTS_TABLE} f
+                    CROSS JOIN calendar_events e ON e.rowid = f.rowid
+                    WHERE {EVENT_FTS_TABLE} MATCH ?
+                    ORDER BY e.event_date DESC, e.start_time DESC
+                    LIMIT ?
+                """,
+                    (fts_query, SEARCH_RESULT_LIMIT),
+                )
+
+                return [self._row_to_event(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            self.logger.error(f"Failed to search events: {str(e)}")
+            return []
+
+    def _search_events_like(self, query: str) -> list[CalendarEvent]:
+        """Search events with LIKE '%query%' (no FTS5, or a query without words)"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
@@ -312,9 +480,15 @@ class AppointmentsDatabase:
                     WHERE title LIKE ? OR description LIKE ?
                     OR location LIKE ? OR notes LIKE ?
                     ORDER BY event_date DESC, start_time DESC
-                    LIMIT 100
+                    LIMIT ?
                 """,
-                    (search_pattern, search_pattern, search_pattern, search_pattern),
+                    (
+                        search_pattern,
+                        search_pattern,
+                        search_pattern,
+                        search_pattern,
+                        SEARCH_RESULT_LIMIT,
+                    ),
                 )
 
                 events = []
@@ -335,38 +509,80 @@ class AppointmentsDatabase:
                 cursor = conn.cursor()
 
                 cursor.execute(
-                    """
-                    SELECT r.*, e.title, e.description, e.event_date,
-                           e.start_time, e.location
-                    FROM event_reminders r
-                    JOIN calendar_events e ON r.event_id = e.id
+                    _REMINDER_SELECT
+                    + """
                     WHERE r.sent = 0 AND r.reminder_time <= datetime('now')
                     ORDER BY r.reminder_time
                 """
                 )
 
-                reminders = []
-                for row in cursor.fetchall():
-                    reminder = {
-                        "id": row[0],
-                        "event_id": row[1],
-                        "reminder_time": row[2],
-                        "sent": bool(row[3]),
-                        "sent_at": row[4],
-                        "event_title": row[5],
-                        "event_description": row[6],
-                        "event_date": row[7],
-                        "start_time": row[8],
-                        "location": row[9],
-                    }
-                    reminders.append(reminder)
-
-                return reminders
+                return [self._row_to_reminder(row) for row in cursor.fetchall()]
 
         except Exception as e:
             self.logger.error(f"Failed to get upcoming reminders: {str(e)}")
             return []
 
+    def get_pending_reminders(self, event_id: str | None = None) -> list[dict[str, Any]]:
+        """Get all unsent reminders regardless of due time, optionally for one event"""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                if event_id is None:
+                    cursor.execute(_REMINDER_SELECT + " WHERE r.sent = 0")
+                else:
+                    cursor.execute(
+                        _REMINDER_SELECT + " WHERE r.sent = 0 AND r.event_id = ?", (event_id,)
+                    )
+
+                return [self._row_to_reminder(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            self.logger.error(f"Failed to get pending reminders: {str(e)}")
+            return []
+
+    def mark_reminders_sent(self, reminder_ids: list[str]) -> int:
+        """Mark a batch of reminders (and their events) as sent in one transaction
+
+        Returns:
+            Number of reminders marked as sent
+        """
+        unique_ids = list(dict.fromkeys(reminder_ids))
+        if not unique_ids:
+            return 0
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                marked = 0
+                for start in range(0, len(unique_ids), _ID_BATCH_SIZE):
+                    batch = unique_ids[start : start + _ID_BATCH_SIZE]
+                    placeholders = ", ".join("?" * len(batch))
+                    cursor.execute(
+                        f"""
+                        UPDATE event_reminders
+                        SET sent = 1, sent_at = CURRENT_TIMESTAMP
+                        WHERE sent = 0 AND id IN ({placeholders})
+                    """,
+                        batch,
+                    )
+                    marked += cursor.rowcount or 0
+                    cursor.execute(
+                        f"""
+                        UPDATE calendar_events
+                        SET reminder_sent = 1
+                        WHERE id IN (SELECT event_id FROM event_reminders
+                                     WHERE id IN ({placeholders}))
+                    """,
+                        batch,
+                    )
+                conn.commit()
+                return marked
+
+        except Exception as e:
+            self.logger.error(f"Failed to mark reminders sent: {str(e)}")
+            return 0
+
     def mark_reminder_sent(self, reminder_id: str) -> bool:
         """Mark a reminder as sent"""
         try:
@@ -455,62 +671,98 @@ class AppointmentsDatabase:
             return []
 
     def get_event_statistics(self) -> dict[str, Any]:
-        """Get calendar event statistics"""
+        """Get calendar event statistics
+
+        Served from the trigger-maintained counter table when it is enabled
+        (see enable_stat_counters), otherwise from a single aggregate query.
+        """
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
-                stats = {}
-
-                # Total events
-                cursor.execute("SELECT COUNT(*) FROM calendar_events")
-                stats["total_events"] = cursor.fetchone()[0]
-
-                # Events by status
                 cursor.execute(
-                    """
-                    SELECT status, COUNT(*)
-                    FROM calendar_events
-                    GROUP BY status
-                """
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'event_stat_counters'"
                 )
-                stats["events_by_status"] = {row[0]: row[1] for row in cursor.fetchall()}
+                if cursor.fetchone() is None:
+                    cursor.execute(_EVENT_STATS_SQL)
+                    return self._fold_event_stats(cursor.fetchall())
 
-                # Events by type
+                cursor.execute(_EVENT_COUNTERS_SQL)
+                stats = self._fold_event_stats(cursor.fetchall())
+                cursor.execute(_UPCOMING_WEEK_SQL)
+                stats["upcoming_events_week"] = cursor.fetchone()[0]
+                return stats
+
+        except Exception as e:
+            self.logger.error(f"Failed to get event statistics: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _fold_event_stats(rows: list[tuple[Any, ...]]) -> dict[str, Any]:
+        events_by_status: dict[Any, int] = {}
+        events_by_type: dict[Any, int] = {}
+        total_events = upcoming = with_reminders = 0
+        for status, event_type, count, upcoming_count, reminder_count in rows:
+            events_by_status[status] = events_by_status.get(status, 0) + count
+            events_by_type[event_type] = events_by_type.get(event_type, 0) + count
+            total_events += count
+            upcoming += upcoming_count or 0
+            with_reminders += reminder_count or 0
+
+        return {
+            "total_events": total_events,
+            "events_by_status": events_by_status,
+            "events_by_type": events_by_type,
+            "upcoming_events_week": upcoming,
+            "events_with_reminders": with_reminders,
+        }
+
+    def enable_stat_counters(self) -> bool:
+        """Create the trigger-maintained event counter table and backfill it
+
+        Makes get_event_statistics cost O(1) plus one indexed range count, for
+        dashboards that poll it, at the cost of a counter update per event write.
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for statement in _EVENT_COUNTER_DDL:
+                    cursor.execute(statement)
+
+                # Backfill from current data inside the same transaction
+                cursor.execute("DELETE FROM event_stat_counters")
                 cursor.execute(
                     """
-                    SELECT event_type, COUNT(*)
+                    INSERT INTO event_stat_counters
+                    (status, event_type, event_count, reminder_count)
+                    SELECT COALESCE(status, ''), COALESCE(event_type, ''), COUNT(*),
+                           SUM(CASE WHEN reminder_minutes_before IS NOT NULL THEN 1 ELSE 0 END)
                     FROM calendar_events
-                    GROUP BY event_type
-                """
-                )
-                stats["events_by_type"] = {row[0]: row[1] for row in cursor.fetchall()}
-
-                # Upcoming events (next 7 days)
-                cursor.execute(
+                    GROUP BY 1, 2
                     """
-                    SELECT COUNT(*) FROM calendar_events
-                    WHERE event_date >= date('now')
-                    AND event_date <= date('now', '+7 days')
-                    AND status = 'scheduled'
-                """
                 )
-                stats["upcoming_events_week"] = cursor.fetchone()[0]
+                conn.commit()
+                return True
 
-                # Events with reminders
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) FROM calendar_events
-                    WHERE reminder_minutes_before IS NOT NULL
-                """
-                )
-                stats["events_with_reminders"] = cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to enable event stat counters: {str(e)}")
+            return False
 
-                return stats
+    def disable_stat_counters(self) -> bool:
+        """Drop the event counter table and its triggers"""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for trigger in _EVENT_COUNTER_TRIGGERS:
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                cursor.execute("DROP TABLE IF EXISTS event_stat_counters")
+                conn.commit()
+                return True
 
-        except Exception as e:
-            self.logger.error(f"Failed to get event statistics: {str(e)}")
-            return {}
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to disable event stat counters: {str(e)}")
+            return False
 
     def _create_reminder(self, cursor: sqlite3.Cursor, event: CalendarEvent) -> None:
         """Create a reminder for an event"""
@@ -572,6 +824,45 @@ class AppointmentsDatabase:
                     ),
                 )
 
+    def _has_fts_index(self) -> bool:
+        """Check (once) whether the calendar_events_fts index exists"""
+        if self._fts_available is None:
+            try:
+                with self._get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                        (EVENT_FTS_TABLE,),
+                    )
+                    self._fts_available = cursor.fetchone() is not None
+            except Exception:
+                self._fts_available = False
+        return self._fts_available
+
+    @staticmethod
+    def _build_fts_query(query: str) -> str | None:
+        """Turn user input into an FTS5 MATCH expression of quoted prefix terms"""
+        terms = _FTS_TERM_RE.findall(query)
+        if not terms:
+            return None
+        return " ".join(f'"{term}"*' for term in terms)
+
+    @staticmethod
+    def _row_to_reminder(row: tuple[Any, ...]) -> dict[str, Any]:
+        """Convert a _REMINDER_SELECT row to a reminder dictionary"""
+        return {
+            "id": row[0],
+            "event_id": row[1],
+            "reminder_time": row[2],
+            "sent": bool(row[3]),
+            "sent_at": row[4],
+            "event_title": row[5],
+            "event_description": row[6],
+            "event_date": row[7],
+            "start_time": row[8],
+            "location": row[9],
+        }
+
     @staticmethod
     def _row_to_event(row: tuple[Any, ...]) -> CalendarEvent:
         """Convert database row to CalendarEvent object"""
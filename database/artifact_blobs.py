@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Artifact Blob Store
+Content-addressed, reference-counted file storage for large artifact payloads.
+
+Each distinct payload is written once under a path derived from its SHA256 checksum
+(plus an ".enc" suffix when stored encrypted). Rows in the artifact_blobs table track
+how many artifact rows and artifact_versions records point at each blob; blobs whose
+count drops to zero are removed by collect_garbage().
+
+Locking: blob files are written and removed only while the caller holds the SQLite
+write lock of the artifacts database (inside the transaction that changes the
+reference count), so garbage collection can never delete a blob that a concurrent
+writer has just re-referenced.
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO, TypedDict, cast
+
+BLOBS_DIR_NAME = "blobs"
+ENCRYPTED_SUFFIX = ".enc"
+TEMP_PREFIX = ".tmp_"
+# Temp files younger than this may belong to a write still in progress
+TEMP_FILE_GRACE_SECONDS = 3600
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Streams plaintext from a source into an open blob file (encryption at rest)
+BlobWriter = Callable[[BinaryIO, BinaryIO], object]
+
+
+class BlobGarbageStats(TypedDict):
+    blobs_removed: int
+    orphans_removed: int
+    bytes_freed: int
+
+
+class _HashingReader:
+    """Read-through wrapper computing SHA256 and size of everything read"""
+
+    def __init__(self, source: BinaryIO) -> None:
+        self._source = source
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self.sha256.update(data)
+        self.size += len(data)
+        return data
+
+
+class ArtifactBlobStore:
+    """Deduplicated payload storage keyed by content checksum"""
+
+    def __init__(self, base_dir: Path, username: str) -> None:
+        """Initialize the store rooted at the user's artifact directory
+
+        Args:
+            base_dir: DinoAir data root (artifact paths are stored relative to it)
+            username: Owner of the artifacts database
+        """
+        self.base_dir = Path(base_dir)
+        self.relative_root = Path("user_data") / username / "artifacts" / BLOBS_DIR_NAME
+
+    def blob_path(self, checksum: str, encrypted: bool) -> str:
+        """Relative storage path for a payload checksum"""
+        name = f"{checksum}{ENCRYPTED_SUFFIX if encrypted else ''}"
+        return str(self.relative_root / checksum[:2] / name)
+
+    def is_blob_path(self, relative_path: str | None) -> bool:
+        """Check whether a stored content_path points into the blob store"""
+        if not relative_path:
+            return False
+        return Path(relative_path).parent.parent == self.relative_root
+
+    def put(
+        self,
+        cursor: sqlite3.Cursor,
+        checksum: str,
+        content: bytes,
+        encrypt: BlobWriter | None = None,
+        refs: int = 1,
+    ) -> str:
+        """Reference a payload, writing it only if no blob holds it yet
+
+        Must run inside the caller's write transaction; the reference count is
+        bumped first so the write lock is held while the file is checked/written.
+
+        Args:
+            cursor: Cursor of the artifacts connection
+            checksum: SHA256 of the plaintext payload
+            content: Plaintext payload
+            encrypt: Optional writer streaming new blobs to disk encrypted
+            refs: References to add (e.g. artifact row + initial version record)
+
+        Returns:
+            Relative storage path of the blob
+        """
+        relative_path = self.blob_path(checksum, encrypt is not None)
+        cursor.execute(
+            """
+            INSERT INTO artifact_blobs
+            (storage_path, checksum, encrypted, size_bytes, stored_size_bytes, ref_count)
+            VALUES (?, ?, ?, ?, 0, ?)
+            ON CONFLICT(storage_path) DO UPDATE SET ref_count = ref_count + excluded.ref_count
+            """,
+            (relative_path, checksum, encrypt is not None, len(content), refs),
+        )
+
+        file_path = self.base_dir / relative_path
+        if not file_path.exists():
+            temp_path = self._spool(io.BytesIO(content), file_path.parent, encrypt)
+            self._commit_file(cursor, temp_path, relative_path)
+        return relative_path
+
+    def put_stream(
+        self,
+        cursor: sqlite3.Cursor,
+        source: BinaryIO,
+        encrypt: BlobWriter | None = None,
+        refs: int = 1,
+    ) -> tuple[str, str, int]:
+        """Reference a payload read from a stream without holding it in memory
+
+        The stream is spooled to a temp file while its checksum is computed; the
+        temp file becomes the blob, or is discarded when the blob already exists.
+
+        Returns:
+            Tuple of (relative storage path, SHA256 checksum, plaintext size)
+        """
+        reader = _HashingReader(source)
+        temp_path = self._spool(reader, self.base_dir / self.relative_root, encrypt)
+        try:
+            checksum = reader.sha256.hexdigest()
+            relative_path = self.blob_path(checksum, encrypt is not None)
+            cursor.execute(
+                """
+                INSERT INTO artifact_blobs
+                (storage_path, checksum, encrypted, size_bytes, stored_size_bytes, ref_count)
+                VALUES (?, ?, ?, ?, 0, ?)
+                ON CONFLICT(storage_path) DO UPDATE SET ref_count = ref_count + excluded.ref_count
+                """,
+                (relative_path, checksum, encrypt is not None, reader.size, refs),
+            )
+            if (self.base_dir / relative_path).exists():
+                temp_path.unlink()
+            else:
+                self._commit_file(cursor, temp_path, relative_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                temp_path.unlink()
+            raise
+        return relative_path, checksum, reader.size
+
+    @staticmethod
+    def acquire(cursor: sqlite3.Cursor, relative_path: str | None, count: int = 1) -> None:
+        """Add references to an existing blob (no-op for non-blob paths)"""
+        if relative_path and count:
+            cursor.execute(
+                "UPDATE artifact_blobs SET ref_count = ref_count + ? WHERE storage_path = ?",
+                (count, relative_path),
+            )
+
+    @staticmethod
+    def release(cursor: sqlite3.Cursor, relative_path: str | None, count: int = 1) -> None:
+        """Drop references to a blob; the file is removed by collect_garbage()"""
+        if relative_path and count:
+            cursor.execute(
+                "UPDATE artifact_blobs SET ref_count = ref_count - ? WHERE storage_path = ?",
+                (count, relative_path),
+            )
+
+    def collect_garbage(self, conn: sqlite3.Connection) -> BlobGarbageStats:
+        """Delete unreferenced blobs and orphaned blob files
+
+        Orphans are files with no artifact_blobs row, left behind when a transaction
+        that wrote a new blob was rolled back.
+        """
+        stats: BlobGarbageStats = {"blobs_removed": 0, "orphans_removed": 0, "bytes_freed": 0}
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("SELECT storage_path FROM artifact_blobs WHERE ref_count <= 0")
+            for (relative_path,) in cursor.fetchall():
+                freed = self._remove_file(self.base_dir / relative_path)
+                if freed is not None:
+                    stats["bytes_freed"] += freed
+                stats["blobs_removed"] += 1
+            cursor.execute("DELETE FROM artifact_blobs WHERE ref_count <= 0")
+
+            blobs_root = self.base_dir / self.relative_root
+            if blobs_root.exists():
+                cursor.execute("SELECT storage_path FROM artifact_blobs")
+                known = {Path(row[0]) for row in cursor.fetchall()}
+                stale_before = time.time() - TEMP_FILE_GRACE_SECONDS
+                for file_path in blobs_root.glob("**/*"):
+                    if not file_path.is_file():
+                        continue
+                    if file_path.relative_to(self.base_dir) in known:
+                        continue
+                    if (
+                        file_path.name.startswith(TEMP_PREFIX)
+                        and file_path.stat().st_mtime > stale_before
+                    ):
+                        continue
+                    freed = self._remove_file(file_path)
+                    if freed is not None:
+                        stats["bytes_freed"] += freed
+                        stats["orphans_removed"] += 1
+
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return stats
+
+    @staticmethod
+    def _spool(
+        source: BinaryIO | _HashingReader, directory: Path, encrypt: BlobWriter | None
+    ) -> Path:
+        """Stream source into a temp file in directory; the caller renames or removes it"""
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=TEMP_PREFIX)
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if encrypt:
+                    encrypt(cast("BinaryIO", source), f)
+                else:
+                    shutil.copyfileobj(source, f, COPY_CHUNK_SIZE)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise
+        return tmp_path
+
+    def _commit_file(self, cursor: sqlite3.Cursor, temp_path: Path, relative_path: str) -> None:
+        """Move a spooled temp file into place so readers never see partial blobs"""
+        file_path = self.base_dir / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.replace(file_path)
+        cursor.execute(
+            "UPDATE artifact_blobs SET stored_size_bytes = ? WHERE storage_path = ?",
+            (file_path.stat().st_size, relative_path),
+        )
+
+    @staticmethod
+    def _remove_file(file_path: Path) -> int | None:
+        """Remove a blob file and its empty shard directory; returns bytes freed"""
+        try:
+            size = file_path.stat().st_size
+            file_path.unlink()
+        except OSError:
+            return None
+        with contextlib.suppress(OSError):
+            file_path.parent.rmdir()
+        return size
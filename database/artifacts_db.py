@@ -9,17 +9,23 @@ import contextlib
 import hashlib
 import json
 import sqlite3
+import threading
+import time
 import uuid
-from collections.abc import Mapping
+import weakref
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, ClassVar, Final, Protocol, TypedDict, cast
+from typing import Any, BinaryIO, ClassVar, Final, Protocol, TypedDict, cast
 
 from input_processing.stages.sql_protection import SQLInjectionProtection
 from models.artifact import Artifact, ArtifactCollection, ArtifactVersion
 from utils.artifact_encryption import ArtifactEncryption
 from utils.logger import Logger
 
+from .artifact_blobs import ENCRYPTED_SUFFIX, ArtifactBlobStore
+
 
 class DatabaseManager(Protocol):
     """Protocol for database manager interface"""
@@ -50,11 +56,150 @@ class ArtifactStats(TypedDict):
     versioned_artifacts: int
 
 
+# One pass over the live artifacts (served by idx_artifacts_stats); each row holds
+# the content type, artifact count, total size and encrypted count, followed by
+# the collection and versioned-artifact totals
+_STATS_ONE_PASS_SQL: Final[str] = """
+    SELECT a.content_type, a.artifact_count, a.total_size_bytes, a.encrypted_count,
+           (SELECT COUNT(*) FROM artifact_collections),
+           (SELECT COUNT(DISTINCT artifact_id) FROM artifact_versions)
+    FROM (SELECT 1)
+    LEFT JOIN (
+        SELECT COALESCE(content_type, 'unknown') AS content_type,
+               COUNT(*) AS artifact_count,
+               COALESCE(SUM(size_bytes), 0) AS total_size_bytes,
+               SUM(CASE WHEN encrypted_fields != '' THEN 1 ELSE 0 END) AS encrypted_count
+        FROM artifacts
+        WHERE status != 'deleted'
+        GROUP BY 1
+    ) AS a
+"""
+
+# Same row shape read from the trigger-maintained counter tables
+_STATS_COUNTERS_SQL: Final[str] = """
+    SELECT c.content_type, c.artifact_count, c.total_size_bytes, c.encrypted_count,
+           (SELECT value FROM artifact_stat_totals WHERE name = 'collections'),
+           (SELECT value FROM artifact_stat_totals WHERE name = 'versioned_artifacts')
+    FROM (SELECT 1)
+    LEFT JOIN artifact_type_counters AS c ON c.artifact_count > 0
+"""
+
+# Optional O(1) statistics: counters kept current by triggers on every write
+_STAT_COUNTER_DDL: Final[tuple[str, ...]] = (
+    """
+    CREATE TABLE IF NOT EXISTS artifact_type_counters (
+        content_type TEXT PRIMARY KEY,
+        artifact_count INTEGER NOT NULL DEFAULT 0,
+        total_size_bytes INTEGER NOT NULL DEFAULT 0,
+        encrypted_count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS artifact_stat_totals (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artifact_counters_ai AFTER INSERT ON artifacts
+    WHEN new.status != 'deleted' BEGIN
+        INSERT INTO artifact_type_counters
+        (content_type, artifact_count, total_size_bytes, encrypted_count)
+        VALUES (COALESCE(new.content_type, 'unknown'), 1, COALESCE(new.size_bytes, 0),
+                CASE WHEN new.encrypted_fields != '' THEN 1 ELSE 0 END)
+        ON CONFLICT(content_type) DO UPDATE SET
+            artifact_count = artifact_count + excluded.artifact_count,
+            total_size_bytes = total_size_bytes + excluded.total_size_bytes,
+            encrypted_count = encrypted_count + excluded.encrypted_count;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artifact_counters_ad AFTER DELETE ON artifacts
+    WHEN old.status != 'deleted' BEGIN
+        UPDATE artifact_type_counters SET
+            artifact_count = artifact_count - 1,
+            total_size_bytes = total_size_bytes - COALESCE(old.size_bytes, 0),
+            encrypted_count = encrypted_count
+                - CASE WHEN old.encrypted_fields != '' THEN 1 ELSE 0 END
+        WHERE content_type = COALESCE(old.content_type, 'unknown');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artifact_counters_au
+    AFTER UPDATE OF status, content_type, size_bytes, encrypted_fields ON artifacts BEGIN
+        UPDATE artifact_type_counters SET
+            artifact_count = artifact_count - 1,
+            total_size_bytes = total_size_bytes - COALESCE(old.size_bytes, 0),
+            encrypted_count = encrypted_count
+                - CASE WHEN old.encrypted_fields != '' THEN 1 ELSE 0 END
+        WHERE content_type = COALESCE(old.content_type, 'unknown')
+        AND old.status != 'deleted';
+        INSERT INTO artifact_type_counters
+        (content_type, artifact_count, total_size_bytes, encrypted_count)
+        SELECT COALESCE(new.content_type, 'unknown'), 1, COALESCE(new.size_bytes, 0),
+               CASE WHEN new.encrypted_fields != '' THEN 1 ELSE 0 END
+        WHERE new.status != 'deleted'
+        ON CONFLICT(content_type) DO UPDATE SET
+            artifact_count = artifact_count + excluded.artifact_count,
+            total_size_bytes = total_size_bytes + excluded.total_size_bytes,
+            encrypted_count = encrypted_count + excluded.encrypted_count;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artifact_collection_counters_ai
+    AFTER INSERT ON artifact_collections BEGIN
+        UPDATE artifact_stat_totals SET value = value + 1 WHERE name = 'collections';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artifact_collection_counters_ad
+    AFTER DELETE ON artifact_collections BEGIN
+        UPDATE artifact_stat_totals SET value = value - 1 WHERE name = 'collections';
+    END
+    """,
+    # versioned_artifacts counts artifacts with at least one version
+    """
+    CREATE TRIGGER IF NOT EXISTS artifact_version_counters_ai
+    AFTER INSERT ON artifact_versions
+    WHEN (SELECT COUNT(*) FROM artifact_versions WHERE artifact_id = new.artifact_id) = 1
+    BEGIN
+        UPDATE artifact_stat_totals SET value = value + 1 WHERE name = 'versioned_artifacts';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artifact_version_counters_ad
+    AFTER DELETE ON artifact_versions
+    WHEN NOT EXISTS (SELECT 1 FROM artifact_versions WHERE artifact_id = old.artifact_id)
+    BEGIN
+        UPDATE artifact_stat_totals SET value = value - 1 WHERE name = 'versioned_artifacts';
+    END
+    """,
+)
+
+_STAT_COUNTER_TRIGGERS: Final[tuple[str, ...]] = (
+    "artifact_counters_ai",
+    "artifact_counters_ad",
+    "artifact_counters_au",
+    "artifact_collection_counters_ai",
+    "artifact_collection_counters_ad",
+    "artifact_version_counters_ai",
+    "artifact_version_counters_ad",
+)
+
+
 class ArtifactsDatabase:
     """Manages artifacts database operations with file storage support"""
 
     # File size threshold for external storage (5MB)
     FILE_SIZE_THRESHOLD: Final[int] = 5 * 1024 * 1024
+    FILE_ENCRYPTION_ALGORITHM: Final[str] = "AES-256-GCM-STREAM"
+    # Plaintext chunk size yielded by iter_artifact_content for unencrypted files
+    READ_CHUNK_SIZE: Final[int] = 1024 * 1024
+    # accessed_at touches are buffered and written in one batch at most this often
+    ACCESS_FLUSH_INTERVAL_SECONDS: Final[float] = 30.0
+    ACCESS_FLUSH_MAX_PENDING: Final[int] = 1000
+    # Stay well below SQLite's host parameter limit for IN (...) lookups
+    BULK_FETCH_BATCH_SIZE: Final[int] = 500
     _ARTIFACT_INSERT_COLUMNS: ClassVar[tuple[str, ...]] = (
         "id",
         "name",
@@ -124,58 +269,59 @@ class ArtifactsDatabase:
         self.encryption = ArtifactEncryption(encryption_password) if encryption_password else None
         self.encryption_at_rest = bool(encryption_password)
 
+        # Large payloads live in a content-addressed, reference-counted blob store
+        self.blobs = ArtifactBlobStore(Path(db_manager.base_dir), self.username)
+
+        # Reads record accessed_at here instead of writing on every read
+        self._pending_access: dict[str, str] = {}
+        self._access_lock = threading.Lock()
+        self._last_access_flush = time.monotonic()
+        # Flushes buffered touches when no further read comes along to do it
+        self._access_timer: threading.Timer | None = None
+        self._access_finalizer = weakref.finalize(
+            self,
+            self._flush_access_batch,
+            db_manager.get_artifacts_connection,
+            self._pending_access,
+            self._access_lock,
+        )
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection"""
         return self.db_manager.get_artifacts_connection()
 
-    def _get_storage_path(self, artifact: Artifact) -> Path:
-        """Get file storage path for artifact"""
-        storage_path = artifact.get_storage_path(self.username)
-        return Path(self.db_manager.base_dir) / storage_path
-
     @staticmethod
     def _compute_checksum(content: bytes) -> str:
         """Compute SHA256 checksum of content"""
         return hashlib.sha256(content).hexdigest()
 
-    def _encrypt_file_content(self, content: bytes) -> tuple[bytes, dict[str, str] | None]:
-        """Encrypt file content for storage
+    def _encrypt_file_stream(self, source: BinaryIO, destination: BinaryIO) -> int:
+        """Encrypt file content for storage in the framed AES-256-GCM format
 
         Args:
-            content: Raw file content
+            source: Raw file content stream
+            destination: Open blob file
 
         Returns:
-            Tuple of (encrypted_content, encryption_metadata)
+            Number of bytes written
+
+        Raises:
+            ValueError: If encryption fails; plaintext is never written under an
+                encrypted blob path
         """
-        if not self.encryption_at_rest or not self.encryption:
-            return content, None
+        if not self.encryption:
+            raise ValueError("Encryption password required to encrypt file content")
 
         try:
-            # Encrypt the content
-            encrypted_data = self.encryption.encrypt_data(content)
-
-            # Convert to bytes for storage (JSON + base64)
-            encrypted_json = json.dumps(encrypted_data).encode("utf-8")
-
-            # Return metadata for database storage
-            metadata: dict[str, str] = {
-                "encryption_algorithm": "AES-256-CBC",
-                "encrypted": "true",
-                "salt": str(encrypted_data["salt"]),
-                "iv": str(encrypted_data["iv"]),
-            }
-
-            return encrypted_json, {k: str(v) for k, v in metadata.items()} if metadata else None
-
+            return self.encryption.encrypt_stream(source, destination)
         except (ValueError, TypeError, OSError) as e:
             self.logger.error(f"Failed to encrypt file content: {e}")
-            # Fall back to unencrypted storage
-            return content, None
+            raise ValueError(f"Cannot encrypt file content: {e}") from e
 
     def _decrypt_file_content(
         self, encrypted_content: bytes, encryption_metadata: dict[str, str] | None
     ) -> bytes:
-        """Decrypt file content from storage
+        """Decrypt file content stored in the legacy JSON-wrapped AES-CBC format
 
         Args:
             encrypted_content: Encrypted file content
@@ -202,7 +348,11 @@ class ArtifactsDatabase:
             raise ValueError(f"Cannot decrypt file content: {e}") from e
 
     def _handle_file_storage(self, artifact: Artifact, content: bytes | None = None) -> Artifact:
-        """Handle file storage for large artifacts with optional encryption"""
+        """Decide where content lives; large payloads are pointed at their blob path
+
+        The blob itself is written (or re-referenced) by _store_blob() inside the
+        transaction that records the artifact, so identical payloads are kept once.
+        """
         if content is None:
             return artifact
 
@@ -212,32 +362,12 @@ class ArtifactsDatabase:
 
         # Determine storage strategy based on size
         if size_bytes > self.FILE_SIZE_THRESHOLD:
-            # Store in filesystem with optional encryption
-            storage_path = self._get_storage_path(artifact)
-            storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Encrypt content if encryption is enabled
-            content_to_store, encryption_metadata = self._encrypt_file_content(content)
-
-            file_path = storage_path / "content.bin"
-            with file_path.open("wb") as f:
-                f.write(content_to_store)
-
-            artifact.content_path = str(file_path.relative_to(self.db_manager.base_dir))
+            encrypted = bool(self.encryption_at_rest and self.encryption)
+            artifact.content_path = self.blobs.blob_path(artifact.checksum, encrypted)
             artifact.content = None  # Don't store in database
 
-            # Store encryption metadata if content was encrypted
-            if encryption_metadata:
-                if artifact.metadata is None:
-                    artifact.metadata = {}
-                if isinstance(artifact.metadata, dict):
-                    artifact.metadata.update(encryption_metadata)
-                artifact.encryption_key_id = "file_encryption"  # Mark as file-encrypted
-
-            self.logger.info(
-                f"Stored artifact {artifact.id} to file: {artifact.content_path} "
-                f"(encrypted: {bool(encryption_metadata)})"
-            )
+            if encrypted:
+                self._mark_file_encrypted(artifact)
         else:
             # Store in database
             artifact.content = content.decode("utf-8", errors="replace")
@@ -245,6 +375,32 @@ class ArtifactsDatabase:
 
         return artifact
 
+    @classmethod
+    def _mark_file_encrypted(cls, artifact: Artifact) -> None:
+        """Flag the artifact's file as encrypted; the wrapped key and nonces live in the blob"""
+        if artifact.metadata is None:
+            artifact.metadata = {}
+        if isinstance(artifact.metadata, dict):
+            artifact.metadata.update(
+                {"encryption_algorithm": cls.FILE_ENCRYPTION_ALGORITHM, "encrypted": "true"}
+            )
+        artifact.encryption_key_id = "file_encryption"
+
+    def _store_blob(
+        self, cursor: sqlite3.Cursor, artifact: Artifact, content: bytes, refs: int
+    ) -> None:
+        """Reference the artifact's blob, writing the payload if it is new"""
+        if not artifact.content_path or not artifact.checksum:
+            return
+        encrypt = None
+        if artifact.content_path.endswith(ENCRYPTED_SUFFIX):
+            encrypt = self._encrypt_file_stream
+        self.blobs.put(cursor, artifact.checksum, content, encrypt=encrypt, refs=refs)
+        self.logger.info(
+            f"Stored artifact {artifact.id} content in blob {artifact.content_path} "
+            f"(encrypted: {encrypt is not None})"
+        )
+
     def _resolve_artifact_file_path(self, relative_path: str) -> Path:
         base_dir = Path(self.db_manager.base_dir).resolve()
         candidate_path = (base_dir / relative_path).resolve()
@@ -256,12 +412,6 @@ class ArtifactsDatabase:
 
         return candidate_path
 
-    @staticmethod
-    def _read_file_bytes(file_path: Path) -> bytes | None:
-        if not file_path.exists():
-            return None
-        return file_path.read_bytes()
-
     @staticmethod
     def _normalize_encryption_metadata(
         metadata: object | None,
@@ -287,15 +437,67 @@ class ArtifactsDatabase:
             ValueError: If artifact data is invalid
             RuntimeError: If database operation fails
         """
-        try:
-            # Validate input
-            if not artifact.id:
-                artifact.id = str(uuid.uuid4())
+        # Validate input
+        if not artifact.id:
+            artifact.id = str(uuid.uuid4())
+
+        # Handle content storage if provided
+        if content is None:
+            return self._insert_new_artifact(artifact)
+
+        artifact = self._handle_file_storage(artifact, content)
+
+        def store_content(cursor: sqlite3.Cursor) -> None:
+            # The artifact row and its initial version both reference the blob
+            self._store_blob(cursor, artifact, content, refs=2)
+
+        return self._insert_new_artifact(artifact, store_content)
+
+    def create_artifact_from_stream(
+        self, artifact: Artifact, source: BinaryIO
+    ) -> ArtifactCreateResult:
+        """Create a new artifact from a binary stream without loading it into memory.
 
-            # Handle content storage if provided
-            if content is not None:
-                artifact = self._handle_file_storage(artifact, content)
+        The content always goes to the blob store regardless of FILE_SIZE_THRESHOLD,
+        encrypted chunk by chunk when encryption at rest is enabled.
 
+        Args:
+            artifact: Artifact object with metadata
+            source: Readable binary stream (e.g. an open file)
+
+        Returns:
+            Dictionary with artifact metadata including id, storage_uri, checksum, timestamps
+
+        Raises:
+            RuntimeError: If storing the content or the database operation fails
+        """
+        if not artifact.id:
+            artifact.id = str(uuid.uuid4())
+
+        encrypt = None
+        if self.encryption_at_rest and self.encryption:
+            encrypt = self._encrypt_file_stream
+
+        def store_content(cursor: sqlite3.Cursor) -> None:
+            content_path, checksum, size_bytes = self.blobs.put_stream(
+                cursor, source, encrypt=encrypt, refs=2
+            )
+            artifact.content = None
+            artifact.content_path = content_path
+            artifact.checksum = checksum
+            artifact.size_bytes = size_bytes
+            if encrypt:
+                self._mark_file_encrypted(artifact)
+
+        return self._insert_new_artifact(artifact, store_content)
+
+    def _insert_new_artifact(
+        self,
+        artifact: Artifact,
+        store_content: Callable[[sqlite3.Cursor], None] | None = None,
+    ) -> ArtifactCreateResult:
+        """Insert an artifact and its initial version, storing content in the same transaction"""
+        try:
             # Set timestamps as ISO format strings
             now = datetime.now(UTC)
             artifact.created_at = now.isoformat()
@@ -307,6 +509,9 @@ class ArtifactsDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
+                if store_content is not None:
+                    store_content(cursor)
+
                 # Insert artifact record
                 artifact_dict = artifact.to_dict()
                 values = [artifact_dict.get(column) for column in self._ARTIFACT_INSERT_COLUMNS]
@@ -352,7 +557,7 @@ class ArtifactsDatabase:
                 return False
 
             # Prepare content-related updates
-            content_updates = self._prepare_content_update(current, content)
+            content_updates, stored = self._prepare_content_update(current, content)
 
             # Combine updates
             merged_updates: dict[str, object] = {**dict(updates), **content_updates}
@@ -372,6 +577,7 @@ class ArtifactsDatabase:
                 cursor = conn.cursor()
                 self._reset_latest_flag(cursor, current)
                 cursor.execute(self._build_update_statement(set_clauses), (*params, artifact_id))
+                self._swap_blob_reference(cursor, current, merged_updates, stored, content)
                 conn.commit()
             return True
         except Exception as e:
@@ -380,21 +586,44 @@ class ArtifactsDatabase:
 
     def _prepare_content_update(
         self, current: Artifact, content: bytes | None
-    ) -> dict[str, object]:
+    ) -> tuple[dict[str, object], Artifact | None]:
         updates: dict[str, object] = {}
-        if content is not None:
-            temp_artifact = Artifact(id=current.id)
-            temp_artifact.created_at = current.created_at
-            temp_artifact = self._handle_file_storage(temp_artifact, content)
-            updates.update(
-                {
-                    "content": temp_artifact.content,
-                    "content_path": temp_artifact.content_path,
-                    "size_bytes": temp_artifact.size_bytes,
-                    "checksum": temp_artifact.checksum,
-                }
-            )
-        return updates
+        if content is None:
+            return updates, None
+
+        temp_artifact = Artifact(id=current.id)
+        temp_artifact.created_at = current.created_at
+        temp_artifact = self._handle_file_storage(temp_artifact, content)
+        updates.update(
+            {
+                "content": temp_artifact.content,
+                "content_path": temp_artifact.content_path,
+                "size_bytes": temp_artifact.size_bytes,
+                "checksum": temp_artifact.checksum,
+            }
+        )
+        if temp_artifact.metadata:
+            current_metadata = current.metadata if isinstance(current.metadata, dict) else {}
+            updates["metadata"] = {**current_metadata, **temp_artifact.metadata}
+        return updates, temp_artifact
+
+    def _swap_blob_reference(
+        self,
+        cursor: sqlite3.Cursor,
+        current: Artifact,
+        updates: Mapping[str, object],
+        stored: Artifact | None,
+        content: bytes | None,
+    ) -> None:
+        """Move the artifact row's blob reference to its new content_path"""
+        if stored is not None and content is not None:
+            self._store_blob(cursor, stored, content, refs=1)
+        elif "content_path" in updates and updates["content_path"] != current.content_path:
+            # e.g. restore_version pointing the row back at an older blob
+            self.blobs.acquire(cursor, cast("str | None", updates["content_path"]))
+        else:
+            return
+        self.blobs.release(cursor, current.content_path)
 
     def _build_update_query(self, updates: Mapping[str, object]) -> tuple[list[str], list[object]]:
         set_clauses: list[str] = []
@@ -494,6 +723,10 @@ class ArtifactsDatabase:
                     if not artifact:
                         return False
 
+                    # Drop the blob references held by the row and its versions
+                    for blob_path, count in self._referenced_blob_paths(cursor, artifact).items():
+                        self.blobs.release(cursor, blob_path, count)
+
                     # Delete versions first (foreign key constraint)
                     cursor.execute(
                         """DELETE FROM artifact_versions
@@ -515,8 +748,9 @@ class ArtifactsDatabase:
                         (artifact_id,),
                     )
 
-                    # Clean up file storage if exists
-                    if artifact.content_path:
+                    # Clean up pre-blob-store file storage if exists; blobs are
+                    # removed by collect_unreferenced_blobs()
+                    if artifact.content_path and not self.blobs.is_blob_path(artifact.content_path):
                         file_path = Path(self.db_manager.base_dir) / artifact.content_path
                         if file_path.exists():
                             file_path.unlink()
@@ -545,6 +779,42 @@ class ArtifactsDatabase:
             self.logger.error(f"Failed to delete artifact: {str(e)}")
             return False
 
+    @staticmethod
+    def _referenced_blob_paths(cursor: sqlite3.Cursor, artifact: Artifact) -> Counter[str]:
+        """Count content_path references held by an artifact row and its versions"""
+        paths: Counter[str] = Counter()
+        if artifact.content_path:
+            paths[artifact.content_path] += 1
+        cursor.execute(
+            "SELECT artifact_data FROM artifact_versions WHERE artifact_id = ?", (artifact.id,)
+        )
+        for (artifact_data,) in cursor.fetchall():
+            try:
+                content_path = json.loads(artifact_data).get("content_path")
+            except (json.JSONDecodeError, TypeError, AttributeError):
+                continue
+            if content_path:
+                paths[content_path] += 1
+        return paths
+
+    def collect_unreferenced_blobs(self) -> dict[str, int]:
+        """Delete blob files no artifact or version references any more
+
+        Returns:
+            Dictionary with blobs_removed, orphans_removed and bytes_freed
+        """
+        try:
+            with self._get_connection() as conn:
+                stats = self.blobs.collect_garbage(conn)
+            self.logger.info(
+                f"Artifact blob cleanup removed {stats['blobs_removed']} blobs and "
+                f"{stats['orphans_removed']} orphaned files ({stats['bytes_freed']} bytes)"
+            )
+            return dict(stats)
+        except (sqlite3.Error, OSError) as e:
+            self.logger.error(f"Failed to collect artifact blobs: {str(e)}")
+            return {"blobs_removed": 0, "orphans_removed": 0, "bytes_freed": 0}
+
     def get_artifact(self, artifact_id: str, update_accessed: bool = True) -> Artifact | None:
         """Get a specific artifact"""
         try:
@@ -562,24 +832,152 @@ class ArtifactsDatabase:
                 if not row:
                     return None
 
-                # Update accessed timestamp if requested
-                if update_accessed:
-                    cursor.execute(
-                        """UPDATE artifacts
-                                     SET accessed_at = CURRENT_TIMESTAMP
-                                     WHERE id = ?""",
-                        (artifact_id,),
-                    )
-                    conn.commit()
+            # Update accessed timestamp if requested (buffered, see flush_access_times)
+            if update_accessed:
+                self._record_access([artifact_id])
 
-                return self._row_to_artifact(row)
+            return self._row_to_artifact(row)
 
         except Exception as e:
             self.logger.error(f"Failed to get artifact: {str(e)}")
             return None
 
+    def get_artifacts_bulk(
+        self, artifact_ids: list[str], update_accessed: bool = True
+    ) -> list[Artifact]:
+        """Get many artifacts with one IN query per batch of ids
+
+        Args:
+            artifact_ids: Artifact ids to fetch
+            update_accessed: Whether to record the access (buffered)
+
+        Returns:
+            Artifacts in the order of artifact_ids; unknown ids are skipped
+        """
+        unique_ids = list(dict.fromkeys(artifact_ids))
+        if not unique_ids:
+            return []
+
+        try:
+            rows: dict[str, tuple[Any, ...]] = {}
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(unique_ids), self.BULK_FETCH_BATCH_SIZE):
+                    batch = unique_ids[start : start + self.BULK_FETCH_BATCH_SIZE]
+                    placeholders = ", ".join("?" * len(batch))
+                    cursor.execute(
+                        f"SELECT * FROM artifacts WHERE id IN ({placeholders})",
+                        batch,
+                    )
+                    for row in cursor.fetchall():
+                        rows[row[0]] = row
+
+            if update_accessed and rows:
+                self._record_access(list(rows))
+
+            return [self._row_to_artifact(rows[i]) for i in unique_ids if i in rows]
+
+        except Exception as e:
+            self.logger.error(f"Failed to get artifacts in bulk: {str(e)}")
+            return []
+
+    def _record_access(self, artifact_ids: list[str]) -> None:
+        """Buffer accessed_at touches; flush when the interval or batch size is reached"""
+        # Same format as CURRENT_TIMESTAMP so ORDER BY accessed_at stays consistent
+        accessed_at = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        with self._access_lock:
+            for artifact_id in artifact_ids:
+                self._pending_access[artifact_id] = accessed_at
+            remaining = self.ACCESS_FLUSH_INTERVAL_SECONDS - (
+                time.monotonic() - self._last_access_flush
+            )
+            due = len(self._pending_access) >= self.ACCESS_FLUSH_MAX_PENDING or remaining <= 0
+            if not due and self._access_timer is None:
+                timer = threading.Timer(remaining, self._flush_on_timer, (weakref.ref(self),))
+                timer.daemon = True
+                self._access_timer = timer
+                timer.start()
+        if due:
+            self.flush_access_times()
+
+    @staticmethod
+    def _flush_on_timer(ref: "weakref.ref[ArtifactsDatabase]") -> None:
+        db = ref()
+        if db is not None:
+            db.flush_access_times()
+
+    def flush_access_times(self) -> int:
+        """Write buffered accessed_at timestamps in a single batch
+
+        Called automatically once the flush interval has passed since touches
+        were buffered, even without further reads, and when the
+        ArtifactsDatabase is garbage collected or the interpreter exits.
+
+        Returns:
+            Number of artifacts whose accessed_at was written
+        """
+        with self._access_lock:
+            timer, self._access_timer = self._access_timer, None
+            self._last_access_flush = time.monotonic()
+        if timer is not None:
+            timer.cancel()
+        try:
+            return self._flush_access_batch(
+                self._get_connection, self._pending_access, self._access_lock
+            )
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to flush artifact access times: {str(e)}")
+            return 0
+
+    @staticmethod
+    def _flush_access_batch(
+        get_connection: Callable[[], sqlite3.Connection],
+        pending: dict[str, str],
+        lock: threading.Lock,
+    ) -> int:
+        with lock:
+            batch = list(pending.items())
+            pending.clear()
+        if not batch:
+            return 0
+
+        try:
+            with get_connection() as conn:
+                conn.executemany(
+                    "UPDATE artifacts SET accessed_at = ? WHERE id = ?",
+                    [(accessed_at, artifact_id) for artifact_id, accessed_at in batch],
+                )
+                conn.commit()
+        except sqlite3.Error:
+            # Put the touches back unless a newer one was recorded meanwhile
+            with lock:
+                for artifact_id, accessed_at in batch:
+                    pending.setdefault(artifact_id, accessed_at)
+            raise
+        return len(batch)
+
     def get_artifact_content(self, artifact_id: str) -> bytes | None:
         """Get artifact content (from database or file) with automatic decryption"""
+        try:
+            chunks = self.iter_artifact_content(artifact_id)
+            if chunks is None:
+                return None
+            return b"".join(chunks)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get artifact content: {str(e)}")
+            return None
+
+    def iter_artifact_content(self, artifact_id: str) -> Iterator[bytes] | None:
+        """Stream artifact content as plaintext chunks with automatic decryption
+
+        File-backed content is read and decrypted one frame at a time, so memory
+        use stays flat regardless of the artifact size. Decryption failures are
+        raised as ValueError while iterating.
+
+        Returns:
+            Iterator of content chunks, or None if the artifact or its file is missing
+        """
         try:
             artifact = self.get_artifact(artifact_id)
             if not artifact:
@@ -587,26 +985,43 @@ class ArtifactsDatabase:
 
             if artifact.content:
                 # Content stored in database
-                return artifact.content.encode("utf-8")
+                return iter((artifact.content.encode("utf-8"),))
             if not artifact.content_path:
                 return None
 
             file_path = self._resolve_artifact_file_path(artifact.content_path)
-            file_bytes = self._read_file_bytes(file_path)
-            if file_bytes is None:
+            if not file_path.exists():
                 return None
 
-            encryption_metadata = self._normalize_encryption_metadata(artifact.metadata)
-            if encryption_metadata and encryption_metadata.get("encrypted") == "true":
-                result = self._decrypt_file_content(file_bytes, encryption_metadata)
-            else:
-                result = file_bytes
-            return result
-
         except Exception as e:
-            self.logger.error(f"Failed to get artifact content: {str(e)}")
+            self.logger.error(f"Failed to open artifact content: {str(e)}")
             return None
 
+        encryption_metadata = self._normalize_encryption_metadata(artifact.metadata)
+        if not encryption_metadata or encryption_metadata.get("encrypted") != "true":
+            encryption_metadata = None
+        return self._iter_file_content(file_path, encryption_metadata)
+
+    def _iter_file_content(
+        self, file_path: Path, encryption_metadata: dict[str, str] | None
+    ) -> Iterator[bytes]:
+        with file_path.open("rb") as f:
+            if encryption_metadata is None:
+                while chunk := f.read(self.READ_CHUNK_SIZE):
+                    yield chunk
+                return
+
+            if not self.encryption:
+                raise ValueError("Encryption password required to decrypt file content")
+
+            prefix = f.read(len(ArtifactEncryption.STREAM_MAGIC))
+            f.seek(0)
+            if ArtifactEncryption.is_stream_format(prefix):
+                yield from self.encryption.decrypt_stream(f)
+            else:
+                # Files written before the streaming format are JSON documents
+                yield self._decrypt_file_content(f.read(), encryption_metadata)
+
     def search_artifacts(self, query: str, limit: int = 100) -> list[Artifact]:
         """Search artifacts by name, description, or tags"""
         try:
@@ -837,6 +1252,8 @@ class ArtifactsDatabase:
                 )
 
                 self._create_version_record(cursor, version)
+                # The version shares the artifact's blob instead of copying it
+                self.blobs.acquire(cursor, artifact.content_path)
                 conn.commit()
 
                 return True
@@ -911,95 +1328,109 @@ class ArtifactsDatabase:
             return False
 
     def get_artifact_statistics(self) -> ArtifactStats:
-        """Get artifact statistics"""
+        """Get artifact statistics
+
+        Served from the trigger-maintained counter tables when they are enabled
+        (see enable_stat_counters), otherwise from a single aggregate query.
+        """
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
+                use_counters = self._has_stat_counters(cursor)
+                cursor.execute(_STATS_COUNTERS_SQL if use_counters else _STATS_ONE_PASS_SQL)
+                return self._fold_artifact_stats(cursor.fetchall())
 
-                stats: ArtifactStats = {
-                    "total_artifacts": 0,
-                    "artifacts_by_type": {},
-                    "total_size_bytes": 0,
-                    "total_size_mb": 0.0,
-                    "encrypted_artifacts": 0,
-                    "total_collections": 0,
-                    "versioned_artifacts": 0,
-                }
+        except Exception as e:
+            self.logger.error(f"Failed to get artifact statistics: {str(e)}")
+            return self._fold_artifact_stats([])
 
-                # Total artifacts
-                cursor.execute(
-                    """SELECT COUNT(*) FROM artifacts
-                                 WHERE status != 'deleted' """
-                )
-                total_artifacts = cursor.fetchone()
-                stats["total_artifacts"] = int(total_artifacts[0]) if total_artifacts else 0
+    @staticmethod
+    def _fold_artifact_stats(rows: list[tuple[Any, ...]]) -> ArtifactStats:
+        stats: ArtifactStats = {
+            "total_artifacts": 0,
+            "artifacts_by_type": {},
+            "total_size_bytes": 0,
+            "total_size_mb": 0.0,
+            "encrypted_artifacts": 0,
+            "total_collections": 0,
+            "versioned_artifacts": 0,
+        }
+        for content_type, count, size_bytes, encrypted, collections, versioned in rows:
+            stats["total_collections"] = int(collections or 0)
+            stats["versioned_artifacts"] = int(versioned or 0)
+            if content_type is None:
+                # LEFT JOIN placeholder row when there are no live artifacts
+                continue
+            stats["artifacts_by_type"][str(content_type)] = int(count)
+            stats["total_artifacts"] += int(count)
+            stats["total_size_bytes"] += int(size_bytes or 0)
+            stats["encrypted_artifacts"] += int(encrypted or 0)
+        stats["total_size_mb"] = round(stats["total_size_bytes"] / (1024 * 1024), 2)
+        return stats
 
-                # Artifacts by type
-                cursor.execute(
-                    """
-                    SELECT content_type, COUNT(*)
-                    FROM artifacts
-                    WHERE status != 'deleted'
-                    GROUP BY content_type
-                """
-                )
-                artifacts_by_type: dict[str, int] = {}
-                for content_type, count in cursor.fetchall():
-                    key = str(content_type) if content_type is not None else "unknown"
-                    artifacts_by_type[key] = int(count)
-                stats["artifacts_by_type"] = artifacts_by_type
+    @staticmethod
+    def _has_stat_counters(cursor: sqlite3.Cursor) -> bool:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artifact_type_counters'"
+        )
+        return cursor.fetchone() is not None
+
+    def enable_stat_counters(self) -> bool:
+        """Create trigger-maintained statistics counters and backfill them
+
+        Makes get_artifact_statistics O(1) for dashboards that poll it, at the
+        cost of a few extra row updates on every artifact write.
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for statement in _STAT_COUNTER_DDL:
+                    cursor.execute(statement)
 
-                # Total storage size
+                # Backfill from current data inside the same transaction
+                cursor.execute("DELETE FROM artifact_type_counters")
                 cursor.execute(
                     """
-                    SELECT SUM(size_bytes)
+                    INSERT INTO artifact_type_counters
+                    (content_type, artifact_count, total_size_bytes, encrypted_count)
+                    SELECT COALESCE(content_type, 'unknown'), COUNT(*),
+                           COALESCE(SUM(size_bytes), 0),
+                           SUM(CASE WHEN encrypted_fields != '' THEN 1 ELSE 0 END)
                     FROM artifacts
                     WHERE status != 'deleted'
-                """
-                )
-                size_row = cursor.fetchone()
-                total_size = int(size_row[0]) if size_row and size_row[0] is not None else 0
-                stats["total_size_bytes"] = total_size
-                stats["total_size_mb"] = round(total_size / (1024 * 1024), 2)
-
-                # Encrypted artifacts
-                cursor.execute(
+                    GROUP BY 1
                     """
-                    SELECT COUNT(*) FROM artifacts
-                    WHERE encrypted_fields != '' AND status != 'deleted'
-                """
                 )
-                encrypted_row = cursor.fetchone()
-                stats["encrypted_artifacts"] = int(encrypted_row[0]) if encrypted_row else 0
-
-                # Collections
-                cursor.execute("SELECT COUNT(*) FROM artifact_collections")
-                collections_row = cursor.fetchone()
-                stats["total_collections"] = int(collections_row[0]) if collections_row else 0
-
-                # Artifacts with versions
                 cursor.execute(
                     """
-                    SELECT COUNT(DISTINCT artifact_id)
-                    FROM artifact_versions
-                """
+                    INSERT OR REPLACE INTO artifact_stat_totals (name, value)
+                    VALUES ('collections', (SELECT COUNT(*) FROM artifact_collections)),
+                           ('versioned_artifacts',
+                            (SELECT COUNT(DISTINCT artifact_id) FROM artifact_versions))
+                    """
                 )
-                versioned_row = cursor.fetchone()
-                stats["versioned_artifacts"] = int(versioned_row[0]) if versioned_row else 0
+                conn.commit()
+                return True
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to enable artifact stat counters: {str(e)}")
+            return False
 
-                return stats
+    def disable_stat_counters(self) -> bool:
+        """Drop the statistics counters and their triggers"""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for trigger in _STAT_COUNTER_TRIGGERS:
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                cursor.execute("DROP TABLE IF EXISTS artifact_type_counters")
+                cursor.execute("DROP TABLE IF EXISTS artifact_stat_totals")
+                conn.commit()
+                return True
 
-        except Exception as e:
-            self.logger.error(f"Failed to get artifact statistics: {str(e)}")
-            return {
-                "total_artifacts": 0,
-                "artifacts_by_type": {},
-                "total_size_bytes": 0,
-                "total_size_mb": 0.0,
-                "encrypted_artifacts": 0,
-                "total_collections": 0,
-                "versioned_artifacts": 0,
-            }
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to disable artifact stat counters: {str(e)}")
+            return False
 
     def _create_version(self, cursor: sqlite3.Cursor, artifact: Artifact) -> ArtifactVersion:
         """Create initial version for new artifact"""
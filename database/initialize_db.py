@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
+from .artifact_blobs import ArtifactBlobStore
+
 # Migration system
 from .migrations import MigrationRunner, get_notes_migrations
 
@@ -60,6 +62,68 @@ DB_FILES: Final[dict[str, str]] = {
     "timers": "timers.db",
 }
 
+# Sortable integer bounds of a calendar event (wall-clock seconds, all-day and
+# overnight events included) as virtual generated columns; end_ts is inclusive.
+# A start_time strftime cannot parse (e.g. '9am') falls back to midnight, so the
+# event still lands on its date
+EVENT_START_TS_SQL = (
+    "COALESCE(CAST(strftime('%s', event_date || ' ' || CASE WHEN all_day "
+    "OR IFNULL(start_time, '') = '' THEN '00:00' ELSE start_time END) AS INTEGER), "
+    "CAST(strftime('%s', event_date) AS INTEGER))"
+)
+_EVENT_END_TIME_TS_SQL = "CAST(strftime('%s', event_date || ' ' || end_time) AS INTEGER)"
+EVENT_END_TS_SQL = (
+    "COALESCE(CASE WHEN all_day THEN start_ts + 86399 "
+    "WHEN IFNULL(end_time, '') = '' THEN start_ts "
+    f"WHEN {_EVENT_END_TIME_TS_SQL} > start_ts THEN {_EVENT_END_TIME_TS_SQL} - 1 "
+    f"WHEN {_EVENT_END_TIME_TS_SQL} = start_ts THEN start_ts "
+    f"ELSE {_EVENT_END_TIME_TS_SQL} + 86399 END, start_ts)"
+)
+EVENT_RANGE_COLUMNS: Final[dict[str, str]] = {
+    "start_ts": f"INTEGER GENERATED ALWAYS AS ({EVENT_START_TS_SQL}) VIRTUAL",
+    "end_ts": f"INTEGER GENERATED ALWAYS AS ({EVENT_END_TS_SQL}) VIRTUAL",
+}
+
+EVENT_FTS_TABLE = "calendar_events_fts"
+EVENT_FTS_DDLS: Final[list[str]] = [
+    f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {EVENT_FTS_TABLE} USING fts5(
+            title,
+            description,
+            location,
+            notes,
+            content='calendar_events',
+            content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+    """,
+    f"""
+        CREATE TRIGGER IF NOT EXISTS calendar_events_fts_ai AFTER INSERT ON calendar_events BEGIN
+            INSERT INTO {EVENT_FTS_TABLE}(rowid, title, description, location, notes)
+            VALUES (new.rowid, new.title, new.description, new.location, new.notes);
+        END
+    """,
+    f"""
+        CREATE TRIGGER IF NOT EXISTS calendar_events_fts_ad AFTER DELETE ON calendar_events BEGIN
+            INSERT INTO {EVENT_FTS_TABLE}({EVENT_FTS_TABLE}, rowid, title, description, location, notes)
+            VALUES ('delete', old.rowid, old.title, old.description, old.location, old.notes);
+        END
+    """,
+    f"""
+        CREATE TRIGGER IF NOT EXISTS calendar_events_fts_au
+        AFTER UPDATE OF title, description, location, notes ON calendar_events BEGIN
+            INSERT INTO {EVENT_FTS_TABLE}({EVENT_FTS_TABLE}, rowid, title, description, location, notes)
+            VALUES ('delete', old.rowid, old.title, old.description, old.location, old.notes);
+            INSERT INTO {EVENT_FTS_TABLE}(rowid, title, description, location, notes)
+            VALUES (new.rowid, new.title, new.description, new.location, new.notes);
+        END
+    """,
+]
+
+# External-content FTS indexes to rebuild after VACUUM, by database key
+FTS_TABLES: Final[dict[str, str]] = {"notes": "note_fts", "appointments": EVENT_FTS_TABLE}
+
 # Declarative schema definitions (idempotent DDLs; names/types preserved)
 SCHEMA_DDLS: Final[dict[str, list[str]]] = {
     "notes": [
@@ -231,9 +295,11 @@ SCHEMA_DDLS: Final[dict[str, list[str]]] = {
                 metadata TEXT,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                completed_at DATETIME
+                completed_at DATETIME,
+                start_ts {start_ts},
+                end_ts {end_ts}
             )
-        """,
+        """.format(**EVENT_RANGE_COLUMNS),
         """
             CREATE TABLE IF NOT EXISTS event_reminders (
                 id TEXT PRIMARY KEY,
@@ -256,8 +322,16 @@ SCHEMA_DDLS: Final[dict[str, list[str]]] = {
                 FOREIGN KEY (event_id) REFERENCES calendar_events (id)
             )
         """,
-        "CREATE INDEX IF NOT EXISTS idx_events_date ON calendar_events(event_date)",
+        # Day views sort by start time; the composite index replaces idx_events_date
+        "DROP INDEX IF EXISTS idx_events_date",
+        "CREATE INDEX IF NOT EXISTS idx_events_date_time ON calendar_events(event_date, start_time)",
+        # Overlap queries for date ranges scan start_ts and filter end_ts in the index
+        "CREATE INDEX IF NOT EXISTS idx_events_range ON calendar_events(start_ts, end_ts)",
         "CREATE INDEX IF NOT EXISTS idx_events_status ON calendar_events(status)",
+        # Covers get_event_statistics; the second serves its upcoming-week range count
+        "CREATE INDEX IF NOT EXISTS idx_events_stats "
+        "ON calendar_events(status, event_type, event_date, reminder_minutes_before)",
+        "CREATE INDEX IF NOT EXISTS idx_events_status_date ON calendar_events(status, event_date)",
         "CREATE INDEX IF NOT EXISTS idx_events_project ON calendar_events(project_id)",
         "CREATE INDEX IF NOT EXISTS idx_events_chat_session ON calendar_events(chat_session_id)",
         "CREATE INDEX IF NOT EXISTS idx_events_created ON calendar_events(created_at)",
@@ -345,6 +419,17 @@ SCHEMA_DDLS: Final[dict[str, list[str]]] = {
                 UNIQUE(artifact_id, user_id)
             )
         """,
+        """
+            CREATE TABLE IF NOT EXISTS artifact_blobs (
+                storage_path TEXT PRIMARY KEY,
+                checksum TEXT NOT NULL,
+                encrypted BOOLEAN DEFAULT 0,
+                size_bytes INTEGER DEFAULT 0,
+                stored_size_bytes INTEGER DEFAULT 0,
+                ref_count INTEGER NOT NULL DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
         "CREATE INDEX IF NOT EXISTS idx_artifacts_name ON artifacts(name)",
         "CREATE INDEX IF NOT EXISTS idx_artifacts_type ON artifacts(content_type)",
         "CREATE INDEX IF NOT EXISTS idx_artifacts_status ON artifacts(status)",
@@ -352,12 +437,17 @@ SCHEMA_DDLS: Final[dict[str, list[str]]] = {
         "CREATE INDEX IF NOT EXISTS idx_artifacts_project ON artifacts(project_id)",
         "CREATE INDEX IF NOT EXISTS idx_artifacts_created ON artifacts(created_at)",
         "CREATE INDEX IF NOT EXISTS idx_artifacts_tags ON artifacts(tags)",
+        # Covers get_artifact_statistics so it never reads the content column
+        "CREATE INDEX IF NOT EXISTS idx_artifacts_stats "
+        "ON artifacts(status, content_type, size_bytes, encrypted_fields)",
         "CREATE INDEX IF NOT EXISTS idx_versions_artifact ON artifact_versions(artifact_id)",
         "CREATE INDEX IF NOT EXISTS idx_versions_number ON artifact_versions(version_number)",
         "CREATE INDEX IF NOT EXISTS idx_collections_name ON artifact_collections(name)",
         "CREATE INDEX IF NOT EXISTS idx_collections_parent ON artifact_collections(parent_id)",
         "CREATE INDEX IF NOT EXISTS idx_permissions_artifact ON artifact_permissions(artifact_id)",
         "CREATE INDEX IF NOT EXISTS idx_permissions_user ON artifact_permissions(user_id)",
+        "CREATE INDEX IF NOT EXISTS idx_blobs_unreferenced ON artifact_blobs(ref_count) "
+        "WHERE ref_count <= 0",
     ],
     "file_search": [
         """
@@ -766,10 +856,17 @@ class DatabaseManager:
 
     def _setup_schema(self, db_key: str, conn: sqlite3.Connection) -> None:
         """Apply schema DDLs and run migrations for a given database key."""
+        # Columns added since a table was first created must exist before its indexes
+        if db_key == "appointments":
+            self._apply_event_range_columns(conn)
+
         # Apply base schema DDLs first
         if ddls := SCHEMA_DDLS.get(db_key, []):
             self._exec_ddl_batch(conn, ddls)
 
+        if db_key == "appointments":
+            self._apply_event_fts(conn)
+
         # Run migrations for the notes database
         if db_key == "notes":
             self._run_notes_migrations(conn)
@@ -827,6 +924,61 @@ class DatabaseManager:
             # Log but do not fail initialization if PRAGMA queries fail
             LOGGER.warning("Notes migration check failed: %s", e)
 
+    def _apply_event_range_columns(self, conn: sqlite3.Connection) -> None:
+        """Add (or rebuild stale) start_ts/end_ts generated columns on an existing calendar_events table."""
+        cur = conn.cursor()
+        try:
+            # table_xinfo (unlike table_info) lists generated columns
+            cur.execute("PRAGMA table_xinfo(calendar_events)")
+            columns = {row[1] for row in cur.fetchall()}
+            if not columns:
+                return  # Table not created yet; SCHEMA_DDLS includes the columns
+            cur.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'calendar_events'"
+            )
+            if (
+                columns >= EVENT_RANGE_COLUMNS.keys()
+                and EVENT_START_TS_SQL not in cur.fetchone()[0]
+            ):
+                # Generated columns cannot be altered: drop stale ones (end_ts reads
+                # start_ts) and re-add them; SCHEMA_DDLS recreates the index
+                cur.execute("DROP INDEX IF EXISTS idx_events_range")
+                for name in reversed(EVENT_RANGE_COLUMNS):
+                    cur.execute(f"ALTER TABLE calendar_events DROP COLUMN {name}")
+                    columns.discard(name)
+            missing = [name for name in EVENT_RANGE_COLUMNS if name not in columns]
+            for name in missing:
+                cur.execute(
+                    f"ALTER TABLE calendar_events ADD COLUMN {name} {EVENT_RANGE_COLUMNS[name]}"
+                )
+            if missing:
+                conn.commit()
+                self.user_feedback("[OK] Added range columns to existing calendar events table")
+        except sqlite3.Error as e:
+            LOGGER.warning("Calendar events range column upgrade failed: %s", e)
+
+    def _apply_event_fts(self, conn: sqlite3.Connection) -> None:
+        """Create the calendar_events_fts index (and populate it) if it is missing.
+
+        SQLite builds without FTS5 are skipped; AppointmentsDatabase.search_events
+        falls back to LIKE queries when the index does not exist.
+        """
+        cur = conn.cursor()
+        try:
+            cur.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (EVENT_FTS_TABLE,),
+            )
+            if cur.fetchone() is not None:
+                return
+            for statement in EVENT_FTS_DDLS:
+                cur.execute(statement)
+            cur.execute(f"INSERT INTO {EVENT_FTS_TABLE}({EVENT_FTS_TABLE}) VALUES('rebuild')")
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            LOGGER.warning("Calendar events full-text index unavailable: %s", e)
+
     def _validate_user_data_permissions(self, path: Path) -> bool:
         """
         Validate that we have proper permissions to create/write to user data directory.
@@ -1131,6 +1283,26 @@ class DatabaseManager:
                 except OSError:
                     continue
 
+    @staticmethod
+    def _rebuild_fts(conn: sqlite3.Connection, table: str) -> None:
+        """Re-index an external-content FTS table; VACUUM may renumber the rowids it points at."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+        if cursor.fetchone() is not None:
+            cursor.execute(f"INSERT INTO {table}({table}) VALUES('rebuild')")
+            conn.commit()
+
+    def _collect_artifact_blobs(
+        self, conn: sqlite3.Connection, stats: dict[str, int | float]
+    ) -> None:
+        """Delete artifact blobs no artifact or version references any more."""
+        blob_stats = ArtifactBlobStore(self.base_dir, self.user_name).collect_garbage(conn)
+        removed = blob_stats["blobs_removed"] + blob_stats["orphans_removed"]
+        stats["files_removed"] += removed
+        stats["space_freed_mb"] += blob_stats["bytes_freed"] / BYTES_TO_MB_DIVISOR
+        if removed and hasattr(self, "user_feedback"):
+            self.user_feedback(f"Removed {removed} unreferenced artifact blobs")
+
     def cleanup_user_data(
         self,
         cleanup_temp_files: bool = True,
@@ -1176,7 +1348,11 @@ class DatabaseManager:
             for db_name, get_connection in db_connections:
                 try:
                     with get_connection() as conn:
+                        if db_name == "artifacts":
+                            self._collect_artifact_blobs(conn, stats)
                         conn.execute("VACUUM")
+                        if db_name in FTS_TABLES:
+                            self._rebuild_fts(conn, FTS_TABLES[db_name])
                         if hasattr(self, "user_feedback"):
                             self.user_feedback(f"Vacuumed {db_name} database")
                 except (sqlite3.Error, OSError):
@@ -0,0 +1,136 @@
+"""
+Migration 006: Full-Text Search Index for Notes
+
+This migration adds an external-content FTS5 index over note titles, content and
+tags so that note searches no longer scan note_list with LIKE '%query%'.
+
+Changes:
+1. Create the note_fts virtual table backed by note_list (content stored once)
+2. Add triggers that keep note_fts in sync on insert, update and delete
+3. Populate the index from existing notes
+
+Benefits:
+- Searches use the inverted index instead of a full table scan
+- bm25() relevance ranking and snippet() highlights for results
+- Prefix queries served from dedicated prefix indexes
+
+SQLite builds without FTS5 skip this migration; NotesRepository keeps using
+the LIKE search path when note_fts does not exist.
+"""
+
+import logging
+import sqlite3
+
+from database.migrations.base import BaseMigration, MigrationError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class NotesFullTextSearchMigration(BaseMigration):
+    """Migration to add an FTS5 index over note_list"""
+
+    def __init__(self):
+        super().__init__(
+            version="006",
+            name="notes_fts",
+            description="Add FTS5 full-text index over note title, content and tags",
+        )
+
+    def up(self, conn: sqlite3.Connection) -> None:
+        """Create the FTS5 table, sync triggers and initial index"""
+        if not self._has_fts5(conn):
+            LOGGER.warning("SQLite build lacks FTS5; notes search will use LIKE queries")
+            return
+
+        cursor = conn.cursor()
+
+        try:
+            # Step 1: External-content table; rows are read back from note_list
+            cursor.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS note_fts USING fts5(
+                    title,
+                    content,
+                    tags,
+                    content='note_list',
+                    content_rowid='rowid',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3'
+                )
+            """
+            )
+
+            # Step 2: Keep the index in sync with note_list
+            self._add_sync_triggers(cursor)
+
+            # Step 3: Index existing notes
+            cursor.execute("INSERT INTO note_fts(note_fts) VALUES('rebuild')")
+
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            raise MigrationError(f"Failed to create notes full-text index: {e}") from e
+
+    @staticmethod
+    def _has_fts5(conn: sqlite3.Connection) -> bool:
+        """Check if the SQLite library was compiled with FTS5"""
+        try:
+            conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+            conn.execute("DROP TABLE temp.fts5_probe")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def _add_sync_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """Add triggers mirroring note_list writes into note_fts"""
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS note_fts_ai AFTER INSERT ON note_list BEGIN
+                INSERT INTO note_fts(rowid, title, content, tags)
+                VALUES (new.rowid, new.title, new.content, new.tags);
+            END
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS note_fts_ad AFTER DELETE ON note_list BEGIN
+                INSERT INTO note_fts(note_fts, rowid, title, content, tags)
+                VALUES ('delete', old.rowid, old.title, old.content, old.tags);
+            END
+        """
+        )
+
+        # Only indexed columns trigger a re-index; soft deletes and project moves do not
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS note_fts_au AFTER UPDATE OF title, content, tags
+            ON note_list BEGIN
+                INSERT INTO note_fts(note_fts, rowid, title, content, tags)
+                VALUES ('delete', old.rowid, old.title, old.content, old.tags);
+                INSERT INTO note_fts(rowid, title, content, tags)
+                VALUES (new.rowid, new.title, new.content, new.tags);
+            END
+        """
+        )
+
+    def down(self, conn: sqlite3.Connection) -> None:
+        """Remove the FTS5 index and its triggers"""
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DROP TRIGGER IF EXISTS note_fts_ai")
+            cursor.execute("DROP TRIGGER IF EXISTS note_fts_ad")
+            cursor.execute("DROP TRIGGER IF EXISTS note_fts_au")
+            cursor.execute("DROP TABLE IF EXISTS note_fts")
+
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            raise MigrationError(f"Failed to rollback notes full-text index: {e}") from e
+
+
+# Migration instance
+migration = NotesFullTextSearchMigration()
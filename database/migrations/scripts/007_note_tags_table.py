@@ -0,0 +1,116 @@
+"""
+Migration 007: Normalized note_tags Table
+
+This migration makes the normalized note_tags table the primary tag store on every
+platform. It was previously only created for SQLite builds without JSON1.
+
+Changes:
+1. Create note_tags (note_id, tag) with an index on tag
+2. Populate it from the existing note_list.tags JSON arrays
+3. Drop note_tags rows automatically when a note is hard-deleted
+
+Benefits:
+- Tag counts come from GROUP BY over an index instead of decoding every note's JSON
+- Tag lookups, renames and removals touch only the rows carrying that tag
+- No dependency on the JSON1 extension for tag queries
+
+note_list.tags is kept as a denormalized copy for reads; NotesRepository writes
+both in the same transaction.
+"""
+
+import json
+import sqlite3
+
+from database.migrations.base import BaseMigration, MigrationError
+
+
+class NoteTagsTableMigration(BaseMigration):
+    """Migration to create and populate the normalized note_tags table"""
+
+    def __init__(self):
+        super().__init__(
+            version="007",
+            name="note_tags_table",
+            description="Create normalized note_tags table as the primary tag store",
+        )
+
+    def up(self, conn: sqlite3.Connection) -> None:
+        """Create note_tags, its indexes and cleanup trigger, then backfill"""
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS note_tags (
+                    note_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (note_id, tag),
+                    FOREIGN KEY (note_id) REFERENCES note_list(id) ON DELETE CASCADE
+                )
+            """
+            )
+
+            # The primary key serves note_id lookups; tag queries need their own index
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_note_tags_tag ON note_tags(tag, note_id)
+            """
+            )
+
+            # foreign_keys is not enabled on our connections, so cascade explicitly
+            cursor.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS note_tags_note_deleted
+                AFTER DELETE ON note_list BEGIN
+                    DELETE FROM note_tags WHERE note_id = old.id;
+                END
+            """
+            )
+
+            self._populate_tag_table(cursor)
+
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            raise MigrationError(f"Failed to create note_tags table: {e}") from e
+
+    def _populate_tag_table(self, cursor: sqlite3.Cursor) -> None:
+        """Populate note_tags from existing JSON tag data"""
+        cursor.execute("SELECT id, tags FROM note_list WHERE tags IS NOT NULL AND tags != ''")
+
+        tag_insertions = []
+        for note_id, tags_json in cursor.fetchall():
+            try:
+                tags = json.loads(tags_json)
+            except (json.JSONDecodeError, TypeError):
+                # Skip malformed tag data
+                continue
+            if not isinstance(tags, list):
+                continue
+            for tag in tags:
+                if isinstance(tag, str) and tag.strip():
+                    tag_insertions.append((note_id, tag.lower().strip()))
+
+        if tag_insertions:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO note_tags (note_id, tag) VALUES (?, ?)", tag_insertions
+            )
+
+    def down(self, conn: sqlite3.Connection) -> None:
+        """Remove the note_tags table and its trigger"""
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("DROP TRIGGER IF EXISTS note_tags_note_deleted")
+            cursor.execute("DROP TABLE IF EXISTS note_tags")
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            raise MigrationError(f"Failed to remove note_tags table: {e}") from e
+
+
+# Migration instance
+migration = NoteTagsTableMigration()
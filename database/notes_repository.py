@@ -3,9 +3,10 @@ NotesRepository - Pure database operations for notes management.
 Handles all SQLite database interactions without business logic.
 """
 
+import html
 import json
+import re
 import sqlite3
-from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -16,6 +17,16 @@ from utils.logger import Logger
 from .initialize_db import DatabaseManager
 
 NOTE_TABLE = "note_list"
+NOTE_TAGS_TABLE = "note_tags"
+
+# Restricts a note_tags statement to rows of non-deleted notes (primary key lookup per row)
+_ACTIVE_NOTE_TAG = (
+    f"EXISTS (SELECT 1 FROM {NOTE_TABLE} n WHERE n.id = {NOTE_TAGS_TABLE}.note_id"
+    " AND n.is_deleted = 0)"
+)
+
+# Max ids per IN (...) list, below SQLite's default host parameter limit
+_ID_BATCH_SIZE = 500
 INVALID_TABLE_ERROR = "Invalid table name"
 
 NOTE_SELECT_COLUMNS = "id, title, content, content_html, tags, created_at, updated_at, project_id"
@@ -29,6 +40,31 @@ UPDATE_NOTE_FIELD_QUERIES = {
 }
 
 
+NOTE_FTS_TABLE = "note_fts"
+
+# FTS5 column filters for each search filter option (None searches every column)
+FTS_FILTER_COLUMNS: dict[str, str | None] = {
+    "Title Only": "title",
+    "Content Only": "content",
+    "Tags Only": "tags",
+    "All": None,
+}
+
+# bm25() weights for (title, content, tags): title and tag hits rank above body hits
+FTS_BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+# Snippet markers are control characters so the surrounding note text can be
+# HTML-escaped before they are swapped for <mark> tags
+_SNIPPET_OPEN = "\x02"
+_SNIPPET_CLOSE = "\x03"
+SNIPPET_TOKENS = 12
+# snippet() is the most expensive part of a broad match, so only the best-ranked
+# results (the ones a result list actually shows) get one
+SNIPPET_RESULT_LIMIT = 100
+
+_FTS_TERM_RE = re.compile(r"\w+")
+
+
 @dataclass
 class QueryResult:
     """Standardized result for database operations"""
@@ -45,10 +81,11 @@ class NotesRepository:
     No business logic, security, or validation - just database CRUD.
     """
 
-    def __init__(self, user_name: str | None = None):
+    def __init__(self, user_name: str | None = None, db_manager: DatabaseManager | None = None):
         self.logger = Logger()
-        self.db_manager = DatabaseManager(user_name)
+        self.db_manager = db_manager or DatabaseManager(user_name)
         self.table_name = NOTE_TABLE
+        self._fts_available: bool | None = None
         self._ensure_database_ready()
 
     def _ensure_database_ready(self) -> None:
@@ -137,15 +174,15 @@ class NotesRepository:
 
         return normalized_tags
 
-    def _has_json1_support(self) -> bool:
-        """Check if SQLite installation supports JSON1 extension"""
-        try:
-            with self.db_manager.get_notes_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT json_valid('[]')")
-                return True
-        except sqlite3.OperationalError:
-            return False
+    @staticmethod
+    def _replace_note_tags(cursor: sqlite3.Cursor, note_id: str, tags: list[str]) -> None:
+        """Replace a note's rows in note_tags (caller owns the transaction)"""
+        cursor.execute(f"DELETE FROM {NOTE_TAGS_TABLE} WHERE note_id = ?", (note_id,))
+        if tags:
+            cursor.executemany(
+                f"INSERT OR IGNORE INTO {NOTE_TAGS_TABLE} (note_id, tag) VALUES (?, ?)",
+                [(note_id, tag) for tag in tags],
+            )
 
     def create_note(self, note: Note, content_html: str | None = None) -> QueryResult:
         """Insert a new note into the database"""
@@ -171,10 +208,18 @@ class NotesRepository:
             note.project_id,
         )
 
-        result = self._execute_write(query, params)
-        if result.success:
-            self.logger.info(f"Created note with ID: {note.id}")
-        return result
+        try:
+            with self.db_manager.get_notes_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                NotesRepository._replace_note_tags(cursor, note.id, normalized_tags)
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Database write error: {str(e)}")
+            return QueryResult(success=False, error=str(e))
+
+        self.logger.info(f"Created note with ID: {note.id}")
+        return QueryResult(success=True, affected_rows=1)
 
     def get_note_by_id(self, note_id: str) -> QueryResult:
         """Retrieve a single note by ID"""
@@ -226,6 +271,7 @@ class NotesRepository:
         """Update a note with the provided field updates."""
 
         processed_updates: list[tuple[str, Any]] = []
+        normalized_tags: list[str] | None = None
         for field in UPDATE_NOTE_FIELD_QUERIES:
             if field in updates:
                 value = updates[field]
@@ -248,6 +294,8 @@ class NotesRepository:
                     cursor.execute(query, (field_value, timestamp, note_id))
                     if cursor.rowcount:
                         affected_rows += cursor.rowcount
+                if normalized_tags is not None and affected_rows > 0:
+                    NotesRepository._replace_note_tags(cursor, note_id, normalized_tags)
                 conn.commit()
         except Exception as exc:
             self.logger.error(f"Error updating note {note_id}: {exc}")
@@ -321,10 +369,145 @@ class NotesRepository:
             self.logger.error(f"Error retrieving deleted notes: {str(e)}")
             return QueryResult(success=False, error=str(e))
 
+    def _has_fts_index(self) -> bool:
+        """Check (once) whether migration 006 created the note_fts index"""
+        if self._fts_available is None:
+            try:
+                with self.db_manager.get_notes_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                        (NOTE_FTS_TABLE,),
+                    )
+                    self._fts_available = cursor.fetchone() is not None
+            except sqlite3.Error:
+                self._fts_available = False
+        return self._fts_available
+
+    @staticmethod
+    def _build_fts_query(query: str, filter_option: str) -> str | None:
+        """
+        Convert free-form user input into an FTS5 MATCH expression.
+
+        Every word becomes a quoted prefix term (so FTS5 operators in user input are
+        treated as text) and all terms must match. Returns None when the input has
+        no searchable words.
+        """
+        terms = _FTS_TERM_RE.findall(query)
+        if not terms:
+            return None
+
+        expression = " ".join(f'"{term}"*' for term in terms)
+        column = FTS_FILTER_COLUMNS.get(filter_option)
+        if column:
+            return f"{column} : ({expression})"
+        return expression
+
+    @staticmethod
+    def _render_snippet(snippet: str | None) -> str:
+        """HTML-escape an FTS snippet and turn its match markers into <mark> tags"""
+        if not snippet:
+            return ""
+        escaped = html.escape(snippet)
+        return escaped.replace(_SNIPPET_OPEN, "<mark>").replace(_SNIPPET_CLOSE, "</mark>")
+
     def search_notes(
         self, query: str, filter_option: str = "All", project_id: str | None = None
     ) -> QueryResult:
-        """Search notes with various filter options"""
+        """
+        Search notes with various filter options.
+
+        Uses the FTS5 index when available: results are ranked by bm25() and set
+        ``Note.search_rank``; the first SNIPPET_RESULT_LIMIT results also set
+        ``Note.search_snippet`` (HTML with <mark> highlights, "" for the rest). Falls
+        back to LIKE matching when the index is missing or the query contains no
+        searchable words; those results leave both fields None.
+        """
+        fts_query = self._build_fts_query(query, filter_option)
+        if fts_query is None or not self._has_fts_index():
+            return self.search_notes_like(query, filter_option, project_id)
+
+        try:
+            weights = ", ".join(str(weight) for weight in FTS_BM25_WEIGHTS)
+            note_columns = ", ".join(f"n.{col.strip()}" for col in NOTE_SELECT_COLUMNS.split(","))
+
+            # CROSS JOIN pins note_fts as the outer loop; otherwise the planner may scan
+            # note_list by is_deleted and run the MATCH once per note
+            sql_parts = [
+                f"SELECT {note_columns}, n.rowid AS note_rowid,",
+                f"bm25({NOTE_FTS_TABLE}, {weights}) AS rank",
+                f"FROM {NOTE_FTS_TABLE} CROSS JOIN {NOTE_TABLE} n",
+                f"ON n.rowid = {NOTE_FTS_TABLE}.rowid",
+                f"WHERE {NOTE_FTS_TABLE} MATCH ? AND n.is_deleted = 0",
+            ]
+            params: list[Any] = [fts_query]
+
+            if project_id is not None:
+                sql_parts.append("AND n.project_id = ?")
+                params.append(project_id)
+
+            sql_parts.append("ORDER BY rank, n.updated_at DESC")
+            search_query = " ".join(sql_parts)
+
+            with self.db_manager.get_notes_connection() as conn:
+                cursor = conn.cursor()
+                # Named access to the rowid and rank that follow the note columns
+                cursor.row_factory = sqlite3.Row
+                cursor.execute(search_query, tuple(params))
+                rows = cursor.fetchall()
+                snippets = self._fetch_snippets(
+                    cursor,
+                    fts_query,
+                    filter_option,
+                    [row["note_rowid"] for row in rows[:SNIPPET_RESULT_LIMIT]],
+                )
+
+            notes = []
+            for row in rows:
+                note = NotesRepository._row_to_note(row)
+                note.search_snippet = snippets.get(row["note_rowid"], "")
+                note.search_rank = row["rank"]
+                notes.append(note)
+
+            self.logger.info(f"Full-text search found {len(notes)} notes for query: '{query}'")
+            return QueryResult(success=True, data=notes)
+
+        except sqlite3.OperationalError as e:
+            # Index unusable (e.g. dropped or corrupt): keep search working
+            self.logger.warning(f"Full-text search failed, falling back to LIKE: {str(e)}")
+            return self.search_notes_like(query, filter_option, project_id)
+        except Exception as e:
+            self.logger.error(f"Error searching notes: {str(e)}")
+            return QueryResult(success=False, error=str(e))
+
+    @staticmethod
+    def _fetch_snippets(
+        cursor: sqlite3.Cursor, fts_query: str, filter_option: str, rowids: list[int]
+    ) -> dict[int, str]:
+        """Build highlighted snippets for the given matched rows, keyed by rowid"""
+        if not rowids:
+            return {}
+
+        column = FTS_FILTER_COLUMNS.get(filter_option)
+        # snippet() column -1 picks the best matching column
+        snippet_column = ("title", "content", "tags").index(column) if column else -1
+        placeholders = ",".join(["?"] * len(rowids))
+        cursor.execute(
+            f"""
+            SELECT rowid, snippet({NOTE_FTS_TABLE}, {snippet_column}, ?, ?, '…', {SNIPPET_TOKENS})
+            FROM {NOTE_FTS_TABLE}
+            WHERE {NOTE_FTS_TABLE} MATCH ? AND rowid IN ({placeholders})
+            """,
+            (_SNIPPET_OPEN, _SNIPPET_CLOSE, fts_query, *rowids),
+        )
+        return {
+            rowid: NotesRepository._render_snippet(snippet) for rowid, snippet in cursor.fetchall()
+        }
+
+    def search_notes_like(
+        self, query: str, filter_option: str = "All", project_id: str | None = None
+    ) -> QueryResult:
+        """Search notes by substring (LIKE) matching, ordered by last update"""
         try:
             filter_map: dict[str, tuple[str, list[str]]] = {
                 "Title Only": ("title LIKE ? ESCAPE '\\'", [f"%{query}%"]),
@@ -355,7 +538,7 @@ class NotesRepository:
                 cursor.execute(search_query, tuple(params))
                 notes = [NotesRepository._row_to_note(row) for row in cursor.fetchall()]
 
-            self.logger.info(f"Search found {len(notes)} notes for query: '{query}'")
+            self.logger.info(f"LIKE search found {len(notes)} notes for query: '{query}'")
             return QueryResult(success=True, data=notes)
 
         except Exception as e:
@@ -363,53 +546,28 @@ class NotesRepository:
             return QueryResult(success=False, error=str(e))
 
     def get_notes_by_tag(self, tag: str) -> QueryResult:
-        """Get all notes with a specific tag using efficient JSON1 queries"""
+        """Get all notes with a specific tag via the note_tags index"""
         try:
             # Normalize the search tag for consistent matching
             normalized_tag = tag.lower().strip()
             if not normalized_tag:
                 return QueryResult(success=True, data=[])
 
-            if self._has_json1_support():
-                # Use efficient JSON1 query with EXISTS and json_each
-                with self.db_manager.get_notes_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        f"""
-                        SELECT {NOTE_SELECT_COLUMNS}
-                        FROM {NOTE_TABLE}
-                        WHERE is_deleted = 0
-                        AND EXISTS (
-                            SELECT 1 FROM json_each(tags)
-                            WHERE value = ?
-                        )
-                        ORDER BY updated_at DESC
-                        """,
-                        (normalized_tag,),
-                    )
-
-                    notes = [NotesRepository._row_to_note(row) for row in cursor.fetchall()]
-            else:
-                # Fallback to LIKE query with post-filtering for systems without JSON1
-                tag_pattern = f'%"{normalized_tag}"%'
-                with self.db_manager.get_notes_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        f"""
-                        SELECT {NOTE_SELECT_COLUMNS}
-                        FROM {NOTE_TABLE}
-                        WHERE is_deleted = 0 AND tags LIKE ? ESCAPE '\\'
-                        ORDER BY updated_at DESC
-                        """,
-                        (tag_pattern,),
-                    )
+            note_columns = ", ".join(f"n.{col.strip()}" for col in NOTE_SELECT_COLUMNS.split(","))
+            with self.db_manager.get_notes_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"""
+                    SELECT {note_columns}
+                    FROM {NOTE_TAGS_TABLE} nt
+                    JOIN {NOTE_TABLE} n ON n.id = nt.note_id
+                    WHERE nt.tag = ? AND n.is_deleted = 0
+                    ORDER BY n.updated_at DESC
+                    """,
+                    (normalized_tag,),
+                )
 
-                    notes = []
-                    for row in cursor.fetchall():
-                        note = NotesRepository._row_to_note(row)
-                        # Double-check that the normalized tag is actually in the list
-                        if normalized_tag in (note.tags or []):
-                            notes.append(note)
+                notes = [NotesRepository._row_to_note(row) for row in cursor.fetchall()]
 
             self.logger.info(
                 f"Found {len(notes)} notes with tag: '{tag}' (normalized: '{normalized_tag}')"
@@ -421,37 +579,41 @@ class NotesRepository:
             return QueryResult(success=False, error=str(e))
 
     def get_all_tags(self) -> QueryResult:
-        """Get all unique tags with their usage counts"""
-        try:
-            # Security: Use parameterized query with validated table name
-            if self.table_name != NOTE_TABLE:  # Validate expected table name
-                return QueryResult(False, None, INVALID_TABLE_ERROR)
+        """
+        Get all unique tags with their usage counts.
 
+        Keys keep the casing a tag first appears with in the notes' tag lists,
+        and are ordered by first appearance (note insertion order, then list
+        order). Counts come from note_tags; only the JSON tag lists of the notes
+        where a tag first appears are decoded.
+        """
+        try:
             with self.db_manager.get_notes_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT tags FROM note_list WHERE is_deleted = 0")
-
-                tag_counts: Counter[str] = Counter()
-                original_case: dict[str, str] = {}
-                for row in cursor.fetchall():
-                    serialized_tags = row[0]
-                    if not serialized_tags:
-                        continue
-
-                    tags = json.loads(serialized_tags)
-                    if not isinstance(tags, list):
-                        continue
-
-                    for tag in tags:
-                        if not isinstance(tag, str):
-                            continue
+                cursor.execute(
+                    f"""
+                    SELECT nt.tag, COUNT(*) AS usage_count, MIN(n.rowid) AS first_rowid
+                    FROM {NOTE_TAGS_TABLE} nt
+                    JOIN {NOTE_TABLE} n ON n.id = nt.note_id
+                    WHERE n.is_deleted = 0
+                    GROUP BY nt.tag
+                    ORDER BY first_rowid, nt.tag
+                    """
+                )
+                tag_rows = cursor.fetchall()
 
-                        normalized = tag.lower()
-                        original_case.setdefault(normalized, tag)
-                        tag_counts[normalized] += 1
+                first_rowids = list(dict.fromkeys(row[2] for row in tag_rows))
+                tag_lists: dict[int, str | None] = {}
+                for start in range(0, len(first_rowids), _ID_BATCH_SIZE):
+                    batch = first_rowids[start : start + _ID_BATCH_SIZE]
+                    placeholders = ",".join(["?"] * len(batch))
+                    cursor.execute(
+                        f"SELECT rowid, tags FROM {NOTE_TABLE} WHERE rowid IN ({placeholders})",
+                        tuple(batch),
+                    )
+                    tag_lists.update(cursor.fetchall())
 
-            # Convert to simple dict preserving the first-seen casing
-            result = {original_case[key]: tag_counts[key] for key in tag_counts}
+            result = self._order_tag_counts(tag_rows, tag_lists)
             self.logger.info(f"Retrieved {len(result)} unique tags")
             return QueryResult(success=True, data=result)
 
@@ -459,6 +621,85 @@ class NotesRepository:
             self.logger.error(f"Error retrieving all tags: {str(e)}")
             return QueryResult(success=False, error=str(e))
 
+    @staticmethod
+    def _order_tag_counts(
+        tag_rows: list[tuple[str, int, int]], tag_lists: dict[int, str | None]
+    ) -> dict[str, int]:
+        """Key tag counts by first-seen casing, in first-seen order"""
+        counts: dict[str, int] = {}
+        tags_by_rowid: dict[int, list[str]] = {}
+        for tag, count, rowid in tag_rows:
+            counts[tag] = count
+            tags_by_rowid.setdefault(rowid, []).append(tag)
+
+        result: dict[str, int] = {}
+        for rowid, stored_tags in tags_by_rowid.items():
+            pending = set(stored_tags)
+            tags_json = tag_lists.get(rowid)
+            tags = json.loads(tags_json) if tags_json else []
+            for tag in tags if isinstance(tags, list) else []:
+                normalized = tag.lower().strip() if isinstance(tag, str) else None
+                if normalized in pending:
+                    pending.discard(normalized)
+                    result[tag] = counts[normalized]
+            # Tags missing from the JSON copy keep their stored form
+            for tag in stored_tags:
+                if tag in pending:
+                    result[tag] = counts[tag]
+        return result
+
+    @staticmethod
+    def _tagged_active_note_ids(cursor: sqlite3.Cursor, tag: str) -> list[str]:
+        """Return ids of non-deleted notes carrying tag (indexed lookup)"""
+        cursor.execute(
+            f"""
+            SELECT nt.note_id
+            FROM {NOTE_TAGS_TABLE} nt
+            JOIN {NOTE_TABLE} n ON n.id = nt.note_id
+            WHERE nt.tag = ? AND n.is_deleted = 0
+            """,
+            (tag,),
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _rewrite_tags_json(
+        cursor: sqlite3.Cursor, note_ids: list[str], old_tag: str, new_tag: str | None
+    ) -> None:
+        """Rename (or drop when new_tag is None) a tag in the JSON copy of the given notes"""
+        if not note_ids:
+            return
+
+        timestamp = datetime.now().isoformat()
+        rows: list[tuple[str, str | None]] = []
+        for start in range(0, len(note_ids), _ID_BATCH_SIZE):
+            batch = note_ids[start : start + _ID_BATCH_SIZE]
+            placeholders = ",".join(["?"] * len(batch))
+            cursor.execute(
+                f"SELECT id, tags FROM {NOTE_TABLE} WHERE id IN ({placeholders})", tuple(batch)
+            )
+            rows.extend(cursor.fetchall())
+
+        updates = []
+        for note_id, tags_json in rows:
+            tags = json.loads(tags_json) if tags_json else []
+            updated_tags: list[str] = []
+            for tag in tags:
+                if not isinstance(tag, str):
+                    continue
+                replacement = tag
+                if tag.lower() == old_tag:
+                    if new_tag is None:
+                        continue
+                    replacement = new_tag
+                if replacement not in updated_tags:
+                    updated_tags.append(replacement)
+            updates.append((json.dumps(updated_tags), timestamp, note_id))
+
+        cursor.executemany(
+            f"UPDATE {NOTE_TABLE} SET tags = ?, updated_at = ? WHERE id = ?", updates
+        )
+
     def update_tag_in_notes(self, old_tag: str, new_tag: str) -> QueryResult:
         """Rename a tag across all notes"""
         try:
@@ -469,42 +710,28 @@ class NotesRepository:
             if not old_tag_normalized or not new_tag_normalized:
                 return QueryResult(False, None, "Tag names cannot be empty")
 
-            # Security: Use validated table name
-            if self.table_name != NOTE_TABLE:
-                return QueryResult(False, None, INVALID_TABLE_ERROR)
-
             with self.db_manager.get_notes_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT id, tags FROM note_list WHERE is_deleted = 0")
-
-                affected_notes = 0
-                for row in cursor.fetchall():
-                    note_id = row[0]
-                    tags = json.loads(row[1]) if row[1] else []
-
-                    # Search for normalized tag and replace with normalized new tag
-                    updated_tags = []
-                    tag_found = False
-                    for tag in tags:
-                        if isinstance(tag, str) and tag.lower() == old_tag_normalized:
-                            updated_tags.append(new_tag_normalized)
-                            tag_found = True
-                        else:
-                            updated_tags.append(tag)
-
-                    if tag_found:
-                        # Update the note
-                        # Security: Use validated table name
-                        if self.table_name != NOTE_TABLE:
-                            continue
-
-                        update_result = self._execute_write(
-                            "UPDATE note_list SET tags = ?, updated_at = ? WHERE id = ?",
-                            (json.dumps(updated_tags), datetime.now().isoformat(), note_id),
-                        )
-                        if update_result.success:
-                            affected_notes += 1
+                note_ids = NotesRepository._tagged_active_note_ids(cursor, old_tag_normalized)
+
+                if note_ids and old_tag_normalized != new_tag_normalized:
+                    # Notes that already carry new_tag keep a single row (OR IGNORE) and
+                    # their leftover old_tag row is removed below
+                    cursor.execute(
+                        f"UPDATE OR IGNORE {NOTE_TAGS_TABLE} SET tag = ? "
+                        f"WHERE tag = ? AND {_ACTIVE_NOTE_TAG}",
+                        (new_tag_normalized, old_tag_normalized),
+                    )
+                    cursor.execute(
+                        f"DELETE FROM {NOTE_TAGS_TABLE} WHERE tag = ? AND {_ACTIVE_NOTE_TAG}",
+                        (old_tag_normalized,),
+                    )
+                    NotesRepository._rewrite_tags_json(
+                        cursor, note_ids, old_tag_normalized, new_tag_normalized
+                    )
+                conn.commit()
 
+            affected_notes = len(note_ids)
             self.logger.info(f"Renamed tag '{old_tag}' to '{new_tag}' in {affected_notes} notes")
             return QueryResult(success=True, data={"affected_notes": affected_notes})
 
@@ -520,40 +747,19 @@ class NotesRepository:
             if not tag_normalized:
                 return QueryResult(False, None, "Tag name cannot be empty")
 
-            # Security: Use validated table name
-            if self.table_name != NOTE_TABLE:
-                return QueryResult(False, None, INVALID_TABLE_ERROR)
-
             with self.db_manager.get_notes_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT id, tags FROM note_list WHERE is_deleted = 0")
-
-                affected_notes = 0
-                for row in cursor.fetchall():
-                    note_id = row[0]
-                    tags = json.loads(row[1]) if row[1] else []
-
-                    # Remove normalized tag
-                    original_count = len(tags)
-                    updated_tags = [
-                        tag
-                        for tag in tags
-                        if isinstance(tag, str) and tag.lower() != tag_normalized
-                    ]
-
-                    if len(updated_tags) < original_count:
-                        # Update the note
-                        # Security: Use validated table name
-                        if self.table_name != NOTE_TABLE:
-                            continue
-
-                        update_result = self._execute_write(
-                            "UPDATE note_list SET tags = ?, updated_at = ? WHERE id = ?",
-                            (json.dumps(updated_tags), datetime.now().isoformat(), note_id),
-                        )
-                        if update_result.success:
-                            affected_notes += 1
+                note_ids = NotesRepository._tagged_active_note_ids(cursor, tag_normalized)
+
+                if note_ids:
+                    cursor.execute(
+                        f"DELETE FROM {NOTE_TAGS_TABLE} WHERE tag = ? AND {_ACTIVE_NOTE_TAG}",
+                        (tag_normalized,),
+                    )
+                    NotesRepository._rewrite_tags_json(cursor, note_ids, tag_normalized, None)
+                conn.commit()
 
+            affected_notes = len(note_ids)
             self.logger.info(f"Deleted tag '{tag_to_remove}' from {affected_notes} notes")
             return QueryResult(success=True, data={"affected_notes": affected_notes})
 
@@ -231,7 +231,7 @@ class NotesService:
     def search_notes(
         self, query: str, filter_option: str = "All", project_id: str | None = None
     ) -> OperationResult:
-        """Search notes with validation"""
+        """Search notes with validation; results are ranked by relevance when indexed"""
         try:
             # Validate search parameters
             validation = self.validator.validate_search_query(query, filter_option)
@@ -240,10 +240,11 @@ class NotesService:
                     success=False, error="; ".join(validation.errors), warnings=validation.warnings
                 )
 
-            # Use raw query; repository composes LIKE with ESCAPE and parameterization
+            # Use raw query; repository quotes each term for FTS5 MATCH (or composes
+            # LIKE with ESCAPE when the full-text index is unavailable)
             escaped_query = query
 
-            # Perform search
+            # Perform search (ranked by relevance, with highlighted snippets when indexed)
             repo_result = self.repository.search_notes(escaped_query, filter_option, project_id)
             if repo_result.success:
                 return OperationResult(
@@ -14,10 +14,13 @@ Refactor goals addressed:
 
 from __future__ import annotations
 
+import contextlib
 import json
 import sqlite3
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Protocol, TypeGuard
 
 from models.project import Project, ProjectStatistics, ProjectStatus, ProjectSummary
@@ -49,6 +52,28 @@ STATUS_TIMESTAMPS: dict[str, dict[str, Any]] = {
 }
 
 
+# Sibling databases aggregated into project trees/statistics via ATTACH:
+# key -> (DatabaseManager path attribute, table, filter for live rows)
+RELATED_DATABASES: dict[str, tuple[str, str, str]] = {
+    "notes": ("notes_db_path", "note_list", "is_deleted = 0"),
+    "artifacts": ("artifacts_db_path", "artifacts", "status != 'deleted'"),
+    "events": ("appointments_db_path", "calendar_events", "1 = 1"),
+}
+
+# Aliases of the aggregate columns selected alongside projects.* by
+# _fetch_projects_with_counts
+_COUNT_COLUMNS = (
+    "child_count",
+    "note_count",
+    "notes_last_updated",
+    "artifact_count",
+    "artifacts_last_updated",
+    "event_count",
+    "events_last_updated",
+    "completed_events",
+)
+
+
 def _is_list_any(x: Any) -> TypeGuard[list[Any]]:
     return isinstance(x, list)
 
@@ -81,7 +106,11 @@ class ProjectsDatabase:
 
     @staticmethod
     def _iso_to_dt(value: str | None) -> datetime | None:
-        """Parse an ISO-like datetime string to datetime, robust to minor variations."""
+        """Parse an ISO-like datetime string to a naive local datetime, robust to minor variations.
+
+        Offset-aware values are converted to local time, so timestamps from tables
+        that store them differently can be compared with each other and datetime.now().
+        """
         if not value:
             return None
         try:
@@ -92,7 +121,10 @@ class ProjectsDatabase:
                 v = f"{v[:-1]}+00:00"
             if " " in v and "T" not in v:
                 v = v.replace(" ", "T", 1)
-            return datetime.fromisoformat(v)
+            dt = datetime.fromisoformat(v)
+            if dt.tzinfo is not None:
+                dt = dt.astimezone().replace(tzinfo=None)
+            return dt
         except Exception:
             return None
 
@@ -332,6 +364,104 @@ class ProjectsDatabase:
 
         return summary
 
+    @contextmanager
+    def _attached_related_databases(self, conn: Connection) -> Iterator[dict[str, str]]:
+        """
+        ATTACH the notes, artifacts and appointments databases to a projects connection.
+
+        Yields a mapping of RELATED_DATABASES key -> schema-qualified table name for each
+        sibling database that exists and has its table; missing ones are skipped so their
+        counts read as zero. Everything attached is detached on exit.
+        """
+        attached: list[str] = []
+        tables: dict[str, str] = {}
+        try:
+            for key, (path_attr, table, _where) in RELATED_DATABASES.items():
+                db_path = getattr(self.db_manager, path_attr, None)
+                if db_path is None or not Path(db_path).exists():
+                    continue
+                alias = f"related_{key}"
+                try:
+                    conn.execute(f"ATTACH DATABASE ? AS {alias}", (str(db_path),))
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Could not attach {key} database: {str(e)}")
+                    continue
+                attached.append(alias)
+                row = conn.execute(
+                    f"SELECT 1 FROM {alias}.sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,),
+                ).fetchone()
+                if row:
+                    tables[key] = f"{alias}.{table}"
+            yield tables
+        finally:
+            for alias in attached:
+                with contextlib.suppress(sqlite3.Error):
+                    conn.execute(f"DETACH DATABASE {alias}")
+
+    @staticmethod
+    def _related_counts_sql(key: str, qualified_table: str | None) -> str:
+        """Aggregate one sibling table per project in scope (empty when unavailable)."""
+        if qualified_table is None:
+            return (
+                "SELECT NULL AS project_id, 0 AS item_count, NULL AS last_updated, "
+                "0 AS completed WHERE 0"
+            )
+        where = RELATED_DATABASES[key][2]
+        completed = "SUM(status = 'completed')" if key == "events" else "0"
+        return f"""
+            SELECT project_id, COUNT(*) AS item_count, MAX(updated_at) AS last_updated,
+                   {completed} AS completed
+            FROM {qualified_table}
+            WHERE {where} AND project_id IN (SELECT id FROM scope)
+            GROUP BY project_id
+        """
+
+    def _fetch_projects_with_counts(
+        self, cursor: Cursor, scope_sql: str, params: tuple[Any, ...], related: dict[str, str]
+    ) -> list[tuple[Project, dict[str, Any]]]:
+        """
+        Fetch the projects selected by scope_sql (a CTE body yielding ids, may recurse
+        on "scope") in a single statement, each with its child count and the note,
+        artifact and event aggregates of the attached sibling databases, keyed by the
+        _COUNT_COLUMNS aliases. Rows are ordered by project name.
+        """
+        ctes = [f"scope(id) AS ({scope_sql})"]
+        ctes.extend(
+            f"{key}_counts AS ({self._related_counts_sql(key, related.get(key))})"
+            for key in RELATED_DATABASES
+        )
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(
+            f"""
+            WITH RECURSIVE {", ".join(ctes)}
+            SELECT p.*,
+                   (SELECT COUNT(*) FROM projects c WHERE c.parent_project_id = p.id)
+                       AS child_count,
+                   COALESCE(nc.item_count, 0) AS note_count,
+                   nc.last_updated AS notes_last_updated,
+                   COALESCE(ac.item_count, 0) AS artifact_count,
+                   ac.last_updated AS artifacts_last_updated,
+                   COALESCE(ec.item_count, 0) AS event_count,
+                   ec.last_updated AS events_last_updated,
+                   COALESCE(ec.completed, 0) AS completed_events
+            FROM scope s
+            JOIN projects p ON p.id = s.id
+            LEFT JOIN notes_counts nc ON nc.project_id = p.id
+            LEFT JOIN artifacts_counts ac ON ac.project_id = p.id
+            LEFT JOIN events_counts ec ON ec.project_id = p.id
+            ORDER BY p.name
+            """,
+            params,
+        )
+        return [
+            (
+                ProjectsDatabase._row_to_project(row),
+                {column: row[column] for column in _COUNT_COLUMNS},
+            )
+            for row in cursor.fetchall()
+        ]
+
     def _safe_max_updated_at(self, cursor: Cursor, table: str, project_id: str) -> datetime | None:
         """Safe wrapper around _max_updated_at with table allowlist."""
         if table not in {"notes", "artifacts", "calendar_events"}:
@@ -535,95 +665,95 @@ class ProjectsDatabase:
             return []
 
     def get_project_tree(self, project_id: str) -> dict[str, Any]:
-        """Get project tree structure starting from a project"""
+        """
+        Get project tree structure starting from a project.
+
+        The whole subtree and its note/artifact/event counts are loaded with one
+        recursive query and linked in a single pass; children are ordered by name.
+        """
         try:
-            project = self.get_project(project_id)
-            if not project:
-                return {}
+            with self._get_connection() as conn, self._attached_related_databases(conn) as related:
+                cursor = conn.cursor()
+                # UNION (not UNION ALL) de-duplicates ids, so a corrupt cycle terminates
+                rows = self._fetch_projects_with_counts(
+                    cursor,
+                    """
+                    SELECT id FROM projects WHERE id = ?
+                    UNION
+                    SELECT p.id FROM projects p JOIN scope ON p.parent_project_id = scope.id
+                    """,
+                    (project_id,),
+                    related,
+                )
 
-            tree: dict[str, Any] = {
-                "id": project.id,
-                "name": project.name,
-                "description": project.description,
-                "status": project.status,
-                "color": project.color,
-                "icon": project.icon,
-                "children": [],
-            }
+            nodes: dict[str, dict[str, Any]] = {}
+            for project, counts in rows:
+                nodes[project.id] = {
+                    "id": project.id,
+                    "name": project.name,
+                    "description": project.description,
+                    "status": project.status,
+                    "color": project.color,
+                    "icon": project.icon,
+                    "note_count": counts["note_count"],
+                    "artifact_count": counts["artifact_count"],
+                    "event_count": counts["event_count"],
+                    "children": [],
+                }
 
-            # Recursively get children
-            children = self.get_child_projects(project_id)
-            for child in children:
-                child_tree = self.get_project_tree(child.id)
-                tree["children"].append(child_tree)
+            root = nodes.get(project_id)
+            if root is None:
+                return {}
+
+            for project, _counts in rows:
+                parent = nodes.get(project.parent_project_id or "")
+                if parent is not None and project.id != project_id:
+                    parent["children"].append(nodes[project.id])
 
-            return tree
+            return root
 
         except Exception as e:
             self.logger.error(f"Failed to get project tree: {str(e)}")
             return {}
 
     def get_project_statistics(self, project_id: str) -> ProjectStatistics:
-        """Get comprehensive statistics for a project"""
+        """Get comprehensive statistics for a project (single aggregate query)"""
         project: Project | None = None
         try:
-            project = self.get_project(project_id)
-            if not project:
-                return ProjectStatistics(project_id=project_id, project_name="Unknown")
-
-            stats = ProjectStatistics(project_id=project_id, project_name=project.name)
-
-            with self._get_connection() as conn:
+            with self._get_connection() as conn, self._attached_related_databases(conn) as related:
                 cursor = conn.cursor()
+                rows = self._fetch_projects_with_counts(
+                    cursor, "SELECT id FROM projects WHERE id = ?", (project_id,), related
+                )
 
-                # Related object counts
-                stats.total_notes = self.get_project_notes_count(project_id)
-                stats.total_artifacts = self.get_project_artifacts_count(project_id)
-                stats.total_calendar_events = self.get_project_events_count(project_id)
+            if not rows:
+                return ProjectStatistics(project_id=project_id, project_name="Unknown")
 
-                # Child projects count
-                stats.child_project_count = self._exec_count(
-                    cursor,
-                    """
-                    SELECT COUNT(*) FROM projects
-                    WHERE parent_project_id = ?
-                    """,
-                    (project_id,),
-                )
+            project, counts = rows[0]
+            stats = ProjectStatistics(project_id=project_id, project_name=project.name)
 
-                # Last activity across tables
-                last_activity = None
-                for table in ("notes", "artifacts", "calendar_events"):
-                    candidate = self._safe_max_updated_at(cursor, table, project_id)
-                    if candidate and (last_activity is None or candidate > last_activity):
-                        last_activity = candidate
+            # Related object counts
+            stats.total_notes = int(counts["note_count"])
+            stats.total_artifacts = int(counts["artifact_count"])
+            stats.total_calendar_events = int(counts["event_count"])
+            stats.child_project_count = int(counts["child_count"])
 
-                stats.last_activity_date = last_activity
-                stats.calculate_days_since_activity()
+            # Last activity across the related tables
+            last_activity = None
+            for column in ("notes_last_updated", "artifacts_last_updated", "events_last_updated"):
+                candidate = self._iso_to_dt(counts[column])
+                if candidate and (last_activity is None or candidate > last_activity):
+                    last_activity = candidate
 
-                # Completion metrics from calendar_events
-                completed_events = self._exec_count(
-                    cursor,
-                    """
-                    SELECT COUNT(*) FROM calendar_events
-                    WHERE project_id = ? AND status = 'completed'
-                    """,
-                    (project_id,),
-                )
-                total_events = self._exec_count(
-                    cursor,
-                    """
-                    SELECT COUNT(*) FROM calendar_events
-                    WHERE project_id = ?
-                    """,
-                    (project_id,),
-                )
+            stats.last_activity_date = last_activity
+            stats.calculate_days_since_activity()
 
-                stats.completed_items = completed_events
-                stats.total_items = total_events
-                stats.calculate_completion_percentage()
+            # Completion metrics from calendar_events
+            stats.completed_items = int(counts["completed_events"])
+            stats.total_items = int(counts["event_count"])
+            stats.calculate_completion_percentage()
 
-                return stats
+            return stats
 
         except Exception as e:
             self.logger.error(f"Failed to get project statistics: {str(e)}")
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Reminder Scheduler
+Keeps pending appointment reminders in a due-time heap and dispatches them when
+they come due, instead of polling the appointments database on a fixed interval.
+
+Lifecycle: the scheduler is owned by whoever creates the AppointmentsDatabase
+and decides how reminders are delivered (the API has no calendar routes and
+does not start one). Call start() once the database is ready and stop() on
+shutdown, or use the scheduler as a context manager:
+
+    with ReminderScheduler(appointments_db, dispatch=notify_user):
+        run_app()
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Self
+
+from utils.logger import Logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .appointments_db import AppointmentsDatabase
+
+REMINDER_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class ReminderScheduler:
+    """Dispatches appointment reminders at their due time.
+
+    Pending reminders are loaded once on start and kept in a min-heap keyed by
+    due time; the worker thread sleeps until the earliest one is due. Creating,
+    updating or deleting an event re-syncs only that event's reminders through
+    AppointmentsDatabase's event listeners. Due reminders are handed to
+    ``dispatch`` as one batch and then marked sent in a single statement.
+
+    ``clock`` returns the current local time (reminder times are stored as local
+    naive timestamps) and can be replaced for tests.
+    """
+
+    DEFAULT_RETRY_DELAY = timedelta(minutes=1)
+
+    def __init__(
+        self,
+        appointments_db: AppointmentsDatabase,
+        dispatch: Callable[[list[dict[str, Any]]], None],
+        clock: Callable[[], datetime] = datetime.now,
+        retry_delay: timedelta = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        self.appointments_db = appointments_db
+        self.dispatch = dispatch
+        self.clock = clock
+        self.retry_delay = retry_delay
+        self.logger = Logger()
+
+        # Heap entries are (due, reminder_id); entries whose reminder is no longer
+        # in _pending, or is pending with a different due time, are stale and skipped
+        self._heap: list[tuple[datetime, str]] = []
+        self._pending: dict[str, tuple[datetime, dict[str, Any]]] = {}
+        self._by_event: dict[str, set[str]] = {}
+        # Reminders popped for dispatch but not yet marked sent; re-syncs skip
+        # them so a concurrent event change cannot queue them a second time
+        self._in_flight: set[str] = set()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Load pending reminders and start the dispatch thread"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        self.appointments_db.add_event_listener(self.resync_event)
+        self.resync()
+        self._thread = threading.Thread(target=self._run, name="ReminderScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the dispatch thread and detach from the appointments database"""
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+
+        self.appointments_db.remove_event_listener(self.resync_event)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Queue maintenance
+    # ------------------------------------------------------------------
+
+    def resync(self) -> int:
+        """Rebuild the queue from every unsent reminder in the database
+
+        Returns:
+            Number of reminders queued
+        """
+        reminders = self.appointments_db.get_pending_reminders()
+        with self._condition:
+            self._heap.clear()
+            self._pending.clear()
+            self._by_event.clear()
+            for reminder in reminders:
+                if reminder["id"] not in self._in_flight:
+                    self._add(reminder)
+            self._condition.notify_all()
+            return len(self._pending)
+
+    def resync_event(self, event_id: str) -> None:
+        """Replace the queued reminders of one event with its current database state"""
+        reminders = self.appointments_db.get_pending_reminders(event_id)
+        with self._condition:
+            for reminder_id in self._by_event.pop(event_id, set()):
+                self._pending.pop(reminder_id, None)
+            for reminder in reminders:
+                if reminder["id"] not in self._in_flight:
+                    self._add(reminder)
+            self._condition.notify_all()
+
+    def next_due(self) -> datetime | None:
+        """Due time of the earliest queued reminder, if any"""
+        with self._condition:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def run_due(self, now: datetime | None = None) -> int:
+        """Dispatch every reminder due at ``now`` (defaults to the clock)
+
+        Returns:
+            Number of reminders dispatched and marked sent
+        """
+        now = now or self.clock()
+        with self._condition:
+            due = self._pop_due(now)
+            reminder_ids = [r["id"] for r in due]
+            self._in_flight.update(reminder_ids)
+        if not due:
+            return 0
+
+        try:
+            try:
+                self.dispatch(due)
+            except Exception as e:
+                self.logger.error(f"Reminder dispatch failed, retrying later: {str(e)}")
+                retry_at = now + self.retry_delay
+                with self._condition:
+                    for reminder in due:
+                        self._add(reminder, due=retry_at)
+                return 0
+
+            return self.appointments_db.mark_reminders_sent(reminder_ids)
+        finally:
+            with self._condition:
+                self._in_flight.difference_update(reminder_ids)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                self._discard_stale()
+                if self._heap:
+                    delay = (self._heap[0][0] - self.clock()).total_seconds()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+                else:
+                    self._condition.wait()
+                    continue
+
+            try:
+                self.run_due()
+            except Exception as e:
+                self.logger.error(f"Reminder scheduler error: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Heap helpers (callers hold self._condition)
+    # ------------------------------------------------------------------
+
+    def _add(self, reminder: dict[str, Any], due: datetime | None = None) -> None:
+        if due is None:
+            try:
+                due = datetime.strptime(reminder["reminder_time"], REMINDER_TIME_FORMAT)
+            except (TypeError, ValueError):
+                self.logger.warning(
+                    f"Skipping reminder {reminder.get('id')} with invalid time "
+                    f"{reminder.get('reminder_time')!r}"
+                )
+                return
+
+        reminder_id = reminder["id"]
+        self._pending[reminder_id] = (due, reminder)
+        self._by_event.setdefault(reminder["event_id"], set()).add(reminder_id)
+        heapq.heappush(self._heap, (due, reminder_id))
+
+    def _is_stale(self, due: datetime, reminder_id: str) -> bool:
+        entry = self._pending.get(reminder_id)
+        return entry is None or entry[0] != due
+
+    def _discard_stale(self) -> None:
+        while self._heap and self._is_stale(*self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now: datetime) -> list[dict[str, Any]]:
+        due: list[dict[str, Any]] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, reminder_id = heapq.heappop(self._heap)
+            if self._is_stale(when, reminder_id):
+                continue
+            _, reminder = self._pending.pop(reminder_id)
+            event_ids = self._by_event.get(reminder["event_id"])
+            if event_ids is not None:
+                event_ids.discard(reminder_id)
+                if not event_ids:
+                    del self._by_event[reminder["event_id"]]
+            due.append(reminder)
+        return due
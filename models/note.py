@@ -18,6 +18,9 @@ class Note:
     updated_at: str | None = None
     # content_html is a derived cache of `content`; it is always recomputed to prevent inconsistencies
     content_html: str | None = None
+    # Set on full-text search results only (bm25 rank, highlighted HTML); never persisted
+    search_rank: float | None = field(default=None, compare=False)
+    search_snippet: str | None = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         # Always derive HTML from content to avoid inconsistencies with persisted content_html
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Calendar range benchmark: month and year views and search over a seeded event table.
+
+Seeds N calendar events (default 50,000) over three years in a throwaway user
+directory, mixing timed, all-day and overnight events, then times:
+
+- month/year views: the overlap query behind get_events_for_date_range
+  (indexed start_ts/end_ts columns) against the old event_date string comparison
+- search: the calendar_events_fts prefix match behind search_events against the
+  old LIKE scan
+
+Both sides run as raw SQL on one connection, so row-to-CalendarEvent conversion
+is not part of the timings.
+
+Each query runs --repeat times over different months/years; times are the
+median per query.
+
+Output (stdout, JSON):
+
+{
+  "events": 50000,
+  "month_view": {"legacy_ms": float, "overlap_ms": float, "rows": int},
+  "year_view": {"legacy_ms": float, "overlap_ms": float, "rows": int},
+  "search": {"like_ms": float, "fts_ms": float, "rows": int}
+}
+
+Run:
+  python scripts/appointments_range_benchmark.py
+  python scripts/appointments_range_benchmark.py --events 10000 --output calendar.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import calendar
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from database.appointments_db import (  # noqa: E402
+    EVENT_FTS_TABLE,
+    EVENT_RANGE_SQL,
+    MAX_EVENT_SPAN_SECONDS,
+    AppointmentsDatabase,
+)
+from database.initialize_db import DatabaseManager  # noqa: E402
+
+FIRST_DAY = date(2024, 1, 1)
+DAYS = 3 * 365
+ALL_DAY_SHARE = 0.1
+OVERNIGHT_SHARE = 0.05
+WORDS = ["standup", "review", "dentist", "planning", "lunch", "retro", "demo", "sync", "gym"]
+
+LEGACY_RANGE_SQL = """
+    SELECT * FROM calendar_events
+    WHERE event_date >= ? AND event_date <= ?
+    ORDER BY event_date, start_time
+"""
+FTS_SEARCH_SQL = f"""
+    SELECT e.* FROM {EVENT_FTS_TABLE} f
+    CROSS JOIN calendar_events e ON e.rowid = f.rowid
+    WHERE {EVENT_FTS_TABLE} MATCH ?
+    ORDER BY e.event_date DESC, e.start_time DESC
+    LIMIT 100
+"""
+LEGACY_SEARCH_SQL = """
+    SELECT * FROM calendar_events
+    WHERE title LIKE ? OR description LIKE ?
+    OR location LIKE ? OR notes LIKE ?
+    ORDER BY event_date DESC, start_time DESC
+    LIMIT 100
+"""
+
+
+def _seed(db_manager: DatabaseManager, count: int, rng: random.Random) -> None:
+    rows = []
+    for index in range(count):
+        day = FIRST_DAY + timedelta(days=rng.randrange(DAYS))
+        kind = rng.random()
+        start_hour = rng.randrange(24)
+        if kind < ALL_DAY_SHARE:
+            start_time, end_time, all_day = None, None, 1
+        elif kind < ALL_DAY_SHARE + OVERNIGHT_SHARE:
+            start_time, end_time, all_day = "22:30", "01:30", 0
+        else:
+            end_hour = min(start_hour + 1, 23)
+            start_time, end_time, all_day = f"{start_hour:02d}:00", f"{end_hour:02d}:45", 0
+        title = f"{rng.choice(WORDS)} {rng.choice(WORDS)} #{index}"
+        rows.append(
+            (
+                f"event-{index}",
+                title,
+                f"Notes about {rng.choice(WORDS)}",
+                day.isoformat(),
+                start_time,
+                end_time,
+                all_day,
+                f"Room {rng.randrange(50)}",
+            )
+        )
+
+    with db_manager.get_appointments_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO calendar_events
+            (id, title, description, event_date, start_time, end_time, all_day, location)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            rows,
+        )
+        conn.commit()
+
+
+def _median_ms(samples: list[float]) -> float:
+    return round(statistics.median(samples) * 1000, 3)
+
+
+def _time_views(db_manager: DatabaseManager, ranges: list[tuple[date, date]]) -> dict[str, Any]:
+    legacy, overlap = [], []
+    rows = 0
+    with db_manager.get_appointments_connection() as conn:
+        for start, end in ranges:
+            began = time.perf_counter()
+            conn.execute(LEGACY_RANGE_SQL, (start.isoformat(), end.isoformat())).fetchall()
+            legacy.append(time.perf_counter() - began)
+
+            range_start = calendar.timegm(start.timetuple())
+            range_end = calendar.timegm(end.timetuple()) + MAX_EVENT_SPAN_SECONDS
+            params = (range_start - MAX_EVENT_SPAN_SECONDS, range_end, range_start)
+            began = time.perf_counter()
+            rows = len(conn.execute(EVENT_RANGE_SQL, params).fetchall())
+            overlap.append(time.perf_counter() - began)
+    return {"legacy_ms": _median_ms(legacy), "overlap_ms": _median_ms(overlap), "rows": rows}
+
+
+def _time_search(db_manager: DatabaseManager, terms: list[str]) -> dict[str, Any]:
+    like, fts = [], []
+    rows = 0
+    with db_manager.get_appointments_connection() as conn:
+        for term in terms:
+            pattern = f"%{term}%"
+            began = time.perf_counter()
+            conn.execute(LEGACY_SEARCH_SQL, (pattern, pattern, pattern, pattern)).fetchall()
+            like.append(time.perf_counter() - began)
+
+            fts_query = AppointmentsDatabase._build_fts_query(term)
+            began = time.perf_counter()
+            rows = len(conn.execute(FTS_SEARCH_SQL, (fts_query,)).fetchall())
+            fts.append(time.perf_counter() - began)
+    return {"like_ms": _median_ms(like), "fts_ms": _median_ms(fts), "rows": rows}
+
+
+def run_benchmark(count: int, repeat: int, base_dir: Path) -> dict[str, Any]:
+    rng = random.Random(40)
+    db_manager = DatabaseManager("bench_user", user_feedback=lambda _msg: None, base_dir=base_dir)
+    _seed(db_manager, count, rng)
+
+    months = []
+    for index in range(repeat):
+        first = date(2024 + index % 3, index % 12 + 1, 1)
+        last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        months.append((first, last))
+    years = [
+        (date(2024 + index % 3, 1, 1), date(2024 + index % 3, 12, 31)) for index in range(repeat)
+    ]
+    # Alternate common words with event numbers (a narrow lookup)
+    terms = [
+        str(rng.randrange(count)) if index % 2 else WORDS[index % len(WORDS)]
+        for index in range(repeat)
+    ]
+
+    return {
+        "events": count,
+        "month_view": _time_views(db_manager, months),
+        "year_view": _time_views(db_manager, years),
+        "search": _time_search(db_manager, terms),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=50_000, help="Events (%(default)s)")
+    parser.add_argument("--repeat", type=int, default=12, help="Queries per view (%(default)s)")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="dinoair_calendar_bench_") as tmp:
+        report = run_benchmark(max(1, args.events), max(1, args.repeat), Path(tmp))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
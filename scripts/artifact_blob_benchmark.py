@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Artifact blob store benchmark: storage saved and write throughput for repeated versions.
+
+Creates artifacts in a throwaway user directory through ArtifactsDatabase and
+rewrites each of them many times, cycling through a small pool of payloads (the
+"save the same file again" pattern). Every write is above FILE_SIZE_THRESHOLD
+so it goes to the content-addressed blob store.
+
+Output (stdout, JSON):
+
+{
+  "artifacts": 20, "versions": 25, "distinct_payloads": 4, "payload_mb": 6.0,
+  "writes": int,
+  "logical_mb": float,      # what one content.bin per write would have stored
+  "stored_mb": float,       # bytes actually present under the blob directory
+  "saved_ratio": float,     # 1 - stored / logical
+  "write_mb_per_s": float,
+  "blobs_after_gc": int     # after hard-deleting every artifact and collecting
+}
+
+Run:
+  python scripts/artifact_blob_benchmark.py
+  python scripts/artifact_blob_benchmark.py --artifacts 50 --versions 10 --output blobs.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from database.artifacts_db import ArtifactsDatabase  # noqa: E402
+from database.initialize_db import DatabaseManager  # noqa: E402
+from models.artifact import Artifact  # noqa: E402
+
+
+def _directory_size(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def run_benchmark(
+    artifacts: int, versions: int, distinct: int, payload_mb: float, base_dir: Path
+) -> dict[str, Any]:
+    db_manager = DatabaseManager("bench_user", user_feedback=lambda _msg: None, base_dir=base_dir)
+    database = ArtifactsDatabase(db_manager)
+
+    payload_size = max(int(payload_mb * 1024 * 1024), database.FILE_SIZE_THRESHOLD + 1)
+    payloads = [os.urandom(payload_size) for _ in range(distinct)]
+
+    writes = 0
+    start = time.perf_counter()
+    artifact_ids = []
+    for index in range(artifacts):
+        result = database.create_artifact(
+            Artifact(id="", name=f"bench-{index}"), payloads[index % distinct]
+        )
+        artifact_ids.append(result["id"])
+        writes += 1
+        for version in range(1, versions):
+            if not database.update_artifact(
+                result["id"], {}, payloads[(index + version) % distinct]
+            ):
+                raise RuntimeError(f"update failed for {result['id']}")
+            writes += 1
+    elapsed = time.perf_counter() - start
+
+    blobs_dir = database.blobs.base_dir / database.blobs.relative_root
+    logical_bytes = writes * payload_size
+    stored_bytes = _directory_size(blobs_dir)
+
+    for artifact_id in artifact_ids:
+        database.delete_artifact(artifact_id, hard_delete=True)
+    database.collect_unreferenced_blobs()
+
+    return {
+        "artifacts": artifacts,
+        "versions": versions,
+        "distinct_payloads": distinct,
+        "payload_mb": round(payload_size / (1024 * 1024), 2),
+        "writes": writes,
+        "logical_mb": round(logical_bytes / (1024 * 1024), 2),
+        "stored_mb": round(stored_bytes / (1024 * 1024), 2),
+        "saved_ratio": round(1 - stored_bytes / logical_bytes, 4) if logical_bytes else 0.0,
+        "write_mb_per_s": round(logical_bytes / (1024 * 1024) / elapsed, 1) if elapsed else None,
+        "blobs_after_gc": sum(1 for f in blobs_dir.rglob("*") if f.is_file())
+        if blobs_dir.exists()
+        else 0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--artifacts", type=int, default=20, help="Artifacts (%(default)s)")
+    parser.add_argument("--versions", type=int, default=25, help="Writes each (%(default)s)")
+    parser.add_argument("--distinct", type=int, default=4, help="Payload pool (%(default)s)")
+    parser.add_argument("--payload-mb", type=float, default=6.0, help="Size (%(default)s)")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="dinoair_blob_bench_") as tmp:
+        report = run_benchmark(
+            max(1, args.artifacts),
+            max(1, args.versions),
+            max(1, args.distinct),
+            args.payload_mb,
+            Path(tmp),
+        )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Notes search latency benchmark: FTS5 index vs. LIKE scan.
+
+Seeds a throwaway notes database (default 100,000 notes) through the real
+DatabaseManager schema and migrations, then times NotesRepository.search_notes
+(FTS5, bm25-ranked with snippets) against NotesRepository.search_notes_like
+(the previous '%query%' scan) for a fixed set of queries.
+
+Output (stdout, JSON):
+
+{
+  "notes": 100000,
+  "seed": 1337,
+  "repeat": 5,
+  "fts_available": true,
+  "queries": {
+    "<label>": {
+      "query": str, "filter": str,
+      "fts":  {"median_ms": float, "p95_ms": float, "results": int},
+      "like": {"median_ms": float, "p95_ms": float, "results": int},
+      "speedup": float
+    }
+  }
+}
+
+Run:
+  python scripts/notes_search_benchmark.py
+  python scripts/notes_search_benchmark.py --notes 20000 --repeat 10 --output search.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from database.initialize_db import DatabaseManager  # noqa: E402
+from database.notes_repository import NotesRepository  # noqa: E402
+
+WORDS = (
+    "meeting project budget review design deploy server client release roadmap "
+    "invoice schedule travel recipe garden workout reading research draft summary "
+    "database migration backup network security password update feature bug fix "
+    "customer feedback quarterly planning hiring interview onboarding training "
+    "python javascript docker kubernetes cache latency index query report chart"
+).split()
+
+# Rare words appear in roughly 0.1% of notes so selective queries are measured too
+RARE_WORDS = ("zephyr", "quasar", "obsidian", "marmalade", "tundra")
+
+TAGS = ("work", "personal", "ideas", "todo", "urgent", "archive", "reference", "health")
+
+# label -> (query, filter option)
+QUERIES: dict[str, tuple[str, str]] = {
+    "common_word": ("budget", "All"),
+    "two_words": ("deploy server", "All"),
+    "prefix": ("migra", "All"),
+    "rare_word": ("quasar", "All"),
+    "title_only": ("roadmap", "Title Only"),
+    "tags_only": ("urgent", "Tags Only"),
+    "no_match": ("nonexistentterm", "All"),
+}
+
+
+def _sentence(rng: random.Random, count: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(count)]
+    if rng.random() < 0.005:
+        words[rng.randrange(count)] = rng.choice(RARE_WORDS)
+    return " ".join(words)
+
+
+def seed_notes(db_manager: DatabaseManager, count: int, seed: int, batch: int = 5000) -> None:
+    """Insert count synthetic notes directly (sync triggers keep the FTS index current)."""
+    rng = random.Random(seed)
+    base_time = datetime(2024, 1, 1)
+    with db_manager.get_notes_connection() as conn:
+        cursor = conn.cursor()
+        rows: list[tuple[Any, ...]] = []
+        for i in range(count):
+            stamp = (base_time + timedelta(minutes=i)).isoformat()
+            tags = json.dumps(sorted(rng.sample(TAGS, rng.randint(0, 3))))
+            rows.append(
+                (
+                    str(uuid.UUID(int=rng.getrandbits(128))),
+                    _sentence(rng, rng.randint(3, 8)).capitalize(),
+                    "\n".join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 8))),
+                    tags,
+                    stamp,
+                    stamp,
+                )
+            )
+            if len(rows) >= batch:
+                _insert_rows(cursor, rows)
+                rows = []
+        if rows:
+            _insert_rows(cursor, rows)
+        conn.commit()
+
+
+def _insert_rows(cursor: Any, rows: list[tuple[Any, ...]]) -> None:
+    cursor.executemany(
+        """
+        INSERT INTO note_list (id, title, content, tags, created_at, updated_at, is_deleted)
+        VALUES (?, ?, ?, ?, ?, ?, 0)
+        """,
+        rows,
+    )
+
+
+def _time_search(search: Callable[..., Any], query: str, filter_option: str, repeat: int) -> dict:
+    samples = []
+    results = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outcome = search(query, filter_option)
+        samples.append((time.perf_counter() - start) * 1000)
+        if not outcome.success:
+            raise RuntimeError(f"search failed for {query!r}: {outcome.error}")
+        results = len(outcome.data)
+    samples.sort()
+    p95_index = min(len(samples) - 1, round(0.95 * (len(samples) - 1)))
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[p95_index], 3),
+        "results": results,
+    }
+
+
+def run_benchmark(notes: int, seed: int, repeat: int, base_dir: Path) -> dict[str, Any]:
+    db_manager = DatabaseManager("bench_user", user_feedback=lambda _msg: None, base_dir=base_dir)
+    seed_notes(db_manager, notes, seed)
+
+    repository = NotesRepository("bench_user", db_manager=db_manager)
+
+    report: dict[str, Any] = {
+        "notes": notes,
+        "seed": seed,
+        "repeat": repeat,
+        "fts_available": repository._has_fts_index(),
+        "queries": {},
+    }
+    for label, (query, filter_option) in QUERIES.items():
+        # One warm-up call each so page-cache effects do not favour the second path
+        repository.search_notes(query, filter_option)
+        repository.search_notes_like(query, filter_option)
+        fts = _time_search(repository.search_notes, query, filter_option, repeat)
+        like = _time_search(repository.search_notes_like, query, filter_option, repeat)
+        report["queries"][label] = {
+            "query": query,
+            "filter": filter_option,
+            "fts": fts,
+            "like": like,
+            "speedup": round(like["median_ms"] / fts["median_ms"], 2) if fts["median_ms"] else None,
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--notes", type=int, default=100_000, help="Notes to seed (%(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (%(default)s)")
+    parser.add_argument("--seed", type=int, default=1337, help="Corpus seed (%(default)s)")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="dinoair_notes_bench_") as tmp:
+        report = run_benchmark(max(1, args.notes), args.seed, max(1, args.repeat), Path(tmp))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
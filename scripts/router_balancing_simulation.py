@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Router balancing simulation: execute_by tail latency per policy against heterogeneous fake backends.
+
+Registers three in-process backends under one tag through an adapter_factory.
+Each backend has a service time and a fixed number of concurrent slots, so
+requests queue once it is saturated:
+
+- fast-a, fast-b: 4 ms, 4 slots
+- slow: 30 ms, 2 slots (its health latency is seeded at 1 ms, i.e. stale)
+
+Client threads call execute_by(tag, payload, policy) back to back and the
+end-to-end latency of every call is recorded per policy.
+
+The policy assertions run in CI as a seeded discrete-event simulation in
+tests/test_balancing.py; this script measures the threaded router end to end.
+
+Output (stdout, JSON):
+
+{
+  "clients": 12,
+  "requests_per_client": 150,
+  "policies": {
+    "<policy>": {"p50_ms": float, "p99_ms": float, "share": {"<service>": float}}
+  }
+}
+
+Run:
+  python scripts/router_balancing_simulation.py
+  python scripts/router_balancing_simulation.py --clients 24 --output balancing.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_router.registry import ServiceDescriptor, ServiceRegistry  # noqa: E402
+from core_router.router import ServiceRouter  # noqa: E402
+
+TAG = "sim"
+BACKENDS = {
+    # name: (service time in seconds, concurrent slots)
+    "fast-a": (0.004, 4),
+    "fast-b": (0.004, 4),
+    "slow": (0.030, 2),
+}
+POLICIES = ["round_robin", "lowest_latency", "p2c", "least_outstanding"]
+
+
+class FakeBackend:
+    """Adapter whose invoke() occupies one of a few slots for a fixed time."""
+
+    def __init__(self, service_time: float, slots: int) -> None:
+        self._service_time = service_time
+        self._slots = threading.Semaphore(slots)
+
+    def invoke(self, service_desc: Any, payload: dict[str, Any]) -> object:
+        with self._slots:
+            time.sleep(self._service_time)
+        return {"served_by": service_desc.name}
+
+    def ping(self) -> bool:
+        return True
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return round(ordered[index] * 1000, 2)
+
+
+def _simulate(policy: str, clients: int, requests: int) -> dict[str, Any]:
+    backends = {name: FakeBackend(*spec) for name, spec in BACKENDS.items()}
+    registry = ServiceRegistry()
+    for name in BACKENDS:
+        registry.register(
+            ServiceDescriptor(
+                name=name,
+                version="1.0.0",
+                tags=[TAG],
+                adapter="sim",
+                health={"state": "HEALTHY", "latency_ms": 1 if name == "slow" else 4},
+            )
+        )
+    router = ServiceRouter(registry=registry, adapter_factory=lambda d: backends[d.name])
+
+    latencies: list[float] = []
+    served: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def client() -> None:
+        local_latencies = []
+        local_served: Counter[str] = Counter()
+        for _ in range(requests):
+            began = time.perf_counter()
+            result = router.execute_by(TAG, {}, policy)
+            local_latencies.append(time.perf_counter() - began)
+            local_served[result["served_by"]] += 1  # type: ignore[index]
+        with lock:
+            latencies.extend(local_latencies)
+            served.update(local_served)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    router.close()
+
+    total = sum(served.values())
+    return {
+        "p50_ms": _percentile(latencies, 0.50),
+        "p99_ms": _percentile(latencies, 0.99),
+        "share": {name: round(served[name] / total, 3) for name in BACKENDS},
+    }
+
+
+def run_simulation(clients: int, requests: int) -> dict[str, Any]:
+    return {
+        "clients": clients,
+        "requests_per_client": requests,
+        "policies": {policy: _simulate(policy, clients, requests) for policy in POLICIES},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=12, help="Client threads (%(default)s)")
+    parser.add_argument(
+        "--requests", type=int, default=150, help="Requests per client (%(default)s)"
+    )
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    report = run_simulation(max(1, args.clients), max(1, args.requests))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Router coalescing benchmark: backend calls and latency for bursts of identical execute() calls.
+
+A fake backend (injected through adapter_factory) sleeps --backend-ms per call
+and counts invocations. --bursts rounds of --concurrency threads each send the
+same payload at once, against three descriptors of the same service:
+
+- plain: every call reaches the backend
+- coalesce: coalesce=True, concurrent duplicates share one backend call
+- cached: cache_ttl_seconds set, later bursts are served from the cache
+
+Output (stdout, JSON):
+
+{
+  "concurrency": 32,
+  "bursts": 10,
+  "modes": {
+    "<mode>": {"backend_calls": int, "p50_ms": float, "max_ms": float,
+               "coalesced": int, "cache_hits": int}
+  }
+}
+
+Run:
+  python scripts/router_coalescing_benchmark.py
+  python scripts/router_coalescing_benchmark.py --concurrency 64 --output coalescing.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_router.metrics import snapshot  # noqa: E402
+from core_router.registry import ServiceRegistry  # noqa: E402
+from core_router.router import ServiceRouter  # noqa: E402
+
+MODES = {
+    "plain": {},
+    "coalesce": {"coalesce": True},
+    "cached": {"cache_ttl_seconds": 60},
+}
+PAYLOAD = {"prompt": "Summarize the release notes", "temperature": 0}
+
+
+class CountingBackend:
+    """Adapter that sleeps for a fixed time and counts invoke() calls."""
+
+    def __init__(self, delay_s: float) -> None:
+        self._delay_s = delay_s
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def invoke(self, service_desc: Any, payload: dict[str, Any]) -> object:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self._delay_s)
+        return {"text": f"reply to {payload['prompt']}"}
+
+    def ping(self) -> bool:
+        return True
+
+
+def _run_mode(
+    mode: str, options: dict[str, Any], concurrency: int, bursts: int, delay_s: float
+) -> dict[str, Any]:
+    name = f"bench-{mode}"
+    backend = CountingBackend(delay_s)
+    registry = ServiceRegistry()
+    registry.register({"name": name, "version": "1.0.0", "adapter": "bench", **options})
+    router = ServiceRouter(registry=registry, adapter_factory=lambda _d: backend)
+
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def client(barrier: threading.Barrier) -> None:
+        barrier.wait()
+        began = time.perf_counter()
+        router.execute(name, PAYLOAD)
+        with lock:
+            latencies.append(time.perf_counter() - began)
+
+    for _ in range(bursts):
+        barrier = threading.Barrier(concurrency)
+        threads = [threading.Thread(target=client, args=(barrier,)) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    router.close()
+
+    stats = snapshot()["services"].get(name, {})
+    return {
+        "backend_calls": backend.calls,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+        "coalesced": stats.get("coalesced", 0),
+        "cache_hits": stats.get("cache_hits", 0),
+    }
+
+
+def run_benchmark(concurrency: int, bursts: int, backend_ms: float) -> dict[str, Any]:
+    return {
+        "concurrency": concurrency,
+        "bursts": bursts,
+        "modes": {
+            mode: _run_mode(mode, options, concurrency, bursts, backend_ms / 1000.0)
+            for mode, options in MODES.items()
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=32, help="Threads (%(default)s)")
+    parser.add_argument("--bursts", type=int, default=10, help="Bursts per mode (%(default)s)")
+    parser.add_argument(
+        "--backend-ms", type=float, default=50.0, help="Backend latency (%(default)s)"
+    )
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(max(1, args.concurrency), max(1, args.bursts), args.backend_ms)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Router metrics benchmark: tail latency accuracy and snapshot cost, 256-sample window vs. histograms.
+
+Feeds --samples lognormal latencies (with a rare slow mode, the tail a long-running
+service sees) into core_router.metrics for each of --services services, then reports:
+
+- accuracy: p50/p99/p999 of the first service against the exact values over all
+  samples, for the former last-256-calls window and the lifetime histogram
+- snapshot cost: time per snapshot() call, and per histogram_snapshot() call
+  (1m/5m/15m/all views for every service)
+
+Output (stdout, JSON):
+
+{
+  "services": 50,
+  "samples_per_service": 20000,
+  "accuracy": {"<pct>": {"exact_ms": float, "window_256_ms": float, "histogram_ms": float}},
+  "snapshot_ms": float,
+  "histogram_snapshot_ms": float,
+  "record_us": float
+}
+
+Run:
+  python scripts/router_metrics_benchmark.py
+  python scripts/router_metrics_benchmark.py --services 200 --output metrics.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_router.metrics import _Metrics  # noqa: E402
+
+LEGACY_WINDOW = 256
+SLOW_SHARE = 0.002
+PERCENTILES = {"p50": 0.50, "p99": 0.99, "p999": 0.999}
+
+
+def _latency(rng: random.Random) -> int:
+    if rng.random() < SLOW_SHARE:
+        return int(rng.uniform(800, 2000))
+    return int(rng.lognormvariate(3.0, 0.5))
+
+
+def _nearest_rank(ordered: list[int], q: float) -> float:
+    return float(ordered[max(0, math.ceil(q * len(ordered)) - 1)])
+
+
+def _legacy_pct(window: list[int], q: float) -> float:
+    """The former estimate: nearest rank over the last 256 calls."""
+    data = sorted(window)
+    return float(data[min(len(data) - 1, max(0, int(round(q * (len(data) - 1)))))])
+
+
+def _time_ms(fn: Any, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return round((time.perf_counter() - start) * 1000 / repeat, 3)
+
+
+def run_benchmark(services: int, samples: int, repeat: int) -> dict[str, Any]:
+    rng = random.Random(47)
+    store = _Metrics()
+    names = [f"svc-{i}" for i in range(services)]
+
+    first: list[int] = []
+    started = time.perf_counter()
+    for index in range(samples):
+        for name in names:
+            value = _latency(rng)
+            store.record_success(name, value)
+            if name == names[0]:
+                first.append(value)
+        if index == 0:
+            started = time.perf_counter()  # exclude first-call setup
+    record_us = (time.perf_counter() - started) * 1_000_000 / max(1, (samples - 1) * services)
+
+    ordered = sorted(first)
+    window = first[-LEGACY_WINDOW:]
+    lifetime = store.histogram_snapshot(names[0])["services"][names[0]]["all"]
+    accuracy = {
+        label: {
+            "exact_ms": _nearest_rank(ordered, q),
+            "window_256_ms": _legacy_pct(window, q),
+            "histogram_ms": round(lifetime[f"{label}_ms"], 3),
+        }
+        for label, q in PERCENTILES.items()
+    }
+
+    return {
+        "services": services,
+        "samples_per_service": samples,
+        "accuracy": accuracy,
+        "snapshot_ms": _time_ms(store.snapshot, repeat),
+        "histogram_snapshot_ms": _time_ms(store.histogram_snapshot, repeat),
+        "record_us": round(record_us, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--services", type=int, default=50, help="Services (%(default)s)")
+    parser.add_argument(
+        "--samples", type=int, default=20_000, help="Samples per service (%(default)s)"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Snapshot calls (%(default)s)")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(max(1, args.services), max(2, args.samples), max(1, args.repeat))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
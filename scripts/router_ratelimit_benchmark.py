@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Router rate limit benchmark: limiter throughput under contention, sliding window vs. token bucket.
+
+32 threads (default) spread over 8 services take permits as fast as they can
+for a fixed duration. Limits are set high enough that no call is rejected, so
+the numbers are pure limiter overhead:
+
+- sliding_window: the former limiter, a deque of call timestamps per service
+  pruned to the last 60 s, all services behind one router-wide lock
+- token_bucket: core_router.ratelimit.TokenBucket, O(1) state per service
+  behind a per-service lock
+- router_execute: ServiceRouter.execute() on rate-limited no-op services
+  (builtins:dict), token buckets included
+
+Output (stdout, JSON):
+
+{
+  "threads": 32,
+  "services": 8,
+  "seconds": float,
+  "sliding_window": {"calls_per_s": float, "state_entries": int},
+  "token_bucket": {"calls_per_s": float, "state_entries": int},
+  "router_execute": {"calls_per_s": float}
+}
+
+Run:
+  python scripts/router_ratelimit_benchmark.py
+  python scripts/router_ratelimit_benchmark.py --threads 64 --seconds 5 --output ratelimit.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_router.ratelimit import TokenBucket, parse_rate_limit  # noqa: E402
+from core_router.registry import ServiceRegistry  # noqa: E402
+from core_router.router import ServiceRouter  # noqa: E402
+
+# High enough that the benchmark never runs out of permits
+RPM = 100_000_000
+
+
+class SlidingWindowLimiter:
+    """The former ServiceRouter limiter, kept here as the baseline."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._windows: dict[str, deque[float]] = {}
+
+    def acquire(self, service_name: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            dq = self._windows.setdefault(service_name, deque())
+            cutoff = now - 60.0
+            while dq and dq[0] <= cutoff:
+                dq.popleft()
+            if len(dq) >= RPM:
+                return False
+            dq.append(now)
+            return True
+
+    def state_entries(self) -> int:
+        return sum(len(dq) for dq in self._windows.values())
+
+
+def _hammer(threads: int, seconds: float, call: Callable[[int], object]) -> float:
+    """Run call(thread_index) in every thread until the deadline; return calls/s."""
+    counts = [0] * threads
+    start = threading.Barrier(threads + 1)
+    deadline = 0.0
+
+    def worker(index: int) -> None:
+        start.wait()
+        done = 0
+        while time.perf_counter() < deadline:
+            call(index)
+            done += 1
+        counts[index] = done
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    deadline = time.perf_counter() + seconds
+    start.wait()
+    for worker_thread in workers:
+        worker_thread.join()
+    return round(sum(counts) / seconds, 1)
+
+
+def run_benchmark(threads: int, services: int, seconds: float) -> dict[str, Any]:
+    names = [f"bench-svc-{i}" for i in range(services)]
+
+    window = SlidingWindowLimiter()
+    window_rate = _hammer(threads, seconds, lambda i: window.acquire(names[i % services]))
+
+    limit = parse_rate_limit({"rpm": RPM})
+    assert limit is not None
+    buckets = {name: TokenBucket(limit) for name in names}
+    bucket_rate = _hammer(threads, seconds, lambda i: buckets[names[i % services]].acquire())
+
+    registry = ServiceRegistry()
+    for name in names:
+        registry.register(
+            {
+                "name": name,
+                "version": "1.0.0",
+                "adapter": "local_python",
+                "adapter_config": {"function_path": "builtins:dict"},
+                "rate_limits": {"rpm": RPM, "burst": RPM},
+            }
+        )
+    router = ServiceRouter(registry=registry)
+    payload = {"text": "hello"}
+    router_rate = _hammer(threads, seconds, lambda i: router.execute(names[i % services], payload))
+    router.close()
+
+    return {
+        "threads": threads,
+        "services": services,
+        "seconds": seconds,
+        "sliding_window": {
+            "calls_per_s": window_rate,
+            "state_entries": window.state_entries(),
+        },
+        "token_bucket": {"calls_per_s": bucket_rate, "state_entries": len(buckets)},
+        "router_execute": {"calls_per_s": router_rate},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=32, help="Worker threads (%(default)s)")
+    parser.add_argument("--services", type=int, default=8, help="Services (%(default)s)")
+    parser.add_argument("--seconds", type=float, default=2.0, help="Per mode (%(default)s)")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(max(1, args.threads), max(1, args.services), max(0.1, args.seconds))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
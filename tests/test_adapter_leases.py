@@ -0,0 +1,152 @@
+"""Tests for ServiceRouter's adapter cache: adapters in use are closed only after their calls."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from core_router.registry import ServiceRegistry
+from core_router.router import ServiceRouter
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class BlockingAdapter:
+    """Adapter whose invoke() (and ping() when block_ping is set) waits for release."""
+
+    def __init__(self, version: str) -> None:
+        self.version = version
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.block_ping = False
+        self.closed = False
+        # Whether the adapter had been closed when a blocked call resumed
+        self.closed_mid_call: bool | None = None
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def _block(self) -> None:
+        self.entered.set()
+        assert self.release.wait(5)
+        self.closed_mid_call = self.closed
+
+    def invoke(self, service_desc: Any, payload: dict[str, Any]) -> object:
+        self._block()
+        return {"version": self.version}
+
+    def ping(self) -> bool:
+        if self.block_ping:
+            self._block()
+        return not self.closed
+
+
+def _register(registry: ServiceRegistry, version: str) -> None:
+    registry.register(
+        {"name": "svc", "version": "1.0.0", "adapter": "fake", "adapter_config": {"v": version}}
+    )
+
+
+@pytest.fixture
+def registry() -> ServiceRegistry:
+    return ServiceRegistry()
+
+
+@pytest.fixture
+def adapters() -> dict[str, BlockingAdapter]:
+    return {}
+
+
+@pytest.fixture
+def router(
+    registry: ServiceRegistry, adapters: dict[str, BlockingAdapter]
+) -> Iterator[ServiceRouter]:
+    def factory(desc: Any) -> BlockingAdapter:
+        version = desc.adapter_config["v"]
+        adapters[version] = BlockingAdapter(version)
+        return adapters[version]
+
+    router = ServiceRouter(registry, adapter_factory=factory)
+    _register(registry, "1")
+    yield router
+    for adapter in adapters.values():
+        adapter.release.set()
+    router.close()
+
+
+def _start(pool: ThreadPoolExecutor, call: Callable[[], Any], adapter: BlockingAdapter) -> Future:
+    future = pool.submit(call)
+    assert adapter.entered.wait(5)
+    return future
+
+
+def test_replaced_adapter_closes_after_in_flight_call(
+    router: ServiceRouter, registry: ServiceRegistry, adapters: dict[str, BlockingAdapter]
+) -> None:
+    old = adapters["1"]
+    with ThreadPoolExecutor(1) as pool:
+        future = _start(pool, lambda: router.execute("svc", {}), old)
+        _register(registry, "2")
+        assert not old.closed
+        old.release.set()
+        assert future.result(5) == {"version": "1"}
+    assert old.closed_mid_call is False
+    assert old.closed
+    assert not adapters["2"].closed
+
+
+def test_unregistered_adapter_closes_after_in_flight_call(
+    router: ServiceRouter, registry: ServiceRegistry, adapters: dict[str, BlockingAdapter]
+) -> None:
+    adapter = adapters["1"]
+    with ThreadPoolExecutor(1) as pool:
+        future = _start(pool, lambda: router.execute("svc", {}), adapter)
+        assert registry.unregister("svc")
+        assert not adapter.closed
+        adapter.release.set()
+        # The call itself then fails to record health for the vanished service
+        wait([future], 5)
+    assert adapter.closed_mid_call is False
+    assert adapter.closed
+
+
+def test_close_waits_for_leases_but_closes_idle_adapters(
+    router: ServiceRouter, registry: ServiceRegistry, adapters: dict[str, BlockingAdapter]
+) -> None:
+    registry.register(
+        {"name": "idle", "version": "1.0.0", "adapter": "fake", "adapter_config": {"v": "idle"}}
+    )
+    busy = adapters["1"]
+    with ThreadPoolExecutor(1) as pool:
+        future = _start(pool, lambda: router.execute("svc", {}), busy)
+        router.close()
+        assert adapters["idle"].closed
+        assert not busy.closed
+        busy.release.set()
+        future.result(5)
+    assert busy.closed
+
+
+def test_health_probe_leases_adapter(
+    router: ServiceRouter, registry: ServiceRegistry, adapters: dict[str, BlockingAdapter]
+) -> None:
+    adapter = adapters["1"]
+    adapter.block_ping = True
+    monitor = router.health_monitor()
+    with ThreadPoolExecutor(1) as pool:
+        future = _start(pool, monitor.run_once, adapter)
+        _register(registry, "2")
+        assert not adapter.closed
+        adapter.release.set()
+        assert future.result(5)["svc"]["state"] == "HEALTHY"
+    assert adapter.closed_mid_call is False
+    assert adapter.closed
+    monitor.stop()
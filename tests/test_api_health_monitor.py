@@ -0,0 +1,72 @@
+"""Tests for the API lifespan health monitor and the routes that read its verdicts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from API_files.app import _make_lifespan
+from API_files.routes.router import router as router_routes
+from API_files.services import router_client
+from API_files.settings import Settings
+from core_router.registry import ServiceRegistry
+from core_router.router import ServiceRouter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class DownAdapter:
+    """Serves calls, but fails every health probe."""
+
+    def invoke(self, service_desc: Any, payload: dict[str, Any]) -> object:
+        return {"served_by": service_desc.name}
+
+    def ping(self) -> bool:
+        raise ConnectionError("health endpoint unreachable")
+
+
+@pytest.fixture
+def tag() -> str:
+    return f"api-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def service_router(tag: str) -> Iterator[ServiceRouter]:
+    registry = ServiceRegistry()
+    registry.register({"name": tag, "version": "1.0.0", "tags": [tag], "adapter": "fake"})
+    router = ServiceRouter(registry, adapter_factory=lambda _desc: DownAdapter())
+    router_client.set_router(router)
+    yield router
+    router_client.set_router(None)
+    router.close()
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    settings = Settings()
+    settings.health_monitor_enabled = True
+    settings.health_check_interval_seconds = 3600
+    app = FastAPI(lifespan=_make_lifespan(settings))
+    app.include_router(router_routes)
+    return app
+
+
+def test_route_sees_service_marked_down_by_monitor(
+    app: FastAPI, service_router: ServiceRouter, tag: str
+) -> None:
+    # Without the lifespan nothing has probed the service yet
+    response = TestClient(app).post("/router/executeBy", json={"tag": tag})
+    assert response.json() == {"served_by": tag}
+
+    with TestClient(app) as client:
+        assert service_router._monitor_owns_health()
+        assert service_router._registry.get_by_name(tag).health["state"] == "DOWN"
+        response = client.post("/router/executeBy", json={"tag": tag})
+        assert response.status_code == 503
+
+    assert not service_router._monitor_owns_health()
@@ -0,0 +1,95 @@
+"""Tests for AppointmentsDatabase date-range queries on the start_ts/end_ts columns."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+
+from database.appointments_db import AppointmentsDatabase
+from database.initialize_db import EVENT_RANGE_COLUMNS, DatabaseManager
+from models.calendar_event import CalendarEvent
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# start_ts as first shipped, without the fallback for unparseable start times
+OLD_START_TS_SQL = (
+    "CAST(strftime('%s', event_date || ' ' || CASE WHEN all_day OR IFNULL(start_time, '') = '' "
+    "THEN '00:00' ELSE start_time END) AS INTEGER)"
+)
+
+
+@pytest.fixture
+def appointments_db(tmp_path: Path) -> AppointmentsDatabase:
+    manager = DatabaseManager(
+        f"range_{uuid.uuid4().hex[:8]}", user_feedback=lambda _msg: None, base_dir=tmp_path
+    )
+    return AppointmentsDatabase(manager)
+
+
+def _create_event(
+    appointments_db: AppointmentsDatabase,
+    event_date: str,
+    start_time: str | None = None,
+    end_time: str | None = None,
+) -> CalendarEvent:
+    event = CalendarEvent(
+        id=str(uuid.uuid4()),
+        title=f"event on {event_date}",
+        event_date=event_date,
+        start_time=start_time,
+        end_time=end_time,
+    )
+    assert appointments_db.create_event(event)["success"]
+    return event
+
+
+def _range_ids(appointments_db: AppointmentsDatabase, start: date, end: date) -> list[str]:
+    return [e.id for e in appointments_db.get_events_for_date_range(start, end)]
+
+
+def test_range_returns_events_in_start_order(appointments_db: AppointmentsDatabase) -> None:
+    late = _create_event(appointments_db, "2030-02-10", "15:00", "16:00")
+    early = _create_event(appointments_db, "2030-02-10", "09:00", "10:00")
+    _create_event(appointments_db, "2030-03-01", "09:00")
+    assert _range_ids(appointments_db, date(2030, 2, 1), date(2030, 2, 28)) == [early.id, late.id]
+
+
+def test_overnight_event_from_previous_day_is_included(
+    appointments_db: AppointmentsDatabase,
+) -> None:
+    overnight = _create_event(appointments_db, "2030-02-09", "22:00", "02:00")
+    _create_event(appointments_db, "2030-02-09", "10:00", "11:00")
+    assert _range_ids(appointments_db, date(2030, 2, 10), date(2030, 2, 10)) == [overnight.id]
+
+
+def test_unparseable_start_time_stays_on_its_date(appointments_db: AppointmentsDatabase) -> None:
+    event = _create_event(appointments_db, "2030-02-10", "9am", "10am")
+    assert _range_ids(appointments_db, date(2030, 2, 1), date(2030, 2, 28)) == [event.id]
+    assert _range_ids(appointments_db, date(2030, 2, 10), date(2030, 2, 10)) == [event.id]
+    assert _range_ids(appointments_db, date(2030, 2, 11), date(2030, 2, 28)) == []
+
+
+def test_stale_range_columns_are_rebuilt(appointments_db: AppointmentsDatabase) -> None:
+    event = _create_event(appointments_db, "2030-02-10", "9am")
+    with appointments_db._get_connection() as conn:
+        conn.execute("DROP INDEX idx_events_range")
+        conn.execute("ALTER TABLE calendar_events DROP COLUMN end_ts")
+        conn.execute("ALTER TABLE calendar_events DROP COLUMN start_ts")
+        conn.execute(
+            "ALTER TABLE calendar_events ADD COLUMN start_ts "
+            f"INTEGER GENERATED ALWAYS AS ({OLD_START_TS_SQL}) VIRTUAL"
+        )
+        conn.execute(
+            f"ALTER TABLE calendar_events ADD COLUMN end_ts {EVENT_RANGE_COLUMNS['end_ts']}"
+        )
+
+    # Every new connection runs the schema upgrade
+    assert _range_ids(appointments_db, date(2030, 2, 1), date(2030, 2, 28)) == [event.id]
+    with appointments_db._get_connection() as conn:
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_events_range'"
+        ).fetchone()
@@ -0,0 +1,67 @@
+"""Tests for ArtifactEncryption master key caching and zeroizing."""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+
+import pytest
+
+from utils import artifact_encryption
+from utils.artifact_encryption import ArtifactEncryption
+
+FIELDS = ["content"]
+
+
+class CountingEncryption(ArtifactEncryption):
+    """Counts PBKDF2 derivations."""
+
+    ITERATIONS = 1000
+
+    def __init__(self, password: str) -> None:
+        super().__init__(password)
+        self.derivations = 0
+
+    def derive_key(self, password: str, salt: bytes) -> bytes:
+        self.derivations += 1
+        return super().derive_key(password, salt)
+
+
+@pytest.fixture
+def password() -> str:
+    return f"pw-{uuid.uuid4().hex}"
+
+
+def test_fields_round_trip(password: str) -> None:
+    encryption = CountingEncryption(password)
+    encrypted = encryption.encrypt_fields({"content": "secret notes"}, FIELDS)
+    assert encrypted["content"] != "secret notes"
+    assert CountingEncryption(password).decrypt_fields(encrypted, FIELDS)["content"] == (
+        "secret notes"
+    )
+
+
+def test_zeroize_leaves_other_instances_keys(password: str) -> None:
+    first = CountingEncryption(password)
+    second = CountingEncryption(password)
+    record = first.encrypt_fields({"content": "shared"}, FIELDS)
+    assert second.decrypt_fields(dict(record), FIELDS)["content"] == "shared"
+
+    first.zeroize_keys()
+    second.data_keys.clear()
+    assert second.decrypt_fields(dict(record), FIELDS)["content"] == "shared"
+    assert first.derivations + second.derivations == 1
+
+    # Once the last holder zeroizes, the master key has to be derived again
+    second.zeroize_keys()
+    assert second.decrypt_fields(dict(record), FIELDS)["content"] == "shared"
+    assert second.derivations == 1
+
+
+def test_ring_does_not_hold_password_digest(password: str) -> None:
+    encryption = CountingEncryption(password)
+    encryption.encrypt_fields({"content": "x"}, FIELDS)
+    ring = artifact_encryption._MASTER_KEYS
+    digest = hashlib.sha256(password.encode("utf-8")).digest()
+    assert all(password_id != digest for password_id, _salt in ring._keys)
+    assert digest not in ring._active_salts
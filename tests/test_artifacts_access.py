@@ -0,0 +1,68 @@
+"""Tests for buffered accessed_at touches in ArtifactsDatabase."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+from database.artifacts_db import ArtifactsDatabase
+from database.initialize_db import DatabaseManager
+from models.artifact import Artifact
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+STALE = "2000-01-01 00:00:00"
+
+
+@pytest.fixture
+def artifacts_db(tmp_path: Path) -> ArtifactsDatabase:
+    manager = DatabaseManager(
+        f"access_{uuid.uuid4().hex[:8]}", user_feedback=lambda _msg: None, base_dir=tmp_path
+    )
+    return ArtifactsDatabase(manager)
+
+
+def _stored_accessed_at(artifacts_db: ArtifactsDatabase, artifact_id: str) -> str:
+    with artifacts_db._get_connection() as conn:
+        return conn.execute(
+            "SELECT accessed_at FROM artifacts WHERE id = ?", (artifact_id,)
+        ).fetchone()[0]
+
+
+def _create_artifact(artifacts_db: ArtifactsDatabase) -> str:
+    artifact = Artifact(id=str(uuid.uuid4()), name="notes", content="text", accessed_at=STALE)
+    artifacts_db.create_artifact(artifact)
+    assert _stored_accessed_at(artifacts_db, artifact.id) == STALE
+    return artifact.id
+
+
+def test_buffered_touch_is_flushed_without_further_reads(
+    artifacts_db: ArtifactsDatabase,
+) -> None:
+    artifacts_db.ACCESS_FLUSH_INTERVAL_SECONDS = 0.2  # type: ignore[misc]
+    artifact_id = _create_artifact(artifacts_db)
+
+    assert artifacts_db.get_artifact(artifact_id) is not None
+    assert _stored_accessed_at(artifacts_db, artifact_id) == STALE
+
+    deadline = time.monotonic() + 5.0
+    while _stored_accessed_at(artifacts_db, artifact_id) == STALE:
+        assert time.monotonic() < deadline, "buffered touch was never flushed"
+        time.sleep(0.05)
+    assert not artifacts_db._pending_access
+
+
+def test_explicit_flush_cancels_pending_timer(artifacts_db: ArtifactsDatabase) -> None:
+    artifact_id = _create_artifact(artifacts_db)
+    artifacts_db.get_artifact(artifact_id)
+    timer = artifacts_db._access_timer
+    assert timer is not None
+
+    assert artifacts_db.flush_access_times() == 1
+    assert artifacts_db._access_timer is None
+    assert timer.finished.is_set()
+    assert _stored_accessed_at(artifacts_db, artifact_id) != STALE
@@ -0,0 +1,107 @@
+"""Tests for ArtifactsDatabase blob storage, encrypted file streaming and bulk reads."""
+
+from __future__ import annotations
+
+import io
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+from database.artifacts_db import ArtifactsDatabase
+from database.initialize_db import DatabaseManager
+from models.artifact import Artifact
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+THRESHOLD = 64
+PAYLOAD = b"large artifact payload " * 20
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> DatabaseManager:
+    return DatabaseManager(
+        f"artifacts_{uuid.uuid4().hex[:8]}", user_feedback=lambda _msg: None, base_dir=tmp_path
+    )
+
+
+def _artifacts_db(manager: DatabaseManager, password: str | None = None) -> ArtifactsDatabase:
+    artifacts_db = ArtifactsDatabase(manager, encryption_password=password)
+    artifacts_db.FILE_SIZE_THRESHOLD = THRESHOLD  # type: ignore[misc]
+    return artifacts_db
+
+
+def _create(artifacts_db: ArtifactsDatabase, content: bytes | None = None) -> Artifact:
+    artifact = Artifact(id=str(uuid.uuid4()), name="artifact")
+    artifacts_db.create_artifact(artifact, content)
+    return artifact
+
+
+def _blob_files(manager: DatabaseManager) -> list[Path]:
+    return [path for path in manager.base_dir.rglob("blobs/**/*") if path.is_file()]
+
+
+def test_identical_payloads_share_one_blob(manager: DatabaseManager) -> None:
+    artifacts_db = _artifacts_db(manager)
+    first = _create(artifacts_db, PAYLOAD)
+    second = _create(artifacts_db, PAYLOAD)
+    assert first.content_path == second.content_path
+    assert len(_blob_files(manager)) == 1
+
+    assert artifacts_db.delete_artifact(first.id, hard_delete=True)
+    assert artifacts_db.collect_unreferenced_blobs()["blobs_removed"] == 0
+    assert artifacts_db.get_artifact_content(second.id) == PAYLOAD
+
+    assert artifacts_db.delete_artifact(second.id, hard_delete=True)
+    assert artifacts_db.collect_unreferenced_blobs()["blobs_removed"] == 1
+    assert _blob_files(manager) == []
+
+
+def test_encrypted_stream_round_trips_without_plaintext_on_disk(
+    manager: DatabaseManager,
+) -> None:
+    artifacts_db = _artifacts_db(manager, password="at-rest")
+    payload = bytes(range(256)) * 5000
+    artifact = Artifact(id=str(uuid.uuid4()), name="stream")
+    artifacts_db.create_artifact_from_stream(artifact, io.BytesIO(payload))
+
+    (blob,) = _blob_files(manager)
+    assert payload[:4096] not in blob.read_bytes()
+    assert b"".join(artifacts_db.iter_artifact_content(artifact.id)) == payload
+
+    # Flipping one ciphertext byte must fail authentication rather than return data
+    data = bytearray(blob.read_bytes())
+    data[-100] ^= 0x01
+    blob.write_bytes(bytes(data))
+    assert artifacts_db.get_artifact_content(artifact.id) is None
+
+
+def test_bulk_fetch_keeps_request_order(manager: DatabaseManager) -> None:
+    artifacts_db = _artifacts_db(manager)
+    ids = [_create(artifacts_db).id for _ in range(3)]
+    requested = [ids[2], "missing", ids[0], ids[2]]
+
+    fetched = artifacts_db.get_artifacts_bulk(requested, update_accessed=False)
+    assert [artifact.id for artifact in fetched] == [ids[2], ids[0]]
+    assert artifacts_db.get_artifacts_bulk([]) == []
+
+
+def test_stat_counters_match_one_pass_statistics(manager: DatabaseManager) -> None:
+    artifacts_db = _artifacts_db(manager)
+    kept = _create(artifacts_db, b"short text")
+    removed = _create(artifacts_db, PAYLOAD)
+    one_pass = artifacts_db.get_artifact_statistics()
+    assert one_pass["total_artifacts"] == 2
+    assert one_pass["total_size_bytes"] == len(b"short text") + len(PAYLOAD)
+
+    assert artifacts_db.enable_stat_counters()
+    assert artifacts_db.get_artifact_statistics() == one_pass
+
+    # Counters follow later writes; compare against the aggregate query again
+    artifacts_db.delete_artifact(removed.id)
+    artifacts_db.update_artifact(kept.id, {"name": "renamed"}, content=b"longer text body")
+    with_counters = artifacts_db.get_artifact_statistics()
+    assert artifacts_db.disable_stat_counters()
+    assert with_counters == artifacts_db.get_artifact_statistics()
+    assert with_counters["total_artifacts"] == 1
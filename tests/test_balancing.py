@@ -0,0 +1,193 @@
+"""Tests for core_router.balancing policies, including a seeded load simulation."""
+
+from __future__ import annotations
+
+import heapq
+import random
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from core_router.balancing import (
+    LoadTracker,
+    SmoothWeightedRoundRobin,
+    least_outstanding,
+    power_of_two_choices,
+)
+from core_router.registry import ServiceDescriptor, ServiceRegistry
+from core_router.router import ServiceRouter
+
+# name: (service time in ms, concurrent slots); the slow replica's health
+# latency is seeded at 1 ms, i.e. stale
+BACKENDS = {"fast-a": (4.0, 4), "fast-b": (4.0, 4), "slow": (30.0, 2)}
+# Mean request arrival rate (per ms), about 70% of total capacity
+ARRIVAL_RATE = 1.4
+
+
+def _desc(name: str, weight: float = 1.0, latency_ms: float | None = None) -> ServiceDescriptor:
+    health = None if latency_ms is None else {"state": "HEALTHY", "latency_ms": latency_ms}
+    return ServiceDescriptor(
+        name=name, version="1.0.0", tags=["sim"], adapter="sim", weight=weight, health=health
+    )
+
+
+def _p99(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[int(0.99 * (len(ordered) - 1))]
+
+
+def _simulate(policy: str, requests: int = 20_000, seed: int = 1) -> dict[str, Any]:
+    """
+    Discrete-event run of one policy: Poisson arrivals, each backend serving
+    FIFO on its slots. Completed requests feed the LoadTracker before the
+    next arrival is routed, as ServiceRouter.execute does.
+    """
+    rng = random.Random(seed)
+    candidates = [
+        _desc(name, latency_ms=1.0 if name == "slow" else 4.0) for name in sorted(BACKENDS)
+    ]
+    tracker = LoadTracker()
+    slots = {name: [0.0] * spec[1] for name, spec in BACKENDS.items()}
+    completions: list[tuple[float, str, float]] = []
+    latencies: list[float] = []
+    served: Counter[str] = Counter()
+    now = 0.0
+
+    for i in range(requests):
+        now += rng.expovariate(ARRIVAL_RATE)
+        while completions and completions[0][0] <= now:
+            _, name, latency = heapq.heappop(completions)
+            tracker.end(name, latency)
+
+        if policy == "round_robin":
+            chosen = candidates[i % len(candidates)]
+        elif policy == "lowest_latency":
+            chosen = min(candidates, key=lambda d: (d.health["latency_ms"], d.name))
+        elif policy == "p2c":
+            chosen = power_of_two_choices(candidates, tracker, rng)
+        else:
+            chosen = least_outstanding(candidates, tracker)
+
+        service_ms = BACKENDS[chosen.name][0]
+        free_at = heapq.heappop(slots[chosen.name])
+        finish = max(now, free_at) + service_ms
+        heapq.heappush(slots[chosen.name], finish)
+        tracker.begin(chosen.name)
+        heapq.heappush(completions, (finish, chosen.name, finish - now))
+        latencies.append(finish - now)
+        served[chosen.name] += 1
+
+    return {"p99_ms": _p99(latencies), "share": {n: served[n] / requests for n in BACKENDS}}
+
+
+@pytest.fixture(scope="module")
+def simulation() -> dict[str, dict[str, Any]]:
+    return {p: _simulate(p) for p in ("round_robin", "lowest_latency", "p2c", "least_outstanding")}
+
+
+def test_load_aware_policies_cut_p99(simulation: dict[str, dict[str, Any]]) -> None:
+    for policy in ("p2c", "least_outstanding"):
+        p99 = simulation[policy]["p99_ms"]
+        assert p99 < simulation["round_robin"]["p99_ms"] / 2
+        assert p99 < simulation["lowest_latency"]["p99_ms"] / 2
+
+
+def test_load_aware_policies_shift_traffic_off_slow_replica(
+    simulation: dict[str, dict[str, Any]],
+) -> None:
+    # Static policies send a third (round robin) or everything (stale latency) to it
+    assert simulation["round_robin"]["share"]["slow"] == pytest.approx(1 / 3, abs=0.01)
+    assert simulation["lowest_latency"]["share"]["slow"] == 1.0
+    for policy in ("p2c", "least_outstanding"):
+        share = simulation[policy]["share"]
+        assert share["slow"] < 0.1
+        assert share["fast-a"] == pytest.approx(share["fast-b"], abs=0.1)
+
+
+def test_p2c_cost_is_per_unit_of_weight() -> None:
+    rng = random.Random(42)
+    tracker = LoadTracker()
+    heavy, light = _desc("heavy", weight=3.0), _desc("light", weight=1.0)
+    for name in ("heavy", "light"):
+        tracker.begin(name)
+        tracker.end(name, 10.0)
+    # Same latency, but the heavier replica is expected to absorb three times the load
+    picks = Counter(power_of_two_choices([heavy, light], tracker, rng).name for _ in range(50))
+    assert picks == {"heavy": 50}
+
+
+def test_p2c_sends_traffic_to_new_replicas() -> None:
+    rng = random.Random(3)
+    tracker = LoadTracker()
+    tracker.begin("busy")
+    tracker.end("busy", 20.0)
+    candidates = [_desc("busy"), _desc("new")]
+    assert power_of_two_choices(candidates, tracker, rng).name == "new"
+
+
+def test_p2c_prefers_cheaper_of_sampled_pair() -> None:
+    rng = random.Random(7)
+    tracker = LoadTracker()
+    fast, slow = _desc("fast"), _desc("slow")
+    tracker.begin("fast")
+    tracker.end("fast", 5.0)
+    tracker.begin("slow")
+    tracker.end("slow", 50.0)
+    picks = Counter(power_of_two_choices([fast, slow], tracker, rng).name for _ in range(100))
+    assert picks == {"fast": 100}
+
+
+def test_least_outstanding_respects_weight() -> None:
+    tracker = LoadTracker()
+    big, small = _desc("big", weight=4.0), _desc("small", weight=1.0)
+    for _ in range(3):
+        tracker.begin("big")
+    tracker.begin("small")
+    # 3 / 4 in flight per unit of weight beats 1 / 1
+    assert least_outstanding([big, small], tracker).name == "big"
+    tracker.begin("big")
+    tracker.begin("big")
+    assert least_outstanding([big, small], tracker).name == "small"
+
+
+def test_failed_calls_never_lower_ewma() -> None:
+    tracker = LoadTracker()
+    tracker.begin("svc")
+    tracker.end("svc", 100.0)
+    tracker.begin("svc")
+    tracker.end("svc", 1.0, ok=False)
+    assert tracker.snapshot()["svc"]["ewma_ms"] == 100.0
+
+
+def test_smooth_weighted_round_robin_interleaves() -> None:
+    swrr = SmoothWeightedRoundRobin()
+    candidates = [_desc("a", weight=5.0), _desc("b"), _desc("c")]
+    sequence = "".join(swrr.select("t", candidates).name for _ in range(7))
+    assert sequence == "aabacaa"
+    counts = Counter(swrr.select("t", candidates).name for _ in range(700))
+    assert counts == {"a": 500, "b": 100, "c": 100}
+
+
+def test_execute_by_weighted_round_robin() -> None:
+    registry = ServiceRegistry()
+    for name, weight in (("primary", 3.0), ("secondary", 1.0)):
+        registry.register(
+            {"name": name, "version": "1.0.0", "tags": ["w"], "adapter": "sim", "weight": weight}
+        )
+
+    class Echo:
+        def invoke(self, service_desc: Any, payload: dict[str, Any]) -> object:
+            return {"served_by": service_desc.name}
+
+        def ping(self) -> bool:
+            return True
+
+    router = ServiceRouter(registry, adapter_factory=lambda _desc: Echo())
+    try:
+        served = Counter(
+            router.execute_by("w", {}, "weighted_round_robin")["served_by"] for _ in range(40)
+        )
+    finally:
+        router.close()
+    assert served == {"primary": 30, "secondary": 10}
@@ -0,0 +1,196 @@
+"""Tests for core_router.circuit and its ServiceRouter integration."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from core_router.circuit import CircuitBreaker, CircuitPolicy, CircuitState
+from core_router.errors import AdapterError, CircuitOpenError, NoHealthyService
+from core_router.metrics import failure_stats
+from core_router.metrics import snapshot as metrics_snapshot
+from core_router.registry import ServiceRegistry
+from core_router.router import ServiceRouter
+
+# Toggled by the tests to make backend_service fail or succeed
+BACKEND: dict[str, bool] = {"fail": True}
+
+
+def backend_service(payload: dict[str, Any]) -> dict[str, Any]:
+    """local_python target for the end-to-end tests."""
+    if BACKEND["fail"]:
+        raise RuntimeError("backend unavailable")
+    return {"echo": payload}
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+POLICY = CircuitPolicy(failure_threshold=3, open_seconds=30.0, probe_interval_seconds=5.0)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker("svc", POLICY, clock)
+
+
+def _fail(breaker: CircuitBreaker, consecutive: int) -> CircuitState:
+    assert breaker.allow_request()
+    return breaker.record(False, {"consecutive_errors": consecutive, "error_rate": 1.0})
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for n in range(1, POLICY.failure_threshold + 1):
+        _fail(breaker, n)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_closed_until_failure_threshold(breaker: CircuitBreaker) -> None:
+    assert _fail(breaker, 1) == CircuitState.CLOSED
+    assert _fail(breaker, 2) == CircuitState.CLOSED
+    assert _fail(breaker, 3) == CircuitState.OPEN
+    assert not breaker.allow_request()
+    assert breaker.snapshot()["trips"] == 1
+
+
+def test_error_rate_trips_after_min_calls(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("svc", CircuitPolicy(error_rate_threshold=0.5, min_calls=4), clock)
+    stats = {"consecutive_errors": 1, "error_rate": 0.5}
+    for _ in range(3):
+        breaker.record(True)
+    assert breaker.record(False, stats) == CircuitState.OPEN
+
+
+def test_open_becomes_half_open_after_open_seconds(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    _trip(breaker)
+    clock.advance(POLICY.open_seconds - 0.1)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.snapshot()["retry_in_s"] == pytest.approx(0.1)
+    clock.advance(0.1)
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_half_open_probes_are_rate_limited(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    _trip(breaker)
+    clock.advance(POLICY.open_seconds)
+    assert breaker.allow_request()
+    # One probe at a time
+    assert not breaker.allow_request()
+    breaker.record(None)
+    # ...and no more often than probe_interval_seconds
+    assert not breaker.is_available()
+    clock.advance(POLICY.probe_interval_seconds)
+    assert breaker.allow_request()
+
+
+def test_successful_probe_closes(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    _trip(breaker)
+    clock.advance(POLICY.open_seconds)
+    assert breaker.allow_request()
+    assert breaker.record(True) == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    _trip(breaker)
+    clock.advance(POLICY.open_seconds)
+    assert breaker.allow_request()
+    assert breaker.record(False, {"consecutive_errors": 4}) == CircuitState.OPEN
+    assert breaker.snapshot()["trips"] == 2
+    assert breaker.snapshot()["retry_in_s"] == pytest.approx(POLICY.open_seconds)
+
+
+def test_late_failures_while_open_are_ignored(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    _trip(breaker)
+    clock.advance(10.0)
+    # Calls admitted before the trip finish after it
+    breaker.record(False, {"consecutive_errors": 4, "error_rate": 1.0})
+    breaker.record(False, {"consecutive_errors": 5, "error_rate": 1.0})
+    snap = breaker.snapshot()
+    assert snap["trips"] == 1
+    assert snap["retry_in_s"] == pytest.approx(POLICY.open_seconds - 10.0)
+
+
+def test_execute_trips_and_recovers_local_python_service(clock: FakeClock) -> None:
+    name = f"circuit-{uuid4().hex[:8]}"
+    registry = ServiceRegistry()
+    registry.register(
+        {
+            "name": name,
+            "version": "1.0.0",
+            "tags": [name],
+            "adapter": "local_python",
+            "adapter_config": {"function_path": f"{__name__}:backend_service"},
+        }
+    )
+    router = ServiceRouter(registry, circuit_policy=POLICY, clock=clock)
+    BACKEND["fail"] = True
+    try:
+        for _ in range(POLICY.failure_threshold):
+            with pytest.raises(AdapterError):
+                router.execute(name, {"q": 1})
+        assert router.circuit_snapshot()[name]["state"] == CircuitState.OPEN.value
+
+        # Open circuits reject calls and drop out of execute_by selection
+        with pytest.raises(CircuitOpenError):
+            router.execute(name, {"q": 1})
+        with pytest.raises(NoHealthyService):
+            router.execute_by(name, {"q": 1})
+
+        clock.advance(POLICY.open_seconds)
+        BACKEND["fail"] = False
+        assert router.execute_by(name, {"q": 2}) == {"echo": {"q": 2}}
+        assert router.circuit_snapshot()[name]["state"] == CircuitState.CLOSED.value
+    finally:
+        BACKEND["fail"] = True
+        router.close()
+
+
+def test_rate_limit_rejections_do_not_trip_circuit(clock: FakeClock) -> None:
+    name = f"circuit-{uuid4().hex[:8]}"
+    registry = ServiceRegistry()
+    registry.register(
+        {
+            "name": name,
+            "version": "1.0.0",
+            "adapter": "local_python",
+            "adapter_config": {"function_path": f"{__name__}:backend_service"},
+            # One token per 1000 s on the frozen clock; no waiting
+            "rate_limits": {"qps": 0.001, "burst": 1},
+        }
+    )
+    router = ServiceRouter(registry, circuit_policy=POLICY, clock=clock)
+    BACKEND["fail"] = True
+    try:
+        with pytest.raises(AdapterError):
+            router.execute(name, {"q": 1})
+        for _ in range(POLICY.failure_threshold * 2):
+            assert router.execute(name, {"q": 1}) is None
+        # A second backend failure is two in a row, below the threshold
+        clock.advance(1000.0)
+        with pytest.raises(AdapterError):
+            router.execute(name, {"q": 1})
+        assert router.circuit_snapshot()[name]["state"] == CircuitState.CLOSED.value
+        assert failure_stats(name)["consecutive_errors"] == 2
+        assert metrics_snapshot()["services"][name]["rejected"] == POLICY.failure_threshold * 2
+    finally:
+        router.close()
@@ -0,0 +1,71 @@
+"""Tests for AppointmentsDatabase event statistics and their counter tables."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from database.appointments_db import AppointmentsDatabase
+from database.initialize_db import DatabaseManager
+from models.calendar_event import CalendarEvent
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def appointments_db(tmp_path: Path) -> AppointmentsDatabase:
+    manager = DatabaseManager(
+        f"events_{uuid.uuid4().hex[:8]}", user_feedback=lambda _msg: None, base_dir=tmp_path
+    )
+    return AppointmentsDatabase(manager)
+
+
+def _create_event(
+    appointments_db: AppointmentsDatabase,
+    days_ahead: int,
+    event_type: str = "meeting",
+    reminder: int | None = None,
+) -> CalendarEvent:
+    event = CalendarEvent(
+        id=str(uuid.uuid4()),
+        title="event",
+        event_type=event_type,
+        event_date=(date.today() + timedelta(days=days_ahead)).isoformat(),
+        start_time="09:00",
+        reminder_minutes_before=reminder,
+    )
+    assert appointments_db.create_event(event)["success"]
+    return event
+
+
+def test_one_pass_statistics(appointments_db: AppointmentsDatabase) -> None:
+    _create_event(appointments_db, 1, reminder=15)
+    _create_event(appointments_db, 3, event_type="call")
+    _create_event(appointments_db, 30)
+
+    stats = appointments_db.get_event_statistics()
+    assert stats["total_events"] == 3
+    assert stats["events_by_type"] == {"meeting": 2, "call": 1}
+    assert stats["events_by_status"] == {"scheduled": 3}
+    assert stats["upcoming_events_week"] == 2
+    assert stats["events_with_reminders"] == 1
+
+
+def test_counters_follow_writes(appointments_db: AppointmentsDatabase) -> None:
+    first = _create_event(appointments_db, 1, reminder=15)
+    _create_event(appointments_db, 2, event_type="call")
+    one_pass = appointments_db.get_event_statistics()
+    assert appointments_db.enable_stat_counters()
+    assert appointments_db.get_event_statistics() == one_pass
+
+    _create_event(appointments_db, 10, reminder=5)
+    assert appointments_db.update_event(first.id, {"status": "completed"})
+    with_counters = appointments_db.get_event_statistics()
+
+    assert appointments_db.disable_stat_counters()
+    assert with_counters == appointments_db.get_event_statistics()
+    assert with_counters["events_by_status"] == {"completed": 1, "scheduled": 2}
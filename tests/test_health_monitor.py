@@ -0,0 +1,157 @@
+"""Tests for core_router.health_monitor with fake adapters."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from core_router.health import HealthState
+from core_router.health_monitor import HealthMonitor, HealthMonitorPolicy
+from core_router.registry import ServiceRegistry
+from core_router.router import ServiceRouter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FakeAdapter:
+    """Adapter whose ping result (or hang) is set by the test."""
+
+    def __init__(self) -> None:
+        self.healthy = True
+        self.fail = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def ping(self) -> bool:
+        self.release.wait()
+        if self.fail:
+            raise RuntimeError("connection refused")
+        return self.healthy
+
+    def invoke(self, service_desc: Any, payload: dict[str, Any]) -> object:
+        return {"ok": True}
+
+    def hang(self) -> None:
+        self.release.clear()
+
+
+POLICY = HealthMonitorPolicy(timeout_seconds=0.2, rise=3, fall=2)
+
+
+@pytest.fixture
+def adapter() -> FakeAdapter:
+    return FakeAdapter()
+
+
+@pytest.fixture
+def registry() -> ServiceRegistry:
+    registry = ServiceRegistry()
+    registry.register({"name": "svc", "version": "1.0.0", "adapter": "fake"})
+    return registry
+
+
+@pytest.fixture
+def monitor(registry: ServiceRegistry, adapter: FakeAdapter) -> Iterator[HealthMonitor]:
+    monitor = HealthMonitor(registry, lambda _desc: adapter, POLICY)
+    yield monitor
+    adapter.release.set()
+    monitor.stop()
+
+
+def _state(registry: ServiceRegistry) -> str:
+    return registry.get_by_name("svc").health["state"]
+
+
+def test_first_probe_is_applied_directly(
+    monitor: HealthMonitor, registry: ServiceRegistry, adapter: FakeAdapter
+) -> None:
+    adapter.fail = True
+    info = monitor.run_once()["svc"]
+    assert info["state"] == HealthState.DOWN.value
+    assert _state(registry) == HealthState.DOWN.value
+
+
+def test_fall_failures_needed_before_down(
+    monitor: HealthMonitor, registry: ServiceRegistry, adapter: FakeAdapter
+) -> None:
+    monitor.run_once()
+    adapter.fail = True
+    monitor.run_once()
+    assert _state(registry) == HealthState.HEALTHY.value
+    monitor.run_once()
+    assert _state(registry) == HealthState.DOWN.value
+    assert registry.get_by_name("svc").health["error"] == "probe failed"
+
+
+def test_rise_successes_needed_before_healthy(
+    monitor: HealthMonitor, registry: ServiceRegistry, adapter: FakeAdapter
+) -> None:
+    adapter.fail = True
+    monitor.run_once()
+    adapter.fail = False
+    for _ in range(POLICY.rise - 1):
+        monitor.run_once()
+        assert _state(registry) == HealthState.DOWN.value
+    monitor.run_once()
+    assert _state(registry) == HealthState.HEALTHY.value
+
+
+def test_flapping_does_not_change_state(
+    monitor: HealthMonitor, registry: ServiceRegistry, adapter: FakeAdapter
+) -> None:
+    monitor.run_once()
+    for _ in range(4):
+        adapter.fail = not adapter.fail
+        monitor.run_once()
+        assert _state(registry) == HealthState.HEALTHY.value
+
+
+def test_timed_out_probe_counts_as_down(registry: ServiceRegistry, adapter: FakeAdapter) -> None:
+    monitor = HealthMonitor(
+        registry, lambda _desc: adapter, HealthMonitorPolicy(timeout_seconds=0.05)
+    )
+    try:
+        adapter.hang()
+        info = monitor.run_once()["svc"]
+        assert info["state"] == HealthState.DOWN.value
+        assert "timed out" in info["error"]
+        # The stuck ping is not probed again, and still counts as down
+        assert monitor.run_once()["svc"]["state"] == HealthState.DOWN.value
+    finally:
+        adapter.release.set()
+        monitor.stop()
+
+
+def test_slow_probes_degrade_through_ewma(registry: ServiceRegistry) -> None:
+    policy = HealthMonitorPolicy(degraded_latency_ms=100, ewma_alpha=0.5, rise=1, fall=1)
+    monitor = HealthMonitor(registry, lambda _desc: FakeAdapter(), policy)
+    try:
+        info: dict[str, Any] = {}
+        for probe_ms in (10, 500, 500, 500):
+            info = monitor._observe("svc", HealthState.HEALTHY, probe_ms, None)
+        assert info["state"] == HealthState.DEGRADED.value
+        assert info["latency_ms"] == pytest.approx(438.75)
+    finally:
+        monitor.stop()
+
+
+def test_execute_leaves_health_to_running_monitor(
+    registry: ServiceRegistry, adapter: FakeAdapter
+) -> None:
+    router = ServiceRouter(registry, adapter_factory=lambda _desc: adapter)
+    monitor = router.health_monitor(HealthMonitorPolicy(interval_seconds=3600, fall=1))
+    try:
+        adapter.fail = True
+        monitor.run_once()
+        monitor.start()
+        # A successful call must not reset the monitor's verdict
+        assert router.execute("svc", {}) == {"ok": True}
+        assert _state(registry) == HealthState.DOWN.value
+    finally:
+        router.close()
+    assert not monitor.running
+    router.execute("svc", {})
+    assert _state(registry) == HealthState.HEALTHY.value
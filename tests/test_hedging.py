@@ -0,0 +1,132 @@
+"""Tests for hedged and retried ServiceRouter.execute_by with sleeping local_python replicas."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import pytest
+
+from core_router.errors import AdapterError
+from core_router.hedging import HedgePolicy
+from core_router.registry import ServiceRegistry
+from core_router.router import ServiceRouter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Replica behaviour read by the local_python targets below: name -> seconds to
+# sleep, or an exception to raise
+BEHAVIOUR: dict[str, float | Exception] = {}
+
+
+def _run_replica(name: str) -> dict[str, Any]:
+    action = BEHAVIOUR[name]
+    if isinstance(action, Exception):
+        raise action
+    time.sleep(action)
+    return {"replica": name}
+
+
+def replica_a(payload: dict[str, Any]) -> dict[str, Any]:
+    """local_python targets, one per replica."""
+    return _run_replica("a")
+
+
+def replica_b(payload: dict[str, Any]) -> dict[str, Any]:
+    return _run_replica("b")
+
+
+def replica_c(payload: dict[str, Any]) -> dict[str, Any]:
+    return _run_replica("c")
+
+
+@pytest.fixture
+def tag() -> str:
+    return f"hedge-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def router(tag: str) -> Iterator[ServiceRouter]:
+    registry = ServiceRegistry()
+    for name in ("a", "b", "c"):
+        registry.register(
+            {
+                # Name-sorted, so first_healthy always picks "a" first
+                "name": f"{tag}-{name}",
+                "version": "1.0.0",
+                "tags": [tag],
+                "adapter": "local_python",
+                "adapter_config": {"function_path": f"{__name__}:replica_{name}"},
+            }
+        )
+    router = ServiceRouter(registry)
+    BEHAVIOUR.update(a=0.0, b=0.0, c=0.0)
+    yield router
+    router.close()
+    BEHAVIOUR.clear()
+
+
+def _timed(fn: Any, *args: Any, **kwargs: Any) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def test_hedge_beats_slow_primary(router: ServiceRouter, tag: str) -> None:
+    BEHAVIOUR["a"] = 1.0
+    result, elapsed = _timed(router.execute_by, tag, {}, hedge=HedgePolicy(delay_ms=20))
+    assert result == {"replica": "b"}
+    assert elapsed < 0.5
+
+
+def test_fast_primary_is_not_hedged(router: ServiceRouter, tag: str) -> None:
+    BEHAVIOUR["b"] = AdapterError("must not be called")
+    result = router.execute_by(tag, {}, hedge=HedgePolicy(delay_ms=500))
+    assert result == {"replica": "a"}
+
+
+def test_spent_hedge_budget_waits_for_primary(router: ServiceRouter, tag: str) -> None:
+    BEHAVIOUR["a"] = 0.2
+    policy = HedgePolicy(delay_ms=10, budget_ratio=0.0, budget_burst=1.0)
+    assert router.execute_by(tag, {}, hedge=policy) == {"replica": "b"}
+    # The single token is gone, so the slow primary's answer is awaited
+    result, elapsed = _timed(router.execute_by, tag, {}, hedge=policy)
+    assert result == {"replica": "a"}
+    assert elapsed >= 0.2
+
+
+def test_retry_moves_to_next_replica(router: ServiceRouter, tag: str) -> None:
+    BEHAVIOUR["a"] = RuntimeError("replica a down")
+    with pytest.raises(AdapterError):
+        router.execute_by(tag, {})
+    assert router.execute_by(tag, {}, retries=1) == {"replica": "b"}
+
+
+def test_retries_exhausted_raise_last_error(router: ServiceRouter, tag: str) -> None:
+    for name in ("a", "b", "c"):
+        BEHAVIOUR[name] = RuntimeError(f"replica {name} down")
+    with pytest.raises(AdapterError, match="replica b down"):
+        router.execute_by(tag, {}, retries=1)
+
+
+def test_early_primary_failure_sends_hedge(router: ServiceRouter, tag: str) -> None:
+    BEHAVIOUR["a"] = RuntimeError("replica a down")
+    result, elapsed = _timed(router.execute_by, tag, {}, hedge=HedgePolicy(delay_ms=2000))
+    assert result == {"replica": "b"}
+    assert elapsed < 1.0
+
+
+def test_hedged_calls_with_random_latency(router: ServiceRouter, tag: str) -> None:
+    rng = random.Random(7)
+    policy = HedgePolicy(delay_ms=30, max_hedges=2, budget_ratio=1.0)
+    for _ in range(10):
+        BEHAVIOUR.update(a=rng.uniform(0, 0.2), b=rng.uniform(0, 0.2), c=rng.uniform(0, 0.2))
+        # Replica b is sent after one hedge delay, c after two
+        best = min(BEHAVIOUR["a"], BEHAVIOUR["b"] + 0.03, BEHAVIOUR["c"] + 0.06)
+        result, elapsed = _timed(router.execute_by, tag, {}, hedge=policy)
+        assert result["replica"] in {"a", "b", "c"}
+        # Never much slower than the best replica given the hedge delays
+        assert elapsed < best + 0.1
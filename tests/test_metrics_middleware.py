@@ -0,0 +1,139 @@
+"""Tests for API_files.middleware.metrics.MetricsMiddleware with a recording metrics client."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from API_files.middleware.metrics import MetricsMiddleware
+from utils.metrics import DinoAirMetrics
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class RecordingMetrics:
+    """Stands in for utils.metrics.DinoAirMetrics; records (kind, name, value, tags)."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, float, list[str]]] = []
+        # (name, value, count) per timing call
+        self.timings: list[tuple[str, float, int]] = []
+        self.threads: set[str] = set()
+
+    def _record(self, kind: str, name: str, value: float, tags: list[str] | None) -> None:
+        self.calls.append((kind, name, value, tags or []))
+        self.threads.add(threading.current_thread().name)
+
+    def increment(self, name: str, value: int = 1, tags: list[str] | None = None) -> None:
+        self._record("increment", name, value, tags)
+
+    def gauge(self, name: str, value: float, tags: list[str] | None = None) -> None:
+        self._record("gauge", name, value, tags)
+
+    def histogram(self, name: str, value: float, tags: list[str] | None = None) -> None:
+        self._record("histogram", name, value, tags)
+
+    def timing(
+        self, name: str, value: float, tags: list[str] | None = None, count: int = 1
+    ) -> None:
+        self._record("timing", name, value, tags)
+        self.timings.append((name, value, count))
+
+    def named(self, kind: str, name: str) -> list[tuple[str, str, float, list[str]]]:
+        return [call for call in self.calls if call[0] == kind and call[1] == name]
+
+
+def _middleware(metrics: RecordingMetrics, flush_interval_seconds: float) -> MetricsMiddleware:
+    # FastAPI routes put the matched route (and its template) in the scope
+    app = FastAPI()
+
+    @app.get("/notes/{note_id}", response_class=PlainTextResponse)
+    async def get_note(note_id: str) -> str:
+        return f"note {note_id}"
+
+    @app.get("/forbidden")
+    async def forbidden() -> None:
+        raise PermissionError("not allowed")
+
+    return MetricsMiddleware(
+        app,
+        flush_interval_seconds=flush_interval_seconds,
+        metrics=metrics,  # type: ignore[arg-type]
+    )
+
+
+def test_requests_are_sent_at_shutdown_not_on_request_path() -> None:
+    metrics = RecordingMetrics()
+    with TestClient(_middleware(metrics, flush_interval_seconds=3600)) as client:
+        assert client.get("/notes/1").text == "note 1"
+        assert client.get("/notes/2").status_code == 200
+        assert metrics.calls == []
+
+    tags = ["method:GET", "endpoint:/notes/{note_id}", "status_code:200"]
+    assert metrics.named("increment", "api.requests") == [("increment", "api.requests", 2, tags)]
+    durations = metrics.named("timing", "api.request_duration")
+    assert 1 <= len(durations) <= 2
+    assert all(call[3] == tags for call in durations)
+    assert metrics.named("timing", "api.ttfb")
+    assert sum(count for _, _, count in metrics.timings) == 4
+    assert not [call for call in metrics.calls if call[0] == "gauge"]
+
+
+def test_latency_is_sent_once_per_bucket() -> None:
+    metrics = RecordingMetrics()
+    with TestClient(_middleware(metrics, flush_interval_seconds=3600)) as client:
+        for n in range(200):
+            client.get(f"/notes/{n}")
+
+    for name in ("api.request_duration", "api.ttfb"):
+        buckets = [(value, count) for n, value, count in metrics.timings if n == name]
+        values = [value for value, _ in buckets]
+        # One packet per distinct bucket value, weighted by its sample count
+        assert len(values) == len(set(values)) < 200
+        assert sum(count for _, count in buckets) == 200
+
+
+def test_weighted_timing_is_one_sample_rated_packet(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = DinoAirMetrics()
+    packets: list[str] = []
+    monkeypatch.setattr(metrics.client, "_send", lambda payload, *_args: packets.append(payload))
+    for _ in range(20):
+        metrics.timing("api.request_duration", 12.5, tags=["endpoint:/x"], count=4)
+    # Never dropped by client-side sampling; the agent counts each packet 4 times
+    assert len(packets) == 20
+    assert all(
+        packet.startswith("dinoair.api.request_duration:12.5|ms|@0.25|#") for packet in packets
+    )
+
+
+def test_background_task_flushes_on_interval() -> None:
+    metrics = RecordingMetrics()
+    with TestClient(_middleware(metrics, flush_interval_seconds=0.05)) as client:
+        client.get("/notes/1")
+        deadline = time.monotonic() + 5
+        while not metrics.named("increment", "api.requests") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert metrics.named("increment", "api.requests")
+        # Sending happens in the event loop's worker threads, not on the loop itself
+        assert metrics.threads
+        assert all(name.startswith("asyncio") for name in metrics.threads)
+
+
+def test_security_event_goes_to_injected_metrics() -> None:
+    metrics = RecordingMetrics()
+    with TestClient(
+        _middleware(metrics, flush_interval_seconds=3600), raise_server_exceptions=False
+    ) as client:
+        assert client.get("/forbidden").status_code == 500
+        (event,) = metrics.named("increment", "security.events")
+        assert "endpoint:/forbidden" in event[3]
+        assert "error:PermissionError" in event[3]
+
+    errors = metrics.named("increment", "api.errors.total")
+    assert [call[2] for call in errors] == [1]
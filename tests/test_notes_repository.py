@@ -0,0 +1,85 @@
+"""Tests for NotesRepository search results and tag counts."""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+from database.initialize_db import DatabaseManager
+from database.notes_repository import NotesRepository
+from models.note import Note
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> NotesRepository:
+    manager = DatabaseManager(
+        f"notes_{uuid.uuid4().hex[:8]}", user_feedback=lambda _msg: None, base_dir=tmp_path
+    )
+    return NotesRepository(db_manager=manager)
+
+
+def _create_note(
+    repository: NotesRepository, title: str, content: str = "", tags: list[str] | None = None
+) -> Note:
+    note = Note(id=str(uuid.uuid4()), title=title, content=content, tags=tags or [])
+    assert repository.create_note(note).success
+    return note
+
+
+def test_fts_results_carry_rank_and_snippet(repository: NotesRepository) -> None:
+    assert repository._has_fts_index()
+    best = _create_note(repository, "Garden plan", "Plant tomatoes; water tomatoes daily")
+    other = _create_note(repository, "Groceries", "Buy tomatoes and bread")
+    _create_note(repository, "Unrelated", "Nothing to see here")
+
+    result = repository.search_notes("tomatoes")
+    assert result.success
+    notes = result.data
+    assert [note.id for note in notes] == [best.id, other.id]
+    assert all(isinstance(note.search_rank, float) for note in notes)
+    assert notes[0].search_rank <= notes[1].search_rank
+    assert "<mark>tomatoes</mark>" in notes[0].search_snippet
+
+
+def test_like_fallback_leaves_search_fields_unset(repository: NotesRepository) -> None:
+    note = _create_note(repository, "Punctuation", "only -- dashes")
+
+    # No searchable words, so the query goes through LIKE matching
+    notes = repository.search_notes("--").data
+    assert [n.id for n in notes] == [note.id]
+    assert notes[0].search_rank is None
+    assert notes[0].search_snippet is None
+
+
+def test_search_fields_are_not_serialized() -> None:
+    note = Note(id="n1", title="t", content="c", search_rank=-1.5, search_snippet="<mark>c</mark>")
+    data = note.to_dict()
+    assert "search_rank" not in data
+    assert "search_snippet" not in data
+    assert Note.from_dict(data) == note
+
+
+def test_all_tags_in_first_seen_order(repository: NotesRepository) -> None:
+    _create_note(repository, "first", tags=["work", "ideas"])
+    _create_note(repository, "second", tags=["zeta", "ideas"])
+    deleted = _create_note(repository, "deleted", tags=["archive"])
+    assert repository.soft_delete_note(deleted.id).success
+
+    tags = repository.get_all_tags().data
+    assert list(tags.items()) == [("work", 1), ("ideas", 2), ("zeta", 1)]
+
+
+def test_all_tags_keep_first_seen_casing(repository: NotesRepository) -> None:
+    legacy = _create_note(repository, "legacy", tags=["work", "ideas"])
+    _create_note(repository, "new", tags=["work"])
+    # Notes written before tags were normalized still carry mixed case in their JSON copy
+    with repository.db_manager.get_notes_connection() as conn:
+        conn.execute("UPDATE note_list SET tags = ? WHERE id = ?", ('["Work", "IDEAS"]', legacy.id))
+
+    tags = repository.get_all_tags().data
+    assert list(tags.items()) == [("Work", 2), ("IDEAS", 1)]
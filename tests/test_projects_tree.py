@@ -0,0 +1,113 @@
+"""Tests for ProjectsDatabase trees and statistics aggregated across the sibling databases."""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+from database.appointments_db import AppointmentsDatabase
+from database.artifacts_db import ArtifactsDatabase
+from database.initialize_db import DatabaseManager
+from database.notes_repository import NotesRepository
+from database.projects_db import ProjectsDatabase
+from models.artifact import Artifact
+from models.calendar_event import CalendarEvent
+from models.note import Note
+from models.project import Project
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> DatabaseManager:
+    return DatabaseManager(
+        f"projects_{uuid.uuid4().hex[:8]}", user_feedback=lambda _msg: None, base_dir=tmp_path
+    )
+
+
+@pytest.fixture
+def projects_db(manager: DatabaseManager) -> ProjectsDatabase:
+    return ProjectsDatabase(manager)
+
+
+def _project(projects_db: ProjectsDatabase, name: str, parent: Project | None = None) -> Project:
+    project = Project(
+        id=str(uuid.uuid4()), name=name, parent_project_id=parent.id if parent else None
+    )
+    assert projects_db.create_project(project)["success"]
+    return project
+
+
+def _add_items(manager: DatabaseManager, project: Project, notes: int, events: int) -> None:
+    notes_repo = NotesRepository(db_manager=manager)
+    for index in range(notes):
+        note = Note(id=str(uuid.uuid4()), title=f"n{index}", content="", project_id=project.id)
+        assert notes_repo.create_note(note).success
+    ArtifactsDatabase(manager).create_artifact(
+        Artifact(id=str(uuid.uuid4()), name="a", content="x", project_id=project.id)
+    )
+    appointments = AppointmentsDatabase(manager)
+    for index in range(events):
+        event = CalendarEvent(
+            id=str(uuid.uuid4()),
+            title=f"e{index}",
+            event_date="2030-01-01",
+            status="completed" if index == 0 else "scheduled",
+            project_id=project.id,
+        )
+        assert appointments.create_event(event)["success"]
+
+
+def test_tree_links_children_by_name_with_counts(
+    manager: DatabaseManager, projects_db: ProjectsDatabase
+) -> None:
+    root = _project(projects_db, "root")
+    beta = _project(projects_db, "beta", root)
+    alpha = _project(projects_db, "alpha", root)
+    leaf = _project(projects_db, "leaf", beta)
+    _add_items(manager, leaf, notes=2, events=3)
+
+    tree = projects_db.get_project_tree(root.id)
+    assert [child["id"] for child in tree["children"]] == [alpha.id, beta.id]
+    leaf_node = tree["children"][1]["children"][0]
+    assert leaf_node["id"] == leaf.id
+    counts = [leaf_node[key] for key in ("note_count", "artifact_count", "event_count")]
+    assert counts == [2, 1, 3]
+    assert tree["note_count"] == 0
+
+
+def test_tree_query_terminates_on_parent_cycle(projects_db: ProjectsDatabase) -> None:
+    root = _project(projects_db, "root")
+    child = _project(projects_db, "child", root)
+    with projects_db._get_connection() as conn:
+        conn.execute("UPDATE projects SET parent_project_id = ? WHERE id = ?", (child.id, root.id))
+
+    tree = projects_db.get_project_tree(root.id)
+    assert [node["id"] for node in tree["children"]] == [child.id]
+    assert tree["children"][0]["children"] == []
+
+
+def test_statistics_count_sibling_databases(
+    manager: DatabaseManager, projects_db: ProjectsDatabase
+) -> None:
+    project = _project(projects_db, "stats")
+    _project(projects_db, "child", project)
+    _add_items(manager, project, notes=1, events=4)
+
+    stats = projects_db.get_project_statistics(project.id)
+    assert stats.total_notes == 1
+    assert stats.total_artifacts == 1
+    assert stats.total_calendar_events == 4
+    assert stats.child_project_count == 1
+    assert (stats.completed_items, stats.total_items) == (1, 4)
+    assert stats.completion_percentage == 25.0
+    assert stats.last_activity_date is not None
+
+
+def test_statistics_without_sibling_databases(projects_db: ProjectsDatabase) -> None:
+    project = _project(projects_db, "alone")
+    stats = projects_db.get_project_statistics(project.id)
+    assert (stats.total_notes, stats.total_artifacts, stats.total_calendar_events) == (0, 0, 0)
@@ -0,0 +1,117 @@
+"""Tests for core_router.ratelimit and rate-limited ServiceRouter.execute."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from core_router.ratelimit import RateLimit, TokenBucket, parse_rate_limit
+from core_router.registry import ServiceRegistry
+from core_router.router import ServiceRouter
+
+
+class FakeTime:
+    """Monotonic clock whose sleep() advances it instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time() -> FakeTime:
+    return FakeTime()
+
+
+def test_parse_rate_limit_defaults_burst_to_one_window() -> None:
+    assert parse_rate_limit({"rpm": 300}) == RateLimit(rate_per_s=5.0, burst=300.0)
+    assert parse_rate_limit({"qps": 5, "burst": 10, "max_wait_ms": 250}) == RateLimit(
+        rate_per_s=5.0, burst=10.0, max_wait_s=0.25
+    )
+    # A resolved per-minute rate wins over the mapping
+    assert parse_rate_limit({"qps": 5}, rpm=120) == RateLimit(rate_per_s=2.0, burst=120.0)
+    assert parse_rate_limit({"burst": 10}) is None
+    assert parse_rate_limit(None) is None
+
+
+def test_empty_bucket_rejects_without_max_wait(fake_time: FakeTime) -> None:
+    bucket = TokenBucket(RateLimit(rate_per_s=2.0, burst=2.0), fake_time.clock, fake_time.sleep)
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert not bucket.acquire()
+    fake_time.now += 0.5
+    assert bucket.acquire()
+    assert fake_time.sleeps == []
+
+
+def test_waiters_sleep_on_the_injected_clock(fake_time: FakeTime) -> None:
+    limit = RateLimit(rate_per_s=10.0, burst=1.0, max_wait_s=0.25)
+    bucket = TokenBucket(limit, fake_time.clock, fake_time.sleep)
+    assert bucket.acquire()
+    # Each waiter reserves the next token, so the waits queue up in arrival order
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert fake_time.sleeps == pytest.approx([0.1, 0.1])
+    assert bucket.tokens == pytest.approx(0.0)
+
+
+def test_wait_beyond_max_wait_is_rejected(fake_time: FakeTime) -> None:
+    limit = RateLimit(rate_per_s=1.0, burst=1.0, max_wait_s=0.5)
+    bucket = TokenBucket(limit, fake_time.clock, fake_time.sleep)
+    assert bucket.acquire()
+    assert not bucket.acquire()
+    assert fake_time.sleeps == []
+    fake_time.now += 0.6
+    assert bucket.acquire()
+    assert fake_time.sleeps == pytest.approx([0.4])
+
+
+def test_execute_waits_for_token_with_injected_sleep(fake_time: FakeTime) -> None:
+    name = f"limited-{uuid4().hex[:8]}"
+    registry = ServiceRegistry()
+    registry.register(
+        {
+            "name": name,
+            "version": "1.0.0",
+            "adapter": "fake",
+            "rate_limits": {"qps": 2, "burst": 1, "max_wait_ms": 600},
+        }
+    )
+
+    calls: list[dict[str, Any]] = []
+
+    class Echo:
+        def invoke(self, service_desc: Any, payload: dict[str, Any]) -> object:
+            calls.append(payload)
+            return payload
+
+        def ping(self) -> bool:
+            return True
+
+    router = ServiceRouter(
+        registry,
+        adapter_factory=lambda _desc: Echo(),
+        clock=fake_time.clock,
+        sleep=fake_time.sleep,
+    )
+    try:
+        assert router.execute(name, {"n": 1}) == {"n": 1}
+        assert router.execute(name, {"n": 2}) == {"n": 2}
+        assert fake_time.sleeps == pytest.approx([0.5])
+        # Two reservations ahead would need a 1 s wait, past max_wait_ms; execute
+        # reports the rejection like other validation errors, by returning None
+        router._buckets[name].reserve(1.0)
+        assert router.execute(name, {"n": 3}) is None
+        assert fake_time.sleeps == pytest.approx([0.5])
+        assert calls == [{"n": 1}, {"n": 2}]
+    finally:
+        router.close()
@@ -0,0 +1,205 @@
+"""Tests for database.reminder_scheduler driven by a fake clock."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from database.appointments_db import AppointmentsDatabase
+from database.initialize_db import DatabaseManager
+from database.reminder_scheduler import ReminderScheduler
+from models.calendar_event import CalendarEvent
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DAY = "2030-01-01"
+
+
+class FakeClock:
+    """Local wall clock set by hand."""
+
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def appointments_db(tmp_path: Path) -> AppointmentsDatabase:
+    # DatabaseManager shares one base directory per pytest process; a fresh user
+    # keeps each test's appointments database separate
+    manager = DatabaseManager(
+        f"reminders_{uuid.uuid4().hex[:8]}", user_feedback=lambda _msg: None, base_dir=tmp_path
+    )
+    return AppointmentsDatabase(manager)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock(datetime(2030, 1, 1, 9, 0))
+
+
+@pytest.fixture
+def sent() -> list[list[dict[str, Any]]]:
+    return []
+
+
+@pytest.fixture
+def scheduler(
+    appointments_db: AppointmentsDatabase,
+    clock: FakeClock,
+    sent: list[list[dict[str, Any]]],
+) -> ReminderScheduler:
+    # Follow event changes like start() does, without the dispatch thread
+    sched = ReminderScheduler(appointments_db, dispatch=sent.append, clock=clock)
+    appointments_db.add_event_listener(sched.resync_event)
+    return sched
+
+
+def _create_event(
+    appointments_db: AppointmentsDatabase, start_time: str, minutes_before: int = 15
+) -> CalendarEvent:
+    event = CalendarEvent(
+        id=str(uuid.uuid4()),
+        title=f"meeting at {start_time}",
+        event_date=DAY,
+        start_time=start_time,
+        reminder_minutes_before=minutes_before,
+    )
+    assert appointments_db.create_event(event)["success"]
+    return event
+
+
+def _event_ids(batches: list[list[dict[str, Any]]]) -> list[str]:
+    return [reminder["event_id"] for batch in batches for reminder in batch]
+
+
+def test_due_reminder_is_dispatched_and_marked_sent(
+    appointments_db: AppointmentsDatabase,
+    scheduler: ReminderScheduler,
+    clock: FakeClock,
+    sent: list[list[dict[str, Any]]],
+) -> None:
+    event = _create_event(appointments_db, "10:00")
+    assert scheduler.next_due() == datetime(2030, 1, 1, 9, 45)
+
+    clock.now = datetime(2030, 1, 1, 9, 45)
+    assert scheduler.run_due() == 1
+    assert _event_ids(sent) == [event.id]
+    assert len(scheduler) == 0
+    assert appointments_db.get_pending_reminders() == []
+
+
+def test_reminder_not_yet_due_is_kept(
+    appointments_db: AppointmentsDatabase,
+    scheduler: ReminderScheduler,
+    clock: FakeClock,
+    sent: list[list[dict[str, Any]]],
+) -> None:
+    _create_event(appointments_db, "10:00")
+    clock.now = datetime(2030, 1, 1, 9, 44, 59)
+    assert scheduler.run_due() == 0
+    assert sent == []
+    assert len(scheduler) == 1
+
+
+def test_due_reminders_are_sent_as_one_batch(
+    appointments_db: AppointmentsDatabase,
+    scheduler: ReminderScheduler,
+    clock: FakeClock,
+    sent: list[list[dict[str, Any]]],
+) -> None:
+    first = _create_event(appointments_db, "10:00")
+    second = _create_event(appointments_db, "10:05")
+    later = _create_event(appointments_db, "12:00")
+
+    clock.now = datetime(2030, 1, 1, 10, 0)
+    assert scheduler.run_due() == 2
+    assert len(sent) == 1
+    assert sorted(_event_ids(sent)) == sorted([first.id, second.id])
+    assert scheduler.next_due() == datetime(2030, 1, 1, 11, 45)
+    assert [r["event_id"] for r in appointments_db.get_pending_reminders()] == [later.id]
+
+
+def test_rescheduled_event_fires_at_new_time(
+    appointments_db: AppointmentsDatabase,
+    scheduler: ReminderScheduler,
+    clock: FakeClock,
+    sent: list[list[dict[str, Any]]],
+) -> None:
+    event = _create_event(appointments_db, "10:00")
+    assert appointments_db.update_event(
+        event.id, {"start_time": "11:00", "reminder_minutes_before": 15}
+    )
+    assert len(scheduler) == 1
+
+    clock.now = datetime(2030, 1, 1, 10, 0)
+    assert scheduler.run_due() == 0
+    clock.now = datetime(2030, 1, 1, 10, 45)
+    assert scheduler.run_due() == 1
+    assert _event_ids(sent) == [event.id]
+
+
+def test_deleted_event_is_not_dispatched(
+    appointments_db: AppointmentsDatabase,
+    scheduler: ReminderScheduler,
+    clock: FakeClock,
+    sent: list[list[dict[str, Any]]],
+) -> None:
+    event = _create_event(appointments_db, "10:00")
+    assert appointments_db.delete_event(event.id)
+    assert len(scheduler) == 0
+
+    clock.now = datetime(2030, 1, 1, 12, 0)
+    assert scheduler.run_due() == 0
+    assert sent == []
+    assert scheduler.next_due() is None
+
+
+def test_failed_dispatch_is_retried(
+    appointments_db: AppointmentsDatabase, clock: FakeClock
+) -> None:
+    attempts: list[int] = []
+
+    def flaky_dispatch(batch: list[dict[str, Any]]) -> None:
+        attempts.append(len(batch))
+        if len(attempts) == 1:
+            raise RuntimeError("notification channel down")
+
+    sched = ReminderScheduler(appointments_db, dispatch=flaky_dispatch, clock=clock)
+    _create_event(appointments_db, "10:00")
+    sched.resync()
+
+    clock.now = datetime(2030, 1, 1, 9, 45)
+    assert sched.run_due() == 0
+    assert sched.next_due() == clock.now + ReminderScheduler.DEFAULT_RETRY_DELAY
+
+    clock.now += ReminderScheduler.DEFAULT_RETRY_DELAY
+    assert sched.run_due() == 1
+    assert attempts == [1, 1]
+
+
+def test_event_change_during_dispatch_does_not_requeue(
+    appointments_db: AppointmentsDatabase, clock: FakeClock
+) -> None:
+    batches: list[list[dict[str, Any]]] = []
+
+    def dispatch(batch: list[dict[str, Any]]) -> None:
+        batches.append(batch)
+        # An event change re-syncs while the reminder is still unsent in the database
+        sched.resync_event(batch[0]["event_id"])
+
+    sched = ReminderScheduler(appointments_db, dispatch=dispatch, clock=clock)
+    _create_event(appointments_db, "10:00")
+    sched.resync()
+
+    clock.now = datetime(2030, 1, 1, 9, 45)
+    assert sched.run_due() == 1
+    assert len(sched) == 0
+    assert sched.run_due() == 0
+    assert len(batches) == 1
@@ -0,0 +1,63 @@
+"""Tests for the pseudocode translator's persistent AST cache store."""
+
+from __future__ import annotations
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+# The translator imports itself as a top-level package from tools/
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.append(str(TOOLS_DIR))
+
+from pseudocode_translator.ast_cache import ASTCache, _ASTDiskStore  # noqa: E402
+
+SOURCES = ["x = 1\n", "def f(a):\n    return a * 2\n", b"y = [1, 2, 3]\n"]
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_entries_survive_restart(tmp_path: Path, compress: bool) -> None:
+    cache = ASTCache(persistent_path=tmp_path, enable_compression=compress)
+    for source in SOURCES:
+        cache.parse(source)
+
+    reloaded = ASTCache(persistent_path=tmp_path, enable_compression=compress)
+    assert reloaded.get_stats()["persistent_entries"] == len(SOURCES)
+    for source in SOURCES:
+        assert ast.dump(reloaded.get(source)) == ast.dump(ast.parse(source))
+    stats = reloaded.get_stats()
+    assert stats["disk_hits"] == len(SOURCES)
+    assert stats["misses"] == 0
+
+
+def test_torn_trailing_record_is_truncated(tmp_path: Path) -> None:
+    ASTCache(persistent_path=tmp_path).parse(SOURCES[0])
+    log = tmp_path / _ASTDiskStore.FILENAME
+    intact_size = log.stat().st_size
+    with log.open("ab") as f:
+        f.write(b"0" * 64 + b'\t{"f":"<unknown>"')
+
+    reloaded = ASTCache(persistent_path=tmp_path)
+    assert log.stat().st_size == intact_size
+    assert reloaded.get(SOURCES[0]) is not None
+    reloaded.parse(SOURCES[1])
+    assert ASTCache(persistent_path=tmp_path).get(SOURCES[1]) is not None
+
+
+def test_compact_keeps_only_live_records(tmp_path: Path) -> None:
+    store = _ASTDiskStore(tmp_path, compress=False)
+    store.append("a" * 64, "x = 1", "<a>", "exec", 1.0)
+    store.append("b" * 64, "y = 2", "<b>", "exec", 2.0)
+    assert not store.append("a" * 64, "x = 1", "<a>", "exec", 3.0)
+    store.discard("a" * 64)
+    store.compact()
+
+    assert len(store) == 1
+    assert store.read("b" * 64) == ("y = 2", "<b>", "exec", 2.0)
+    reopened = _ASTDiskStore(tmp_path, compress=False)
+    assert "a" * 64 not in reopened
+    assert reopened.read("b" * 64) == ("y = 2", "<b>", "exec", 2.0)
+    assert store.path.stat().st_size == reopened._live_bytes
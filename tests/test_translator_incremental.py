@@ -0,0 +1,82 @@
+"""Tests for incremental re-parsing and translation reuse in the pseudocode translator."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+# The translator imports itself as a top-level package from tools/
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.append(str(TOOLS_DIR))
+
+incremental = pytest.importorskip("pseudocode_translator.translator_support.incremental")
+
+from pseudocode_translator.parser import ParserModule  # noqa: E402
+
+IncrementalTranslationState = incremental.IncrementalTranslationState
+
+DOCUMENT = """def greet(name):
+    return f"hello {name}"
+
+create a list of the numbers from 1 to 10
+then print each of them
+
+x = 5
+y = x * 2
+
+show the total to the user
+"""
+
+EDITS = [
+    DOCUMENT.replace("then print each of them", "then print every one of them"),
+    DOCUMENT.replace("x = 5\n", "x = 5\n\nz = 3\n"),
+    DOCUMENT.replace("\nx = 5", "x = 5"),
+    "# header\n" + DOCUMENT,
+    DOCUMENT + "\nreturn the result\n",
+    DOCUMENT.split("\n\n", 1)[1],
+]
+
+
+def _blocks(result) -> list[tuple]:
+    return [(b.type, b.content, b.line_numbers, b.metadata, b.context) for b in result.blocks]
+
+
+@pytest.mark.parametrize("edited", EDITS)
+def test_incremental_parse_matches_full_parse(edited: str) -> None:
+    state = IncrementalTranslationState()
+    state.parse(ParserModule(), DOCUMENT)
+    result = state.parse(ParserModule(), edited)
+    expected = ParserModule().get_parse_result(edited)
+    assert _blocks(result) == _blocks(expected)
+    assert result.warnings == expected.warnings
+
+
+def test_only_edited_block_is_reanalyzed() -> None:
+    state = IncrementalTranslationState()
+    state.parse(ParserModule(), DOCUMENT)
+    assert state.stats.blocks_reparsed == state.stats.blocks_total
+
+    state.parse(ParserModule(), EDITS[0])
+    assert state.stats.blocks_reparsed == 1
+
+
+def test_cached_translation_is_rebased_and_failures_are_retried() -> None:
+    state = IncrementalTranslationState()
+    block = state.parse(ParserModule(), DOCUMENT).blocks[1]
+    key = state.translation_key(block, {"before": ""}, "python")
+    output = replace(block, metadata={"translated": True})
+    state.store_translation(key, block, [output])
+
+    shifted = state.parse(ParserModule(), "# header\n\n" + DOCUMENT).blocks[2]
+    assert state.translation_key(shifted, {"before": ""}, "python") == key
+    reused = state.get_translation(key, shifted)
+    assert [b.line_numbers for b in reused] == [shifted.line_numbers]
+
+    failed = replace(block, metadata={"translation_failed": True})
+    failed_key = state.translation_key(block, {"before": "other"}, "python")
+    state.store_translation(failed_key, block, [failed])
+    assert state.get_translation(failed_key, block) is None
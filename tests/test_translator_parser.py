@@ -0,0 +1,79 @@
+"""Tests for the pseudocode translator's line scoring and block classification."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The translator imports itself as a top-level package from tools/
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.append(str(TOOLS_DIR))
+
+from pseudocode_translator.models import BlockType  # noqa: E402
+from pseudocode_translator.parser import ParserModule  # noqa: E402
+
+LINES = [
+    "def add(a, b):",
+    "return a + b",
+    "x = [i * 2 for i in range(10)]",
+    "total := compute(x)",
+    "match command:",
+    "case 'quit':",
+    "print the result to the screen",
+    "Create a list of the numbers from 1 to 10.",
+    "if the user is logged in then show the dashboard",
+    "result = calculate total price",
+    "for item in items:",
+    "call process(item) with retries",
+    "s = 'it is a string'",
+    'msg = "unterminated',
+    '"""docstring line',
+    "x=1;y=2",
+    "lambda x: x + 1",
+]
+
+
+@pytest.fixture
+def parser() -> ParserModule:
+    return ParserModule()
+
+
+@pytest.mark.parametrize("line", LINES)
+def test_feature_scan_matches_separate_regexes(line: str) -> None:
+    features = {m.lastgroup for m in ParserModule._PYTHON_FEATURES_RE.finditer(line)}
+    assert ("keyword" in features) == bool(ParserModule._PYTHON_KEYWORDS_RE.search(line))
+    assert ("operator" in features) == bool(ParserModule._PYTHON_OPERATORS_RE.search(line))
+    assert ("delimiter" in features) == bool(ParserModule._PYTHON_DELIMITERS_RE.search(line))
+
+
+def test_tokenizer_shortcut_keeps_verdicts_and_scores(parser: ParserModule) -> None:
+    invalid = parser._token_invalid_lines(LINES)
+    assert LINES.index("print the result to the screen") in invalid
+    for index in invalid:
+        # The shortcut must not change the verdict or score of a rejected line
+        assert parser._is_valid_python(LINES[index], True) == parser._is_valid_python(LINES[index])
+        assert parser._calculate_python_score(LINES[index], True) == (
+            parser._calculate_python_score(LINES[index], False)
+        )
+
+
+def test_block_classification_is_stable_with_memo(parser: ParserModule) -> None:
+    block = "\n".join(LINES[:4])
+    english = "\n".join(LINES[6:9])
+    assert parser._classify_block(block) == BlockType.PYTHON
+    assert parser._classify_block(english) == BlockType.ENGLISH
+
+    # Second pass is served from the line memo and must agree with a fresh parser
+    assert parser._classify_block(block) == ParserModule()._classify_block(block)
+    for line in LINES:
+        assert parser.score_line_language(line) == ParserModule().score_line_language(line)
+
+
+def test_line_memo_is_bounded(parser: ParserModule, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ParserModule, "_LINE_SCORE_CACHE_SIZE", 4)
+    for index in range(10):
+        parser.score_line_language(f"value_{index} = {index}")
+    assert len(parser._line_scores) <= 4
@@ -0,0 +1,70 @@
+"""Tests for the streaming pipeline's ReorderBuffer."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+# The translator imports itself as a top-level package from tools/
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.append(str(TOOLS_DIR))
+
+buffer = pytest.importorskip("pseudocode_translator.streaming.buffer")
+ReorderBuffer = buffer.ReorderBuffer
+
+
+@dataclass
+class Block:
+    """Stands in for a translated CodeBlock."""
+
+    content: str
+
+
+@dataclass
+class Result:
+    """Stands in for a chunk result."""
+
+    index: int
+    translated_blocks: list[Block] = field(default_factory=list)
+
+
+def _result(index: int, size: int = 10) -> Result:
+    return Result(index, [Block("x" * size)])
+
+
+def test_results_are_released_in_chunk_order() -> None:
+    reorder = ReorderBuffer()
+    released: list[int] = []
+    for index in [2, 0, 3, 1, 4]:
+        released.extend(r.index for r in reorder.push(index, _result(index)))
+    assert released == [0, 1, 2, 3, 4]
+
+    stats = reorder.get_stats()
+    assert stats["max_reorder_depth"] == 2
+    assert stats["reorder_depth"] == 0
+    assert stats["buffered_bytes"] == 0
+
+
+def test_results_beyond_watermark_are_spilled_and_read_back(tmp_path: Path) -> None:
+    reorder = ReorderBuffer(memory_watermark=2_000, spill_dir=str(tmp_path))
+    for index in range(5, 0, -1):
+        assert reorder.push(index, _result(index, size=1_000)) == []
+
+    stats = reorder.get_stats()
+    assert stats["spilled_chunks"] >= 3
+    assert stats["buffered_bytes"] <= 2_000
+
+    released = reorder.push(0, _result(0, size=1_000))
+    assert [r.index for r in released] == [0, 1, 2, 3, 4, 5]
+    assert all(r.translated_blocks[0].content == "x" * 1_000 for r in released)
+
+
+def test_drain_releases_remaining_results_across_gaps() -> None:
+    reorder = ReorderBuffer(memory_watermark=0)
+    reorder.push(3, _result(3))
+    reorder.push(1, _result(1))
+    assert [r.index for r in reorder.drain()] == [1, 3]
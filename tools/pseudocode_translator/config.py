@@ -14,7 +14,7 @@ import logging
 import os
 import sys
 from contextlib import suppress
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -830,6 +830,21 @@ class Config:
         return cls(**data)
 
 
+class TranslatorConfig(Config):
+    """
+    Config as TranslationManager and its components take it.
+
+    TranslatorConfig() builds the defaults; TranslatorConfig(config) copies the
+    settings of a loaded Config (e.g. from ConfigManager.load()). Keyword
+    arguments override single fields in both cases.
+    """
+
+    def __init__(self, config: Config | None = None, **overrides: Any) -> None:
+        values = {} if config is None else {f.name: getattr(config, f.name) for f in fields(config)}
+        values.update(overrides)
+        super().__init__(**values)
+
+
 class ConfigManager:
     """Simple configuration manager"""
 
@@ -1220,6 +1235,7 @@ class ConfigManager:
 # Export simplified API
 __all__ = [
     "Config",
+    "TranslatorConfig",
     "LLMConfig",
     "StreamingConfig",
     "ModelConfig",
@@ -67,9 +67,15 @@ class StructuredParsingController:
         start_time: float,
         translation_id: int,
         warnings: list[str],
+        *,
+        parse_fn: Callable[[str], Any] | None = None,
+        process_blocks_fn: Callable[[list[CodeBlock]], list[CodeBlock]] | None = None,
     ) -> Any:
         """
         Execute structured parsing flow and return TranslationResult (manager's dataclass instance).
+
+        parse_fn and process_blocks_fn override the injected parse/process callbacks for a
+        single run (used by the incremental translation mode).
         """
         logger = self._logger
         logger.debug(f"Translation #{translation_id}: Using structured parsing approach")
@@ -81,7 +87,7 @@ class StructuredParsingController:
             logger.debug("Parsing input text")
             try:
                 with self._recorder.timed_section("translate.parse"):
-                    parse_result = self._maybe_offload_parse(input_text)
+                    parse_result = (parse_fn or self._maybe_offload_parse)(input_text)
 
                 # Compatible success check
                 success_attr = getattr(parse_result, "success", None)
@@ -126,7 +132,7 @@ class StructuredParsingController:
 
             # Step 2: Process blocks
             logger.debug("Processing %d blocks", len(parse_result.blocks))
-            processed_blocks = self._process_blocks(parse_result.blocks)
+            processed_blocks = (process_blocks_fn or self._process_blocks)(parse_result.blocks)
 
             # Step 3: Handle dependencies between blocks
             try:
@@ -5,6 +5,7 @@ Handles parsing of mixed English/Python pseudocode input
 """
 
 import ast
+import keyword
 import re
 from collections.abc import Iterator
 from typing import Any
@@ -19,6 +20,9 @@ except ImportError:
 
     from models import BlockType, CodeBlock, ParseError, ParseResult
 
+# Words that may legally sit next to another name/number token on one line
+_KEYWORDS = frozenset(keyword.kwlist) | frozenset(getattr(keyword, "softkwlist", ()))
+
 
 class ParserModule:
     """Main parser class that processes mixed English/Python pseudocode"""
@@ -34,6 +38,8 @@ class ParserModule:
     _INDENT_PATTERN_RE = re.compile(r"^[ \t]*")
     _COMMENT_PATTERN_RE = re.compile(r"^\s*#.*$")
     _DOCSTRING_PATTERN_RE = re.compile(r'^\s*["\']["\']["\'].*["\']["\']["\']')
+    # Any line of a block opening a triple-quoted string
+    _DOCSTRING_RE = re.compile(r'^\s*["\']["\']["\']', re.MULTILINE)
 
     # Additional pre-compiled patterns used in hot paths
     _FUNCTION_CALL_RE = re.compile(r"\w+\s*\(.*\)")
@@ -60,12 +66,46 @@ class ParserModule:
     _PYTHON_SYNTAX_RE = re.compile(r"[(){}\[\]:]")
     _WORD_RE = re.compile(r"\b\w+\b")
 
+    # Single-pass scan for the keyword/operator/delimiter features of a line. The three
+    # alternatives match disjoint character classes (word characters vs. two separate
+    # punctuation sets), so one finditer pass reports every feature the individual
+    # _PYTHON_KEYWORDS_RE/_PYTHON_OPERATORS_RE/_PYTHON_DELIMITERS_RE searches would.
+    _PYTHON_FEATURES_RE = re.compile(
+        r"(?P<keyword>\b(?:def|class|import|from|if|elif|else|for|while|return|try|except|"
+        r"finally|with|as|lambda|yield|assert|break|continue|pass|raise|del|"
+        r"global|nonlocal|in|is|and|or|not)\b)"
+        r"|(?P<operator>[\+\-\*\/\%\=\<\>\!\&\|\^\~]+)"
+        r"|(?P<delimiter>[\(\)\[\]\{\}\,\:\;])"
+    )
+    _MATCH_CASE_RE = re.compile(r"^\s*(?:match\s+.+:|case\s+)")
+    _INCOMPLETE_PYTHON_RE = re.compile(
+        r"^\s*(?:if|elif|while|for|def|class|try|except|with)\s+.*$"
+        r"|^\s*\w+\s*\($"
+        r"|^\s*[\[\{].*$"
+    )
+
+    # Lightweight line tokenizer: strings and comments are consumed whole so that only
+    # code-level names/numbers are compared; "other" catches any remaining character.
+    _LINE_TOKEN_RE = re.compile(
+        r"(?P<string>'[^'\\\n]*(?:\\.[^'\\\n]*)*'|\"[^\"\\\n]*(?:\\.[^\"\\\n]*)*\")"
+        r"|(?P<comment>#.*)"
+        r"|(?P<name>[^\W\d]\w*)"
+        r"|(?P<number>\d[\w.]*)"
+        r"|(?P<space>\s+)"
+        r"|(?P<other>.)"
+    )
+
+    # Bound for the per-parser memo of line scores keyed by stripped line content
+    _LINE_SCORE_CACHE_SIZE = 8192
+
     def __init__(self):
         """Initialize the parser module"""
         self.errors: list[ParsingError] = []
         self.warnings: list[str] = []
         self.current_line = 1
         self.input_text = ""
+        # stripped line -> (python_score, english_score)
+        self._line_scores: dict[str, tuple[float, float]] = {}
 
     def parse(self, input_text: str) -> list[CodeBlock]:
         """
@@ -210,8 +250,14 @@ class ParserModule:
         english_score = 0
         total_lines = len(lines)
 
-        for line in lines:
-            stripped = line.strip()
+        stripped_lines = [line.strip() for line in lines]
+        # Tokenize the block once, and only if some line is not memoized yet
+        token_invalid: set[int] | None = None
+        if any(s not in self._line_scores for s in stripped_lines):
+            token_invalid = self._token_invalid_lines(stripped_lines)
+
+        for index, line in enumerate(lines):
+            stripped = stripped_lines[index]
             if not stripped:
                 continue
 
@@ -220,9 +266,10 @@ class ParserModule:
                 # Comments are considered separately
                 continue
 
-            # Calculate scores
-            line_python_score = self._calculate_python_score(stripped)
-            line_english_score = self._calculate_english_score(stripped)
+            # Calculate scores (memoized by content)
+            line_python_score, line_english_score = self._score_line(
+                stripped, token_invalid is not None and index in token_invalid
+            )
 
             if line_python_score > line_english_score:
                 python_score += 1
@@ -241,6 +288,21 @@ class ParserModule:
             return BlockType.ENGLISH
         return BlockType.MIXED
 
+    def analyze_block(self, block_text: str) -> tuple[BlockType, dict[str, Any]]:
+        """
+        Classify a single raw block and extract its metadata
+
+        This is the per-block work performed by parse(); it is exposed so that
+        incremental callers can re-analyze only the blocks that changed.
+
+        Args:
+            block_text: Raw block text (a run of non-blank lines)
+
+        Returns:
+            Tuple of (block type, metadata dictionary)
+        """
+        return self._classify_block(block_text), self._extract_metadata(block_text)
+
     def _extract_metadata(self, block: str) -> dict[str, Any]:
         """
         Extract metadata from a block
@@ -372,52 +434,114 @@ class ParserModule:
 
     def score_line_language(self, line: str) -> float:
         """Return Python-language score for the given line. Stable public API."""
-        return self._calculate_python_score(line)
+        cached = self._line_scores.get(line)
+        if cached is not None:
+            return cached[0]
+        return self._score_line(line, 0 in self._token_invalid_lines([line]))[0]
 
-    def _calculate_python_score(self, line: str) -> float:
+    def _score_line(self, line: str, token_invalid: bool = False) -> tuple[float, float]:
+        """
+        Return memoized (python_score, english_score) for a stripped line
+
+        Args:
+            line: Stripped line to score
+            token_invalid: Tokenizer already proved the line cannot parse as Python
+
+        Returns:
+            Tuple of Python and English scores
+        """
+        scores = self._line_scores.get(line)
+        if scores is None:
+            scores = (
+                self._calculate_python_score(line, token_invalid),
+                self._calculate_english_score(line),
+            )
+            if len(self._line_scores) >= self._LINE_SCORE_CACHE_SIZE:
+                self._line_scores.clear()
+            self._line_scores[line] = scores
+        return scores
+
+    def _calculate_python_score(self, line: str, token_invalid: bool = False) -> float:
         """
         Calculate how "Python-like" a line is using AST-based analysis
 
         Args:
             line: Line to analyze
+            token_invalid: Tokenizer already proved the line cannot parse as Python
 
         Returns:
             Score from 0.0 to 1.0
         """
         score = 0.0
 
-        # Check for Python keywords (higher weight)
-        if self._PYTHON_KEYWORDS_RE.search(line):
+        # Keywords (higher weight), operators and delimiters in one scan
+        features = {m.lastgroup for m in self._PYTHON_FEATURES_RE.finditer(line)}
+        if "keyword" in features:
             score += 0.3
-
-        # Check for Python operators
-        if self._PYTHON_OPERATORS_RE.search(line):
+        if "operator" in features:
             score += 0.15
-
-        # Check for Python delimiters
-        if self._PYTHON_DELIMITERS_RE.search(line):
+        if "delimiter" in features:
             score += 0.15
 
-        # Check for function/method calls
-        if self._FUNCTION_CALL_RE.search(line):
+        # Check for function/method calls (needs a delimiter, so skip the scan otherwise)
+        if "delimiter" in features and self._FUNCTION_CALL_RE.search(line):
             score += 0.1
 
-        # Check for variable assignments (including walrus)
-        if self._VARIABLE_ASSIGN_RE.search(line) or ":=" in line:
+        # Check for variable assignments (including walrus); both need an operator
+        if "operator" in features and (self._VARIABLE_ASSIGN_RE.search(line) or ":=" in line):
             score += 0.1
 
         # Check for match statement (Python 3.10+)
-        match_pattern = re.match(r"^\s*match\s+.+:", line)
-        case_pattern = re.match(r"^\s*case\s+", line)
-        if match_pattern or case_pattern:
+        if self._MATCH_CASE_RE.match(line):
             score += 0.2
 
         # Check if it's valid Python syntax (higher weight for AST validity)
-        if self._is_valid_python(line):
+        if self._is_valid_python(line, token_invalid):
             score += 0.2
 
         return min(score, 1.0)
 
+    def _token_invalid_lines(self, lines: list[str]) -> set[int]:
+        """
+        Tokenize a block's lines in one pass and return the lines that cannot parse as Python
+
+        A line is disqualified when two name/number tokens sit next to each other on it
+        and neither is a keyword (e.g. "print the result"): no statement, expression or
+        "<line>:" form accepts that. Lines with quotes the tokenizer cannot close on the
+        same line (triple-quoted or unterminated strings) are left undecided for the
+        AST check.
+
+        Args:
+            lines: Stripped lines of one block
+
+        Returns:
+            Set of 0-based line indexes known to be invalid Python
+        """
+        invalid: set[int] = set()
+        for index, line in enumerate(lines):
+            if not line or line.startswith("#") or '"""' in line or "'''" in line:
+                continue
+            prev_kind: str | None = None
+            prev_text = ""
+            for match in self._LINE_TOKEN_RE.finditer(line):
+                kind = match.lastgroup
+                if kind == "space":
+                    continue
+                if kind == "other" and match.group() in "'\"":
+                    # Unterminated string: cannot attribute the rest of the line
+                    break
+                text = match.group()
+                if (
+                    kind in ("name", "number")
+                    and prev_kind in ("name", "number")
+                    and text not in _KEYWORDS
+                    and prev_text not in _KEYWORDS
+                ):
+                    invalid.add(index)
+                    break
+                prev_kind, prev_text = kind, text
+        return invalid
+
     def _calculate_english_score(self, line: str) -> float:
         """
         Calculate how "English-like" a line is
@@ -482,12 +606,14 @@ class ParserModule:
 
         return False
 
-    def _is_valid_python(self, line: str) -> bool:
+    def _is_valid_python(self, line: str, token_invalid: bool = False) -> bool:
         """
         Check if a line is valid Python syntax using AST
 
         Args:
             line: Line to check
+            token_invalid: Tokenizer already proved every AST attempt would fail,
+                so only the incomplete-construct patterns are checked
 
         Returns:
             True if valid Python syntax
@@ -499,6 +625,9 @@ class ParserModule:
         if line.strip().startswith("#"):
             return True
 
+        if token_invalid:
+            return bool(self._INCOMPLETE_PYTHON_RE.match(line))
+
         try:
             # Try to parse as a statement
             ast.parse(line)
@@ -518,16 +647,10 @@ class ParserModule:
                 except SyntaxError:
                     pass
 
-                # Check for common incomplete patterns
-                incomplete_patterns = [
-                    r"^\s*(if|elif|while|for|def|class|try|except|with)\s+.*$",
-                    r"^\s*\w+\s*\($",  # Function call start
-                    r"^\s*[\[\{].*$",  # List/dict start
-                ]
-
-                for pattern in incomplete_patterns:
-                    if re.match(pattern, line):
-                        return True
+                # Check for common incomplete patterns (statement header,
+                # function call start, list/dict start)
+                if self._INCOMPLETE_PYTHON_RE.match(line):
+                    return True
 
         return False
 
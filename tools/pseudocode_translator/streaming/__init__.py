@@ -6,7 +6,7 @@ large files through chunk-based processing while maintaining code quality
 and respecting code boundaries.
 """
 
-from .buffer import BufferConfig, StreamBuffer
+from .buffer import BufferConfig, ReorderBuffer, StreamBuffer
 from .chunker import ChunkConfig, CodeChunker
 from .pipeline import StreamConfig, StreamingPipeline
 
@@ -17,6 +17,7 @@ __all__ = [
     "StreamConfig",
     "StreamBuffer",
     "BufferConfig",
+    "ReorderBuffer",
 ]
 
 # Version info
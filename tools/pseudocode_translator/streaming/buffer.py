@@ -9,7 +9,9 @@ import gzip
 import io
 import json
 import logging
+import pickle
 import sys
+import tempfile
 import threading
 from collections import OrderedDict
 from dataclasses import dataclass
@@ -342,6 +344,163 @@ class StreamBuffer:
             return False
 
 
+def _estimate_result_size(result: Any) -> int:
+    """Estimate the in-memory footprint of a chunk result from its block contents"""
+    size = sys.getsizeof(result)
+    for attr in ("parsed_blocks", "translated_blocks"):
+        for block in getattr(result, attr, None) or ():
+            content = getattr(block, "content", "")
+            size += len(content.encode("utf-8")) if isinstance(content, str) else 0
+    return size
+
+
+class ReorderBuffer:
+    """
+    Reorders out-of-order chunk results into chunk-index order
+
+    Results are released as soon as a contiguous prefix starting at the next
+    expected index is available. Out-of-order results are held in memory up to
+    a watermark; beyond it they are pickled to an anonymous temp file and read
+    back when their turn comes, so memory stays bounded by the watermark rather
+    than by the size of the translated output.
+
+    Use as a context manager (or call close()) so the spill file is released
+    even when the consumer stops early.
+    """
+
+    def __init__(
+        self,
+        memory_watermark: int = 8 * 1024 * 1024,
+        spill_dir: str | None = None,
+        first_index: int = 0,
+    ):
+        """
+        Initialize reorder buffer
+
+        Args:
+            memory_watermark: Max bytes of out-of-order results kept in memory
+            spill_dir: Directory for the spill file (system temp dir if None)
+            first_index: Index of the first result to release
+        """
+        self.memory_watermark = memory_watermark
+        self.spill_dir = spill_dir
+        self._next_index = first_index
+        self._pending: dict[int, tuple[Any, int]] = {}
+        self._spilled: dict[int, tuple[int, int]] = {}
+        self._spill_file: Any | None = None
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "high_water_bytes": 0,
+            "max_reorder_depth": 0,
+            "spilled_chunks": 0,
+            "spilled_bytes": 0,
+        }
+
+    def push(self, index: int, result: Any) -> list[Any]:
+        """
+        Add a result and return all results now releasable in order
+
+        Args:
+            index: Chunk index of the result
+            result: Chunk result
+
+        Returns:
+            Results in chunk order (possibly empty)
+        """
+        with self._lock:
+            if index == self._next_index:
+                ready = [result]
+                self._next_index += 1
+                ready.extend(self._release_prefix())
+                return ready
+
+            size = _estimate_result_size(result)
+            if self._memory_bytes + size > self.memory_watermark:
+                self._spill(index, result)
+            else:
+                self._pending[index] = (result, size)
+                self._memory_bytes += size
+                self._stats["high_water_bytes"] = max(
+                    self._stats["high_water_bytes"], self._memory_bytes
+                )
+
+            depth = len(self._pending) + len(self._spilled)
+            self._stats["max_reorder_depth"] = max(self._stats["max_reorder_depth"], depth)
+            return []
+
+    def drain(self) -> list[Any]:
+        """Release every remaining result in index order, skipping any gaps"""
+        with self._lock:
+            ready: list[Any] = []
+            for index in sorted(set(self._pending) | set(self._spilled)):
+                self._next_index = index
+                ready.extend(self._release_prefix())
+            self.close()
+            return ready
+
+    def _release_prefix(self) -> list[Any]:
+        ready = []
+        while True:
+            index = self._next_index
+            if index in self._pending:
+                result, size = self._pending.pop(index)
+                self._memory_bytes -= size
+            elif index in self._spilled:
+                result = self._load_spilled(index)
+            else:
+                return ready
+            ready.append(result)
+            self._next_index += 1
+
+    def _spill(self, index: int, result: Any):
+        if self._spill_file is None:
+            # Outlives this call; released by close() / the context manager
+            self._spill_file = tempfile.TemporaryFile(dir=self.spill_dir)  # noqa: SIM115
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spill_file.seek(0, io.SEEK_END)
+        offset = self._spill_file.tell()
+        self._spill_file.write(payload)
+        self._spilled[index] = (offset, len(payload))
+        self._stats["spilled_chunks"] += 1
+        self._stats["spilled_bytes"] += len(payload)
+
+    def _load_spilled(self, index: int) -> Any:
+        offset, length = self._spilled.pop(index)
+        self._spill_file.seek(offset)
+        return pickle.loads(self._spill_file.read(length))
+
+    def depth(self) -> int:
+        """Number of results waiting for an earlier index"""
+        return len(self._pending) + len(self._spilled)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get reorder statistics"""
+        with self._lock:
+            return {
+                **self._stats,
+                "buffered_bytes": self._memory_bytes,
+                "reorder_depth": self.depth(),
+            }
+
+    def close(self):
+        """Release the spill file"""
+        if self._spill_file is not None:
+            try:
+                self._spill_file.close()
+            except Exception as e:
+                logger.debug("Error closing reorder spill file: %s", e)
+            self._spill_file = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+
 class ContextBuffer:
     """Specialized buffer for maintaining translation context"""
 
@@ -20,6 +20,7 @@ from ..integration.events import EventType
 from ..models import BlockType, CodeBlock
 from ..models.base_model import TranslationResult as ModelTranslationResult
 from ..telemetry import get_recorder
+from .buffer import ReorderBuffer
 from .chunker import CodeChunk
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,9 @@ class StreamConfig:
     enable_backpressure: bool = True
     max_queue_size: int = 10
     thread_pool_size: int = 4
+    # Out-of-order parallel results kept in memory before spilling to a temp file
+    reorder_memory_watermark: int = 8 * 1024 * 1024
+    reorder_spill_dir: str | None = None
 
 
 @dataclass
@@ -84,6 +88,7 @@ class StreamingPipeline:
 
     def __init__(self, config: TranslatorConfig, stream_config: StreamConfig | None = None):
         """Initialize streaming pipeline"""
+        self._reorder: ReorderBuffer | None = None
 
     def _dispatch(self, event_type, **data):
         """Best-effort event dispatch via manager's dispatcher; never raises."""
@@ -268,6 +273,10 @@ class StreamingPipeline:
         """
         Process chunks in parallel with backpressure
 
+        Results are yielded in chunk order: completed chunks pass through a
+        ReorderBuffer that releases each contiguous prefix as soon as it is
+        available and spills out-of-order results past a memory watermark.
+
         Args:
             chunks: List of code chunks
 
@@ -280,89 +289,104 @@ class StreamingPipeline:
         futures: dict[Any, CodeChunk] = {}
         chunk_iter = iter(chunks)
 
-        # Pre-fill up to max_concurrent_chunks to cap initial in-flight work.
-        # Additional submissions are bounded by (max_concurrent_chunks + max_queue_size)
-        # which limits queued-but-not-yet-executing work, providing backpressure upstream.
-        initial = min(self.stream_config.max_concurrent_chunks, len(chunks))
-        for _ in range(initial):
-            try:
-                chunk = next(chunk_iter)
-            except StopIteration:
-                break
-            fut = self.executor.submit(self._process_single_chunk, chunk)
-            futures[fut] = chunk
-
-        # Combined window for outstanding work. When backpressure is disabled, we
-        # fall back to strict concurrency only.
-        combined_limit = (
-            self.stream_config.max_concurrent_chunks + self.stream_config.max_queue_size
-            if self.stream_config.enable_backpressure
-            else self.stream_config.max_concurrent_chunks
+        reorder = ReorderBuffer(
+            memory_watermark=self.stream_config.reorder_memory_watermark,
+            spill_dir=self.stream_config.reorder_spill_dir,
+            first_index=chunks[0].chunk_index if chunks else 0,
         )
-
-        # Submission/collection loop
-        while True:
-            # Submit as many as allowed by the combined window
-            while len(futures) < combined_limit:
+        self._reorder = reorder
+
+        # The with block releases the spill file even if the consumer stops early
+        with reorder:
+            # Pre-fill up to max_concurrent_chunks to cap initial in-flight work.
+            # Additional submissions are bounded by (max_concurrent_chunks + max_queue_size)
+            # which limits queued-but-not-yet-executing work, providing backpressure upstream.
+            initial = min(self.stream_config.max_concurrent_chunks, len(chunks))
+            for _ in range(initial):
                 try:
-                    next_chunk = next(chunk_iter)
+                    chunk = next(chunk_iter)
                 except StopIteration:
                     break
-                fut = self.executor.submit(self._process_single_chunk, next_chunk)
-                futures[fut] = next_chunk
-
-            if not futures:
-                # No outstanding work and no more chunks to submit
-                break
+                fut = self.executor.submit(self._process_single_chunk, chunk)
+                futures[fut] = chunk
+
+            # Combined window for outstanding work. When backpressure is disabled, we
+            # fall back to strict concurrency only.
+            combined_limit = (
+                self.stream_config.max_concurrent_chunks + self.stream_config.max_queue_size
+                if self.stream_config.enable_backpressure
+                else self.stream_config.max_concurrent_chunks
+            )
 
-            # Backpressure: we've reached the window or have nothing more to submit.
-            # Block until at least one future completes to free capacity.
-            done, _ = wait(futures.keys(), return_when=FIRST_COMPLETED)
+            # Submission/collection loop
+            while True:
+                # Submit as many as allowed by the combined window
+                while len(futures) < combined_limit:
+                    try:
+                        next_chunk = next(chunk_iter)
+                    except StopIteration:
+                        break
+                    fut = self.executor.submit(self._process_single_chunk, next_chunk)
+                    futures[fut] = next_chunk
+
+                if not futures:
+                    # No outstanding work and no more chunks to submit
+                    break
 
-            for fut in list(done):
-                chunk = futures.pop(fut)
-                try:
-                    result = fut.result(timeout=self.stream_config.chunk_timeout)
+                # Backpressure: we've reached the window or have nothing more to submit.
+                # Block until at least one future completes to free capacity.
+                done, _ = wait(futures.keys(), return_when=FIRST_COMPLETED)
 
+                for fut in list(done):
+                    chunk = futures.pop(fut)
                     try:
-                        recorder = get_recorder()
-                        recorder.record_event(
-                            "stream.chunk",
-                            getattr(result, "processing_time", 0.0) * 1000.0,
-                            extra={
-                                "chunk_index": chunk.chunk_index,
-                                "size": chunk.size,
-                            },
+                        result = fut.result(timeout=self.stream_config.chunk_timeout)
+
+                        try:
+                            recorder = get_recorder()
+                            recorder.record_event(
+                                "stream.chunk",
+                                getattr(result, "processing_time", 0.0) * 1000.0,
+                                extra={
+                                    "chunk_index": chunk.chunk_index,
+                                    "size": chunk.size,
+                                },
+                            )
+                        except Exception:
+                            pass
+
+                        # Update progress
+                        self.progress.processed_chunks += 1
+                        self.progress.bytes_processed += chunk.size
+
+                        if result.error:
+                            self.progress.errors.append(result.error)
+                        self.progress.warnings.extend(result.warnings)
+
+                        # Emit per-chunk event
+                        self._dispatch(
+                            EventType.STREAM_CHUNK_PROCESSED,
+                            index=chunk.chunk_index,
+                            success=bool(result.success),
+                            duration_ms=int(getattr(result, "processing_time", 0.0) * 1000.0),
                         )
-                    except Exception:
-                        pass
-
-                    # Update progress
-                    self.progress.processed_chunks += 1
-                    self.progress.bytes_processed += chunk.size
-
-                    if result.error:
-                        self.progress.errors.append(result.error)
-                    self.progress.warnings.extend(result.warnings)
-
-                    # Emit per-chunk event
-                    self._dispatch(
-                        EventType.STREAM_CHUNK_PROCESSED,
-                        index=chunk.chunk_index,
-                        success=bool(result.success),
-                        duration_ms=int(getattr(result, "processing_time", 0.0) * 1000.0),
-                    )
 
-                    yield result
-                except Exception as e:
-                    logger.error("Error processing chunk %s: %s", chunk.chunk_index, e)
-                    # Emit per-chunk failure event
-                    self._dispatch(
-                        EventType.STREAM_CHUNK_PROCESSED,
-                        index=chunk.chunk_index,
-                        success=False,
-                    )
-                    yield ChunkResult(chunk_index=chunk.chunk_index, success=False, error=str(e))
+                    except Exception as e:
+                        logger.error("Error processing chunk %s: %s", chunk.chunk_index, e)
+                        # Emit per-chunk failure event
+                        self._dispatch(
+                            EventType.STREAM_CHUNK_PROCESSED,
+                            index=chunk.chunk_index,
+                            success=False,
+                        )
+                        result = ChunkResult(
+                            chunk_index=chunk.chunk_index, success=False, error=str(e)
+                        )
+
+                    yield from reorder.push(chunk.chunk_index, result)
+
+            # Only reached with gaps (e.g. cancelled mid-stream); release what is left in order
+            yield from reorder.drain()
 
     def _process_single_chunk(self, chunk: CodeChunk) -> ChunkResult:
         """
@@ -603,4 +627,17 @@ class StreamingPipeline:
             # No internal chunk_queue; queued work is bounded via submission window.
             # Expose 0 to preserve key without referencing removed attribute.
             "queue_size": 0,
+            **self._get_reorder_usage(),
+        }
+
+    def _get_reorder_usage(self) -> dict[str, int]:
+        """Reorder buffer statistics from the most recent parallel run (zeros if none)"""
+        stats = self._reorder.get_stats() if self._reorder is not None else {}
+        return {
+            "reorder_buffered_bytes": stats.get("buffered_bytes", 0),
+            "reorder_high_water_bytes": stats.get("high_water_bytes", 0),
+            "reorder_depth": stats.get("reorder_depth", 0),
+            "reorder_max_depth": stats.get("max_reorder_depth", 0),
+            "reorder_spilled_chunks": stats.get("spilled_chunks", 0),
+            "reorder_spilled_bytes": stats.get("spilled_bytes", 0),
         }
@@ -123,6 +123,17 @@ class TelemetryRecorder:
         # Tiny internal sanity check (best-effort, never raises)
         self._self_check_basic()
 
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """Record the sampling rate applied by get_recorder() (reported in snapshots)."""
+        with self._lock:
+            self._sample_rate = max(1, int(sample_rate))
+
+    def increment_seq(self) -> int:
+        """Advance and return the call sequence used for deterministic sampling."""
+        with self._lock:
+            self._seq += 1
+            return self._seq
+
     @contextmanager
     def timed_section(self, name: str, extra: dict | None = None):
         start = time.perf_counter()
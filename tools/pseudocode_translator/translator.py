@@ -45,6 +45,7 @@ from .parser import ParserModule
 from .services.dependency_gateway import DependencyAnalysisGateway
 from .services.validation_service import ValidationService
 from .telemetry import get_recorder
+from .translator_support.incremental import IncrementalTranslationState
 from .validator import ValidationResult, Validator
 
 if TYPE_CHECKING:
@@ -265,6 +266,9 @@ class TranslationManager(ShutdownMixin):
         # Thread-local flow context for helper orchestration (internal-only)
         self._thread = threading.local()
 
+        # Previous-document state for incremental re-translation (editor use)
+        self._incremental = IncrementalTranslationState()
+
         # Events dispatcher (sync to keep unit tests deterministic)
         self._events = EventDispatcher(async_mode=False)
 
@@ -631,13 +635,31 @@ class TranslationManager(ShutdownMixin):
         return result
 
     def translate_pseudocode(
-        self, input_text: str, target_language: OutputLanguage | None = None
+        self,
+        input_text: str,
+        target_language: OutputLanguage | None = None,
+        *,
+        incremental: bool = False,
     ) -> TranslationResult:
-        """Main translation method that converts pseudocode to code"""
+        """
+        Main translation method that converts pseudocode to code
+
+        Args:
+            input_text: Mixed English/Python pseudocode
+            target_language: Optional output language override
+            incremental: When True, translate as an edit of the previously translated
+                document: only the changed region is re-parsed and only blocks whose
+                content or context changed are re-translated (structured flow only).
+        """
         start_time, translation_id, errors, warnings = self._initialize_translation_context(
             target_language
         )
 
+        if incremental:
+            self._emit_translation_started(translation_id, "incremental")
+            result = self._translate_incrementally(input_text, start_time, translation_id, warnings)
+            return self._finalize_structured_result(result, translation_id)
+
         # Emit started (best-effort)
         self._emit_translation_started(translation_id, "llm_first")
 
@@ -651,6 +673,68 @@ class TranslationManager(ShutdownMixin):
             input_text, payload, warnings, errors, start_time, translation_id
         )
 
+    def _translate_incrementally(
+        self,
+        input_text: str,
+        start_time: float,
+        translation_id: int,
+        existing_warnings: list[str],
+    ) -> TranslationResult:
+        """Run the structured flow against the incremental parse and translation caches."""
+        state = self._incremental
+        with timed_section("translate.incremental"):
+            result = self._structured.run(
+                input_text,
+                start_time,
+                translation_id,
+                existing_warnings,
+                parse_fn=lambda text: state.parse(self.parser, text),
+                process_blocks_fn=self._process_blocks_incremental,
+            )
+        state.prune()
+
+        meta = _safe_meta(result.metadata)
+        meta["incremental"] = state.stats.to_dict()
+        meta["cache_hits"] = state.stats.blocks_reused
+        if meta.get("approach") == "structured_parsing":
+            meta["approach"] = "incremental"
+        result.metadata = meta
+        return result
+
+    def _process_blocks_incremental(self, blocks: list[CodeBlock]) -> list[CodeBlock]:
+        """
+        Incremental variant of _process_blocks: splice in cached translations for blocks
+        whose content and context inputs are unchanged, translate the rest.
+        """
+        state = self._incremental
+        processed_blocks: list[CodeBlock] = []
+
+        for i, block in enumerate(blocks):
+            if block.type not in (BlockType.ENGLISH, BlockType.MIXED):
+                processed_blocks.append(self._process_passthrough_block(block))
+                continue
+
+            key = state.translation_key(
+                block, self._build_context(blocks, i), self._target_language
+            )
+            cached = state.get_translation(key, block)
+            if cached is not None:
+                processed_blocks.extend(cached)
+                continue
+
+            if block.type == BlockType.ENGLISH:
+                outputs = [self._process_english_block(block, i, blocks)]
+            else:
+                outputs = self._process_mixed_block(block, i, blocks)
+            state.store_translation(key, block, outputs)
+            processed_blocks.extend(outputs)
+
+        return processed_blocks
+
+    def reset_incremental_state(self) -> None:
+        """Forget the previous document used by incremental translation."""
+        self._incremental.reset()
+
     def _translate_with_llm_first(
         self, input_text: str, start_time: float, translation_id: int
     ) -> TranslationResult:
@@ -0,0 +1,298 @@
+"""
+Incremental re-translation support for edited pseudocode documents.
+
+IncrementalTranslationState remembers the previously translated document as a list
+of raw block spans with per-block content hashes, the parser's analysis of each
+block, and the translated output of each ENGLISH/MIXED block. On the next edit:
+
+- Only the changed line region (common prefix/suffix diff, widened to the
+  surrounding blank-line boundaries) is re-split and re-classified.
+- Blocks whose content and translation context are unchanged reuse their previous
+  translation, shifted to their new line numbers, before assembly.
+
+Behavior-preservation constraints:
+- No imports from translator.py (avoids cycles).
+- Parse output (block boundaries, line numbers, metadata, context, warnings) matches
+  a full ParserModule.parse() of the same text.
+- Failed translations are never cached; they are retried on the next pass.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from ..models import BlockType, CodeBlock, ParseResult
+
+# Lines of surrounding context attached to each block (ParserModule._get_context default)
+_CONTEXT_LINES = 2
+
+
+def _content_hash(*parts: str) -> str:
+    """Return a stable SHA-256 digest over the given string parts."""
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+@dataclass
+class _BlockAnalysis:
+    """Parser output for one raw block, keyed by its content hash."""
+
+    block_type: BlockType
+    metadata: dict[str, Any]
+    warnings: list[str]
+
+
+@dataclass
+class _CachedTranslation:
+    """Translated output blocks for one source block."""
+
+    source_start: int
+    blocks: list[CodeBlock]
+
+
+@dataclass
+class IncrementalStats:
+    """Counters describing the work done by the most recent incremental pass."""
+
+    blocks_total: int = 0
+    blocks_reparsed: int = 0
+    blocks_reused: int = 0
+    blocks_translated: int = 0
+    region: tuple[int, int] = (0, 0)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "blocks_total": self.blocks_total,
+            "blocks_reparsed": self.blocks_reparsed,
+            "blocks_reused": self.blocks_reused,
+            "blocks_translated": self.blocks_translated,
+            "region": list(self.region),
+        }
+
+
+@dataclass
+class IncrementalTranslationState:
+    """
+    Previous-document state used to bound re-parsing and re-translation to edits.
+
+    The state tracks a single document; translating an unrelated document simply
+    degrades to a full parse and full translation. Methods are thread-safe.
+    """
+
+    _lines: list[str] = field(default_factory=list)
+    # Half-open [start, end) line index spans of raw blocks in _lines
+    _spans: list[tuple[int, int]] = field(default_factory=list)
+    _hashes: list[str] = field(default_factory=list)
+    _analysis: dict[str, _BlockAnalysis] = field(default_factory=dict)
+    _translations: dict[str, _CachedTranslation] = field(default_factory=dict)
+    _used_keys: set[str] = field(default_factory=set)
+    stats: IncrementalStats = field(default_factory=IncrementalStats)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    def reset(self) -> None:
+        """Forget the previous document and all cached translations."""
+        with self._lock:
+            self._lines = []
+            self._spans = []
+            self._hashes = []
+            self._analysis = {}
+            self._translations = {}
+            self._used_keys = set()
+            self.stats = IncrementalStats()
+
+    # ------------------------------------------------------------------ parsing
+
+    def parse(self, parser: Any, input_text: str) -> ParseResult:
+        """
+        Parse input_text, re-analyzing only the region that differs from the
+        previous document.
+
+        Args:
+            parser: ParserModule providing analyze_block()
+            input_text: Full text of the edited document
+
+        Returns:
+            ParseResult equivalent to parser.get_parse_result(input_text)
+        """
+        with self._lock:
+            if not input_text or not input_text.strip():
+                self._lines, self._spans, self._hashes = [], [], []
+                self._analysis = {}
+                self.stats = IncrementalStats()
+                return ParseResult(blocks=[], errors=[], warnings=[])
+
+            new_lines = input_text.splitlines()
+            spans, region = self._splice_spans(new_lines)
+
+            # Re-analyze blocks inside the changed region; reuse everything else by hash
+            r_start, r_end = region
+            hashes: list[str] = []
+            analysis: dict[str, _BlockAnalysis] = {}
+            reparsed = 0
+            old_index = dict(zip(self._spans, self._hashes, strict=False))
+            delta = len(new_lines) - len(self._lines)
+            for start, end in spans:
+                if start >= r_end:
+                    # Unchanged suffix block: hash carried over from its old position
+                    digest = old_index.get((start - delta, end - delta))
+                elif end <= r_start:
+                    digest = old_index.get((start, end))
+                else:
+                    digest = None
+                if digest is None:
+                    digest = _content_hash("\n".join(new_lines[start:end]))
+                entry = analysis.get(digest) or self._analysis.get(digest)
+                if entry is None:
+                    entry = self._analyze(parser, "\n".join(new_lines[start:end]))
+                    reparsed += 1
+                analysis[digest] = entry
+                hashes.append(digest)
+
+            self._lines = new_lines
+            self._spans = spans
+            self._hashes = hashes
+            self._analysis = analysis
+            self._used_keys = set()
+            self.stats = IncrementalStats(
+                blocks_total=len(spans), blocks_reparsed=reparsed, region=region
+            )
+            return self._build_result()
+
+    def _splice_spans(self, new_lines: list[str]) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+        """
+        Compute block spans for new_lines by re-splitting only the edited region.
+
+        Returns:
+            (spans, (region_start, region_end)) with the region in new-line indices
+        """
+        old_lines = self._lines
+        n_old, n_new = len(old_lines), len(new_lines)
+
+        prefix = 0
+        limit = min(n_old, n_new)
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        limit -= prefix
+        while suffix < limit and old_lines[n_old - 1 - suffix] == new_lines[n_new - 1 - suffix]:
+            suffix += 1
+
+        old_lo, old_hi = prefix, n_old - suffix
+        new_hi = n_new - suffix
+        delta = n_new - n_old
+
+        # Blocks touching (or directly adjacent to) the edit must be re-split: removing a
+        # blank line can merge two blocks and inserting one can split a block.
+        before = [s for s in self._spans if s[1] < old_lo]
+        after = [(a + delta, b + delta) for a, b in self._spans if a > old_hi]
+        affected = [s for s in self._spans if s[1] >= old_lo and s[0] <= old_hi]
+
+        region_start = min([old_lo] + [a for a, _ in affected])
+        region_end = max([new_hi] + [b + delta for _, b in affected])
+        region_end = min(region_end, n_new)
+
+        region_spans: list[tuple[int, int]] = []
+        run_start: int | None = None
+        for idx in range(region_start, region_end):
+            if new_lines[idx].strip():
+                if run_start is None:
+                    run_start = idx
+            elif run_start is not None:
+                region_spans.append((run_start, idx))
+                run_start = None
+        if run_start is not None:
+            region_spans.append((run_start, region_end))
+
+        return before + region_spans + after, (region_start, region_end)
+
+    def _analyze(self, parser: Any, block_text: str) -> _BlockAnalysis:
+        """Run the parser's per-block analysis, capturing any warnings it emits."""
+        warnings_before = len(parser.warnings)
+        block_type, metadata = parser.analyze_block(block_text)
+        new_warnings = list(parser.warnings[warnings_before:])
+        del parser.warnings[warnings_before:]
+        return _BlockAnalysis(block_type, metadata, new_warnings)
+
+    def _build_result(self) -> ParseResult:
+        """Materialize CodeBlocks for the current spans (mirrors ParserModule.parse)."""
+        lines = self._lines
+        blocks: list[CodeBlock] = []
+        warnings: list[str] = []
+        current_line = 1
+        for (start, end), digest in zip(self._spans, self._hashes, strict=False):
+            entry = self._analysis[digest]
+            end_line = current_line + (end - start) - 1
+            ctx_start = max(0, current_line - 1 - _CONTEXT_LINES)
+            ctx_end = min(len(lines), end_line + _CONTEXT_LINES)
+            blocks.append(
+                CodeBlock(
+                    type=entry.block_type,
+                    content="\n".join(lines[start:end]),
+                    line_numbers=(current_line, end_line),
+                    metadata=dict(entry.metadata),
+                    context="\n".join(lines[ctx_start:ctx_end]),
+                )
+            )
+            warnings.extend(entry.warnings)
+            current_line = end_line + 1
+        return ParseResult(blocks=blocks, errors=[], warnings=warnings)
+
+    # -------------------------------------------------------------- translation
+
+    @staticmethod
+    def translation_key(block: CodeBlock, context: dict[str, Any], target_language: Any) -> str:
+        """
+        Key a block translation by everything that feeds the model: block type and
+        content, the neighbour context built for it, and the target language.
+        """
+        language = getattr(target_language, "value", target_language)
+        context_parts = [f"{k}={context[k]}" for k in sorted(context)]
+        return _content_hash(block.type.value, block.content, str(language), *context_parts)
+
+    def get_translation(self, key: str, block: CodeBlock) -> list[CodeBlock] | None:
+        """
+        Return copies of the cached translation for key, re-based onto block's lines.
+
+        Returns:
+            List of output CodeBlocks, or None on a cache miss
+        """
+        with self._lock:
+            cached = self._translations.get(key)
+            if cached is None:
+                return None
+            self._used_keys.add(key)
+            self.stats.blocks_reused += 1
+            shift = block.line_numbers[0] - cached.source_start
+            return [
+                replace(
+                    out,
+                    line_numbers=(out.line_numbers[0] + shift, out.line_numbers[1] + shift),
+                    metadata=dict(out.metadata),
+                )
+                for out in cached.blocks
+            ]
+
+    def store_translation(self, key: str, block: CodeBlock, outputs: list[CodeBlock]) -> None:
+        """Cache the translated outputs for block unless any of them failed."""
+        with self._lock:
+            self.stats.blocks_translated += 1
+            if any(out.metadata.get("translation_failed") for out in outputs):
+                return
+            self._used_keys.add(key)
+            self._translations[key] = _CachedTranslation(
+                source_start=block.line_numbers[0],
+                blocks=[replace(out, metadata=dict(out.metadata)) for out in outputs],
+            )
+
+    def prune(self) -> None:
+        """Drop translations not used by the current document to bound memory."""
+        with self._lock:
+            self._translations = {
+                k: v for k, v in self._translations.items() if k in self._used_keys
+            }
@@ -2,19 +2,155 @@
 """
 Artifact Encryption Utilities
 Provides field-level encryption/decryption for sensitive artifact data.
-Uses AES-256 encryption with PBKDF2 key derivation.
+Uses AES-256 encryption with a two-level key hierarchy:
+
+- A master key (key-encryption key) is derived from the password with PBKDF2
+  once per process and master salt, and kept in memory until every instance
+  that used it has zeroized its keys.
+- Every encrypted artifact gets its own random data key, stored only in wrapped
+  form (AES key wrap, RFC 3394, under the master key) next to the ciphertext.
+
+Unwrapped data keys are held in a bounded LRU cache that can be zeroized.
+Records written with the previous scheme (PBKDF2 salt per value) still decrypt.
+
+Large artifact files use a framed, streaming AES-256-GCM format instead of
+JSON-wrapped AES-CBC:
+
+    header: magic "DAES" | format version (1 byte) | chunk size (uint32)
+            | master salt (32 bytes) | wrapped data key (40 bytes)
+    frames: nonce (12 bytes) | ciphertext (chunk size, shorter for the last frame) | tag (16 bytes)
+
+Each frame is authenticated with the header, its index and a final-frame flag
+as associated data, so reordered, dropped or truncated frames fail to decrypt.
 """
 
 import base64
+import hashlib
+import hmac
+import itertools
 import json
 import os
 import secrets
-from typing import Any
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any, BinaryIO
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.keywrap import InvalidUnwrap, aes_key_unwrap, aes_key_wrap
+
+
+def _zeroize(buffer: bytearray) -> None:
+    """Overwrite key material in place (best effort; immutable copies may remain)"""
+    buffer[:] = bytes(len(buffer))
+
+
+class DataKeyCache:
+    """Bounded LRU cache of unwrapped data keys, keyed by their wrapped form"""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._keys: OrderedDict[bytes, bytearray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, wrapped_key: bytes) -> bytes | None:
+        with self._lock:
+            key = self._keys.get(wrapped_key)
+            if key is None:
+                return None
+            self._keys.move_to_end(wrapped_key)
+            return bytes(key)
+
+    def put(self, wrapped_key: bytes, key: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if wrapped_key in self._keys:
+                self._keys.move_to_end(wrapped_key)
+                return
+            self._keys[wrapped_key] = bytearray(key)
+            while len(self._keys) > self.max_entries:
+                _wrapped, evicted = self._keys.popitem(last=False)
+                _zeroize(evicted)
+
+    def clear(self) -> None:
+        """Zeroize and drop every cached key"""
+        with self._lock:
+            for key in self._keys.values():
+                _zeroize(key)
+            self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _MasterKeyRing:
+    """Process-wide master keys, derived once per (password, salt)
+
+    Each entry tracks the encryption instances that have used it, so one
+    instance zeroizing its keys leaves keys other instances still hold alone.
+    """
+
+    def __init__(self) -> None:
+        self._keys: dict[tuple[bytes, bytes], bytearray] = {}
+        self._holders: dict[tuple[bytes, bytes], set[int]] = {}
+        # Salt used for new data keys, per password, for the life of the process
+        self._active_salts: dict[bytes, bytes] = {}
+        # Passwords are identified by an HMAC under a per-process secret, so the
+        # ring never holds a fast, password-equivalent digest
+        self._id_key = secrets.token_bytes(32)
+        self._next_holder = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _password_id(self, password: str) -> bytes:
+        return hmac.new(self._id_key, password.encode("utf-8"), hashlib.sha256).digest()
+
+    def new_holder(self) -> int:
+        """Return a token identifying one user of the ring"""
+        with self._lock:
+            return next(self._next_holder)
+
+    def get(
+        self, encryption: "ArtifactEncryption", holder: int, password: str, salt: bytes
+    ) -> bytes:
+        cache_key = (self._password_id(password), salt)
+        with self._lock:
+            key = self._keys.get(cache_key)
+            if key is None:
+                key = bytearray(encryption.derive_key(password, salt))
+                self._keys[cache_key] = key
+            self._holders.setdefault(cache_key, set()).add(holder)
+            return bytes(key)
+
+    def active_salt(self, encryption: "ArtifactEncryption", password: str) -> bytes:
+        password_id = self._password_id(password)
+        with self._lock:
+            salt = self._active_salts.get(password_id)
+            if salt is None:
+                salt = encryption.generate_salt()
+                self._active_salts[password_id] = salt
+            return salt
+
+    def release(self, holder: int) -> None:
+        """Drop holder from every entry, zeroizing keys no other holder uses"""
+        with self._lock:
+            for cache_key, holders in list(self._holders.items()):
+                holders.discard(holder)
+                if not holders:
+                    del self._holders[cache_key]
+                    _zeroize(self._keys.pop(cache_key))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+_MASTER_KEYS = _MasterKeyRing()
 
 
 class ArtifactEncryption:
@@ -25,15 +161,34 @@ class ArtifactEncryption:
     IV_LENGTH = 16  # 128 bits for AES block size
     SALT_LENGTH = 32  # 256 bits for salt
     ITERATIONS = 100000  # PBKDF2 iterations
-
-    def __init__(self, password: str | None = None):
+    WRAPPED_KEY_LENGTH = 40  # AES key wrap output for a 256-bit key
+    DATA_KEY_CACHE_SIZE = 4096
+
+    # Streaming file format parameters
+    STREAM_MAGIC = b"DAES"
+    STREAM_VERSION = 2
+    STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MiB plaintext per frame
+    STREAM_NONCE_LENGTH = 12  # 96-bit GCM nonce
+    STREAM_TAG_LENGTH = 16  # 128-bit GCM tag
+    _STREAM_PREFIX = struct.Struct(">4sBI")
+    # Version 1 carried a PBKDF2 salt for a per-file key
+    _STREAM_KEYS: dict[int, struct.Struct] = {1: struct.Struct(">32s"), 2: struct.Struct(">32s40s")}
+    _STREAM_FRAME_AAD = struct.Struct(">QB")
+
+    def __init__(self, password: str | None = None, key_cache_size: int | None = None):
         """
         Initialize encryption handler
 
         Args:
             password: User password for key derivation (optional)
+            key_cache_size: Maximum unwrapped data keys kept in memory
+                (defaults to DATA_KEY_CACHE_SIZE; 0 disables caching)
         """
         self.password = password
+        self.data_keys = DataKeyCache(
+            self.DATA_KEY_CACHE_SIZE if key_cache_size is None else key_cache_size
+        )
+        self._ring_holder = _MASTER_KEYS.new_holder()
 
     def derive_key(self, password: str, salt: bytes) -> bytes:
         """
@@ -64,18 +219,93 @@ class ArtifactEncryption:
         # CBC requires unpredictable IVs; 16 bytes = 128-bit block size for AES
         return os.urandom(self.IV_LENGTH)
 
-    def encrypt_data(self, data: str | bytes, key: bytes | None = None) -> dict[str, str]:
+    def _require_password(self) -> str:
+        if not self.password:
+            raise ValueError("No password provided for key derivation")
+        return self.password
+
+    def new_data_key(self) -> tuple[bytes, bytes, bytes]:
+        """
+        Generate a random data key wrapped under the process master key
+
+        Returns:
+            Tuple of (data key, wrapped data key, master salt)
+        """
+        password = self._require_password()
+        master_salt = _MASTER_KEYS.active_salt(self, password)
+        master_key = _MASTER_KEYS.get(self, self._ring_holder, password, master_salt)
+        data_key = secrets.token_bytes(self.KEY_LENGTH)
+        wrapped_key = aes_key_wrap(master_key, data_key, backend=default_backend())
+        self.data_keys.put(wrapped_key, data_key)
+        return data_key, wrapped_key, master_salt
+
+    def unwrap_data_key(self, wrapped_key: bytes, master_salt: bytes) -> bytes:
+        """
+        Recover a data key, using the in-memory cache when possible
+
+        Raises:
+            ValueError: If the key was not wrapped under this password
+        """
+        data_key = self.data_keys.get(wrapped_key)
+        if data_key is not None:
+            return data_key
+
+        master_key = _MASTER_KEYS.get(
+            self, self._ring_holder, self._require_password(), master_salt
+        )
+        try:
+            data_key = aes_key_unwrap(master_key, wrapped_key, backend=default_backend())
+        except InvalidUnwrap as e:
+            raise ValueError("Data key cannot be unwrapped with this password") from e
+        self.data_keys.put(wrapped_key, data_key)
+        return data_key
+
+    def zeroize_keys(self) -> None:
+        """Wipe cached data keys, and master keys no other instance is using, from memory"""
+        self.data_keys.clear()
+        _MASTER_KEYS.release(self._ring_holder)
+
+    def _encrypt_with_key(self, data_bytes: bytes, key: bytes) -> tuple[bytes, bytes]:
+        """AES-256-CBC encrypt with PKCS7 padding; returns (ciphertext, iv)"""
+        iv = self.generate_iv()
+        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+        encryptor = cipher.encryptor()
+
+        # PKCS7 padding using cryptography padder (AES block size is 128 bits)
+        padder = padding.PKCS7(128).padder()
+        padded_data = padder.update(data_bytes) + padder.finalize()
+
+        return encryptor.update(padded_data) + encryptor.finalize(), iv
+
+    @staticmethod
+    def _decrypt_with_key(encrypted: bytes, iv: bytes, key: bytes) -> bytes:
+        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
+        decryptor = cipher.decryptor()
+        decrypted_padded = decryptor.update(encrypted) + decryptor.finalize()
+
+        # Remove PKCS7 padding using cryptography unpadder
+        unpadder = padding.PKCS7(128).unpadder()
+        return unpadder.update(decrypted_padded) + unpadder.finalize()
+
+    def encrypt_data(
+        self,
+        data: str | bytes,
+        key: bytes | None = None,
+        data_key: tuple[bytes, bytes, bytes] | None = None,
+    ) -> dict[str, str]:
         """
         Encrypt data using AES-256-CBC
 
         Args:
             data: Data to encrypt (string or bytes)
-            key: Optional encryption key (will derive from password if not
-                provided)
+            key: Optional raw encryption key; the result then carries no key
+                material and the same key must be passed to decrypt_data
+            data_key: Optional (data key, wrapped key, master salt) from
+                new_data_key(), to share one data key across several values
 
         Returns:
-            Dictionary containing encrypted data, salt, and IV (all base64
-            encoded)
+            Dictionary with base64 encoded data and IV, plus the wrapped data key
+            and master salt when no raw key was given
         """
         # Ensure input is bytes; avoid implicit bytes() on arbitrary objects
         if isinstance(data, str):
@@ -85,30 +315,23 @@ class ArtifactEncryption:
         else:
             raise TypeError("data must be of type str or bytes")
 
-        # Generate salt and derive key if not provided
-        salt = self.generate_salt()
-        if key is None:
-            if not self.password:
-                raise ValueError("No password provided for key derivation")
-            key = self.derive_key(self.password, salt)
-
-        # Generate IV and create cipher (AES-CBC)
-        iv = self.generate_iv()
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
-
-        # PKCS7 padding using cryptography padder (AES block size is 128 bits)
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(data_bytes) + padder.finalize()
+        if key is not None:
+            encrypted, iv = self._encrypt_with_key(data_bytes, key)
+            return {
+                "data": base64.b64encode(encrypted).decode("utf-8"),
+                "salt": base64.b64encode(self.generate_salt()).decode("utf-8"),
+                "iv": base64.b64encode(iv).decode("utf-8"),
+            }
 
-        # Encrypt
-        encrypted = encryptor.update(padded_data) + encryptor.finalize()
+        raw_key, wrapped_key, master_salt = data_key or self.new_data_key()
+        encrypted, iv = self._encrypt_with_key(data_bytes, raw_key)
 
         # Return base64 encoded values
         return {
             "data": base64.b64encode(encrypted).decode("utf-8"),
-            "salt": base64.b64encode(salt).decode("utf-8"),
             "iv": base64.b64encode(iv).decode("utf-8"),
+            "wrapped_key": base64.b64encode(wrapped_key).decode("utf-8"),
+            "key_salt": base64.b64encode(master_salt).decode("utf-8"),
         }
 
     def decrypt_data(self, encrypted_data: dict[str, str], key: bytes | None = None) -> bytes:
@@ -116,9 +339,10 @@ class ArtifactEncryption:
         Decrypt data encrypted with encrypt_data
 
         Args:
-            encrypted_data: Dictionary with encrypted data, salt, and IV
-            key: Optional encryption key (will derive from password if not
-                provided)
+            encrypted_data: Dictionary with encrypted data, IV and either a wrapped
+                data key or (legacy format) a PBKDF2 salt
+            key: Optional encryption key (will be recovered from the password if
+                not provided)
 
         Returns:
             Decrypted data as bytes
@@ -129,22 +353,139 @@ class ArtifactEncryption:
 
         # Decode base64 values
         encrypted = base64.b64decode(encrypted_data["data"])
-        salt = base64.b64decode(encrypted_data["salt"])
         iv = base64.b64decode(encrypted_data["iv"])
 
-        # Derive key if not provided
         if key is None:
-            # type: ignore  # Already checked above
-            key = self.derive_key(self.password, salt)
+            if "wrapped_key" in encrypted_data:
+                key = self.unwrap_data_key(
+                    base64.b64decode(encrypted_data["wrapped_key"]),
+                    base64.b64decode(encrypted_data["key_salt"]),
+                )
+            else:
+                # Legacy records derived a key from the password for every value
+                salt = base64.b64decode(encrypted_data["salt"])
+                key = self.derive_key(self._require_password(), salt)
 
-        # Create cipher and decrypt
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
-        decryptor = cipher.decryptor()
-        decrypted_padded = decryptor.update(encrypted) + decryptor.finalize()
+        return self._decrypt_with_key(encrypted, iv, key)
 
-        # Remove PKCS7 padding using cryptography unpadder
-        unpadder = padding.PKCS7(128).unpadder()
-        return unpadder.update(decrypted_padded) + unpadder.finalize()
+    @classmethod
+    def is_stream_format(cls, prefix: bytes) -> bool:
+        """Check whether file content starts with the streaming format header"""
+        return prefix[: len(cls.STREAM_MAGIC)] == cls.STREAM_MAGIC
+
+    @staticmethod
+    def _read_full(source: BinaryIO, size: int) -> bytes:
+        """Read exactly size bytes unless the source is exhausted first"""
+        data = source.read(size)
+        if len(data) in (0, size):
+            return data
+        parts = [data]
+        remaining = size - len(data)
+        while remaining:
+            chunk = source.read(remaining)
+            if not chunk:
+                break
+            parts.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(parts)
+
+    def encrypt_stream(
+        self, source: BinaryIO, destination: BinaryIO, chunk_size: int | None = None
+    ) -> int:
+        """
+        Encrypt a binary stream into the framed AES-256-GCM file format
+
+        Memory use is bounded by the chunk size regardless of the stream length.
+
+        Args:
+            source: Readable plaintext stream
+            destination: Writable stream receiving header and frames
+            chunk_size: Plaintext bytes per frame (defaults to STREAM_CHUNK_SIZE)
+
+        Returns:
+            Number of bytes written to destination
+        """
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        data_key, wrapped_key, master_salt = self.new_data_key()
+        header = self._STREAM_PREFIX.pack(
+            self.STREAM_MAGIC, self.STREAM_VERSION, chunk_size
+        ) + self._STREAM_KEYS[self.STREAM_VERSION].pack(master_salt, wrapped_key)
+        aead = AESGCM(data_key)
+
+        destination.write(header)
+        written = len(header)
+        index = 0
+        chunk = self._read_full(source, chunk_size)
+        while True:
+            # Look one chunk ahead so the last frame carries the final flag
+            next_chunk = self._read_full(source, chunk_size) if len(chunk) == chunk_size else b""
+            final = not next_chunk
+            nonce = os.urandom(self.STREAM_NONCE_LENGTH)
+            aad = header + self._STREAM_FRAME_AAD.pack(index, final)
+            frame = aead.encrypt(nonce, chunk, aad)
+            destination.write(nonce)
+            destination.write(frame)
+            written += len(nonce) + len(frame)
+            if final:
+                return written
+            chunk = next_chunk
+            index += 1
+
+    def _read_stream_header(self, source: BinaryIO) -> tuple[bytes, int, bytes]:
+        """Parse the stream header; returns (raw header, chunk size, data key)"""
+        prefix = self._read_full(source, self._STREAM_PREFIX.size)
+        if len(prefix) != self._STREAM_PREFIX.size or not self.is_stream_format(prefix):
+            raise ValueError("Not an encrypted artifact stream")
+        _magic, version, chunk_size = self._STREAM_PREFIX.unpack(prefix)
+        key_struct = self._STREAM_KEYS.get(version)
+        if key_struct is None:
+            raise ValueError(f"Unsupported encrypted stream version: {version}")
+
+        key_fields = self._read_full(source, key_struct.size)
+        if len(key_fields) != key_struct.size:
+            raise ValueError("Encrypted artifact stream is truncated")
+        if version == 1:
+            (salt,) = key_struct.unpack(key_fields)
+            data_key = self.derive_key(self._require_password(), salt)
+        else:
+            master_salt, wrapped_key = key_struct.unpack(key_fields)
+            data_key = self.unwrap_data_key(wrapped_key, master_salt)
+        return prefix + key_fields, chunk_size, data_key
+
+    def decrypt_stream(self, source: BinaryIO) -> Iterator[bytes]:
+        """
+        Decrypt the framed AES-256-GCM file format, yielding plaintext chunks
+
+        Args:
+            source: Readable stream positioned at the format header
+
+        Yields:
+            Authenticated plaintext chunks in order
+
+        Raises:
+            ValueError: If the header is invalid or any frame fails authentication
+        """
+        header, chunk_size, data_key = self._read_stream_header(source)
+        aead = AESGCM(data_key)
+        frame_size = self.STREAM_NONCE_LENGTH + chunk_size + self.STREAM_TAG_LENGTH
+
+        index = 0
+        frame = self._read_full(source, frame_size)
+        while True:
+            next_frame = self._read_full(source, frame_size) if len(frame) == frame_size else b""
+            final = not next_frame
+            if len(frame) < self.STREAM_NONCE_LENGTH + self.STREAM_TAG_LENGTH:
+                raise ValueError("Encrypted artifact stream is truncated")
+            nonce = frame[: self.STREAM_NONCE_LENGTH]
+            aad = header + self._STREAM_FRAME_AAD.pack(index, final)
+            try:
+                yield aead.decrypt(nonce, frame[self.STREAM_NONCE_LENGTH :], aad)
+            except InvalidTag as e:
+                raise ValueError(f"Encrypted artifact frame {index} failed authentication") from e
+            if final:
+                return
+            frame = next_frame
+            index += 1
 
     def encrypt_fields(self, data: dict[str, Any], fields: list[str]) -> dict[str, Any]:
         """
@@ -159,6 +500,8 @@ class ArtifactEncryption:
         """
         encrypted_data = data.copy()
         encrypted_fields_info = {}
+        # One data key per artifact; every field stores the same wrapped copy
+        data_key = None
 
         for field in fields:
             if field in data and data[field] is not None:
@@ -172,16 +515,14 @@ class ArtifactEncryption:
                 )
 
                 # Encrypt the field
-                encrypted_info = self.encrypt_data(value)
+                data_key = data_key or self.new_data_key()
+                encrypted_info = self.encrypt_data(value, data_key=data_key)
 
                 # Store encrypted value
-                encrypted_data[field] = encrypted_info["data"]
+                encrypted_data[field] = encrypted_info.pop("data")
 
-                # Store encryption info (salt and IV) separately
-                encrypted_fields_info[field] = {
-                    "salt": encrypted_info["salt"],
-                    "iv": encrypted_info["iv"],
-                }
+                # Store encryption info (IV and wrapped data key) separately
+                encrypted_fields_info[field] = encrypted_info
 
         # Add encryption metadata
         if encrypted_fields_info:
@@ -206,11 +547,7 @@ class ArtifactEncryption:
         for field in fields:
             if field in data and field in encryption_info:
                 # Reconstruct encrypted data dictionary
-                encrypted_dict = {
-                    "data": data[field],
-                    "salt": encryption_info[field]["salt"],
-                    "iv": encryption_info[field]["iv"],
-                }
+                encrypted_dict = {"data": data[field], **encryption_info[field]}
 
                 # Decrypt
                 decrypted_bytes = self.decrypt_data(encrypted_dict)
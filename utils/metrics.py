@@ -84,7 +84,9 @@ class DinoAirMetrics:
         self.client.histogram(metric_name, value=value, tags=all_tags)
         self.logger.debug("Recorded histogram %s value %s", metric_name, value)
 
-    def timing(self, metric_name: str, value: float, tags: list[str] | None = None) -> None:
+    def timing(
+        self, metric_name: str, value: float, tags: list[str] | None = None, count: int = 1
+    ) -> None:
         """
         Record a timing metric in milliseconds.
 
@@ -92,10 +94,18 @@ class DinoAirMetrics:
             metric_name: Name of the metric
             value: Duration in milliseconds
             tags: Additional tags for this metric
+            count: Number of samples with this value. They are sent as one
+                packet with sample rate 1/count, which the agent counts
+                count times.
         """
         all_tags = self.default_tags + (tags or [])
-        self.client.timing(metric_name, value=value, tags=all_tags)
-        self.logger.debug("Recorded timing %s: %sms", metric_name, value)
+        if count > 1:
+            # The samples are already aggregated; skip the client's random
+            # sampling, which would drop the packet instead of weighting it
+            self.client._report(metric_name, "ms", value, all_tags, 1.0 / count, sampling=False)
+        else:
+            self.client.timing(metric_name, value=value, tags=all_tags)
+        self.logger.debug("Recorded timing %s: %sms x%s", metric_name, value, count)
 
     @contextmanager
     def timer(self, metric_name: str, tags: list[str] | None = None):
@@ -205,16 +215,19 @@ def track_api_request(endpoint: str, method: str, status_code: int, duration_ms:
 
 
 def track_security_event(
-    event_type: str, severity: str, details: dict[str, Any] | None = None
+    event_type: str,
+    severity: str,
+    details: dict[str, Any] | None = None,
+    metrics: DinoAirMetrics | None = None,
 ) -> None:
-    """Track a security-related event."""
+    """Track a security-related event (on the global client unless metrics is given)."""
     tags = [f"event_type:{event_type}", f"severity:{severity}"]
 
     if details:
         for key, value in details.items():
             tags.append(f"{key}:{value}")
 
-    increment_counter("security.events", tags=tags)
+    (metrics or get_metrics_client()).increment("security.events", tags=tags)
 
 
 def track_translation_request(source_lang: str, target_lang: str, success: bool) -> None: